@@ -0,0 +1,171 @@
+"""JPEG encoding policy for spooled captures.
+
+Native 5K/6K screenshots at quality 85 are 1-3 MB each, while the edge OCR
+detector downsamples to ``Det.limit_side_len`` anyway. The policy here caps
+the long side and picks the JPEG quality, optionally stepping down a
+quality ladder while the spool backlog or upload latency is high.
+
+Configured from the ``[capture]`` section of client.toml:
+
+    max_long_side      – 0 keeps native resolution
+    jpeg_quality       – quality when adaptive mode is off
+    quality_ladder     – qualities tried best-first in adaptive mode
+    adaptive_quality   – enable backlog/latency-driven quality steps
+    adaptive_backlog   – spool items that count as congestion
+    adaptive_latency_ms – upload RTT (EWMA) that counts as congestion
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from PIL import Image
+
+from myrecall.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_QUALITY = 85
+_DEFAULT_LADDER = (85, 75, 65)
+# Weight of the newest sample in the upload latency EWMA
+_LATENCY_ALPHA = 0.2
+
+
+@dataclass(frozen=True)
+class EncodingPolicy:
+    max_long_side: int = 0
+    quality: int = _DEFAULT_QUALITY
+    quality_ladder: tuple[int, ...] = _DEFAULT_LADDER
+    adaptive: bool = False
+    backlog_high: int = 100
+    latency_high_ms: float = 2000.0
+
+    def __post_init__(self) -> None:
+        # Bound the fixed quality like the ladder, so a bad config value
+        # never reaches the encoder whether or not adaptive mode is on
+        object.__setattr__(self, "quality", _clamp_quality(self.quality))
+        object.__setattr__(self, "quality_ladder", _normalize_ladder(self.quality_ladder))
+
+    @classmethod
+    def from_settings(cls) -> "EncodingPolicy":
+        ladder = getattr(settings, "capture_quality_ladder", _DEFAULT_LADDER)
+        return cls(
+            max_long_side=int(getattr(settings, "capture_max_long_side", 0)),
+            quality=int(getattr(settings, "capture_jpeg_quality", _DEFAULT_QUALITY)),
+            quality_ladder=tuple(ladder),
+            adaptive=bool(getattr(settings, "capture_adaptive_quality", False)),
+            backlog_high=int(getattr(settings, "capture_adaptive_backlog", 100)),
+            latency_high_ms=float(
+                getattr(settings, "capture_adaptive_latency_ms", 2000)
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class EncodeResult:
+    quality: int
+    width: int
+    height: int
+    source_width: int
+    source_height: int
+
+
+def _clamp_quality(quality: Any) -> int:
+    """Clamp to the JPEG qualities Pillow accepts without degenerate output."""
+    return max(1, min(95, int(quality)))
+
+
+def _normalize_ladder(ladder: Sequence[Any]) -> tuple[int, ...]:
+    """Clamp to valid JPEG qualities, best first, without duplicates."""
+    values = sorted({_clamp_quality(q) for q in ladder}, reverse=True)
+    return tuple(values) or _DEFAULT_LADDER
+
+
+def fit_long_side(image: Image.Image, max_long_side: int) -> Image.Image:
+    """Downscale so the longer edge is at most ``max_long_side`` pixels."""
+    width, height = image.size
+    long_side = max(width, height)
+    if max_long_side <= 0 or long_side <= max_long_side:
+        return image
+    scale = max_long_side / long_side
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    # Area averaging (like cv2.INTER_AREA) keeps glyph edges clean when
+    # shrinking and is ~3x cheaper than LANCZOS on a 5K frame
+    return image.resize(size, Image.Resampling.BOX)
+
+
+class CaptureEncoder:
+    """Applies an EncodingPolicy when the spool writes a capture.
+
+    In adaptive mode the quality steps one rung down the ladder per capture
+    while congested, and back up once the backlog falls below a quarter of
+    ``backlog_high`` and latency below half of ``latency_high_ms``. The gap
+    between the two thresholds keeps it from flapping.
+    """
+
+    def __init__(self, policy: Optional[EncodingPolicy] = None) -> None:
+        self.policy = policy or EncodingPolicy.from_settings()
+        self._level = 0
+        self._latency_ms: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def observe_upload_latency(self, elapsed_ms: float) -> None:
+        """Feed an upload round-trip time (called by the spool uploader)."""
+        with self._lock:
+            if self._latency_ms is None:
+                self._latency_ms = elapsed_ms
+            else:
+                self._latency_ms += _LATENCY_ALPHA * (elapsed_ms - self._latency_ms)
+
+    @property
+    def upload_latency_ms(self) -> Optional[float]:
+        return self._latency_ms
+
+    def select_quality(self, backlog: int) -> int:
+        policy = self.policy
+        if not policy.adaptive:
+            return policy.quality
+
+        ladder = policy.quality_ladder
+        latency = self._latency_ms
+        congested = backlog >= policy.backlog_high or (
+            latency is not None and latency >= policy.latency_high_ms
+        )
+        relieved = backlog <= policy.backlog_high // 4 and (
+            latency is None or latency < policy.latency_high_ms / 2
+        )
+        with self._lock:
+            previous = self._level
+            if congested:
+                self._level = min(self._level + 1, len(ladder) - 1)
+            elif relieved:
+                self._level = max(self._level - 1, 0)
+            level = self._level
+        if level != previous:
+            logger.info(
+                "capture_encoding: quality %d -> %d (backlog=%d latency_ms=%s)",
+                ladder[previous],
+                ladder[level],
+                backlog,
+                None if latency is None else int(latency),
+            )
+        return ladder[level]
+
+    def encode(self, image: Image.Image, fp: Any, backlog: int = 0) -> EncodeResult:
+        """Resize and write ``image`` as JPEG to ``fp`` (path or file object)."""
+        source_width, source_height = image.size
+        quality = self.select_quality(backlog)
+        scaled = fit_long_side(image, self.policy.max_long_side)
+        if scaled.mode not in ("RGB", "L"):
+            scaled = scaled.convert("RGB")
+        scaled.save(fp, format="JPEG", quality=quality, optimize=False)
+        return EncodeResult(
+            quality=quality,
+            width=scaled.size[0],
+            height=scaled.size[1],
+            source_width=source_width,
+            source_height=source_height,
+        )
@@ -22,6 +22,9 @@ class ClientSettings(TOMLConfig):
     server_api_url: str = "http://localhost:8083/api"
     server_edge_base_url: str = "http://localhost:8083"
     server_upload_timeout: int = 180
+    server_upload_concurrency: int = 4
+    server_upload_compression: str = "auto"
+    server_upload_chunk_bytes: int = 1048576
 
     # [paths]
     paths_data_dir: Path = Path("~/.myrecall/client")
@@ -31,6 +34,12 @@ class ClientSettings(TOMLConfig):
     capture_primary_monitor_only: bool = True
     capture_save_local_copies: bool = False
     capture_permission_poll_sec: int = 10
+    capture_max_long_side: int = 0
+    capture_jpeg_quality: int = 85
+    capture_quality_ladder: tuple[int, ...] = (85, 75, 65)
+    capture_adaptive_quality: bool = False
+    capture_adaptive_backlog: int = 100
+    capture_adaptive_latency_ms: int = 2000
 
     # [debounce]
     debounce_click_ms: int = 3000
@@ -70,11 +79,22 @@ class ClientSettings(TOMLConfig):
                 "server.edge_base_url", "http://localhost:8083"
             ),
             server_upload_timeout=data.get("server.upload_timeout", 180),
+            server_upload_concurrency=data.get("server.upload_concurrency", 4),
+            server_upload_compression=data.get("server.upload_compression", "auto"),
+            server_upload_chunk_bytes=data.get("server.upload_chunk_bytes", 1048576),
             paths_data_dir=Path(data.get("paths.data_dir", "~/.myrecall/client")),
             paths_buffer_dir=Path(data.get("paths.buffer_dir", "~/.myrecall/buffer")),
             capture_primary_monitor_only=data.get("capture.primary_monitor_only", True),
             capture_save_local_copies=data.get("capture.save_local_copies", False),
             capture_permission_poll_sec=data.get("capture.permission_poll_sec", 10),
+            capture_max_long_side=data.get("capture.max_long_side", 0),
+            capture_jpeg_quality=data.get("capture.jpeg_quality", 85),
+            capture_quality_ladder=tuple(
+                data.get("capture.quality_ladder", (85, 75, 65))
+            ),
+            capture_adaptive_quality=data.get("capture.adaptive_quality", False),
+            capture_adaptive_backlog=data.get("capture.adaptive_backlog", 100),
+            capture_adaptive_latency_ms=data.get("capture.adaptive_latency_ms", 2000),
             debounce_click_ms=data.get("debounce.click_ms", 3000),
             debounce_trigger_ms=data.get("debounce.trigger_ms", 3000),
             debounce_capture_ms=data.get("debounce.capture_ms", 3000),
@@ -153,6 +173,21 @@ class ClientSettings(TOMLConfig):
     def upload_timeout(self) -> int:
         return self.server_upload_timeout
 
+    @property
+    def upload_concurrency(self) -> int:
+        """Maximum in-flight spool uploads (adaptive, never exceeds this)."""
+        return self.server_upload_concurrency
+
+    @property
+    def upload_compression(self) -> str:
+        """Metadata compression: auto, zstd, gzip or none."""
+        return self.server_upload_compression
+
+    @property
+    def upload_chunk_bytes(self) -> int:
+        """JPEGs larger than this use chunked, resumable uploads."""
+        return self.server_upload_chunk_bytes
+
     @property
     def click_debounce_ms(self) -> int:
         return self.debounce_click_ms
@@ -2,10 +2,22 @@
 
 import logging
 import sqlite3
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# In-process write counters keyed by resolved db path. Every store instance
+# pointing at the same client.db shares one counter, so readers can detect
+# changes made through another instance (e.g. the web UI) without querying.
+_write_versions: dict[Path, int] = {}
+_write_versions_lock = threading.Lock()
+
+
+def _bump_write_version(db_path: Path) -> None:
+    with _write_versions_lock:
+        _write_versions[db_path] = _write_versions.get(db_path, 0) + 1
+
 
 class ClientSettingsStore:
     """SQLite-backed store for client-side settings.
@@ -44,9 +56,19 @@ class ClientSettingsStore:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._version_key = self.db_path.resolve()
         self._ensure_tables()
         self._ensure_defaults()
 
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every write made in this process.
+
+        Cheap to read (no SQLite access); used by runtime_config to decide
+        whether its in-memory snapshot needs reloading.
+        """
+        return _write_versions.get(self._version_key, 0)
+
     def _ensure_tables(self) -> None:
         """Create the client_settings table if it doesn't exist."""
         with sqlite3.connect(self.db_path) as conn:
@@ -111,6 +133,7 @@ class ClientSettingsStore:
                 (key, value),
             )
             conn.commit()
+        _bump_write_version(self._version_key)
         logger.debug(f"Setting updated: {key} = {value}")
 
     def get_all(self) -> dict[str, str]:
@@ -138,4 +161,5 @@ class ClientSettingsStore:
                     (key, value),
                 )
             conn.commit()
+        _bump_write_version(self._version_key)
         logger.info("Settings reset to defaults")
@@ -414,7 +414,26 @@ class ScreenRecorder:
     def _get_debounced_count_and_reset(self) -> int:
         return self._trigger_debouncer.get_and_reset_debounced_count()
 
+    def _report_upload_stats(self) -> None:
+        upload = self._spool_uploader.stats.get_and_reset()
+        if upload["frames"] == 0 and upload["failures"] == 0:
+            return
+        logger.info(
+            "📤 Upload (%ds): ok=%d failed=%d | throughput=%.2f frames/s %.1f KB/s | rtt avg=%dms max=%dms | concurrency=%d in_flight=%d",
+            self._stats_report_interval_sec,
+            upload["frames"],
+            upload["failures"],
+            upload["frames_per_sec"],
+            upload["kbytes_per_sec"],
+            upload["rtt_avg_ms"],
+            upload["rtt_max_ms"],
+            self._spool_uploader.concurrency_limit,
+            self._spool_uploader.in_flight,
+        )
+
     def _report_stats(self) -> None:
+        self._report_upload_stats()
+
         total_captures = sum(self._capture_counts.values())
         if total_captures == 0:
             return
@@ -544,19 +563,16 @@ class ScreenRecorder:
                 continue
 
             try:
-                store = runtime_config._get_store()
-                if store is None:
+                if runtime_config._get_store() is None:
                     continue
 
-                # Update click debouncer
-                click_ms = store.get("debounce.click_ms", "")
-                if click_ms:
-                    self._click_debouncer.update_interval_ms(int(click_ms))
-
-                # Update trigger debouncer
-                trigger_ms = store.get("debounce.trigger_ms", "")
-                if trigger_ms:
-                    self._trigger_debouncer.update_interval_ms(int(trigger_ms))
+                # notify_config_changed() already invalidated the snapshot,
+                # so this reloads it once for every hot-path reader.
+                snapshot = runtime_config.get_snapshot()
+                click_ms = snapshot.debounce_click_ms
+                trigger_ms = snapshot.debounce_trigger_ms
+                self._click_debouncer.update_interval_ms(click_ms)
+                self._trigger_debouncer.update_interval_ms(trigger_ms)
 
                 logger.info(
                     "[Recorder] Hot-reloaded: click=%sms trigger=%sms",
@@ -6,14 +6,20 @@ a process restart.
 
 Settings are stored in client.db within the client data directory
 (e.g., ~/.myrecall/client/client.db or ~/MRC/client.db depending on config).
+
+Values are served from an immutable in-memory snapshot. The snapshot is
+rebuilt (one ``SELECT`` over client_settings) only after
+``notify_config_changed()`` or when the store's write version moves, so
+the getters below are plain attribute lookups on the capture hot path.
 """
 
 from __future__ import annotations
 
 import logging
 import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 from myrecall.client.database import ClientSettingsStore
 
@@ -26,6 +32,39 @@ logger = logging.getLogger(__name__)
 _settings_store: ClientSettingsStore | None = None
 _data_dir: Path | None = None
 
+# Current snapshot plus the store it was built from; replaced atomically.
+_snapshot: RuntimeConfigSnapshot | None = None
+_snapshot_store: ClientSettingsStore | None = None
+_snapshot_dirty = False
+_snapshot_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RuntimeConfigSnapshot:
+    """Immutable view of all hot-reloadable client settings.
+
+    ``version`` is the store write version the snapshot was built from
+    (-1 when no store is initialized and values come from TOML only).
+    """
+
+    version: int
+    permission_poll_interval_sec: int
+    save_local_copies: bool
+    debounce_click_ms: int
+    debounce_trigger_ms: int
+    debounce_capture_ms: int
+    debounce_idle_interval_ms: int
+    stats_interval_sec: int
+    dedup_enabled: bool
+    dedup_threshold: int
+    dedup_ttl_seconds: float
+    dedup_cache_size: int
+    dedup_for_click: bool
+    dedup_for_app_switch: bool
+    dedup_force_after_skip_sec: int
+    recording_enabled: bool
+    upload_enabled: bool
+
 
 def init_runtime_config(data_dir: Path) -> None:
     """Initialize the runtime configuration with the client data directory.
@@ -38,6 +77,7 @@ def init_runtime_config(data_dir: Path) -> None:
     global _data_dir, _settings_store
     _data_dir = Path(data_dir)
     _settings_store = ClientSettingsStore(_data_dir / "client.db")
+    _invalidate_snapshot()
     logger.debug(f"Runtime config initialized with data_dir: {_data_dir}")
 
 
@@ -46,54 +86,162 @@ def _get_store() -> ClientSettingsStore | None:
     return _settings_store
 
 
-def get_permission_poll_interval_sec() -> int:
-    """Get permission poll interval from runtime settings.
+def _parse_bool(value: str) -> bool:
+    return value.lower() == "true"
 
-    Priority:
-    1. SQLite runtime settings (set via WebUI)
-    2. TOML config (via settings.permission_poll_interval_sec)
 
-    Returns:
-        Permission poll interval in seconds
-    """
-    store = _get_store()
-    if store is not None:
+def _read(
+    values: dict[str, str],
+    key: str,
+    parse: Callable[[str], Any],
+    fallback: Callable[[], Any],
+) -> Any:
+    """Parse ``values[key]``, falling back when it is missing or invalid."""
+    value = values.get(key, "")
+    if value:
         try:
-            value = store.get("capture_permission_poll_sec", "")
-            if value:
-                return int(value)
+            return parse(value)
         except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid capture_permission_poll_sec in runtime settings: {e}")
+            logger.warning(f"Invalid {key} in runtime settings: {e}")
+    return fallback()
+
+
+def _build_snapshot(store: ClientSettingsStore | None) -> RuntimeConfigSnapshot:
+    """Build a snapshot from SQLite (if available) with TOML fallbacks.
 
-    # Fall back to TOML config
+    Priority for every field: SQLite runtime settings (set via WebUI) >
+    TOML config > hardcoded default.
+    """
     from myrecall.shared.config import settings
 
-    return settings.permission_poll_interval_sec
+    values: dict[str, str] = {}
+    version = -1
+    if store is not None:
+        # Read the version first: a write racing with get_all() leaves the
+        # snapshot one version behind, which forces another reload.
+        version = store.version
+        try:
+            values = store.get_all()
+        except Exception as e:
+            logger.warning(f"Failed to read runtime settings: {e}")
+
+    return RuntimeConfigSnapshot(
+        version=version,
+        permission_poll_interval_sec=_read(
+            values, "capture_permission_poll_sec", int,
+            lambda: getattr(settings, "permission_poll_interval_sec", 10),
+        ),
+        save_local_copies=_read(
+            values, "capture_save_local_copies", _parse_bool,
+            lambda: getattr(settings, "client_save_local_screenshots", False),
+        ),
+        debounce_click_ms=_read(
+            values, "debounce.click_ms", int,
+            lambda: getattr(settings, "click_debounce_ms", 3000),
+        ),
+        debounce_trigger_ms=_read(
+            values, "debounce.trigger_ms", int,
+            lambda: getattr(settings, "trigger_debounce_ms", 3000),
+        ),
+        debounce_capture_ms=_read(
+            values, "debounce.capture_ms", int,
+            lambda: getattr(settings, "capture_debounce_ms", 3000),
+        ),
+        debounce_idle_interval_ms=_read(
+            values, "debounce.idle_interval_ms", int,
+            lambda: getattr(settings, "idle_capture_interval_ms", 60000),
+        ),
+        stats_interval_sec=_read(
+            values, "stats.interval_sec", int,
+            lambda: getattr(settings, "stats_interval_sec", 120),
+        ),
+        dedup_enabled=_read(
+            values, "dedup.enabled", _parse_bool,
+            lambda: getattr(settings, "simhash_dedup_enabled", True),
+        ),
+        dedup_threshold=_read(
+            values, "dedup.threshold", int,
+            lambda: getattr(settings, "simhash_dedup_threshold", 10),
+        ),
+        dedup_ttl_seconds=_read(
+            values, "dedup.ttl_seconds", float,
+            lambda: getattr(settings, "simhash_ttl_seconds", 60.0),
+        ),
+        dedup_cache_size=_read(
+            values, "dedup.cache_size_per_device", int,
+            lambda: getattr(settings, "simhash_cache_size_per_device", 1),
+        ),
+        dedup_for_click=_read(
+            values, "dedup.for_click", _parse_bool,
+            lambda: getattr(settings, "simhash_enabled_for_click", True),
+        ),
+        dedup_for_app_switch=_read(
+            values, "dedup.for_app_switch", _parse_bool,
+            lambda: getattr(settings, "simhash_enabled_for_app_switch", False),
+        ),
+        dedup_force_after_skip_sec=_read(
+            values, "dedup.force_after_skip_seconds", int,
+            lambda: getattr(settings, "max_skip_duration_sec", 30),
+        ),
+        # recording/upload are controlled locally by the client, not by TOML
+        recording_enabled=_read(values, "recording_enabled", _parse_bool, lambda: True),
+        upload_enabled=_read(values, "upload_enabled", _parse_bool, lambda: True),
+    )
+
+
+def _invalidate_snapshot() -> None:
+    global _snapshot_dirty
+    _snapshot_dirty = True
+
+
+def get_snapshot() -> RuntimeConfigSnapshot:
+    """Return the current runtime config snapshot, reloading only if stale.
+
+    The snapshot is reloaded when ``notify_config_changed()`` has fired,
+    when the store's write version changed, or when the store was
+    re-initialized. Otherwise this is a couple of attribute reads.
+    Without an initialized store, values come straight from TOML.
+    """
+    global _snapshot, _snapshot_store, _snapshot_dirty
 
+    store = _get_store()
+    if store is None:
+        return _build_snapshot(None)
+
+    snapshot = _snapshot
+    if (
+        snapshot is not None
+        and not _snapshot_dirty
+        and _snapshot_store is store
+        and snapshot.version == store.version
+    ):
+        return snapshot
+
+    with _snapshot_lock:
+        # Clear the flag before reading so a notify that lands mid-reload
+        # triggers another reload on the next call.
+        _snapshot_dirty = False
+        snapshot = _build_snapshot(store)
+        _snapshot = snapshot
+        _snapshot_store = store
+    logger.debug(f"Runtime config snapshot reloaded (version={snapshot.version})")
+    return snapshot
 
-def get_save_local_copies() -> bool:
-    """Get save local copies setting from runtime settings.
 
-    Priority:
-    1. SQLite runtime settings (set via WebUI)
-    2. TOML config (via settings.client_save_local_screenshots)
+def get_permission_poll_interval_sec() -> int:
+    """Get permission poll interval in seconds.
 
-    Returns:
-        True if local copies should be saved
+    Priority: SQLite runtime settings > TOML config (permission_poll_interval_sec)
     """
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("capture_save_local_copies", "")
-            if value:
-                return value.lower() == "true"
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid capture_save_local_copies in runtime settings: {e}")
+    return get_snapshot().permission_poll_interval_sec
 
-    # Fall back to TOML config
-    from myrecall.shared.config import settings
 
-    return settings.client_save_local_screenshots
+def get_save_local_copies() -> bool:
+    """Get save local copies setting.
+
+    Priority: SQLite runtime settings > TOML config (client_save_local_screenshots)
+    """
+    return get_snapshot().save_local_copies
 
 
 def get_debounce_click_ms() -> int:
@@ -101,17 +249,7 @@ def get_debounce_click_ms() -> int:
 
     Priority: SQLite runtime settings > TOML config (click_debounce_ms) > 3000
     """
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("debounce.click_ms", "")
-            if value:
-                return int(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid debounce.click_ms in runtime settings: {e}")
-
-    from myrecall.shared.config import settings
-    return settings.click_debounce_ms
+    return get_snapshot().debounce_click_ms
 
 
 def get_debounce_trigger_ms() -> int:
@@ -119,17 +257,7 @@ def get_debounce_trigger_ms() -> int:
 
     Priority: SQLite runtime settings > TOML config (trigger_debounce_ms) > 3000
     """
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("debounce.trigger_ms", "")
-            if value:
-                return int(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid debounce.trigger_ms in runtime settings: {e}")
-
-    from myrecall.shared.config import settings
-    return settings.trigger_debounce_ms
+    return get_snapshot().debounce_trigger_ms
 
 
 def get_debounce_capture_ms() -> int:
@@ -137,17 +265,7 @@ def get_debounce_capture_ms() -> int:
 
     Priority: SQLite runtime settings > TOML config (capture_debounce_ms) > 3000
     """
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("debounce.capture_ms", "")
-            if value:
-                return int(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid debounce.capture_ms in runtime settings: {e}")
-
-    from myrecall.shared.config import settings
-    return settings.capture_debounce_ms
+    return get_snapshot().debounce_capture_ms
 
 
 def get_debounce_idle_interval_ms() -> int:
@@ -155,17 +273,7 @@ def get_debounce_idle_interval_ms() -> int:
 
     Priority: SQLite runtime settings > TOML config (idle_capture_interval_ms) > 60000
     """
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("debounce.idle_interval_ms", "")
-            if value:
-                return int(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid debounce.idle_interval_ms in runtime settings: {e}")
-
-    from myrecall.shared.config import settings
-    return settings.idle_capture_interval_ms
+    return get_snapshot().debounce_idle_interval_ms
 
 
 def get_stats_interval_sec() -> int:
@@ -173,115 +281,42 @@ def get_stats_interval_sec() -> int:
 
     Priority: SQLite runtime settings > TOML config (stats.interval_sec) > 120
     """
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("stats.interval_sec", "")
-            if value:
-                return int(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid stats.interval_sec in runtime settings: {e}")
-
-    from myrecall.shared.config import settings
-    return settings.stats_interval_sec
+    return get_snapshot().stats_interval_sec
 
 
 def get_dedup_enabled() -> bool:
     """Priority: SQLite runtime > TOML (dedup.enabled) > True"""
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("dedup.enabled", "")
-            if value:
-                return value.lower() == "true"
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid dedup.enabled in runtime settings: {e}")
-    from myrecall.shared.config import settings
-    return settings.simhash_dedup_enabled
+    return get_snapshot().dedup_enabled
 
 
 def get_dedup_threshold() -> int:
     """Priority: SQLite runtime > TOML (dedup.threshold) > 10"""
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("dedup.threshold", "")
-            if value:
-                return int(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid dedup.threshold in runtime settings: {e}")
-    from myrecall.shared.config import settings
-    return settings.simhash_dedup_threshold
+    return get_snapshot().dedup_threshold
 
 
 def get_dedup_ttl_seconds() -> float:
     """Priority: SQLite runtime > TOML (dedup.ttl_seconds) > 60.0"""
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("dedup.ttl_seconds", "")
-            if value:
-                return float(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid dedup.ttl_seconds in runtime settings: {e}")
-    from myrecall.shared.config import settings
-    return getattr(settings, "simhash_ttl_seconds", 60.0)
+    return get_snapshot().dedup_ttl_seconds
 
 
 def get_dedup_cache_size() -> int:
     """Priority: SQLite runtime > TOML (dedup.cache_size_per_device) > 1"""
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("dedup.cache_size_per_device", "")
-            if value:
-                return int(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid dedup.cache_size_per_device in runtime settings: {e}")
-    from myrecall.shared.config import settings
-    return getattr(settings, "simhash_cache_size_per_device", 1)
+    return get_snapshot().dedup_cache_size
 
 
 def get_dedup_for_click() -> bool:
     """Priority: SQLite runtime > TOML (dedup.for_click) > True"""
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("dedup.for_click", "")
-            if value:
-                return value.lower() == "true"
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid dedup.for_click in runtime settings: {e}")
-    from myrecall.shared.config import settings
-    return getattr(settings, "simhash_enabled_for_click", True)
+    return get_snapshot().dedup_for_click
 
 
 def get_dedup_for_app_switch() -> bool:
     """Priority: SQLite runtime > TOML (dedup.for_app_switch) > False"""
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("dedup.for_app_switch", "")
-            if value:
-                return value.lower() == "true"
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid dedup.for_app_switch in runtime settings: {e}")
-    from myrecall.shared.config import settings
-    return getattr(settings, "simhash_enabled_for_app_switch", False)
+    return get_snapshot().dedup_for_app_switch
 
 
 def get_dedup_force_after_skip_sec() -> int:
     """Priority: SQLite runtime > TOML (dedup.force_after_skip_seconds) > 30"""
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("dedup.force_after_skip_seconds", "")
-            if value:
-                return int(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid dedup.force_after_skip_seconds in runtime settings: {e}")
-    from myrecall.shared.config import settings
-    return getattr(settings, "max_skip_duration_sec", 30)
+    return get_snapshot().dedup_force_after_skip_sec
 
 
 def get_recording_enabled() -> bool:
@@ -289,19 +324,8 @@ def get_recording_enabled() -> bool:
 
     Priority: SQLite runtime settings > True (default)
     This setting is controlled locally by the client, not by the server.
-
-    Returns:
-        True if recording is enabled
     """
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("recording_enabled", "")
-            if value:
-                return value.lower() == "true"
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid recording_enabled in runtime settings: {e}")
-    return True
+    return get_snapshot().recording_enabled
 
 
 def get_upload_enabled() -> bool:
@@ -309,19 +333,8 @@ def get_upload_enabled() -> bool:
 
     Priority: SQLite runtime settings > True (default)
     This setting is controlled locally by the client, not by the server.
-
-    Returns:
-        True if upload is enabled
     """
-    store = _get_store()
-    if store is not None:
-        try:
-            value = store.get("upload_enabled", "")
-            if value:
-                return value.lower() == "true"
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid upload_enabled in runtime settings: {e}")
-    return True
+    return get_snapshot().upload_enabled
 
 
 _config_change_event = threading.Event()
@@ -333,7 +346,10 @@ def notify_config_changed() -> None:
     Leaves the event in SET state — the listener clears it after processing.
     This prevents race conditions where notify fires while listener is
     between wait() and the set() call.
+
+    Also marks the in-memory snapshot stale so the next getter reloads it.
     """
+    _invalidate_snapshot()
     _config_change_event.set()
 
 
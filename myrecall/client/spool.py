@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional
 
 from PIL import Image
 
+from myrecall.client.capture_encoding import CaptureEncoder
 from myrecall.shared.config import settings
 
 logger = logging.getLogger(__name__)
@@ -51,11 +52,19 @@ class SpoolQueue:
     Write: jpg -> json.tmp -> os.replace(json.tmp, json)  (atomic on POSIX/Win)
     Read:  glob *.json, skip entries missing paired .jpg
     Drain: removes legacy .webp files from LocalBuffer on init
+
+    Resolution and JPEG quality come from ``encoder`` (see capture_encoding);
+    the current backlog is passed in so adaptive mode can react to it.
     """
 
-    def __init__(self, storage_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        storage_dir: Optional[Path] = None,
+        encoder: Optional[CaptureEncoder] = None,
+    ) -> None:
         self.storage_dir: Path = storage_dir or settings.spool_path
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.encoder: CaptureEncoder = encoder or CaptureEncoder()
         self._drain_legacy_webp()
 
     def enqueue(self, image: Image.Image, metadata: Dict[str, Any]) -> str:
@@ -65,11 +74,19 @@ class SpoolQueue:
         json_tmp = self.storage_dir / f"{capture_id}.json.tmp"
         json_path = self.storage_dir / f"{capture_id}.json"
 
-        image.save(str(jpg_tmp), format="JPEG", quality=85)
+        backlog = self.count()
+        encoded = self.encoder.encode(image, str(jpg_tmp), backlog=backlog)
         os.replace(jpg_tmp, jpg_path)
 
         meta = self._serialize_metadata(metadata)
         meta["capture_id"] = capture_id
+        meta["jpeg_quality"] = encoded.quality
+        if (encoded.width, encoded.height) != (
+            encoded.source_width,
+            encoded.source_height,
+        ):
+            meta["source_width"] = encoded.source_width
+            meta["source_height"] = encoded.source_height
         meta.setdefault(
             "timestamp",
             datetime.now(timezone.utc)
@@ -83,10 +100,13 @@ class SpoolQueue:
         os.replace(json_tmp, json_path)
 
         logger.info(
-            "spool: enqueued capture_id=%s size=%d queue=%d",
+            "spool: enqueued capture_id=%s size=%d %dx%d q=%d queue=%d",
             capture_id,
             jpg_path.stat().st_size,
-            self.count(),
+            encoded.width,
+            encoded.height,
+            encoded.quality,
+            backlog + 1,
         )
         return capture_id
 
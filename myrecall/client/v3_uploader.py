@@ -1,18 +1,27 @@
-"""v3 spool uploader: multipart POST /v1/ingest with retry and resume."""
+"""v3 spool uploader: multipart POST /v1/ingest with retry and resume.
+
+Metadata compression and chunked JPEG uploads are negotiated per edge,
+so older edges keep receiving plain multipart.
+"""
 
 import json
 import logging
 import threading
 import time
 import urllib.parse
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Deque, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from myrecall.client.database import ClientSettingsStore
 from myrecall.client.spool import SpoolItem, SpoolQueue, get_spool
+from myrecall.shared.compression import choose_encoding, compress
 from myrecall.shared.config import settings
 from myrecall.shared.utils import _build_request_kwargs
 
@@ -21,10 +30,19 @@ logger = logging.getLogger(__name__)
 _INGEST_TIMEOUT = 30
 _BACKOFF_BASE = 1
 _BACKOFF_MAX = 60
+_DEFAULT_CONCURRENCY = 4
+# Latency above this multiple of the best observed RTT counts as congestion
+_LATENCY_CONGESTION_FACTOR = 3.0
+_CAPABILITIES_TTL = 600
+# A run of 409s this long means the edge keeps losing the partial upload
+_MAX_OFFSET_RESYNCS = 3
 
 # Settings store for hot-reload support
 _settings_store: Optional[ClientSettingsStore] = None
 
+# ingest_url -> (fetched_at, capabilities); {} means a legacy edge
+_capabilities_cache: Dict[str, "tuple[float, Dict[str, Any]]"] = {}
+
 
 def _get_settings_store() -> ClientSettingsStore:
     """Get or create the settings store singleton."""
@@ -40,6 +58,21 @@ class UploadResult:
     success: bool
     retry_after: Optional[int] = None
     apply_backoff: bool = True
+    elapsed_ms: float = 0.0
+    bytes_sent: int = 0
+
+
+def create_upload_session(pool_size: int = _DEFAULT_CONCURRENCY) -> requests.Session:
+    """Create a keep-alive session sized for ``pool_size`` concurrent uploads.
+
+    Reusing one session keeps TCP (and TLS) connections to the edge open
+    across frames instead of handshaking on every POST.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 def _ingest_url() -> str:
@@ -63,7 +96,106 @@ def _ingest_url() -> str:
     return f"{base}/v1/ingest"
 
 
-def upload_capture(item: SpoolItem, spool: Optional[SpoolQueue] = None) -> UploadResult:
+def _edge_capabilities(
+    ingest_url: str, session: Optional[requests.Session] = None
+) -> Dict[str, Any]:
+    """Return the edge's transfer capabilities (cached per ingest URL).
+
+    Edges that predate GET /v1/ingest/capabilities answer 404; they get an
+    empty dict, which means plain uncompressed multipart. Network errors
+    are not cached so the probe is retried with the next upload.
+    """
+    cached = _capabilities_cache.get(ingest_url)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _CAPABILITIES_TTL:
+        return cached[1]
+
+    caps_url = f"{ingest_url}/capabilities"
+    get = session.get if session is not None else requests.get
+    try:
+        response = get(caps_url, **_build_request_kwargs(caps_url, 5))
+    except requests.RequestException as exc:
+        logger.debug("v3_uploader: capabilities probe failed: %s", exc)
+        return {}
+
+    caps: Dict[str, Any] = {}
+    if response.status_code == 200:
+        try:
+            body = response.json()
+            if isinstance(body, dict):
+                caps = body
+        except ValueError:
+            pass
+    _capabilities_cache[ingest_url] = (now, caps)
+    return caps
+
+
+def _push_resumable(
+    item: SpoolItem, ingest_url: str, http: Any, chunk_bytes: int
+) -> Optional[int]:
+    """Send the JPEG in ``chunk_bytes`` pieces, resuming from the edge offset.
+
+    Returns:
+        Bytes sent in this attempt, or None if the upload did not complete
+        (the caller backs off and the next attempt resumes).
+    """
+    upload_url = f"{ingest_url}/uploads/{urllib.parse.quote(item.capture_id)}"
+    kwargs = _build_request_kwargs(upload_url, _INGEST_TIMEOUT)
+
+    response = http.get(upload_url, **kwargs)
+    if response.status_code != 200:
+        logger.warning(
+            "v3_uploader: resumable status %d capture_id=%s",
+            response.status_code,
+            item.capture_id,
+        )
+        return None
+    offset = int(response.json().get("offset", 0))
+    if offset:
+        logger.info(
+            "v3_uploader: resuming capture_id=%s at offset=%d", item.capture_id, offset
+        )
+
+    size = item.jpg_path.stat().st_size
+    sent = 0
+    resyncs = 0
+    with open(item.jpg_path, "rb") as jpg_fh:
+        while offset < size:
+            jpg_fh.seek(offset)
+            chunk = jpg_fh.read(chunk_bytes)
+            response = http.patch(
+                upload_url,
+                data=chunk,
+                headers={
+                    "Upload-Offset": str(offset),
+                    "Content-Type": "application/offset+octet-stream",
+                },
+                **kwargs,
+            )
+            if response.status_code == 409 and resyncs < _MAX_OFFSET_RESYNCS:
+                resyncs += 1
+                offset = int(response.json().get("offset", 0))
+                continue
+            if response.status_code != 200:
+                logger.warning(
+                    "v3_uploader: chunk rejected %d capture_id=%s offset=%d",
+                    response.status_code,
+                    item.capture_id,
+                    offset,
+                )
+                return None
+            sent += len(chunk)
+            resyncs = 0
+            offset = int(response.json().get("offset", offset + len(chunk)))
+    return sent
+
+
+def upload_capture(
+    item: SpoolItem,
+    spool: Optional[SpoolQueue] = None,
+    session: Optional[requests.Session] = None,
+    commit: bool = True,
+) -> UploadResult:
     """Upload one spool item to POST /v1/ingest.
 
     Handles:
@@ -73,9 +205,17 @@ def upload_capture(item: SpoolItem, spool: Optional[SpoolQueue] = None) -> Uploa
     - network errors    → logs warning, returns False (caller backs off)
     - other 4xx/5xx     → logs error, returns False
 
+    When the edge advertises it (GET /v1/ingest/capabilities), metadata is
+    sent compressed and JPEGs above ``upload_chunk_bytes`` go through the
+    resumable chunk endpoint first. Legacy edges get plain multipart.
+
     Args:
         item: The SpoolItem to upload.
         spool: SpoolQueue for cleanup on success. Defaults to global singleton.
+        session: Keep-alive session to post through. A one-shot request is
+            used when omitted.
+        commit: Delete the spool entry on success. SpoolUploader passes
+            False and commits itself, in capture order.
 
     Returns:
         UploadResult with success flag and optional retry hint.
@@ -84,24 +224,58 @@ def upload_capture(item: SpoolItem, spool: Optional[SpoolQueue] = None) -> Uploa
         spool = get_spool()
 
     url = _ingest_url()
+    http = session if session is not None else requests
+    caps = _edge_capabilities(url, session)
+    started = time.monotonic()
+    bytes_sent = 0
     try:
-        with open(item.jpg_path, "rb") as jpg_fh:
-            files = {"file": (f"{item.capture_id}.jpg", jpg_fh, "image/jpeg")}
-            data = {
-                "capture_id": item.capture_id,
-                "metadata": json.dumps(item.metadata),
-            }
-            response = requests.post(
+        jpg_size = item.jpg_path.stat().st_size
+        data: Dict[str, Any] = {"capture_id": item.capture_id}
+        files: Dict[str, Any] = {}
+
+        metadata_json = json.dumps(item.metadata).encode("utf-8")
+        encoding = choose_encoding(
+            getattr(settings, "upload_compression", "auto"),
+            caps.get("metadata_encodings", []),
+        )
+        if encoding:
+            metadata_part = compress(metadata_json, encoding)
+            files["metadata"] = ("metadata.json", metadata_part, "application/octet-stream")
+            data["metadata_encoding"] = encoding
+            bytes_sent += len(metadata_part)
+        else:
+            data["metadata"] = metadata_json.decode("utf-8")
+            bytes_sent += len(metadata_json)
+
+        chunk_bytes = getattr(settings, "upload_chunk_bytes", 1048576)
+        if caps.get("resumable") and jpg_size > chunk_bytes:
+            pushed = _push_resumable(item, url, http, chunk_bytes)
+            if pushed is None:
+                return UploadResult(success=False, apply_backoff=True)
+            bytes_sent += pushed
+            data["upload_id"] = item.capture_id
+            response = http.post(
                 url,
-                files=files,
+                files=files or None,
                 data=data,
                 **_build_request_kwargs(url, _INGEST_TIMEOUT),
             )
+        else:
+            with open(item.jpg_path, "rb") as jpg_fh:
+                files["file"] = (f"{item.capture_id}.jpg", jpg_fh, "image/jpeg")
+                bytes_sent += jpg_size
+                response = http.post(
+                    url,
+                    files=files,
+                    data=data,
+                    **_build_request_kwargs(url, _INGEST_TIMEOUT),
+                )
     except requests.RequestException as exc:
         logger.warning(
             "v3_uploader: network error capture_id=%s: %s", item.capture_id, exc
         )
         return UploadResult(success=False, apply_backoff=True)
+    elapsed_ms = (time.monotonic() - started) * 1000.0
 
     if response.status_code in (200, 201):
         body = {}
@@ -117,8 +291,14 @@ def upload_capture(item: SpoolItem, spool: Optional[SpoolQueue] = None) -> Uploa
             item.capture_id,
             body.get("frame_id"),
         )
-        spool.commit(item.capture_id)
-        return UploadResult(success=True, apply_backoff=False)
+        if commit:
+            spool.commit(item.capture_id)
+        return UploadResult(
+            success=True,
+            apply_backoff=False,
+            elapsed_ms=elapsed_ms,
+            bytes_sent=bytes_sent,
+        )
 
     if response.status_code == 503:
         retry_after = 5
@@ -131,7 +311,12 @@ def upload_capture(item: SpoolItem, spool: Optional[SpoolQueue] = None) -> Uploa
             item.capture_id,
             retry_after,
         )
-        return UploadResult(success=False, retry_after=retry_after, apply_backoff=False)
+        return UploadResult(
+            success=False,
+            retry_after=retry_after,
+            apply_backoff=False,
+            elapsed_ms=elapsed_ms,
+        )
 
     logger.error(
         "v3_uploader: unexpected %d capture_id=%s body=%r",
@@ -142,16 +327,102 @@ def upload_capture(item: SpoolItem, spool: Optional[SpoolQueue] = None) -> Uploa
     return UploadResult(success=False, apply_backoff=True)
 
 
+class AdaptiveConcurrency:
+    """AIMD limit on in-flight uploads.
+
+    - success at normal latency: additive increase (+1 per ``limit`` successes)
+    - success with latency well above the best RTT seen: multiplicative decrease
+    - 503 QUEUE_FULL: multiplicative decrease (the edge is shedding load)
+    - network failure: collapse to a single in-flight request
+
+    Not thread-safe; only the SpoolUploader thread touches it.
+    """
+
+    def __init__(self, max_limit: int) -> None:
+        self.max_limit = max(1, max_limit)
+        self._limit = float(self.max_limit)
+        self.min_rtt_ms: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        return max(1, int(self._limit))
+
+    def on_success(self, elapsed_ms: float) -> None:
+        if self.min_rtt_ms is None or elapsed_ms < self.min_rtt_ms:
+            self.min_rtt_ms = elapsed_ms
+        if elapsed_ms > self.min_rtt_ms * _LATENCY_CONGESTION_FACTOR and elapsed_ms > 50:
+            self._limit = max(1.0, self._limit * 0.75)
+        else:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def on_overload(self) -> None:
+        self._limit = max(1.0, self._limit / 2.0)
+
+    def on_error(self) -> None:
+        self._limit = 1.0
+
+
+class UploadStats:
+    """Rolling upload counters, read and reset by the recorder stats report."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._window_start = time.monotonic()
+        self._frames = 0
+        self._bytes = 0
+        self._failures = 0
+        self._rtt_samples: list[float] = []
+
+    def record(self, result: UploadResult) -> None:
+        with self._lock:
+            if result.success:
+                self._frames += 1
+                self._bytes += result.bytes_sent
+                self._rtt_samples.append(result.elapsed_ms)
+            else:
+                self._failures += 1
+
+    def get_and_reset(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = max(time.monotonic() - self._window_start, 1e-6)
+            samples = self._rtt_samples
+            snapshot = {
+                "frames": self._frames,
+                "failures": self._failures,
+                "bytes": self._bytes,
+                "frames_per_sec": self._frames / elapsed,
+                "kbytes_per_sec": self._bytes / 1024.0 / elapsed,
+                "rtt_avg_ms": int(sum(samples) / len(samples)) if samples else 0,
+                "rtt_max_ms": int(max(samples)) if samples else 0,
+            }
+            self._reset()
+        return snapshot
+
+
+@dataclass
+class _InFlight:
+    item: SpoolItem
+    future: "Future[UploadResult]"
+
+
 class SpoolUploader(threading.Thread):
     """Background thread that drains the spool via POST /v1/ingest.
 
     On start it immediately scans the spool directory for any residual
     .jpg + .json pairs from previous runs (auto-resume after restart).
 
-    Retry policy:
-      - 503 QUEUE_FULL: honour retry_after from response
-      - network failure: exponential backoff 1s -> 2s -> 4s ... capped at 60s
-      - success: reset backoff counter
+    Uploads are pipelined: up to ``concurrency`` requests are in flight on a
+    shared keep-alive session, and spool entries are committed strictly in
+    submission (capture) order as the head of the window completes.
+
+    Retry policy (see AdaptiveConcurrency):
+      - 503 QUEUE_FULL: halve concurrency and honour retry_after
+      - network failure: drop to one in-flight request; repeated failures at
+        that floor back off 1s -> 2s -> 4s ... capped at 60s
+      - success: reset the failure counter, grow concurrency
       - upload_disabled: pause upload but keep retrying (check every 1s)
     """
 
@@ -161,16 +432,31 @@ class SpoolUploader(threading.Thread):
         stop_event: Optional[threading.Event] = None,
         name: str = "SpoolUploader",
         upload_enabled_fn: Optional[Callable[[], bool]] = None,
+        concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(name=name, daemon=True)
         self.spool = spool or get_spool()
         self._stop_event = stop_event or threading.Event()
         self._retry_count = 0
         self._upload_enabled_fn = upload_enabled_fn
+        if concurrency is None:
+            concurrency = getattr(settings, "upload_concurrency", _DEFAULT_CONCURRENCY)
+        self._concurrency = AdaptiveConcurrency(int(concurrency))
+        self._session = create_upload_session(self._concurrency.max_limit)
+        self._window: Deque[_InFlight] = deque()
+        self.stats = UploadStats()
 
     def stop(self) -> None:
         self._stop_event.set()
 
+    @property
+    def concurrency_limit(self) -> int:
+        return self._concurrency.limit
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._window)
+
     def _is_upload_enabled(self) -> bool:
         """Check if upload is enabled."""
         if self._upload_enabled_fn is None:
@@ -180,36 +466,61 @@ class SpoolUploader(threading.Thread):
         except Exception:
             return True  # Fail open - continue uploading if check fails
 
-    def run(self) -> None:
-        residual = self.spool.count()
-        logger.info("v3_uploader: SpoolUploader started | residual=%d", residual)
-
-        while not self._stop_event.is_set():
-            # Check if upload is enabled
-            if not self._is_upload_enabled():
-                self._stop_event.wait(timeout=1.0)
+    def _fill_window(self, executor: ThreadPoolExecutor) -> None:
+        free = self._concurrency.limit - len(self._window)
+        if free <= 0:
+            return
+        in_flight_ids = {entry.item.capture_id for entry in self._window}
+        for item in self.spool.get_pending(limit=free + len(in_flight_ids)):
+            if free <= 0:
+                break
+            if item.capture_id in in_flight_ids:
                 continue
+            future = executor.submit(
+                upload_capture,
+                item,
+                spool=self.spool,
+                session=self._session,
+                commit=False,
+            )
+            self._window.append(_InFlight(item=item, future=future))
+            free -= 1
+
+    def _drain_head(self) -> Optional[float]:
+        """Commit completed uploads in order; return a pause in seconds, if any."""
+        pause: Optional[float] = None
+        while self._window and self._window[0].future.done():
+            entry = self._window.popleft()
+            try:
+                result = entry.future.result()
+            except Exception as exc:
+                logger.warning(
+                    "v3_uploader: upload crashed capture_id=%s: %s",
+                    entry.item.capture_id,
+                    exc,
+                )
+                result = UploadResult(success=False, apply_backoff=True)
+            self.stats.record(result)
 
-            items = self.spool.get_pending(limit=1)
-
-            if not items:
-                self._stop_event.wait(timeout=1.0)
+            if result.success:
+                self._retry_count = 0
+                self._concurrency.on_success(result.elapsed_ms)
+                self.spool.encoder.observe_upload_latency(result.elapsed_ms)
+                self.spool.commit(entry.item.capture_id)
                 continue
 
-            item = items[0]
-            result = upload_capture(item, spool=self.spool)
-
-            if result.success:
+            if result.retry_after is not None:
                 self._retry_count = 0
-            else:
-                if result.retry_after is not None:
-                    self._retry_count = 0
-                    self._stop_event.wait(timeout=float(result.retry_after))
-                    continue
+                self._concurrency.on_overload()
+                pause = max(pause or 0.0, float(result.retry_after))
+                continue
 
-                if not result.apply_backoff:
-                    continue
+            if not result.apply_backoff:
+                continue
 
+            at_floor = self._concurrency.limit == 1
+            self._concurrency.on_error()
+            if at_floor:
                 self._retry_count += 1
                 wait = min(_BACKOFF_BASE * (2 ** (self._retry_count - 1)), _BACKOFF_MAX)
                 logger.debug(
@@ -217,8 +528,44 @@ class SpoolUploader(threading.Thread):
                     wait,
                     self._retry_count,
                 )
-                self._stop_event.wait(timeout=float(wait))
+                pause = max(pause or 0.0, float(wait))
+        return pause
+
+    def run(self) -> None:
+        residual = self.spool.count()
+        logger.info(
+            "v3_uploader: SpoolUploader started | residual=%d concurrency=%d",
+            residual,
+            self._concurrency.max_limit,
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=self._concurrency.max_limit,
+            thread_name_prefix="SpoolUpload",
+        ) as executor:
+            while not self._stop_event.is_set():
+                # Check if upload is enabled (in-flight requests still finish)
+                if self._is_upload_enabled():
+                    self._fill_window(executor)
+
+                if not self._window:
+                    self._stop_event.wait(timeout=1.0)
+                    continue
+
+                wait_futures(
+                    [entry.future for entry in self._window],
+                    timeout=1.0,
+                    return_when=FIRST_COMPLETED,
+                )
+                pause = self._drain_head()
+                if pause is not None:
+                    self._stop_event.wait(timeout=pause)
+
+            # Let in-flight requests land so their spool entries get committed
+            wait_futures([entry.future for entry in self._window], timeout=5.0)
+            self._drain_head()
 
+        self._session.close()
         remaining = self.spool.count()
         logger.info("v3_uploader: SpoolUploader stopped | remaining=%d", remaining)
 
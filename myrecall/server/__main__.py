@@ -8,6 +8,7 @@ import argparse
 import sqlite3
 import signal
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +19,8 @@ logger = None  # Set in main() after settings are initialized
 _description_worker = None  # module-level reference for shutdown
 _embedding_worker = None  # module-level reference for shutdown
 
+_TREE_COMPACTION_INTERVAL_SEC = 3600
+
 
 def _parse_args():
     parser = argparse.ArgumentParser(prog="myrecall-server")
@@ -159,10 +162,15 @@ def _preload_ocr_model():
     logger.info("Preloading OCR model (RapidOCR)...")
 
     try:
+        from myrecall.server.ocr.engine_pool import get_ocr_engine_pool
         from myrecall.server.ocr.rapid_backend import RapidOCRBackend
 
-        # Initialize the singleton - this triggers model loading
-        _ = RapidOCRBackend()
+        # Initialize the singleton (or the engine pool when [ocr] pool_size > 1)
+        # - this triggers model loading
+        if get_ocr_engine_pool() is None:
+            backend = RapidOCRBackend()
+            if getattr(settings, "ocr_warmup", True):
+                backend.warmup()
         logger.info("✅ OCR model loaded successfully")
     except Exception as e:
         logger.error("❌ Failed to load OCR model: %s", e)
@@ -203,6 +211,89 @@ def _start_ocr_mode():
     return worker
 
 
+def _start_tree_compaction() -> None:
+    """Periodically compress accessibility trees of old frames (if enabled)."""
+    days = settings.storage_compact_trees_after_days
+    if days <= 0:
+        return
+
+    import threading
+
+    from myrecall.server.database.frames_store import FramesStore
+
+    def _loop() -> None:
+        store = FramesStore()
+        while True:
+            try:
+                store.compact_accessibility_trees(days)
+            except Exception as exc:
+                logger.exception("Accessibility tree compaction failed: %s", exc)
+            time.sleep(_TREE_COMPACTION_INTERVAL_SEC)
+
+    threading.Thread(target=_loop, name="TreeCompaction", daemon=True).start()
+    logger.info("Accessibility tree compaction enabled (after %d days)", days)
+
+
+def _start_storage_tiering() -> None:
+    """Periodically move aging snapshots to cheaper storage tiers (if enabled)."""
+    if settings.storage_compress_after_days <= 0 and settings.storage_archive_after_days <= 0:
+        return
+
+    import threading
+
+    from myrecall.server.database.frames_store import FramesStore
+    from myrecall.server.frame_storage import run_storage_tiering
+
+    interval = max(1, int(settings.storage_tiering_interval_minutes)) * 60
+
+    def _loop() -> None:
+        store = FramesStore()
+        while True:
+            try:
+                run_storage_tiering(store)
+            except Exception as exc:
+                logger.exception("Storage tiering failed: %s", exc)
+            time.sleep(interval)
+
+    threading.Thread(target=_loop, name="StorageTiering", daemon=True).start()
+    logger.info(
+        "Storage tiering enabled (compress after %d days, archive after %d days)",
+        settings.storage_compress_after_days,
+        settings.storage_archive_after_days,
+    )
+
+
+def _start_retention_pruner() -> None:
+    """Periodically delete frames past their retention rule (if any)."""
+    from myrecall.server.retention import load_retention_rules, prune_expired_frames
+
+    rules = load_retention_rules()
+    if not any(rule.max_age_days > 0 for rule in rules):
+        return
+
+    import threading
+
+    from myrecall.server.database.frames_store import FramesStore
+
+    interval = max(1, int(settings.retention_interval_minutes)) * 60
+
+    def _loop() -> None:
+        store = FramesStore()
+        while True:
+            try:
+                prune_expired_frames(store, rules)
+            except Exception as exc:
+                logger.exception("Retention pruning failed: %s", exc)
+            time.sleep(interval)
+
+    threading.Thread(target=_loop, name="RetentionPruner", daemon=True).start()
+    logger.info(
+        "Retention pruner enabled (%d rule(s), every %d min)",
+        len(rules),
+        interval // 60,
+    )
+
+
 def main():
     global logger
     logger = configure_logging("myrecall.server")
@@ -223,6 +314,9 @@ def main():
     logger.info("=" * 50)
 
     ensure_v3_schema()
+    _start_tree_compaction()
+    _start_retention_pruner()
+    _start_storage_tiering()
 
     # Initialize server-side runtime_config BEFORE any worker dispatch.
     # All three startup modes (noop, ocr, legacy) may start a DescriptionWorker,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import importlib
+import logging
 import threading
 from typing import TYPE_CHECKING, Dict, Union
 
@@ -13,29 +15,93 @@ from myrecall.server.ai.base import (
     EmbeddingProvider,
     OCRProvider,
 )
-from myrecall.server.ai.providers import (
-    DashScopeEmbeddingProvider,
-    DashScopeOCRProvider,
-    DoctrOCRProvider,
-    LocalEmbeddingProvider,
-    LocalOCRProvider,
-    OpenAIEmbeddingProvider,
-    OpenAIOCRProvider,
-    RapidOCRProvider,
-)
 from myrecall.shared.config import settings
 
+logger = logging.getLogger(__name__)
+
 _instances: Dict[str, object] = {}
 _lock = threading.Lock()
 
+# capability -> provider name -> "module:Class". A backend module is imported
+# only when its provider is selected, so e.g. a cloud-only edge never loads
+# torch/transformers/sentence_transformers. Extend with register_provider().
+_PROVIDER_REGISTRY: Dict[str, Dict[str, str]] = {
+    "vision": {
+        "local": "myrecall.server.ai.providers:LocalProvider",
+        "dashscope": "myrecall.server.ai.providers:DashScopeProvider",
+        "openai": "myrecall.server.ai.providers:OpenAIProvider",
+    },
+    "ocr": {
+        "local": "myrecall.server.ai.providers:LocalOCRProvider",
+        "rapidocr": "myrecall.server.ai.providers:RapidOCRProvider",
+        "doctr": "myrecall.server.ai.providers:DoctrOCRProvider",
+        "dashscope": "myrecall.server.ai.providers:DashScopeOCRProvider",
+        "openai": "myrecall.server.ai.providers:OpenAIOCRProvider",
+    },
+    "embedding": {
+        "local": "myrecall.server.ai.providers:LocalEmbeddingProvider",
+        "dashscope": "myrecall.server.ai.providers:DashScopeEmbeddingProvider",
+        "openai": "myrecall.server.ai.providers:OpenAIEmbeddingProvider",
+    },
+    "description": {
+        "local": "myrecall.server.description.providers.local:LocalDescriptionProvider",
+        "dashscope": "myrecall.server.description.providers.dashscope:DashScopeDescriptionProvider",
+        "openai": "myrecall.server.description.providers.openai:OpenAIDescriptionProvider",
+    },
+    "multimodal_embedding": {
+        "openai": "myrecall.server.embedding.providers.openai:OpenAIEmbeddingProvider",
+        "dashscope": "myrecall.server.embedding.providers.dashscope:DashScopeEmbeddingProvider",
+        "multimodal": "myrecall.server.embedding.providers.multimodal:QwenVLEmbeddingProvider",
+        "siliconflow": "myrecall.server.embedding.providers.siliconflow:SiliconFlowEmbeddingProvider",
+    },
+}
+
+_CAPABILITY_LABELS = {
+    "vision": "AI",
+    "ocr": "OCR",
+    "embedding": "embedding",
+    "description": "description",
+    "multimodal_embedding": "embedding",
+}
+
+
+def register_provider(capability: str, name: str, target: str) -> None:
+    """Register (or override) a provider as ``"package.module:ClassName"``."""
+    if ":" not in target:
+        raise ValueError(f"Provider target must be 'module:Class', got {target!r}")
+    _PROVIDER_REGISTRY.setdefault(capability, {})[name.strip().lower()] = target
+    invalidate(capability)
+
+
+def _load_provider_class(capability: str, name: str) -> type:
+    """Import and return the class registered for ``name``."""
+    target = _PROVIDER_REGISTRY.get(capability, {}).get(name)
+    if target is None:
+        label = _CAPABILITY_LABELS.get(capability, capability)
+        raise AIProviderConfigError(f"Unknown {label} provider: {name}")
+    module_name, _, class_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 def invalidate(capability: str | None = None) -> None:
-    """Clear cached provider instance(s). None = clear all."""
+    """Clear cached provider instance(s). None = clear all.
+
+    Dropped providers are closed so local ones release their pooled model;
+    the weights stay warm for a rebuilt provider that asks for the same one.
+    """
     with _lock:
         if capability is None:
+            dropped = list(_instances.values())
             _instances.clear()
         else:
-            _instances.pop(capability, None)
+            dropped = [_instances.pop(capability, None)]
+    for instance in dropped:
+        close = getattr(instance, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                logger.exception("Failed to close provider %r", instance)
 
 
 def _resolve_ocr_config() -> tuple[str, str, str, str]:
@@ -67,23 +133,15 @@ def get_ai_provider(
     api_base = settings.ai_api_base
     provider = (provider or "local").strip().lower()
 
-    # Import here to avoid circular dependency at module level
-    from myrecall.server.ai.providers import (
-        DashScopeProvider,
-        LocalProvider,
-        OpenAIProvider,
-    )
-
+    provider_cls = _load_provider_class(capability, provider)
     if provider == "local":
-        instance: AIProvider = LocalProvider(model_name=model_name)
+        instance: AIProvider = provider_cls(model_name=model_name)
     elif provider == "dashscope":
-        instance = DashScopeProvider(api_key=api_key, model_name=model_name)
-    elif provider == "openai":
-        instance = OpenAIProvider(
+        instance = provider_cls(api_key=api_key, model_name=model_name)
+    else:
+        instance = provider_cls(
             api_key=api_key, model_name=model_name, api_base=api_base
         )
-    else:
-        raise AIProviderConfigError(f"Unknown AI provider: {provider}")
 
     _instances[capability] = instance
     return instance
@@ -98,20 +156,15 @@ def get_ocr_provider() -> OCRProvider:
     provider, model_name, api_key, api_base = _resolve_ocr_config()
     provider = (provider or "local").strip().lower()
 
-    if provider == "local":
-        instance: OCRProvider = LocalOCRProvider()
-    elif provider == "rapidocr":
-        instance = RapidOCRProvider()
-    elif provider == "doctr":
-        instance = DoctrOCRProvider()
+    provider_cls = _load_provider_class(capability, provider)
+    if provider in ("local", "rapidocr", "doctr"):
+        instance: OCRProvider = provider_cls()
     elif provider == "dashscope":
-        instance = DashScopeOCRProvider(api_key=api_key, model_name=model_name)
-    elif provider == "openai":
-        instance = OpenAIOCRProvider(
+        instance = provider_cls(api_key=api_key, model_name=model_name)
+    else:
+        instance = provider_cls(
             api_key=api_key, model_name=model_name, api_base=api_base
         )
-    else:
-        raise AIProviderConfigError(f"Unknown OCR provider: {provider}")
 
     _instances[capability] = instance
     return instance
@@ -130,16 +183,15 @@ def get_embedding_provider() -> EmbeddingProvider:
     api_base = settings.ai_api_base
     provider = (provider or "local").strip().lower()
 
+    provider_cls = _load_provider_class(capability, provider)
     if provider == "local":
-        instance: EmbeddingProvider = LocalEmbeddingProvider()
+        instance: EmbeddingProvider = provider_cls()
     elif provider == "dashscope":
-        instance = DashScopeEmbeddingProvider(api_key=api_key, model_name=model_name)
-    elif provider == "openai":
-        instance = OpenAIEmbeddingProvider(
+        instance = provider_cls(api_key=api_key, model_name=model_name)
+    else:
+        instance = provider_cls(
             api_key=api_key, model_name=model_name, api_base=api_base
         )
-    else:
-        raise AIProviderConfigError(f"Unknown embedding provider: {provider}")
 
     _instances[capability] = instance
     return instance
@@ -165,12 +217,6 @@ def get_description_provider() -> "DescriptionProvider":
         if cached is not None:
             return cached  # type: ignore[return-value]
 
-        # Lazy import to avoid circular dependency
-        from myrecall.server.description.providers import (
-            LocalDescriptionProvider,
-            OpenAIDescriptionProvider,
-            DashScopeDescriptionProvider,
-        )
         from myrecall.server.runtime_config import (
             get_description_provider as get_provider_name,
             get_description_model,
@@ -183,16 +229,15 @@ def get_description_provider() -> "DescriptionProvider":
         api_key = get_description_api_key()
         api_base = get_description_api_base()
 
+        provider_cls = _load_provider_class(capability, provider)
         if provider == "local":
-            instance: DescriptionProvider = LocalDescriptionProvider(model_name=model_name)
+            instance: DescriptionProvider = provider_cls(model_name=model_name)
         elif provider == "dashscope":
-            instance = DashScopeDescriptionProvider(api_key=api_key, model_name=model_name)
-        elif provider == "openai":
-            instance = OpenAIDescriptionProvider(
+            instance = provider_cls(api_key=api_key, model_name=model_name)
+        else:
+            instance = provider_cls(
                 api_key=api_key, model_name=model_name, api_base=api_base
             )
-        else:
-            raise AIProviderConfigError(f"Unknown description provider: {provider}")
 
         _instances[capability] = instance
         return instance
@@ -203,14 +248,6 @@ def get_multimodal_embedding_provider() -> "MultimodalEmbeddingProvider":
 
     Supports providers: openai, dashscope, multimodal, siliconflow
     """
-    from myrecall.server.embedding.providers import (
-        MultimodalEmbeddingProvider,
-        OpenAIEmbeddingProvider,
-        DashScopeEmbeddingProvider,
-        QwenVLEmbeddingProvider,
-        SiliconFlowEmbeddingProvider,
-    )
-
     capability = "multimodal_embedding"
     cached = _instances.get(capability)
     if cached is not None:
@@ -222,34 +259,20 @@ def get_multimodal_embedding_provider() -> "MultimodalEmbeddingProvider":
     api_base = settings.embedding_api_base
     dimension = settings.embedding_dim
 
-    if provider == "openai":
-        instance: MultimodalEmbeddingProvider = OpenAIEmbeddingProvider(
-            api_key=api_key,
-            model_name=model_name,
-            api_base=api_base,
-        )
-    elif provider == "dashscope":
-        instance = DashScopeEmbeddingProvider(
+    provider_cls = _load_provider_class(capability, provider)
+    if provider in ("openai", "dashscope"):
+        instance: MultimodalEmbeddingProvider = provider_cls(
             api_key=api_key,
             model_name=model_name,
             api_base=api_base,
         )
-    elif provider == "multimodal":
-        instance = QwenVLEmbeddingProvider(
-            api_key=api_key,
-            model_name=model_name,
-            api_base=api_base,
-            dimension=dimension,
-        )
-    elif provider == "siliconflow":
-        instance = SiliconFlowEmbeddingProvider(
+    else:
+        instance = provider_cls(
             api_key=api_key,
             model_name=model_name,
             api_base=api_base,
             dimension=dimension,
         )
-    else:
-        raise AIProviderConfigError(f"Unknown embedding provider: {provider}")
 
     _instances[capability] = instance
     return instance
@@ -0,0 +1,202 @@
+"""Process-wide warm pool for local Qwen-VL model weights.
+
+The vision provider and the local description provider load the same
+multi-GB checkpoint. Both acquire it from here, so each
+(model_id, dtype, device) combination is loaded once and shared.
+
+Leases are refcounted. A released model stays warm, so a provider rebuilt
+after a settings tweak reuses it. Idle models are evicted when a different
+model is acquired or after ``IDLE_TTL_SEC`` without a lease.
+"""
+from __future__ import annotations
+
+import gc
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from myrecall.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+IDLE_TTL_SEC = 300.0
+
+ModelKey = Tuple[str, str, str]  # (model_id, dtype, device)
+Loader = Callable[[ModelKey], Tuple[Any, Any]]
+
+
+def model_key(model_id: str, device: Optional[str] = None) -> ModelKey:
+    """Build the pool key; dtype follows the device like the providers did."""
+    device = device or settings.device
+    dtype = "float32" if device == "cpu" else "bfloat16"
+    return (model_id, dtype, device)
+
+
+def _load_qwen_vl(key: ModelKey) -> Tuple[Any, Any]:
+    import torch
+    from transformers import AutoProcessor, Qwen3VLForConditionalGeneration
+
+    model_id, dtype, device = key
+    model = Qwen3VLForConditionalGeneration.from_pretrained(
+        model_id,
+        trust_remote_code=True,
+        dtype=getattr(torch, dtype),
+        device_map=device,
+    )
+    processor = AutoProcessor.from_pretrained(
+        model_id,
+        trust_remote_code=True,
+        min_pixels=256 * 28 * 28,
+        max_pixels=1024 * 28 * 28,
+    )
+    return model, processor
+
+
+def _memory_bytes(model: Any) -> Optional[int]:
+    footprint = getattr(model, "get_memory_footprint", None)
+    if callable(footprint):
+        try:
+            return int(footprint())
+        except Exception:
+            pass
+    parameters = getattr(model, "parameters", None)
+    if callable(parameters):
+        try:
+            return sum(p.numel() * p.element_size() for p in parameters())
+        except Exception:
+            pass
+    return None
+
+
+@dataclass
+class _PooledModel:
+    key: ModelKey
+    model: Any
+    processor: Any
+    load_seconds: float
+    memory_bytes: Optional[int]
+    loaded_at: str
+    refcount: int = 0
+    idle_since: Optional[float] = field(default=None)
+
+
+class ModelLease:
+    """Handle to a pooled model; call ``release()`` when the owner is done."""
+
+    def __init__(self, pool: "ModelPool", entry: _PooledModel) -> None:
+        self._pool = pool
+        self.key = entry.key
+        self.model = entry.model
+        self.processor = entry.processor
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._pool._release(self.key)
+
+
+class ModelPool:
+    """Refcounted registry of loaded models keyed by (model_id, dtype, device)."""
+
+    def __init__(self, loader: Loader = _load_qwen_vl, idle_ttl: float = IDLE_TTL_SEC) -> None:
+        self._loader = loader
+        self._idle_ttl = idle_ttl
+        self._entries: Dict[ModelKey, _PooledModel] = {}
+        self._lock = threading.Lock()
+        # Serializes loads so two capabilities starting together load once
+        self._load_lock = threading.Lock()
+
+    def acquire(self, model_id: str, device: Optional[str] = None) -> ModelLease:
+        key = model_key(model_id, device)
+        with self._load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    # A different model is wanted: drop idle ones before loading
+                    self._evict_locked(lambda e: e.refcount == 0)
+                else:
+                    self._take_locked(entry)
+                    logger.info(f"Model pool hit: {key[0]} ({key[1]}, {key[2]}), refs={entry.refcount}")
+                    return ModelLease(self, entry)
+
+            logger.info(f"Model pool loading: {key[0]} ({key[1]}, {key[2]})")
+            started = time.perf_counter()
+            model, processor = self._loader(key)
+            load_seconds = time.perf_counter() - started
+            entry = _PooledModel(
+                key=key,
+                model=model,
+                processor=processor,
+                load_seconds=load_seconds,
+                memory_bytes=_memory_bytes(model),
+                loaded_at=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            )
+            logger.info(f"Model pool loaded {key[0]} in {load_seconds:.1f}s")
+            with self._lock:
+                self._entries[key] = entry
+                self._take_locked(entry)
+                return ModelLease(self, entry)
+
+    def _take_locked(self, entry: _PooledModel) -> None:
+        entry.refcount += 1
+        entry.idle_since = None
+
+    def _release(self, key: ModelKey) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refcount = max(0, entry.refcount - 1)
+            if entry.refcount == 0:
+                entry.idle_since = time.monotonic()
+            self._evict_expired_locked()
+
+    def evict_idle(self) -> int:
+        """Evict every model with no active lease. Returns the number evicted."""
+        with self._lock:
+            return self._evict_locked(lambda e: e.refcount == 0)
+
+    def _evict_expired_locked(self) -> int:
+        now = time.monotonic()
+        return self._evict_locked(
+            lambda e: e.refcount == 0
+            and e.idle_since is not None
+            and now - e.idle_since >= self._idle_ttl
+        )
+
+    def _evict_locked(self, predicate: Callable[[_PooledModel], bool]) -> int:
+        victims = [key for key, entry in self._entries.items() if predicate(entry)]
+        for key in victims:
+            del self._entries[key]
+            logger.info(f"Model pool evicted: {key[0]} ({key[1]}, {key[2]})")
+        if victims:
+            gc.collect()
+            torch = sys.modules.get("torch")
+            if torch is not None and torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        return len(victims)
+
+    def stats(self) -> List[dict]:
+        """Per-model load time, memory and lease counts for health output."""
+        with self._lock:
+            self._evict_expired_locked()
+            return [
+                {
+                    "model_id": entry.key[0],
+                    "dtype": entry.key[1],
+                    "device": entry.key[2],
+                    "refcount": entry.refcount,
+                    "load_seconds": round(entry.load_seconds, 3),
+                    "memory_bytes": entry.memory_bytes,
+                    "loaded_at": entry.loaded_at,
+                }
+                for entry in self._entries.values()
+            ]
+
+
+model_pool = ModelPool()
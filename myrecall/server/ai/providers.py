@@ -8,10 +8,7 @@ from typing import Any
 
 import numpy as np
 import requests
-import torch
 from PIL import Image
-from qwen_vl_utils import process_vision_info
-from transformers import AutoProcessor, Qwen3VLForConditionalGeneration
 
 from myrecall.server.ai.base import (
     AIProvider,
@@ -21,12 +18,12 @@ from myrecall.server.ai.base import (
     AIProviderUnavailableError,
     OCRProvider,
 )
-from myrecall.server.ai_engine import AIEngine
-from myrecall.server.nlp import get_nlp_engine
-# from myrecall.server.ocr import extract_text_from_image
-from myrecall.server.ocr.rapid_backend import RapidOCRBackend
 from myrecall.shared.config import settings
 
+# Local model backends (torch, transformers, qwen_vl_utils, rapidocr,
+# sentence_transformers) are imported inside the providers that use them,
+# so cloud-only configurations never load those stacks.
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,31 +54,24 @@ def _l2_normalize(vec: np.ndarray) -> np.ndarray:
 
 
 class LocalProvider(AIProvider):
-    MAX_IMAGE_SIZE = AIEngine.MAX_IMAGE_SIZE
+    MAX_IMAGE_SIZE = 1024  # Same as AIEngine.MAX_IMAGE_SIZE
 
     def __init__(self, model_name: str = "") -> None:
-        self.model_id = model_name or AIEngine.MODEL_ID
+        from myrecall.server.ai.model_pool import model_pool
+        from myrecall.server.ai_engine import AIEngine
 
-        if settings.device == "cpu":
-            torch_dtype = torch.float32
-        else:
-            torch_dtype = torch.bfloat16
+        self.model_id = model_name or AIEngine.MODEL_ID
 
         logger.info(f"Loading LocalProvider model: {self.model_id}")
         logger.info(f"Using device: {settings.device}")
 
-        self.model = Qwen3VLForConditionalGeneration.from_pretrained(
-            self.model_id,
-            trust_remote_code=True,
-            dtype=torch_dtype,
-            device_map=settings.device,
-        )
-        self.processor = AutoProcessor.from_pretrained(
-            self.model_id,
-            trust_remote_code=True,
-            min_pixels=256 * 28 * 28,
-            max_pixels=1024 * 28 * 28,
-        )
+        # Shared with LocalDescriptionProvider when both use the same model
+        self._lease = model_pool.acquire(self.model_id)
+        self.model = self._lease.model
+        self.processor = self._lease.processor
+
+    def close(self) -> None:
+        self._lease.release()
 
     def _resize_for_cpu(self, image: Image.Image) -> Image.Image:
         width, height = image.size
@@ -99,6 +89,9 @@ class LocalProvider(AIProvider):
         return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
     def analyze_image(self, image_path: str) -> dict[str, Any]:
+        import torch
+        from qwen_vl_utils import process_vision_info
+
         path = Path(image_path)
         if not path.is_file():
             raise AIProviderRequestError(f"Image not found: {image_path}")
@@ -351,6 +344,8 @@ class DoctrOCRProvider(OCRProvider):
 
 class LocalOCRProvider(OCRProvider):
     def extract_text(self, image_path: str) -> str:
+        from myrecall.server.ocr.rapid_backend import RapidOCRBackend
+
         # Backward compatibility: Use RapidOCR as the default local provider
         return RapidOCRBackend().extract_text(image_path)
 
@@ -498,6 +493,8 @@ class DashScopeOCRProvider(OCRProvider):
 
 class LocalEmbeddingProvider(EmbeddingProvider):
     def __init__(self) -> None:
+        from myrecall.server.nlp import get_nlp_engine
+
         self._engine = get_nlp_engine()
 
     def embed_text(self, text: str) -> np.ndarray:
@@ -612,5 +609,7 @@ class RapidOCRProvider(OCRProvider):
         path = Path(image_path)
         if not path.is_file():
             raise AIProviderRequestError(f"Image not found: {image_path}")
+        from myrecall.server.ocr.rapid_backend import RapidOCRBackend
+
         # RapidOCRBackend supports path string directly
         return RapidOCRBackend().extract_text(str(path))
@@ -20,10 +20,12 @@ from PIL import Image
 from myrecall.server.config_runtime import runtime_settings
 from myrecall.server.database import SQLStore
 from myrecall.server.database.frames_store import (
+    MEMORY_TEXT_FIELDS,
     FramesStore,
     normalize_timestamp_filter,
 )
 from myrecall.server.search.engine import SearchEngine
+from myrecall.server.utils.projection import parse_projection, project
 from myrecall.shared.config import settings
 
 logger = logging.getLogger(__name__)
@@ -180,9 +182,10 @@ def memories_latest():
             ),
             400,
         )
+    fields, include = parse_projection(request.args, MEMORY_TEXT_FIELDS)
     try:
-        memories = frames_store.get_memories_since(normalized_since)
-        return jsonify(memories), 200
+        memories = frames_store.get_memories_since(normalized_since, include=include)
+        return jsonify(project(memories, fields)), 200
     except Exception as e:
         logger.exception("Error fetching latest memories")
         return jsonify({"status": "error", "message": str(e)}), 500
@@ -190,6 +193,15 @@ def memories_latest():
 
 @api_bp.route("/memories/recent", methods=["GET"])
 def memories_recent():
+    """Recent frames for the grid.
+
+    Query Params:
+        limit: Max frames (default 500, max 1000).
+        include: Comma-separated full text fields to add
+            (accessibility_text, ocr_text). Omitted by default; fetch them
+            per frame from /v1/frames/<id>/text instead.
+        fields: Comma-separated keys to keep in each frame.
+    """
     limit_str = (request.args.get("limit") or "500").strip()
     try:
         limit = int(limit_str)
@@ -204,9 +216,10 @@ def memories_recent():
             400,
         )
 
+    fields, include = parse_projection(request.args, MEMORY_TEXT_FIELDS)
     try:
-        memories = frames_store.get_recent_memories(limit=limit)
-        return jsonify(memories), 200
+        memories = frames_store.get_recent_memories(limit=limit, include=include)
+        return jsonify(project(memories, fields)), 200
     except Exception as e:
         logger.exception("Error fetching recent memories")
         return jsonify({"status": "error", "message": str(e)}), 500
@@ -218,6 +231,7 @@ def memories_by_day():
 
     Query Params:
         date: Date in YYYY-MM-DD format (local_timestamp).
+        fields / include: Projection, as in /api/memories/recent.
 
     Returns:
         JSON list of frame dicts (same format as /api/memories/recent).
@@ -231,9 +245,10 @@ def memories_by_day():
             400,
         )
 
+    fields, include = parse_projection(request.args, MEMORY_TEXT_FIELDS)
     try:
-        memories = frames_store.get_frames_by_day(date=date_str)
-        return jsonify(memories), 200
+        memories = frames_store.get_frames_by_day(date=date_str, include=include)
+        return jsonify(project(memories, fields)), 200
     except Exception as e:
         logger.exception("Error fetching frames by day")
         return jsonify({"status": "error", "message": str(e)}), 500
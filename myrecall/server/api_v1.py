@@ -2,32 +2,61 @@
 
 This module defines the v1_bp Blueprint and implements:
   - POST /v1/ingest          — idempotent single-frame upload
+  - GET  /v1/ingest/capabilities — supported transfer encodings / resumable uploads
+  - GET  /v1/ingest/uploads/<capture_id> — resumable upload offset
+  - PATCH /v1/ingest/uploads/<capture_id> — append a resumable upload chunk
   - GET  /v1/ingest/queue/status — live queue counters
   - GET  /v1/frames/<frame_id>   — serve frame JPEG
+  - GET  /v1/frames/<frame_id>/text — full accessibility/OCR text of a frame
   - GET  /v1/frames/<frame_id>/context — frame context for chat grounding
+  - GET  /v1/frames/context?ids=   — frame context for several frames at once
   - GET  /v1/frames/<frame_id>/similar — find similar frames using vector search
   - POST /v1/frames/<frame_id>/embedding — manually trigger embedding generation
   - GET  /v1/health              — health check
   - GET  /v1/search              — FTS5/hybrid/vector search
+  - GET  /v1/timeline/density    — bucketed frame density for the timeline scrubber
+  - POST /v1/batch               — several read-only calls in one round trip
   - GET  /v1/embedding/tasks/status — embedding task queue statistics
   - POST /v1/admin/embedding/backfill — trigger embedding backfill
-  - POST /v1/admin/frames/retry-failed — retry all failed frames
+  - POST /v1/admin/frames/retry-failed — start a job retrying all failed frames
+  - GET  /v1/admin/frames/retry-failed/<job_id> — progress of a retry job
+  - POST /v1/admin/activity-rollups/rebuild — recompute activity-summary rollups
+  - GET  /v1/admin/activity-rollups/check — rollup vs raw activity-summary check
 
 SSOT: docs/v3/spec.md §4.7, §4.8.1, §4.9; docs/v3/http_contract_ledger.md
 """
 
+import io
 import json
 import logging
 import sqlite3
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
-from flask import Blueprint, jsonify, request, send_file
+from flask import Blueprint, current_app, jsonify, request, send_file
 
+from myrecall.server.ai.model_pool import model_pool
 from myrecall.server.config_runtime import runtime_settings
-from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.frames_store import MEMORY_TEXT_FIELDS, FramesStore
+from myrecall.server.database.task_lanes import LANE_USER
+from myrecall.server.frame_storage import SnapshotLocation, location_for_frame, sniff_mimetype
+from myrecall.server.ocr.visualization import get_ocr_vis_cache, render_ocr_visualization
+from myrecall.server.search.visibility import is_text_visible, visibility_mode
+from myrecall.server.utils.projection import parse_projection, project
+from myrecall.server.ingest_transfer import (
+    OffsetMismatch,
+    PartialUploadStore,
+    UploadTooLarge,
+    decode_request_body,
+    transfer_stats,
+)
+from myrecall.shared.compression import (
+    DecompressionError,
+    decompress,
+    supported_encodings,
+)
 from myrecall.shared.config import settings
 
 logger = logging.getLogger(__name__)
@@ -36,9 +65,12 @@ v1_bp = Blueprint("v1", __name__, url_prefix="/v1")
 
 # Module-level store instance (shared across requests in the same process)
 _frames_store: Optional[FramesStore] = None
+_partial_uploads: Optional[PartialUploadStore] = None
 
 # Constants for validation
 _MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB
+_MAX_METADATA_BYTES = 16 * 1024 * 1024  # accessibility trees can be large
+_MAX_DECODED_REQUEST_BYTES = _MAX_FILE_SIZE_BYTES + _MAX_METADATA_BYTES + 64 * 1024
 _ALLOWED_MIME_TYPE = "image/jpeg"
 _ALLOWED_CAPTURE_TRIGGERS = frozenset({"idle", "app_switch", "manual", "click"})
 
@@ -51,6 +83,14 @@ def _get_frames_store() -> FramesStore:
     return _frames_store
 
 
+def _get_partial_uploads() -> PartialUploadStore:
+    """Lazily initialize the resumable-upload store under the data dir."""
+    global _partial_uploads
+    if _partial_uploads is None:
+        _partial_uploads = PartialUploadStore(Path(settings.base_path) / "uploads")
+    return _partial_uploads
+
+
 def _parse_utc_timestamp(raw_value: str | None) -> datetime | None:
     if raw_value is None:
         return None
@@ -151,6 +191,12 @@ def ingest():
         metadata    – JSON string (required, may be ``{}``)
         file        – JPEG binary (required, <= 10 MB)
 
+    Transfer options (see GET /v1/ingest/capabilities):
+        Content-Encoding   – gzip/zstd for the whole request body
+        metadata_encoding  – gzip/zstd; ``metadata`` is then a compressed file part
+        upload_id          – replaces ``file`` with a completed resumable
+                             upload (must equal capture_id)
+
     Success:
         201 Created       → new frame   {"capture_id", "frame_id", "status": "queued",       "request_id"}
         200 OK            → duplicate   {"capture_id", "frame_id", "status": "already_exists","request_id"}
@@ -163,12 +209,46 @@ def ingest():
     """
     request_id = str(uuid.uuid4())
 
+    # ------------------------------------------------------------------
+    # Step 0: Undo transfer encodings (must precede form parsing)
+    # ------------------------------------------------------------------
+    try:
+        wire_bytes = decode_request_body(request.environ, _MAX_DECODED_REQUEST_BYTES)
+    except DecompressionError as exc:
+        return make_error_response(
+            f"request body could not be decoded: {exc}",
+            "INVALID_PARAMS",
+            400,
+            request_id=request_id,
+        )
+    if wire_bytes is None:
+        wire_bytes = request.content_length or 0
+
     # ------------------------------------------------------------------
     # Step 1: Parse multipart fields
     # ------------------------------------------------------------------
     capture_id_raw = request.form.get("capture_id", "").strip()
-    metadata_raw = request.form.get("metadata", "").strip()
     file_storage = request.files.get("file")
+    upload_id = request.form.get("upload_id", "").strip()
+
+    metadata_encoding = request.form.get("metadata_encoding", "").strip().lower()
+    if metadata_encoding:
+        metadata_part = request.files.get("metadata")
+        encoded = metadata_part.read() if metadata_part is not None else b""
+        try:
+            metadata_raw = decompress(
+                encoded, metadata_encoding, _MAX_METADATA_BYTES
+            ).decode("utf-8").strip()
+        except (DecompressionError, UnicodeDecodeError) as exc:
+            return make_error_response(
+                f"metadata could not be decoded: {exc}",
+                "INVALID_PARAMS",
+                400,
+                request_id=request_id,
+            )
+        transfer_stats.record_payload(len(encoded), len(metadata_raw))
+    else:
+        metadata_raw = request.form.get("metadata", "").strip()
 
     # ------------------------------------------------------------------
     # Step 2: Validate required fields and formats
@@ -201,8 +281,10 @@ def ingest():
             request_id=request_id,
         )
 
-    # file must be present
-    if file_storage is None or file_storage.filename == "":
+    has_file = file_storage is not None and file_storage.filename != ""
+
+    # file (or a completed resumable upload) must be present
+    if not has_file and not upload_id:
         return make_error_response(
             "file is required",
             "INVALID_PARAMS",
@@ -210,21 +292,45 @@ def ingest():
             request_id=request_id,
         )
 
-    # MIME type must be image/jpeg
-    content_type = file_storage.content_type or ""
+    if has_file:
+        # MIME type must be image/jpeg
+        content_type = file_storage.content_type or ""
 
-    # Strip parameters, e.g. "image/jpeg; charset=..."
-    mime_type = content_type.split(";")[0].strip().lower()
-    if mime_type != _ALLOWED_MIME_TYPE:
-        return make_error_response(
-            f"file must be image/jpeg, got: {content_type!r}",
-            "INVALID_PARAMS",
-            400,
-            request_id=request_id,
-        )
+        # Strip parameters, e.g. "image/jpeg; charset=..."
+        mime_type = content_type.split(";")[0].strip().lower()
+        if mime_type != _ALLOWED_MIME_TYPE:
+            return make_error_response(
+                f"file must be image/jpeg, got: {content_type!r}",
+                "INVALID_PARAMS",
+                400,
+                request_id=request_id,
+            )
 
-    # Read file bytes (needed for size check and persistence)
-    file_bytes = file_storage.read()
+        # Read file bytes (needed for size check and persistence)
+        file_bytes = file_storage.read()
+    else:
+        if upload_id != capture_id_raw:
+            return make_error_response(
+                "upload_id must equal capture_id",
+                "INVALID_PARAMS",
+                400,
+                request_id=request_id,
+            )
+        stored = _get_partial_uploads().read(capture_id_raw)
+        if not stored:
+            return make_error_response(
+                "no resumable upload found for upload_id",
+                "INVALID_PARAMS",
+                400,
+                request_id=request_id,
+            )
+        file_bytes = stored
+
+    transfer_stats.add(
+        requests=1,
+        wire_bytes=wire_bytes,
+        decoded_bytes=len(file_bytes) + len(metadata_raw),
+    )
 
     # Size check — must come AFTER reading; 413 must not write to DB
     if len(file_bytes) > _MAX_FILE_SIZE_BYTES:
@@ -307,6 +413,9 @@ def ingest():
             request_id=request_id,
         )
 
+    if upload_id:
+        _get_partial_uploads().discard(capture_id_raw)
+
     if not is_new:
         logger.debug(
             "ingest: 200 already_exists capture_id=%s frame_id=%d request_id=%s",
@@ -600,6 +709,94 @@ def _handle_accessibility_canonical_ingest(
     )
 
 
+# ---------------------------------------------------------------------------
+# Transfer negotiation and resumable uploads
+# ---------------------------------------------------------------------------
+
+
+@v1_bp.route("/ingest/capabilities", methods=["GET"])
+def ingest_capabilities():
+    """Advertise transfer features so clients can negotiate safely.
+
+    Older edges return 404 here; clients then fall back to plain multipart.
+    """
+    encodings = supported_encodings()
+    return jsonify(
+        {
+            "content_encodings": encodings,
+            "metadata_encodings": encodings,
+            "resumable": True,
+            "max_file_bytes": _MAX_FILE_SIZE_BYTES,
+        }
+    )
+
+
+@v1_bp.route("/ingest/uploads/<capture_id>", methods=["GET"])
+def resumable_upload_status(capture_id: str):
+    """Return how many bytes of a resumable upload the edge already holds."""
+    uploads = _get_partial_uploads()
+    try:
+        offset = uploads.offset(capture_id)
+    except ValueError:
+        return make_error_response(
+            "capture_id must be a UUID", "INVALID_PARAMS", 400
+        )
+    if offset > 0:
+        transfer_stats.add(resumed_uploads=1)
+    return jsonify({"capture_id": capture_id, "offset": offset})
+
+
+@v1_bp.route("/ingest/uploads/<capture_id>", methods=["PATCH"])
+def resumable_upload_append(capture_id: str):
+    """Append one chunk to a resumable upload.
+
+    Headers:
+        Upload-Offset – byte offset the chunk starts at (required)
+
+    Responses:
+        200 {"capture_id", "offset"}   — chunk stored
+        409 OFFSET_MISMATCH {"offset"} — resend from the returned offset
+        413 PAYLOAD_TOO_LARGE          — upload would exceed 10 MB
+    """
+    raw_offset = request.headers.get("Upload-Offset", "")
+    try:
+        offset = int(raw_offset)
+        if offset < 0:
+            raise ValueError(raw_offset)
+    except ValueError:
+        return make_error_response(
+            "Upload-Offset header must be a non-negative integer",
+            "INVALID_PARAMS",
+            400,
+        )
+
+    chunk = request.get_data()
+    uploads = _get_partial_uploads()
+    try:
+        new_offset = uploads.append(capture_id, offset, chunk, _MAX_FILE_SIZE_BYTES)
+    except OffsetMismatch as exc:
+        return make_error_response(
+            "Upload-Offset does not match stored data",
+            "OFFSET_MISMATCH",
+            409,
+            offset=exc.current,
+        )
+    except UploadTooLarge:
+        uploads.discard(capture_id)
+        return make_error_response(
+            f"file exceeds maximum size of {_MAX_FILE_SIZE_BYTES // (1024 * 1024)} MB",
+            "PAYLOAD_TOO_LARGE",
+            413,
+        )
+    except ValueError:
+        return make_error_response(
+            "capture_id must be a UUID", "INVALID_PARAMS", 400
+        )
+
+    transfer_stats.add(chunks_received=1, wire_bytes=len(chunk))
+    return jsonify({"capture_id": capture_id, "offset": new_offset})
+
+
 # ---------------------------------------------------------------------------
 # GET /v1/ingest/queue/status
 # ---------------------------------------------------------------------------
@@ -646,6 +843,7 @@ def queue_status():
             "trigger_channel": runtime_settings.get_trigger_channel_snapshot(),
             "capture_latency": store.get_capture_latency_summary(),
             "status_sync": store.get_status_sync_summary(),
+            "transfer": transfer_stats.snapshot(),
         }
     )
 
@@ -657,17 +855,18 @@ def queue_status():
 
 @v1_bp.route("/frames/<int:frame_id>", methods=["GET"])
 def get_frame(frame_id: int):
-    """Serve the JPEG snapshot for a frame.
+    """Serve the snapshot for a frame, whatever its storage tier.
 
     Returns:
-        200 image/jpeg  — JPEG binary
+        200 image/jpeg  — JPEG binary (image/webp or image/avif for frames
+                          moved to the compressed tier, see frame_storage.py)
         404 NOT_FOUND   — frame_id not in DB, or snapshot file missing
     """
     request_id = str(uuid.uuid4())
     store = _get_frames_store()
 
-    frame = store.get_frame(frame_id)
-    if frame is None:
+    row = store.get_snapshot_location(frame_id)
+    if row is None:
         return make_error_response(
             "frame not found",
             "NOT_FOUND",
@@ -675,8 +874,8 @@ def get_frame(frame_id: int):
             request_id=request_id,
         )
 
-    snapshot_path = frame.snapshot_path
-    if not snapshot_path:
+    location = SnapshotLocation.from_row(row)
+    if location is None:
         logger.error(
             "get_frame: snapshot_path is empty for frame_id=%d (IO_ERROR)",
             frame_id,
@@ -688,12 +887,11 @@ def get_frame(frame_id: int):
             request_id=request_id,
         )
 
-    path = Path(snapshot_path)
-    if not path.exists():
+    if not location.exists():
         logger.error(
             "get_frame: snapshot file missing frame_id=%d path=%s (IO_ERROR)",
             frame_id,
-            snapshot_path,
+            location.path,
         )
         # Read-only path: must NOT call mark_failed() or any write operation
         return make_error_response(
@@ -703,7 +901,25 @@ def get_frame(frame_id: int):
             request_id=request_id,
         )
 
-    return send_file(str(path), mimetype="image/jpeg")
+    if location.is_packed:
+        try:
+            data = location.read_bytes()
+        except OSError as exc:
+            logger.error(
+                "get_frame: archive read failed frame_id=%d path=%s: %s (IO_ERROR)",
+                frame_id,
+                location.path,
+                exc,
+            )
+            return make_error_response(
+                "frame snapshot file not found on disk",
+                "NOT_FOUND",
+                404,
+                request_id=request_id,
+            )
+        return send_file(io.BytesIO(data), mimetype=sniff_mimetype(data))
+
+    return send_file(location.path, mimetype=location.mimetype)
 
 
 # ---------------------------------------------------------------------------
@@ -754,6 +970,12 @@ def delete_frame(frame_id: int):
             exc,
         )
 
+    # Post-transaction: drop cached OCR visualization (non-blocking)
+    try:
+        get_ocr_vis_cache().discard(frame_id)
+    except OSError as exc:
+        logger.warning("delete_frame: OCR vis cleanup failed frame_id=%d: %s", frame_id, exc)
+
     # Post-transaction: delete disk JPEG (non-blocking)
     if snapshot_path:
         try:
@@ -785,11 +1007,143 @@ def delete_frame(frame_id: int):
     })
 
 
+# ---------------------------------------------------------------------------
+# DELETE /v1/frames — bulk time-range deletion
+# ---------------------------------------------------------------------------
+
+
+@v1_bp.route("/frames", methods=["DELETE"])
+def delete_frames_in_range():
+    """Delete every frame in a local time range as a background job.
+
+    Query Parameters:
+        start_time (str): Required. Local time start (inclusive).
+        end_time (str): Required. Local time end (exclusive).
+        app_name (str): Optional. Only frames of this app.
+        window_name (str): Optional. Only frames whose window title contains it.
+
+    Frames are deleted in batches of ``[retention] batch_size`` (see
+    retention.py); poll ``GET /v1/frames/deletions/<job_id>`` for progress.
+
+    Returns:
+        202 JSON       — the deletion job (job_id, status, total, ...)
+        400 INVALID_PARAMS — missing or inverted time range
+    """
+    from myrecall.server.retention import frame_range_filter, start_deletion_job
+
+    request_id = str(uuid.uuid4())
+    start_time = _parse_time_filter(request.args.get("start_time"))
+    end_time = _parse_time_filter(request.args.get("end_time"))
+    try:
+        valid = bool(start_time and end_time) and (
+            datetime.fromisoformat(start_time) < datetime.fromisoformat(end_time)
+        )
+    except (TypeError, ValueError):
+        valid = False
+    if not valid:
+        return make_error_response(
+            "start_time and end_time must be local timestamps with start_time < end_time",
+            "INVALID_PARAMS",
+            400,
+            request_id=request_id,
+        )
+
+    frame_filter = frame_range_filter(
+        start_time,
+        end_time,
+        app_name=request.args.get("app_name", "").strip() or None,
+        window_name=request.args.get("window_name", "").strip() or None,
+    )
+    try:
+        job = start_deletion_job(_get_frames_store(), frame_filter)
+    except sqlite3.Error as exc:
+        logger.exception("delete_frames_in_range: DB error: %s", exc)
+        return make_error_response(
+            "Failed to start frame deletion",
+            "INTERNAL_ERROR",
+            500,
+            request_id=request_id,
+        )
+
+    logger.info(
+        "delete_frames_in_range: job=%s frames=%d range=[%s, %s) request_id=%s",
+        job.job_id,
+        job.total,
+        start_time,
+        end_time,
+        request_id,
+    )
+    return jsonify({**job.to_dict(), "request_id": request_id}), 202
+
+
+@v1_bp.route("/frames/deletions", methods=["GET"])
+def list_frame_deletions():
+    """Return recent bulk deletion jobs (range deletes and retention runs)."""
+    from myrecall.server.retention import list_deletion_jobs
+
+    return jsonify({"jobs": [job.to_dict() for job in list_deletion_jobs()]})
+
+
+@v1_bp.route("/frames/deletions/<job_id>", methods=["GET"])
+def get_frame_deletion(job_id: str):
+    """Return the progress of one bulk deletion job."""
+    from myrecall.server.retention import get_deletion_job
+
+    job = get_deletion_job(job_id)
+    if job is None:
+        return make_error_response("deletion job not found", "NOT_FOUND", 404)
+    return jsonify(job.to_dict())
+
+
+# ---------------------------------------------------------------------------
+# GET /v1/storage/tiers — snapshot storage tier report
+# ---------------------------------------------------------------------------
+
+
+@v1_bp.route("/storage/tiers", methods=["GET"])
+def storage_tiers():
+    """Report snapshot storage per tier (see frame_storage.py).
+
+    Query Parameters:
+        sample (int): Frames per tier to time reads on (default 5, max 50).
+
+    Returns:
+        JSON with ``tiers`` (tier, frames, ingested_bytes, stored_bytes,
+        saved_bytes, read_ms_p50, decode_ms_p50) and ``last_run`` (the
+        latest tiering run in this process, or null).
+    """
+    from myrecall.server.frame_storage import last_tiering_result, tier_report
+
+    sample = min(max(request.args.get("sample", 5, type=int) or 0, 0), 50)
+    last_run = last_tiering_result()
+    return jsonify({
+        "tiers": tier_report(_get_frames_store(), sample=sample),
+        "last_run": last_run.to_dict() if last_run else None,
+    })
+
+
 # ---------------------------------------------------------------------------
 # GET /v1/frames/<frame_id>/context
 # ---------------------------------------------------------------------------
 
 
+@v1_bp.route("/frames/<int:frame_id>/text", methods=["GET"])
+def frame_text(frame_id: int):
+    """Return a frame's full accessibility/OCR text.
+
+    The memories lists omit these bodies unless asked (``include=``); the
+    grid fetches them here when a frame is opened.
+    """
+    text = _get_frames_store().get_frame_text(frame_id)
+    if text is None:
+        return make_error_response(
+            f"Frame {frame_id} not found",
+            "NOT_FOUND",
+            404,
+        )
+    return jsonify(text)
+
+
 @v1_bp.route("/frames/<int:frame_id>/context", methods=["GET"])
 def get_frame_context(frame_id: int):
     """Return frame context for chat grounding.
@@ -812,8 +1166,8 @@ def get_frame_context(frame_id: int):
             request_id=request_id,
         )
 
-    # Check if frame is queryable
-    if context.get("visibility_status") != "queryable":
+    # Check if frame is visible to search (see processing.visibility_mode)
+    if not is_text_visible(context.get("status"), context.get("visibility_status")):
         return make_error_response(
             "frame not ready for querying",
             "NOT_READY",
@@ -844,12 +1198,15 @@ def get_frame_context(frame_id: int):
     except Exception as e:
         logger.warning(f"Failed to get description for frame {frame_id}: {e}")
 
-    # Remove visibility_status from response (internal field)
-    context.pop("visibility_status", None)
+    return jsonify(_frame_context_result(context, description, description_status))
+
 
-    # Insert description at the correct field position (after window_name, before text)
-    # Build ordered result dict
-    result = {
+def _frame_context_result(
+    context: dict, description: Optional[dict], description_status: Optional[str]
+) -> dict:
+    """Frame context response body, with the description after window_name."""
+    # visibility_status is internal and not part of the response
+    return {
         "frame_id": context["frame_id"],
         "timestamp": context["timestamp"],
         "app_name": context["app_name"],
@@ -863,7 +1220,73 @@ def get_frame_context(frame_id: int):
         "status": context["status"],
     }
 
-    return jsonify(result)
+
+MAX_CONTEXT_IDS = 100
+
+
+@v1_bp.route("/frames/context", methods=["GET"])
+def get_frame_contexts():
+    """Return frame context for several frames in one call.
+
+    Query params:
+        ids: comma-separated frame ids (at most ``MAX_CONTEXT_IDS``)
+
+    All frames are read with one query (text truncated in SQL) plus one
+    description query, instead of a context request per frame.
+
+    Returns:
+        200 JSON — ``data`` (one ``/frames/<id>/context`` body per found,
+            queryable frame, in request order), ``not_found`` and
+            ``not_ready`` (frame ids)
+        400 INVALID_PARAMS — ids missing or malformed
+    """
+    request_id = str(uuid.uuid4())
+    try:
+        frame_ids = list(dict.fromkeys(
+            int(part) for part in request.args.get("ids", "").split(",") if part.strip()
+        ))
+    except ValueError:
+        return make_error_response(
+            "ids must be comma-separated integers",
+            "INVALID_PARAMS",
+            400,
+            request_id=request_id,
+        )
+    if not 1 <= len(frame_ids) <= MAX_CONTEXT_IDS:
+        return make_error_response(
+            f"ids must list 1 to {MAX_CONTEXT_IDS} frame ids",
+            "INVALID_PARAMS",
+            400,
+            request_id=request_id,
+        )
+
+    store = _get_frames_store()
+    contexts = store.get_frame_contexts(frame_ids)
+    ready = [
+        frame_id for frame_id in frame_ids
+        if frame_id in contexts
+        and is_text_visible(contexts[frame_id]["status"], contexts[frame_id]["visibility_status"])
+    ]
+    described = [
+        frame_id for frame_id in ready
+        if contexts[frame_id]["description_status"] == "completed"
+    ]
+    descriptions = store.get_frame_descriptions_batch(described, include_model=True)
+
+    return jsonify({
+        "data": [
+            _frame_context_result(
+                contexts[frame_id],
+                descriptions.get(frame_id),
+                contexts[frame_id]["description_status"],
+            )
+            for frame_id in ready
+        ],
+        "not_found": [frame_id for frame_id in frame_ids if frame_id not in contexts],
+        "not_ready": [
+            frame_id for frame_id in frame_ids if frame_id in contexts and frame_id not in ready
+        ],
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -876,7 +1299,8 @@ def get_ocr_visualization(frame_id: int):
     """Serve the OCR visualization image for a frame.
 
     The visualization shows the original screenshot with OCR bounding boxes
-    and recognized text overlaid.
+    overlaid. It is rendered on first request from the stored boxes
+    (``ocr_text.text_json``) and kept in a bounded LRU disk cache.
 
     Returns:
         200 image/jpeg  — JPEG binary with OCR boxes overlaid
@@ -904,17 +1328,43 @@ def get_ocr_visualization(frame_id: int):
             request_id=request_id,
         )
 
-    # Build path to visualization image
-    vis_path = settings.server_data_dir / "ocr_vis" / f"{frame_id}.jpg"
-    if not vis_path.exists():
+    cache = get_ocr_vis_cache()
+    vis_path = cache.get(frame_id)
+    if vis_path is not None:
+        return send_file(str(vis_path), mimetype="image/jpeg")
+
+    boxes = store.get_ocr_boxes(frame_id)
+    location = location_for_frame(store, frame_id)
+    if boxes is None or location is None:
         return make_error_response(
-            "OCR visualization file not found",
+            "OCR visualization not available (no OCR boxes)",
             "NOT_FOUND",
             404,
             request_id=request_id,
         )
 
-    return send_file(str(vis_path), mimetype="image/jpeg")
+    try:
+        with location.open() as snapshot:
+            data = render_ocr_visualization(snapshot, boxes, scale=location.scale)
+    except OSError as exc:
+        logger.warning(
+            "get_ocr_visualization: render failed frame_id=%d path=%s: %s",
+            frame_id,
+            location.path,
+            exc,
+        )
+        return make_error_response(
+            "frame snapshot file not found on disk",
+            "NOT_FOUND",
+            404,
+            request_id=request_id,
+        )
+
+    try:
+        cache.put(frame_id, data)
+    except OSError as exc:
+        logger.warning("get_ocr_visualization: cache write failed frame_id=%d: %s", frame_id, exc)
+    return send_file(io.BytesIO(data), mimetype="image/jpeg")
 
 
 # ---------------------------------------------------------------------------
@@ -933,6 +1383,7 @@ def health():
         frame_status        — "ok" | "stale"
         message             — human-readable description
         queue               — { pending, processing, failed }
+        models              — pooled local models: load_seconds, memory_bytes, refcount
     """
     store = _get_frames_store()
     try:
@@ -1014,10 +1465,44 @@ def health():
                 "failed": failed_count,
             },
             "capture_runtime": capture_runtime_snapshot,
+            "models": model_pool.stats(),
         }
     )
 
 
+# ---------------------------------------------------------------------------
+# GET /v1/visibility/latency
+# ---------------------------------------------------------------------------
+
+
+@v1_bp.route("/visibility/latency", methods=["GET"])
+def visibility_latency():
+    """Time from ingest until frames become searchable.
+
+    Query Parameters:
+        hours: Look-back window over ingest time (default 24)
+
+    Returns ``mode`` (processing.visibility_mode) and, for
+    text_searchable / vector_searchable / fully_enriched, the count and
+    p50/p95/max seconds since ingest.
+    """
+    try:
+        hours = float(request.args.get("hours", 24))
+    except (ValueError, TypeError):
+        hours = 24.0
+    hours = max(0.0, hours)
+    since = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat(
+        timespec="milliseconds"
+    ).replace("+00:00", "Z")
+
+    store = _get_frames_store()
+    return jsonify({
+        "mode": visibility_mode(),
+        "window_hours": hours,
+        **store.get_visibility_latency(since),
+    })
+
+
 # ---------------------------------------------------------------------------
 # GET /v1/search
 # ---------------------------------------------------------------------------
@@ -1054,6 +1539,9 @@ def search():
         focused: Filter by focused state (true/false)
         include_text: Include text field in response (default: false)
         max_text_length: Maximum text length when include_text=true (default: 200)
+        include: Comma-separated optional fields; "text" is include_text=true
+        fields: Comma-separated keys to keep in each result. Descriptions
+            are only looked up when "description" is kept.
 
     Returns:
         JSON response with flat frame objects (no content wrapper, no type/tags/file_path).
@@ -1094,7 +1582,8 @@ def search():
 
     # Parse include_text (default false)
     include_text_str = request.args.get("include_text", "false").strip().lower()
-    include_text = include_text_str in ("true", "1", "yes")
+    fields, include = parse_projection(request.args, ("text",))
+    include_text = include_text_str in ("true", "1", "yes") or "text" in include
 
     # Parse max_text_length (default 200)
     try:
@@ -1167,8 +1656,9 @@ def search():
 
     # Batch fetch descriptions for all frame_ids
     frame_ids = [r.get("frame_id") for r in results if r.get("frame_id")]
-    store = _get_frames_store()
-    descriptions = store.get_frame_descriptions_batch(frame_ids) if frame_ids else {}
+    descriptions = {}
+    if frame_ids and (fields is None or "description" in fields):
+        descriptions = _get_frames_store().get_frame_descriptions_batch(frame_ids)
 
     # Build response with flat structure
     data_items = []
@@ -1212,7 +1702,7 @@ def search():
 
     return jsonify(
         {
-            "data": data_items,
+            "data": project(data_items, fields),
             "pagination": {
                 "limit": limit,
                 "offset": offset,
@@ -1299,17 +1789,93 @@ def timeline():
 
     Query Parameters:
         limit: Max results (default 5000, max 10000)
+        fields: Comma-separated keys to keep in each frame
     """
     limit = request.args.get("limit", 5000, type=int)
+    fields, _ = parse_projection(request.args, ())
     store = _get_frames_store()
     try:
         frames = store.get_timeline_frames(limit=limit)
-        return jsonify(frames), 200
+        return jsonify(project(frames, fields)), 200
     except Exception:
         logger.exception("Error fetching timeline frames")
         return jsonify({"error": "failed to fetch timeline frames"}), 500
 
 
+# Timeline density zoom: bucket widths are whole activity-rollup buckets
+_DENSITY_MIN_BUCKET_SECONDS = 300
+_DENSITY_MAX_BUCKET_SECONDS = 86400
+_DENSITY_MAX_BUCKETS = 2000
+
+
+@v1_bp.route("/timeline/density", methods=["GET"])
+def timeline_density():
+    """Return frame density in fixed-width buckets for the timeline scrubber.
+
+    Query Parameters:
+        start_time (str): Required. Local time start (e.g. "2026-04-01").
+        end_time (str): Required. Local time end (e.g. "2026-05-01").
+        bucket_seconds (int): Bucket width, a multiple of 300 up to 86400
+            (default 3600). Buckets are aligned to local midnight and the
+            range is widened to whole buckets.
+
+    Returns:
+        JSON with start, end, bucket_seconds and the non-empty ``buckets``
+        (start, frame_count, active_minutes, dominant_app, frame_id).
+        frame_count covers every captured frame, including ones still
+        being processed, as ``/v1/timeline`` does.
+    """
+    request_id = str(uuid.uuid4())
+    start_raw = _parse_time_filter(request.args.get("start_time"))
+    end_raw = _parse_time_filter(request.args.get("end_time"))
+    bucket_seconds = request.args.get("bucket_seconds", 3600, type=int)
+    try:
+        start = datetime.fromisoformat(start_raw) if start_raw else None
+        end = datetime.fromisoformat(end_raw) if end_raw else None
+    except ValueError:
+        start = end = None
+    if start is None or end is None or start.tzinfo or end.tzinfo or end <= start:
+        return make_error_response(
+            "start_time and end_time must be local timestamps with start_time < end_time",
+            "INVALID_PARAMS",
+            400,
+            request_id=request_id,
+        )
+    if (
+        bucket_seconds is None
+        or not _DENSITY_MIN_BUCKET_SECONDS <= bucket_seconds <= _DENSITY_MAX_BUCKET_SECONDS
+        or bucket_seconds % _DENSITY_MIN_BUCKET_SECONDS
+    ):
+        return make_error_response(
+            "bucket_seconds must be a multiple of 300 between 300 and 86400",
+            "INVALID_PARAMS",
+            400,
+            request_id=request_id,
+        )
+
+    width = timedelta(seconds=bucket_seconds)
+    midnight = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    start = midnight + (start - midnight) // width * width
+    bucket_count = -(-(end - start) // width)
+    if bucket_count > _DENSITY_MAX_BUCKETS:
+        return make_error_response(
+            f"range spans {bucket_count} buckets; use a wider bucket_seconds "
+            f"(max {_DENSITY_MAX_BUCKETS} buckets)",
+            "INVALID_PARAMS",
+            400,
+            request_id=request_id,
+        )
+    end = start + bucket_count * width
+
+    buckets = _get_frames_store().get_timeline_density(start, end, bucket_seconds)
+    return jsonify({
+        "start": start.strftime("%Y-%m-%dT%H:%M:%S"),
+        "end": end.strftime("%Y-%m-%dT%H:%M:%S"),
+        "bucket_seconds": bucket_seconds,
+        "buckets": buckets,
+    })
+
+
 # IMPORTANT: This route MUST be registered AFTER /v1/search to avoid shadowing
 # the main search route. Flask matches routes in registration order, and
 # /v1/search is a prefix that would otherwise match /v1/search/keyword.
@@ -1420,6 +1986,94 @@ def activity_summary():
     })
 
 
+# ---------------------------------------------------------------------------
+# POST /v1/batch — several read-only calls in one round trip
+# ---------------------------------------------------------------------------
+
+
+@v1_bp.route("/batch", methods=["POST"])
+def batch():
+    """Run several read-only v1 GET calls in one request (see batch.py).
+
+    Body:
+        requests (list): Up to 10 ``{"id", "path", "params"}`` calls, e.g.
+            ``/v1/activity-summary``, ``/v1/search``,
+            ``/v1/frames/{frame_id}/context``. A call with ``frames_from``
+            (an earlier id) and ``top`` runs once per frame id in that
+            call's first ``top`` results.
+        max_chars (int): Character budget for the whole response
+            (default 16000, 1000-200000). Long text is middle-truncated,
+            then trailing list items are dropped.
+
+    Returns:
+        200 JSON — ``results`` keyed by call id (``status`` + ``body``, or
+                   ``items`` for frames_from calls), ``max_chars``, ``truncated``
+        400 INVALID_PARAMS — malformed body or non-batchable path
+    """
+    from myrecall.server.batch import BatchError, execute_batch
+
+    request_id = str(uuid.uuid4())
+    try:
+        body = execute_batch(current_app._get_current_object(), request.get_json(silent=True))
+    except BatchError as exc:
+        return make_error_response(str(exc), "INVALID_PARAMS", 400, request_id=request_id)
+    return jsonify({**body, "request_id": request_id})
+
+
+# ---------------------------------------------------------------------------
+# Activity rollup maintenance
+# ---------------------------------------------------------------------------
+
+
+@v1_bp.route("/admin/activity-rollups/rebuild", methods=["POST"])
+def activity_rollups_rebuild():
+    """Recompute the activity-summary rollups from all queryable frames."""
+    request_id = str(uuid.uuid4())
+    store = _get_frames_store()
+
+    try:
+        count = store.rebuild_activity_rollups()
+    except sqlite3.Error as exc:
+        logger.exception("activity_rollups_rebuild failed: %s request_id=%s", exc, request_id)
+        return make_error_response(
+            "Failed to rebuild activity rollups",
+            "INTERNAL_ERROR",
+            500,
+            request_id=request_id,
+        )
+
+    return jsonify({
+        "message": "Rollups rebuilt",
+        "bucket_count": count,
+        "request_id": request_id,
+    }), 200
+
+
+@v1_bp.route("/admin/activity-rollups/check", methods=["GET"])
+def activity_rollups_check():
+    """Compare rollup-based activity summary with the raw frame query.
+
+    Takes the same start_time/end_time/app_name parameters as
+    /v1/activity-summary.
+    """
+    request_id = str(uuid.uuid4())
+    start_time_raw = request.args.get("start_time", "").strip()
+    end_time_raw = request.args.get("end_time", "").strip()
+    start_time = _parse_time_filter(start_time_raw) or start_time_raw
+    end_time = _parse_time_filter(end_time_raw) or end_time_raw
+    if not start_time or not end_time:
+        return make_error_response(
+            "start_time and end_time are required",
+            "INVALID_PARAMS",
+            400,
+            request_id=request_id,
+        )
+    app_name = (request.args.get("app_name") or "").strip() or None
+
+    result = _get_frames_store().check_activity_rollups(start_time, end_time, app_name)
+    return jsonify({**result, "request_id": request_id})
+
+
 # ---------------------------------------------------------------------------
 # POST /v1/frames/<frame_id>/description — manual trigger
 # ---------------------------------------------------------------------------
@@ -1448,6 +2102,10 @@ def trigger_description(frame_id: int):
             "request_id": request_id,
         }), 409
     if description_status in ("pending", "processing"):
+        if description_status == "pending":
+            # Still waiting: move it ahead of live ingest and backfill
+            with store._connect() as conn:
+                store.insert_description_task(conn, frame_id, lane=LANE_USER)
         return jsonify({
             "error": "Description already queued/processing",
             "code": "ALREADY_QUEUED",
@@ -1455,7 +2113,7 @@ def trigger_description(frame_id: int):
         }), 409
 
     with store._connect() as conn:
-        store.insert_description_task(conn, frame_id)
+        store.insert_description_task(conn, frame_id, lane=LANE_USER)
         conn.commit()
 
         row = conn.execute(
@@ -1480,11 +2138,21 @@ def trigger_description(frame_id: int):
 
 @v1_bp.route("/description/tasks/status", methods=["GET"])
 def description_queue_status():
-    """Return description task queue statistics."""
+    """Return description task queue statistics.
+
+    ``lanes`` breaks the queue down by scheduling lane (live, user,
+    backfill) with pending/processing counts and wait times.
+    ``dispatch`` reports remote provider requests in this process:
+    in_flight, completed/failed/throttled totals, throughput_per_min over
+    the last minute and latency_ms_p50/p95 over recent requests.
+    """
+    from myrecall.server.description.providers.dispatch import dispatch_metrics
+
     store = _get_frames_store()
     with store._connect() as conn:
         status = store.get_description_queue_status(conn)
-        return jsonify(status)
+        lanes = store.get_task_lane_status(conn, "description")
+        return jsonify({**status, "lanes": lanes, "dispatch": dispatch_metrics.snapshot()})
 
 
 # ---------------------------------------------------------------------------
@@ -1516,14 +2184,12 @@ def description_backfill():
 
 @v1_bp.route("/embedding/tasks/status", methods=["GET"])
 def embedding_tasks_status():
-    """Return embedding task queue statistics."""
-    from myrecall.server.embedding.service import EmbeddingService
-
+    """Return embedding task queue statistics, with a per-lane ``lanes`` breakdown."""
     store = _get_frames_store()
-    service = EmbeddingService(store=store)
 
     with store._connect() as conn:
-        status = service.get_queue_status(conn)
+        status = store.get_embedding_queue_status(conn)
+        status["lanes"] = store.get_task_lane_status(conn, "embedding")
 
     return jsonify(status)
 
@@ -1600,6 +2266,9 @@ def create_frame_embedding(frame_id: int):
         ).fetchone()
 
         if existing and existing[1] in ("pending", "processing"):
+            if existing[1] == "pending":
+                # Still waiting: move it ahead of live ingest and backfill
+                store.insert_embedding_task(conn, frame_id, lane=LANE_USER)
             return jsonify({
                 "error": "Embedding task already queued",
                 "code": "ALREADY_QUEUED",
@@ -1608,7 +2277,7 @@ def create_frame_embedding(frame_id: int):
             }), 409
 
         # Enqueue embedding task
-        store.insert_embedding_task(conn, frame_id)
+        store.insert_embedding_task(conn, frame_id, lane=LANE_USER)
         conn.commit()
 
         row = conn.execute(
@@ -1631,14 +2300,18 @@ def frames_latest():
 
     Query Parameters:
         since (str): Local timestamp (e.g. "2026-04-26T16:30:00.123")
+        include (str): Full text fields to add (accessibility_text, ocr_text);
+            omitted by default, see /v1/frames/<frame_id>/text.
+        fields (str): Comma-separated keys to keep in each frame.
 
     Returns:
         JSON list of frame objects with local timestamps.
     """
     since_str = request.args.get("since", "1970-01-01T00:00:00")
+    fields, include = parse_projection(request.args, MEMORY_TEXT_FIELDS)
     store = _get_frames_store()
-    memories = store.get_memories_since(since_str)
-    return jsonify(memories), 200
+    memories = store.get_memories_since(since_str, include=include)
+    return jsonify(project(memories, fields)), 200
 
 
 @v1_bp.route("/admin/embedding/backfill", methods=["POST"])
@@ -1667,27 +2340,23 @@ def embedding_backfill():
 
 @v1_bp.route("/admin/frames/retry-failed", methods=["POST"])
 def retry_failed_frames():
-    """Reset all failed frames to pending for reprocessing."""
-    request_id = str(uuid.uuid4())
-    store = _get_frames_store()
+    """Start resetting all failed frames to pending for reprocessing.
 
-    try:
-        result = store.reset_failed_frames()
+    Frames are reset in chunks of ``[recovery] batch_size`` on a background
+    job (see recovery.py); poll ``GET /v1/admin/frames/retry-failed/<job_id>``
+    for progress. If a recovery is already running, that job is returned.
 
-        logger.info(
-            "retry_failed_frames: reset_count=%d breakdown=%s request_id=%s",
-            result["total"],
-            result["breakdown"],
-            request_id,
-        )
+    Returns:
+        202 JSON — the recovery job (job_id, status, total, reset_count,
+                   breakdown, progress, ...)
+    """
+    from myrecall.server.recovery import start_recovery_job
 
-        return jsonify({
-            "message": "Retry triggered",
-            "reset_count": result["total"],
-            "breakdown": result["breakdown"],
-            "request_id": request_id,
-        }), 200
+    request_id = str(uuid.uuid4())
+    store = _get_frames_store()
 
+    try:
+        job = start_recovery_job(store)
     except Exception as exc:
         logger.exception("retry_failed_frames failed: %s request_id=%s", exc, request_id)
         return make_error_response(
@@ -1697,6 +2366,29 @@ def retry_failed_frames():
             request_id=request_id,
         )
 
+    logger.info(
+        "retry_failed_frames: job=%s failed_frames=%d request_id=%s",
+        job.job_id,
+        job.total,
+        request_id,
+    )
+    return jsonify({
+        "message": "Retry started",
+        **job.to_dict(),
+        "request_id": request_id,
+    }), 202
+
+
+@v1_bp.route("/admin/frames/retry-failed/<job_id>", methods=["GET"])
+def get_retry_failed_job(job_id: str):
+    """Return the progress of one failed-frame recovery job."""
+    from myrecall.server.recovery import get_recovery_job
+
+    job = get_recovery_job(job_id)
+    if job is None:
+        return make_error_response("recovery job not found", "NOT_FOUND", 404)
+    return jsonify(job.to_dict())
+
 
 # ---------------------------------------------------------------------------
 # Settings endpoints
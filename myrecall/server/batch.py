@@ -0,0 +1,199 @@
+"""``POST /v1/batch``: several read-only v1 calls in one round trip.
+
+The chat agent's progressive-disclosure flow (activity summary → search →
+frame context) used to take one HTTP round trip per step and per frame.
+A batch names the calls up front:
+
+    {"max_chars": 12000,
+     "requests": [
+       {"id": "summary", "path": "/v1/activity-summary", "params": {...}},
+       {"id": "hits", "path": "/v1/search", "params": {"q": "PR", ...}},
+       {"id": "ctx", "path": "/v1/frames/{frame_id}/context",
+        "frames_from": "hits", "top": 3}
+     ]}
+
+Calls without ``frames_from`` run in parallel. A ``frames_from`` call runs
+once per frame id in the first ``top`` items of the named earlier call's
+result (search ``data``, activity-summary ``descriptions`` or
+``similar_frames``), in parallel, after that call finishes. Each call goes
+through the regular view function, so parameters, defaults and errors
+match the REST endpoints. The combined result is trimmed to ``max_chars``
+(see ``utils/budget.py``).
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from flask import Flask
+from werkzeug.exceptions import HTTPException
+
+from myrecall.server.utils.budget import fit_to_budget
+
+logger = logging.getLogger(__name__)
+
+# Read-only endpoints a batch may call
+ALLOWED_ENDPOINTS = frozenset({
+    "v1.activity_summary",
+    "v1.search",
+    "v1.search_counts",
+    "v1.timeline_density",
+    "v1.get_frame_context",
+    "v1.get_frame_contexts",
+    "v1.frame_text",
+    "v1.similar_frames",
+})
+MAX_REQUESTS = 10
+MAX_TOP = 10
+MAX_WORKERS = 4
+DEFAULT_MAX_CHARS = 16000
+MIN_MAX_CHARS = 1000
+MAX_MAX_CHARS = 200000
+
+# Result lists whose items carry a frame_id, in lookup order
+_FRAME_LISTS = ("data", "descriptions", "similar_frames")
+
+
+class BatchError(ValueError):
+    """The batch request is malformed."""
+
+
+@dataclass(frozen=True)
+class BatchCall:
+    """One call of a batch."""
+
+    id: str
+    path: str
+    params: dict
+    frames_from: Optional[str] = None
+    top: int = 3
+
+
+def parse_batch(app: Flask, payload: Any) -> tuple[list[BatchCall], int]:
+    """Validate a batch body; returns (calls, max_chars).
+
+    Raises:
+        BatchError: On a malformed body, unknown or non-allowed paths,
+            duplicate ids or a ``frames_from`` that does not name an
+            earlier call without ``frames_from``.
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get("requests"), list):
+        raise BatchError("body must be a JSON object with a 'requests' list")
+    entries = payload["requests"]
+    if not 1 <= len(entries) <= MAX_REQUESTS:
+        raise BatchError(f"'requests' must hold 1 to {MAX_REQUESTS} entries")
+
+    max_chars = payload.get("max_chars", DEFAULT_MAX_CHARS)
+    if isinstance(max_chars, bool) or not isinstance(max_chars, int):
+        raise BatchError("'max_chars' must be an integer")
+    max_chars = min(max(max_chars, MIN_MAX_CHARS), MAX_MAX_CHARS)
+
+    adapter = app.url_map.bind("localhost")
+    calls: list[BatchCall] = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise BatchError(f"requests[{index}] must be an object")
+        call_id = str(entry.get("id") or index)
+        if any(call.id == call_id for call in calls):
+            raise BatchError(f"duplicate request id {call_id!r}")
+        path = entry.get("path")
+        params = entry.get("params") or {}
+        if not isinstance(path, str) or not isinstance(params, dict):
+            raise BatchError(f"requests[{index}] needs a 'path' string and 'params' object")
+
+        frames_from = entry.get("frames_from")
+        top = entry.get("top", 3)
+        if frames_from is not None:
+            source = next((call for call in calls if call.id == frames_from), None)
+            if source is None:
+                raise BatchError(
+                    f"requests[{index}].frames_from must name an earlier request id"
+                )
+            if source.frames_from is not None:
+                # Its result is a list of per-frame items, not a frame list
+                raise BatchError(
+                    f"requests[{index}].frames_from cannot name another frames_from request"
+                )
+            if "{frame_id}" not in path:
+                raise BatchError(f"requests[{index}].path needs a {{frame_id}} placeholder")
+            if isinstance(top, bool) or not isinstance(top, int) or not 1 <= top <= MAX_TOP:
+                raise BatchError(f"requests[{index}].top must be 1 to {MAX_TOP}")
+
+        try:
+            endpoint, _ = adapter.match(path.replace("{frame_id}", "0"), method="GET")
+        except HTTPException:
+            endpoint = None
+        if endpoint not in ALLOWED_ENDPOINTS:
+            raise BatchError(f"requests[{index}].path {path!r} is not a batchable endpoint")
+
+        calls.append(BatchCall(call_id, path, params, frames_from, top))
+    return calls, max_chars
+
+
+def _dispatch(app: Flask, path: str, params: dict) -> dict:
+    """Run one GET through the app; returns {"status", "body"}."""
+    try:
+        with app.test_request_context(path, method="GET", query_string=params):
+            response = app.full_dispatch_request()
+        return {"status": response.status_code, "body": response.get_json(silent=True)}
+    except Exception as exc:
+        logger.exception("batch: %s failed: %s", path, exc)
+        return {"status": 500, "body": {"error": "internal error", "code": "INTERNAL_ERROR"}}
+
+
+def _frame_ids(result: dict, top: int) -> list[int]:
+    body = result.get("body")
+    if result.get("status") != 200 or not isinstance(body, dict):
+        return []
+    for key in _FRAME_LISTS:
+        items = body.get(key)
+        if isinstance(items, list):
+            ids = []
+            for item in items:
+                frame_id = item.get("frame_id") if isinstance(item, dict) else None
+                if isinstance(frame_id, int) and frame_id not in ids:
+                    ids.append(frame_id)
+            return ids[:top]
+    return []
+
+
+def run_batch(app: Flask, calls: list[BatchCall]) -> dict:
+    """Run ``calls`` and return their results keyed by call id.
+
+    A ``frames_from`` call's result is ``{"status": 200, "items": [...]}``
+    with one ``{"frame_id", "status", "body"}`` entry per frame.
+    """
+    results: dict[str, dict] = {}
+    pending = list(calls)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="v1-batch") as pool:
+        # Each round runs every call whose dependency is done, all in parallel
+        while pending:
+            ready = [c for c in pending if c.frames_from is None or c.frames_from in results]
+            pending = [c for c in pending if c not in ready]
+            jobs = []
+            for call in ready:
+                if call.frames_from is None:
+                    jobs.append((call, None, pool.submit(_dispatch, app, call.path, call.params)))
+                    continue
+                results[call.id] = {"status": 200, "items": []}
+                for frame_id in _frame_ids(results[call.frames_from], call.top):
+                    path = call.path.replace("{frame_id}", str(frame_id))
+                    jobs.append((call, frame_id, pool.submit(_dispatch, app, path, call.params)))
+            for call, frame_id, future in jobs:
+                if frame_id is None:
+                    results[call.id] = future.result()
+                else:
+                    results[call.id]["items"].append({"frame_id": frame_id, **future.result()})
+    return {call.id: results[call.id] for call in calls}
+
+
+def execute_batch(app: Flask, payload: Any) -> dict:
+    """Parse, run and trim a batch; the ``POST /v1/batch`` response body.
+
+    Raises:
+        BatchError: If the payload is malformed (see ``parse_batch``).
+    """
+    calls, max_chars = parse_batch(app, payload)
+    results, truncated = fit_to_budget(run_batch(app, calls), max_chars)
+    return {"results": results, "max_chars": max_chars, "truncated": truncated}
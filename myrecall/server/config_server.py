@@ -38,6 +38,18 @@ class ServerSettings(TOMLConfig):
     ocr_model_name: str = ""
     ocr_rapid_version: str = "PP-OCRv4"
     ocr_model_type: str = "mobile"
+    ocr_vis_eager: bool = False  # also write ocr_vis/<id>.jpg while OCRing each frame
+    ocr_vis_cache_mb: int = 256  # disk budget for rendered OCR visualizations
+    ocr_det_limit_side_len: int = 960  # detection input long side
+    ocr_pool_size: int = 1  # independent engines; frames OCR'd concurrently when > 1
+    ocr_intra_op_threads: int = 0  # ONNX Runtime threads per engine, 0 = ORT default
+    ocr_inter_op_threads: int = 0
+    ocr_cpu_mem_arena: bool = False
+    ocr_warmup: bool = True  # run one inference per engine at startup
+    ocr_use_cls: bool = True  # text-angle classifier; screen text is rarely rotated
+    ocr_batch_frames: int = 1  # frames per cross-frame recognition batch, 1 = off
+    ocr_rec_batch_size: int = 6  # text lines per recognizer forward pass
+    ocr_decode_max_side: int = 2000  # JPEG DCT-scaled decode target, 0 = full size
 
     # [description] - Independent configuration (no fallback to [ai])
     description_enabled: bool = True
@@ -46,6 +58,9 @@ class ServerSettings(TOMLConfig):
     description_api_key: str = ""
     description_api_base: str = ""
     description_request_timeout: int = 120  # NEW
+    description_batch_size: int = 1  # >1 enables batched generation (local provider)
+    description_max_concurrency: int = 8  # in-flight requests (remote providers)
+    description_rate_limit: float = 0.0  # requests/second (remote providers), 0 = unlimited
 
     # [reranker]
     reranker_enabled: bool = False
@@ -66,6 +81,9 @@ class ServerSettings(TOMLConfig):
     processing_mode: str = "ocr"
     processing_queue_capacity: int = 200
     processing_preload_models: bool = True
+    processing_backfill_share: float = 0.1  # min share of task claims for backfill
+    processing_max_wait_seconds: int = 900  # live/user tasks waiting longer jump the lane order
+    processing_visibility_mode: str = "complete"  # "complete" | "staged" search visibility
 
     # [ui]
     ui_show_ai_description: bool = True
@@ -73,6 +91,26 @@ class ServerSettings(TOMLConfig):
     # [advanced]
     fusion_log_enabled: bool = False
 
+    # [storage]
+    storage_compact_trees_after_days: int = 0
+    storage_compress_after_days: int = 0  # snapshot -> WebP/AVIF tier, 0 = off
+    storage_compress_format: str = "webp"  # "webp" | "avif" (if Pillow supports it)
+    storage_compress_quality: int = 60
+    storage_compress_max_side: int = 0  # downscale long side when compressing, 0 = keep
+    storage_archive_after_days: int = 0  # snapshot -> per-day pack file, 0 = off
+    storage_tiering_interval_minutes: int = 60
+    storage_tiering_batch_size: int = 200
+
+    # [retention]
+    retention_max_age_days: int = 0  # default rule for all frames, 0 = keep forever
+    retention_rules: tuple = ()  # [[retention.rules]] max_age_days + app_name / window_name
+    retention_interval_minutes: int = 60  # background pruner period
+    retention_batch_size: int = 500  # frames per bulk-delete transaction
+
+    # [recovery]
+    recovery_batch_size: int = 500  # failed frames reset per transaction
+    recovery_batch_pause_ms: int = 5  # yield the write lock to ingest between chunks
+
     @classmethod
     def _default_filename(cls) -> str:
         """Return default config filename for server."""
@@ -97,12 +135,27 @@ class ServerSettings(TOMLConfig):
             ocr_model_name=data.get("ocr.model_name", ""),
             ocr_rapid_version=data.get("ocr.rapid_version", "PP-OCRv4"),
             ocr_model_type=data.get("ocr.model_type", "mobile"),
+            ocr_vis_eager=data.get("ocr.vis_eager", False),
+            ocr_vis_cache_mb=data.get("ocr.vis_cache_mb", 256),
+            ocr_det_limit_side_len=data.get("ocr.det_limit_side_len", 960),
+            ocr_pool_size=data.get("ocr.pool_size", 1),
+            ocr_intra_op_threads=data.get("ocr.intra_op_threads", 0),
+            ocr_inter_op_threads=data.get("ocr.inter_op_threads", 0),
+            ocr_cpu_mem_arena=data.get("ocr.cpu_mem_arena", False),
+            ocr_warmup=data.get("ocr.warmup", True),
+            ocr_use_cls=data.get("ocr.use_cls", True),
+            ocr_batch_frames=data.get("ocr.batch_frames", 1),
+            ocr_rec_batch_size=data.get("ocr.rec_batch_size", 6),
+            ocr_decode_max_side=data.get("ocr.decode_max_side", 2000),
             description_enabled=data.get("description.enabled", True),
             description_provider=data.get("description.provider", "local"),
             description_model=data.get("description.model", ""),
             description_api_key=data.get("description.api_key", ""),
             description_api_base=data.get("description.api_base", ""),
             description_request_timeout=data.get("description.request_timeout", 120),  # NEW
+            description_batch_size=data.get("description.batch_size", 1),
+            description_max_concurrency=data.get("description.max_concurrency", 8),
+            description_rate_limit=data.get("description.rate_limit", 0.0),
             reranker_enabled=data.get("reranker.enabled", False),
             reranker_mode=data.get("reranker.mode", "api"),
             reranker_url=data.get("reranker.url", "http://localhost:8083/rerank"),
@@ -117,8 +170,27 @@ class ServerSettings(TOMLConfig):
             processing_mode=data.get("processing.mode", "ocr"),
             processing_queue_capacity=data.get("processing.queue_capacity", 200),
             processing_preload_models=data.get("processing.preload_models", True),
+            processing_backfill_share=data.get("processing.backfill_share", 0.1),
+            processing_max_wait_seconds=data.get("processing.max_wait_seconds", 900),
+            processing_visibility_mode=data.get("processing.visibility_mode", "complete"),
             ui_show_ai_description=data.get("ui.show_ai_description", True),
             fusion_log_enabled=data.get("advanced.fusion_log_enabled", False),
+            storage_compact_trees_after_days=data.get(
+                "storage.compact_trees_after_days", 0
+            ),
+            storage_compress_after_days=data.get("storage.compress_after_days", 0),
+            storage_compress_format=data.get("storage.compress_format", "webp"),
+            storage_compress_quality=data.get("storage.compress_quality", 60),
+            storage_compress_max_side=data.get("storage.compress_max_side", 0),
+            storage_archive_after_days=data.get("storage.archive_after_days", 0),
+            storage_tiering_interval_minutes=data.get("storage.tiering_interval_minutes", 60),
+            storage_tiering_batch_size=data.get("storage.tiering_batch_size", 200),
+            retention_max_age_days=data.get("retention.max_age_days", 0),
+            retention_rules=tuple(data.get("retention.rules", ())),
+            retention_interval_minutes=data.get("retention.interval_minutes", 60),
+            retention_batch_size=data.get("retention.batch_size", 500),
+            recovery_batch_size=data.get("recovery.batch_size", 500),
+            recovery_batch_pause_ms=data.get("recovery.batch_pause_ms", 5),
         )
 
     def __init__(self, **kwargs: Any) -> None:
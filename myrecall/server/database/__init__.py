@@ -1,4 +1,13 @@
-from .vector_store import VectorStore
 from .sql import SQLStore
 from .frames_store import Frame, FramesStore
+
 __all__ = ["VectorStore", "SQLStore", "Frame", "FramesStore"]
+
+
+def __getattr__(name: str):
+    # VectorStore pulls in lancedb (~2s import); load it on first use only
+    if name == "VectorStore":
+        from .vector_store import VectorStore
+
+        return VectorStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -182,6 +182,30 @@ class EmbeddingStore:
         table.delete(f"frame_id = {frame_id}")
         logger.debug(f"Deleted embedding for frame_id={frame_id}")
 
+    def delete_by_frame_ids(self, frame_ids: List[int]) -> None:
+        """Delete the embeddings of many frames with one predicate delete.
+
+        Each LanceDB delete writes a new table version, so bulk deletion
+        issues one per batch rather than one per frame; call ``compact``
+        once afterwards.
+        """
+        if not frame_ids:
+            return
+        table = self.db.open_table(self.table_name)
+        table.delete(f"frame_id IN ({', '.join(str(int(i)) for i in frame_ids)})")
+        logger.debug(f"Deleted embeddings for {len(frame_ids)} frame(s)")
+
+    def compact(self) -> None:
+        """Compact data files and drop old table versions after bulk deletes."""
+        table = self.db.open_table(self.table_name)
+        optimize = getattr(table, "optimize", None)
+        if callable(optimize):
+            optimize()
+        else:
+            table.compact_files()
+            table.cleanup_old_versions()
+        logger.debug("Compacted embedding table %s", self.table_name)
+
     def count(self) -> int:
         """Return total number of embeddings."""
         table = self.db.open_table(self.table_name)
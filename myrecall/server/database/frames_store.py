@@ -8,12 +8,132 @@ import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
-
+from typing import List, Optional, Sequence
+
+from myrecall.shared.compression import (
+    compress,
+    decompress,
+    detect_encoding,
+    supported_encodings,
+)
+from myrecall.server.database.task_lanes import (
+    DEFAULT_LANE_ORDER,
+    LANE_BACKFILL,
+    LANE_LIVE,
+    LANE_NAMES,
+)
 from myrecall.shared.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound when inflating a compacted accessibility tree
+_MAX_TREE_JSON_BYTES = 64 * 1024 * 1024
+
+# Full text bodies the memories queries return only when asked to
+MEMORY_TEXT_FIELDS = ("accessibility_text", "ocr_text")
+
+# Task queue table -> column giving queue order within a lane
+_TASK_QUEUE_ORDER = {"description_tasks": "id", "embedding_tasks": "created_at"}
+
+
+def _task_table(queue: str) -> str:
+    table = f"{queue}_tasks"
+    if table not in _TASK_QUEUE_ORDER:
+        raise ValueError(f"Unknown task queue: {queue!r}")
+    return table
+
+
+def _memory_text_columns(include: Sequence[str]) -> str:
+    """SELECT list for MEMORY_TEXT_FIELDS: the column if included, else NULL."""
+    return ", ".join(
+        f"f.{name}" if name in include else f"NULL AS {name}" for name in MEMORY_TEXT_FIELDS
+    )
+
+
+def _latency_summary(seconds: list[float]) -> dict:
+    if not seconds:
+        return {"count": 0, "p50_seconds": None, "p95_seconds": None, "max_seconds": None}
+    ordered = sorted(max(0.0, value) for value in seconds)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 1)
+
+    return {
+        "count": len(ordered),
+        "p50_seconds": pct(0.50),
+        "p95_seconds": pct(0.95),
+        "max_seconds": round(ordered[-1], 1),
+    }
+
+
+# Width of an activity_rollups bucket (see 20260504000000_add_activity_rollups.sql)
+_ROLLUP_BUCKET = timedelta(minutes=5)
+
+
+def _rollup_interior(start_time: str, end_time: str) -> Optional[tuple[str, str]]:
+    """Return [first, last) bucket starts lying wholly inside [start, end].
+
+    None when the bounds are not naive local timestamps or when no whole
+    bucket fits, in which case the range is answered from raw frames.
+    """
+    try:
+        start = datetime.fromisoformat(start_time)
+        end = datetime.fromisoformat(end_time)
+    except ValueError:
+        return None
+    if start.tzinfo is not None or end.tzinfo is not None:
+        return None
+
+    def floor(dt: datetime) -> datetime:
+        return dt.replace(minute=dt.minute - dt.minute % 5, second=0, microsecond=0)
+
+    first = floor(start) if floor(start) == start else floor(start) + _ROLLUP_BUCKET
+    last = floor(end)
+    if first >= last:
+        return None
+    return first.strftime("%Y-%m-%dT%H:%M:%S"), last.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _derive_element_rows(
+    frame_id: int, elements: list[dict], first_id: int
+) -> list[tuple]:
+    """Build ``elements`` rows with pre-assigned ids and derived parent_id.
+
+    ``elements`` is in depth-first order; a depth stack tracks the path from
+    the root, so each node's parent is the nearest preceding shallower node.
+    """
+    rows: list[tuple] = []
+    depth_stack: list[tuple[int, int]] = []  # Stack of (depth, element_id)
+    for sort_order, elem in enumerate(elements):
+        element_id = first_id + sort_order
+        depth = elem.get("depth", 0)
+
+        # Pop stack until we find a shallower depth (potential parent)
+        while depth_stack and depth_stack[-1][0] >= depth:
+            depth_stack.pop()
+        parent_id = depth_stack[-1][1] if depth_stack else None
+
+        bounds = elem.get("bounds")
+        if not isinstance(bounds, dict):
+            bounds = {}
+        rows.append(
+            (
+                element_id,
+                frame_id,
+                elem.get("role"),
+                elem.get("text"),
+                parent_id,
+                depth,
+                bounds.get("left"),
+                bounds.get("top"),
+                bounds.get("width"),
+                bounds.get("height"),
+                sort_order,
+            )
+        )
+        depth_stack.append((depth, element_id))
+    return rows
+
 
 def _to_utc_iso8601(value: object) -> Optional[str]:
     if value is None:
@@ -360,18 +480,22 @@ class FramesStore:
         Returns:
             (success, snapshot_path_or_none)
             snapshot_path is returned so the caller can delete the
-            JPEG file from disk. None if frame not found.
+            JPEG file from disk. None if frame not found, or if the frame
+            lives in a shared archive pack (see frame_storage.py).
         """
         try:
             with self._connect() as conn:
                 # Read snapshot_path before deleting
                 row = conn.execute(
-                    "SELECT snapshot_path FROM frames WHERE id = ?",
+                    "SELECT snapshot_path, storage_tier FROM frames WHERE id = ?",
                     (frame_id,),
                 ).fetchone()
                 if row is None:
                     return False, None
-                snapshot_path = row["snapshot_path"]
+                # An archived frame's snapshot_path is its shared day pack
+                snapshot_path = (
+                    None if row["storage_tier"] == "archived" else row["snapshot_path"]
+                )
 
                 # Delete child tables first (SQLite foreign keys not enforced)
                 conn.execute("DELETE FROM ocr_text WHERE frame_id = ?", (frame_id,))
@@ -392,6 +516,159 @@ class FramesStore:
             logger.error("delete_frame failed frame_id=%d: %s", frame_id, e)
             raise
 
+    def count_frames_where(self, where: str, params: Sequence = ()) -> int:
+        """Count frames matching a WHERE fragment (see retention.FrameFilter)."""
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT COUNT(*) FROM frames WHERE {where}", params).fetchone()
+            return row[0]
+
+    def find_frame_ids_where(
+        self, where: str, params: Sequence = (), limit: int = 500
+    ) -> list[int]:
+        """Lowest ``limit`` frame IDs matching a WHERE fragment."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT id FROM frames WHERE {where} ORDER BY id LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+            return [row[0] for row in rows]
+
+    def delete_frames(self, frame_ids: Sequence[int]) -> list[tuple[int, Optional[str]]]:
+        """Delete a batch of frames and their child rows in one transaction.
+
+        The bulk counterpart of ``delete_frame``: each child table is
+        cleared with one statement per batch, and the activity rollups are
+        recomputed once for the affected buckets instead of once per
+        deleted row (see 20260505000000_add_bulk_frame_deletion.sql).
+
+        LanceDB embedding, OCR visualization and JPEG cleanup remain the
+        caller's responsibility.
+
+        Returns:
+            (frame_id, snapshot_path) for each frame actually deleted;
+            snapshot_path is None for frames in a shared archive pack.
+        """
+        if not frame_ids:
+            return []
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    CREATE TEMP TABLE IF NOT EXISTS frame_delete_batch (
+                        id INTEGER PRIMARY KEY,
+                        local_timestamp TEXT,
+                        app_name TEXT,
+                        queryable INTEGER NOT NULL
+                    )
+                    """
+                )
+                conn.execute("DELETE FROM temp.frame_delete_batch")
+                conn.execute(
+                    f"""
+                    INSERT INTO temp.frame_delete_batch (id, local_timestamp, app_name, queryable)
+                    SELECT id, local_timestamp, app_name, visibility_status = 'queryable'
+                    FROM frames WHERE id IN ({", ".join("?" * len(frame_ids))})
+                    """,
+                    list(frame_ids),
+                )
+                deleted = [
+                    (row["id"], row["snapshot_path"])
+                    for row in conn.execute(
+                        """
+                        SELECT f.id,
+                               CASE WHEN f.storage_tier = 'archived' THEN NULL
+                                    ELSE f.snapshot_path END AS snapshot_path
+                        FROM frames f
+                        JOIN temp.frame_delete_batch b ON b.id = f.id
+                        ORDER BY f.id
+                        """
+                    )
+                ]
+                if not deleted:
+                    conn.rollback()
+                    return []
+
+                batch = "SELECT id FROM temp.frame_delete_batch"
+                conn.execute("INSERT INTO activity_rollups_deferred (id) VALUES (1)")
+                conn.execute(f"DELETE FROM ocr_text WHERE frame_id IN ({batch})")
+                conn.execute(f"DELETE FROM accessibility WHERE frame_id IN ({batch})")
+                conn.execute(f"DELETE FROM elements WHERE frame_id IN ({batch})")
+                conn.execute(f"DELETE FROM frame_descriptions WHERE frame_id IN ({batch})")
+                conn.execute(f"DELETE FROM description_tasks WHERE frame_id IN ({batch})")
+                conn.execute(f"DELETE FROM embedding_tasks WHERE frame_id IN ({batch})")
+                conn.execute(f"DELETE FROM frames WHERE id IN ({batch})")
+
+                # Rollup buckets touched: each deleted frame's own, and that of
+                # the surviving same-app frame before it (its gap changed)
+                bucket = (
+                    "substr({ts}, 1, 14)"
+                    " || printf('%02d', CAST(substr({ts}, 15, 2) AS INTEGER) / 5 * 5)"
+                    " || ':00'"
+                )
+                conn.execute(
+                    f"""
+                    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+                    SELECT DISTINCT {bucket.format(ts="local_timestamp")}, app_name
+                    FROM temp.frame_delete_batch
+                    WHERE queryable AND length(local_timestamp) >= 16
+                    """
+                )
+                conn.execute(
+                    f"""
+                    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+                    SELECT DISTINCT bucket_start, app_name FROM (
+                        SELECT (
+                            SELECT {bucket.format(ts="p.local_timestamp")}
+                            FROM frames p
+                            WHERE p.visibility_status = 'queryable'
+                              AND p.app_name IS b.app_name
+                              AND (p.local_timestamp, p.id) < (b.local_timestamp, b.id)
+                              AND length(p.local_timestamp) >= 16
+                            ORDER BY p.local_timestamp DESC, p.id DESC
+                            LIMIT 1
+                        ) AS bucket_start, b.app_name
+                        FROM temp.frame_delete_batch b
+                        WHERE b.queryable
+                    )
+                    WHERE bucket_start IS NOT NULL
+                    """
+                )
+                conn.execute(
+                    """
+                    DELETE FROM activity_rollups WHERE rowid IN (
+                        SELECT r.rowid FROM activity_rollups_dirty d
+                        JOIN activity_rollups r
+                          ON r.bucket_start = d.bucket_start AND r.app_name IS d.app_name
+                    )
+                    """
+                )
+                conn.execute(
+                    """
+                    INSERT INTO activity_rollups
+                        (bucket_start, app_name, frame_count, active_seconds, first_seen, last_seen)
+                    SELECT d.bucket_start, d.app_name, COUNT(*),
+                           TOTAL(CASE WHEN g.gap_sec < 300 THEN g.gap_sec END),
+                           MIN(g.ts), MAX(g.ts)
+                    FROM (SELECT DISTINCT bucket_start, app_name FROM activity_rollups_dirty) d
+                    JOIN activity_frame_gaps g
+                      ON g.app_name IS d.app_name
+                     AND g.ts >= d.bucket_start
+                     AND g.ts < strftime('%Y-%m-%dT%H:%M:%S', d.bucket_start, '+5 minutes')
+                    GROUP BY d.bucket_start, d.app_name
+                    """
+                )
+                conn.execute("DELETE FROM activity_rollups_dirty")
+                conn.execute("DELETE FROM activity_rollups_deferred")
+                conn.execute("DELETE FROM temp.frame_delete_batch")
+                conn.commit()
+
+                logger.info("delete_frames: %d frame(s) deleted", len(deleted))
+                return deleted
+
+        except sqlite3.Error as e:
+            logger.error("delete_frames failed (%d ids): %s", len(frame_ids), e)
+            raise
+
     def get_frame(self, frame_id: int) -> Optional[Frame]:
         try:
             with self._connect() as conn:
@@ -409,6 +686,124 @@ class FramesStore:
             logger.error("get_frame failed frame_id=%d: %s", frame_id, e)
             return None
 
+    def get_snapshot_location(self, frame_id: int) -> Optional[sqlite3.Row]:
+        """Return where a frame's snapshot is stored (see frame_storage.py).
+
+        Row keys: snapshot_path, storage_tier, storage_offset,
+        storage_length, storage_scale. None if the frame does not exist.
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                """
+                SELECT snapshot_path, storage_tier, storage_offset, storage_length, storage_scale
+                FROM frames WHERE id = ?
+                """,
+                (frame_id,),
+            ).fetchone()
+
+    def find_frames_for_tiering(
+        self, tiers: Sequence[str], older_than: str, limit: int = 200, after_id: int = 0
+    ) -> list[sqlite3.Row]:
+        """Completed frames in ``tiers`` captured before ``older_than`` (UTC).
+
+        Ordered by id and paged with ``after_id``. Frames with description
+        or embedding work still pending or running are skipped, so a
+        worker never loses a snapshot file it is about to read. Work
+        queued later (retries, backfills) reads through ``SnapshotLocation``.
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                f"""
+                SELECT f.id, f.snapshot_path, f.local_timestamp, f.storage_tier,
+                       f.storage_offset, f.storage_length, f.storage_scale
+                FROM frames f
+                WHERE f.storage_tier IN ({", ".join("?" * len(tiers))})
+                  AND f.timestamp < ?
+                  AND f.id > ?
+                  AND f.status = 'completed'
+                  AND f.snapshot_path IS NOT NULL
+                  AND NOT EXISTS (
+                      SELECT 1 FROM description_tasks t
+                      WHERE t.frame_id = f.id AND t.status IN ('pending', 'processing')
+                  )
+                  AND NOT EXISTS (
+                      SELECT 1 FROM embedding_tasks t
+                      WHERE t.frame_id = f.id AND t.status IN ('pending', 'processing')
+                  )
+                ORDER BY f.id
+                LIMIT ?
+                """,
+                (*tiers, older_than, after_id, limit),
+            ).fetchall()
+
+    def update_snapshot_locations(self, moves: Sequence[tuple]) -> list[int]:
+        """Point frames at their re-tiered snapshots in one transaction.
+
+        Args:
+            moves: (frame_id, old_snapshot_path, new_snapshot_path, tier,
+                offset, length, scale) tuples. A move applies only if the
+                frame still has ``old_snapshot_path`` (it may have been
+                deleted or moved meanwhile).
+
+        Returns:
+            IDs of the frames updated.
+        """
+        applied = []
+        with self._connect() as conn:
+            for frame_id, old_path, new_path, tier, offset, length, scale in moves:
+                cursor = conn.execute(
+                    """
+                    UPDATE frames
+                    SET snapshot_path = ?, storage_tier = ?, storage_offset = ?,
+                        storage_length = ?, storage_scale = ?
+                    WHERE id = ? AND snapshot_path = ?
+                    """,
+                    (new_path, tier, offset, length, scale, frame_id, old_path),
+                )
+                if cursor.rowcount:
+                    applied.append(frame_id)
+            conn.commit()
+        return applied
+
+    def sample_snapshot_locations(self, tier: str, limit: int = 5) -> list[sqlite3.Row]:
+        """Snapshot locations of the most recent frames in a storage tier."""
+        with self._connect() as conn:
+            return conn.execute(
+                """
+                SELECT snapshot_path, storage_tier, storage_offset, storage_length, storage_scale
+                FROM frames
+                WHERE storage_tier = ? AND snapshot_path IS NOT NULL
+                ORDER BY timestamp DESC
+                LIMIT ?
+                """,
+                (tier, limit),
+            ).fetchall()
+
+    def get_storage_tier_stats(self) -> list[dict]:
+        """Frame count, ingested bytes and stored bytes per storage tier."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT storage_tier,
+                       COUNT(*) AS frames,
+                       TOTAL(image_size_bytes) AS ingested_bytes,
+                       TOTAL(COALESCE(storage_length, image_size_bytes)) AS stored_bytes
+                FROM frames
+                WHERE snapshot_path IS NOT NULL
+                GROUP BY storage_tier
+                ORDER BY storage_tier
+                """
+            ).fetchall()
+        return [
+            {
+                "tier": row["storage_tier"],
+                "frames": row["frames"],
+                "ingested_bytes": int(row["ingested_bytes"]),
+                "stored_bytes": int(row["stored_bytes"]),
+            }
+            for row in rows
+        ]
+
     def get_frame_by_capture_id(self, capture_id: str) -> Optional[Frame]:
         try:
             with self._connect() as conn:
@@ -428,19 +823,26 @@ class FramesStore:
             )
             return None
 
-    def get_queue_counts(self) -> dict[str, int]:
+    @staticmethod
+    def _read_queue_counters(conn: sqlite3.Connection, queue: str) -> dict[str, int]:
+        """Per-status row counts from the trigger-maintained queue_counters table."""
         counts = {"pending": 0, "processing": 0, "completed": 0, "failed": 0}
+        rows = conn.execute(
+            "SELECT status, count FROM queue_counters WHERE queue = ?",
+            (queue,),
+        ).fetchall()
+        for status, count in rows:
+            if status in counts:
+                counts[status] = count
+        return counts
+
+    def get_queue_counts(self) -> dict[str, int]:
         try:
             with self._connect() as conn:
-                rows = conn.execute(
-                    "SELECT status, COUNT(*) AS cnt FROM frames GROUP BY status"
-                ).fetchall()
-                for row in rows:
-                    if row["status"] in counts:
-                        counts[row["status"]] = row["cnt"]
+                return self._read_queue_counters(conn, "frames")
         except sqlite3.Error as e:
             logger.error("get_queue_counts failed: %s", e)
-        return counts
+        return {"pending": 0, "processing": 0, "completed": 0, "failed": 0}
 
     def get_oldest_pending_ingested_at(self) -> Optional[str]:
         """Returns None when no pending frames exist — never empty string or current time."""
@@ -462,9 +864,9 @@ class FramesStore:
         try:
             with self._connect() as conn:
                 row = conn.execute(
-                    "SELECT COUNT(*) AS cnt FROM frames WHERE status = 'pending'"
+                    "SELECT count FROM queue_counters WHERE queue = 'frames' AND status = 'pending'"
                 ).fetchone()
-                return row["cnt"] if row else 0
+                return row["count"] if row else 0
         except sqlite3.Error as e:
             logger.error("get_pending_count failed: %s", e)
             return 0
@@ -670,109 +1072,160 @@ class FramesStore:
             )
             return False
 
-    def reset_failed_frames(self) -> dict:
-        """Reset all failed frames to pending status.
+    def get_visibility_latency(self, since: str) -> dict[str, dict]:
+        """Ingest-to-visible latency for frames ingested at or after ``since``.
+
+        - ``text_searchable``: ingest -> text stage completed (FTS-visible
+          in staged mode)
+        - ``vector_searchable``: ingest -> embedding completed
+        - ``fully_enriched``: ingest -> last of text, description and
+          embedding completed (visible in complete mode)
+
+        Each entry has count, p50_seconds, p95_seconds and max_seconds.
+        """
+        rows = []
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT (julianday(f.processed_at) - julianday(f.ingested_at)) * 86400,
+                           (julianday(et.completed_at) - julianday(f.ingested_at)) * 86400,
+                           (MAX(julianday(f.processed_at), julianday(dt.completed_at),
+                                julianday(et.completed_at)) - julianday(f.ingested_at)) * 86400
+                    FROM frames f
+                    LEFT JOIN description_tasks dt
+                      ON dt.frame_id = f.id AND dt.status = 'completed'
+                    LEFT JOIN embedding_tasks et
+                      ON et.frame_id = f.id AND et.status = 'completed'
+                    WHERE f.ingested_at >= ? AND f.status = 'completed'
+                    """,
+                    (since,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error("get_visibility_latency failed: %s", e)
+        stages = ("text_searchable", "vector_searchable", "fully_enriched")
+        return {
+            stage: _latency_summary([row[i] for row in rows if row[i] is not None])
+            for i, stage in enumerate(stages)
+        }
+
+    def count_failed_frames(self) -> int:
+        """Number of frames with visibility_status = 'failed'."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS cnt FROM frames WHERE visibility_status = 'failed'"
+            ).fetchone()
+            return row["cnt"] if row else 0
+
+    def find_failed_frame_ids(self, limit: int = 500, after_id: int = 0) -> list[int]:
+        """IDs of failed frames after ``after_id``, ascending."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id FROM frames
+                WHERE visibility_status = 'failed' AND id > ?
+                ORDER BY id
+                LIMIT ?
+                """,
+                (after_id, limit),
+            ).fetchall()
+            return [row["id"] for row in rows]
+
+    def reset_failed_frame_chunk(self, frame_ids: Sequence[int]) -> dict:
+        """Reset one chunk of failed frames to pending in a single short transaction.
 
         Smart reset: only resets the stage(s) that failed.
         - OCR failed -> status = 'pending', error_message = NULL
-        - Description failed -> description_status = 'pending', enqueue task
-        - Embedding failed -> embedding_status = 'pending', enqueue task
+        - Description failed -> description_status = 'pending', task reset or enqueued
+        - Embedding failed -> embedding_status = 'pending', task reset or enqueued
+
+        Every step is one set-based statement over ``frame_ids``; frames
+        no longer failed by the time the chunk runs are left alone.
 
         Returns:
-            Dict with 'total' count and 'breakdown' by stage.
+            Dict with 'total' frames reset and 'breakdown' by stage.
         """
         breakdown = {"ocr": 0, "description": 0, "embedding": 0}
+        if not frame_ids:
+            return {"total": 0, "breakdown": breakdown}
+        in_ids = f"id IN ({', '.join('?' * len(frame_ids))})"
+        failed = f"visibility_status = 'failed' AND {in_ids}"
+        params = tuple(frame_ids)
 
-        try:
-            with self._connect() as conn:
-                # Count unique failed frames before reset
-                total_result = conn.execute("""
-                    SELECT COUNT(*) as cnt FROM frames WHERE visibility_status = 'failed'
-                """).fetchone()
-                total = total_result["cnt"] if total_result else 0
-
-                if total == 0:
-                    return {"total": 0, "breakdown": breakdown}
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"""
+                UPDATE frames
+                SET status = 'pending', error_message = NULL
+                WHERE {failed} AND status = 'failed'
+                """,
+                params,
+            )
+            breakdown["ocr"] = cursor.rowcount
 
-                # 1. Reset OCR failures
-                cursor = conn.execute("""
-                    UPDATE frames
-                    SET status = 'pending', error_message = NULL
-                    WHERE visibility_status = 'failed' AND status = 'failed'
-                """)
-                breakdown["ocr"] = cursor.rowcount
-
-                # 2. Reset description failures and enqueue tasks
-                desc_failed_rows = conn.execute("""
-                    SELECT id FROM frames
-                    WHERE visibility_status = 'failed' AND description_status = 'failed'
-                """).fetchall()
-
-                for row in desc_failed_rows:
-                    frame_id = row["id"]
-                    # Reset existing failed task to pending (if exists)
-                    conn.execute("""
-                        UPDATE description_tasks
-                        SET status = 'pending', error_message = NULL, retry_count = retry_count + 1
-                        WHERE frame_id = ? AND status = 'failed'
-                    """, (frame_id,))
-                    # Insert new task if one doesn't exist
-                    conn.execute("""
-                        INSERT OR IGNORE INTO description_tasks (frame_id, status)
-                        VALUES (?, 'pending')
-                    """, (frame_id,))
-
-                cursor = conn.execute("""
-                    UPDATE frames
-                    SET description_status = 'pending'
-                    WHERE visibility_status = 'failed' AND description_status = 'failed'
-                """)
-                breakdown["description"] = cursor.rowcount
-
-                # 3. Reset embedding failures and enqueue tasks
-                embed_failed_rows = conn.execute("""
-                    SELECT id FROM frames
-                    WHERE visibility_status = 'failed' AND embedding_status = 'failed'
-                """).fetchall()
-
-                for row in embed_failed_rows:
-                    frame_id = row["id"]
-                    # Reset existing failed task to pending (if exists)
-                    conn.execute("""
-                        UPDATE embedding_tasks
-                        SET status = 'pending', error_message = NULL, retry_count = retry_count + 1
-                        WHERE frame_id = ? AND status = 'failed'
-                    """, (frame_id,))
-                    # Insert new task if one doesn't exist
-                    conn.execute("""
-                        INSERT OR IGNORE INTO embedding_tasks (frame_id, status)
-                        VALUES (?, 'pending')
-                    """, (frame_id,))
-
-                cursor = conn.execute("""
+            for stage, tasks in (("description", "description_tasks"),
+                                 ("embedding", "embedding_tasks")):
+                stage_failed = f"{failed} AND {stage}_status = 'failed'"
+                # Reset existing failed tasks, then enqueue frames without one
+                conn.execute(
+                    f"""
+                    UPDATE {tasks}
+                    SET status = 'pending', error_message = NULL, retry_count = retry_count + 1
+                    WHERE status = 'failed'
+                      AND frame_id IN (SELECT id FROM frames WHERE {stage_failed})
+                    """,
+                    params,
+                )
+                conn.execute(
+                    f"""
+                    INSERT OR IGNORE INTO {tasks} (frame_id, status)
+                    SELECT id, 'pending' FROM frames WHERE {stage_failed}
+                    """,
+                    params,
+                )
+                cursor = conn.execute(
+                    f"""
                     UPDATE frames
-                    SET embedding_status = 'pending'
-                    WHERE visibility_status = 'failed' AND embedding_status = 'failed'
-                """)
-                breakdown["embedding"] = cursor.rowcount
+                    SET {stage}_status = 'pending'
+                    WHERE {failed} AND {stage}_status = 'failed'
+                    """,
+                    params,
+                )
+                breakdown[stage] = cursor.rowcount
 
-                # 4. Set visibility_status back to pending for all failed frames
-                conn.execute("""
-                    UPDATE frames
-                    SET visibility_status = 'pending'
-                    WHERE visibility_status = 'failed'
-                """)
+            cursor = conn.execute(
+                f"UPDATE frames SET visibility_status = 'pending' WHERE {failed}", params
+            )
+            conn.commit()
+            return {"total": cursor.rowcount, "breakdown": breakdown}
 
-                conn.commit()
+    def reset_failed_frames(self, batch_size: int = 500) -> dict:
+        """Reset all failed frames to pending status.
 
-                return {
-                    "total": total,
-                    "breakdown": breakdown
-                }
+        Works through the failed frames ``batch_size`` at a time with
+        ``reset_failed_frame_chunk``, so the write lock is only held for
+        one chunk at a time. Large recoveries should go through the async
+        admin job (``myrecall.server.recovery``) instead of calling this
+        from a request.
 
+        Returns:
+            Dict with 'total' count and 'breakdown' by stage.
+        """
+        result = {"total": 0, "breakdown": {"ocr": 0, "description": 0, "embedding": 0}}
+        after_id = 0
+        try:
+            while True:
+                frame_ids = self.find_failed_frame_ids(batch_size, after_id)
+                if not frame_ids:
+                    return result
+                after_id = frame_ids[-1]
+                chunk = self.reset_failed_frame_chunk(frame_ids)
+                result["total"] += chunk["total"]
+                for stage, count in chunk["breakdown"].items():
+                    result["breakdown"][stage] += count
         except sqlite3.Error as e:
             logger.error("reset_failed_frames failed: %s", e)
-            return {"total": 0, "breakdown": breakdown}
+            return result
 
     def get_last_frame_timestamp(self) -> Optional[str]:
         try:
@@ -796,11 +1249,16 @@ class FramesStore:
             logger.error("get_last_frame_ingested_at failed: %s", e)
             return None
 
-    def get_recent_memories(self, limit: int = 500) -> list[dict[str, object]]:
+    def get_recent_memories(
+        self, limit: int = 500, include: Sequence[str] = ()
+    ) -> list[dict[str, object]]:
         """Retrieve recent frames for the grid view.
 
         Args:
             limit: Maximum number of frames to return.
+            include: Full text fields (MEMORY_TEXT_FIELDS) to return. They
+                are omitted by default; text_preview and the *_length
+                fields are always present.
 
         Returns:
             List of dicts with frame data formatted for UI consumption.
@@ -812,12 +1270,12 @@ class FramesStore:
         try:
             with self._connect() as conn:
                 rows = conn.execute(
-                    """
+                    f"""
                     SELECT f.id, f.capture_id, f.local_timestamp AS timestamp, f.app_name, f.window_name,
                            f.snapshot_path, f.status, f.ingested_at, f.last_known_app,
                            f.last_known_window, f.text_source, f.processed_at,
                            f.capture_trigger, f.device_name, f.error_message,
-                           f.accessibility_text, f.ocr_text, f.browser_url, f.focused,
+                           {_memory_text_columns(include)}, f.browser_url, f.focused,
                            f.description_status, f.embedding_status, f.visibility_status,
                            LENGTH(f.accessibility_text) as accessibility_text_length,
                            LENGTH(f.ocr_text) as ocr_text_length,
@@ -866,8 +1324,6 @@ class FramesStore:
                             # Text source and content
                             "text_source": row["text_source"] or "",
                             "text_length": row["text_length_computed"] or 0,
-                            "accessibility_text": row["accessibility_text"] or "",
-                            "ocr_text": row["ocr_text"] or "",
                             "text_preview": row["text_preview"] or "",
                             "ocr_engine": row["ocr_engine"] or "",
                             # Additional metadata
@@ -889,15 +1345,21 @@ class FramesStore:
                             "visibility_status": row["visibility_status"] or "pending",
                         }
                     )
+                    for name in MEMORY_TEXT_FIELDS:
+                        if name in include:
+                            memories[-1][name] = row[name] or ""
         except sqlite3.Error as e:
             logger.error("get_recent_memories failed: %s", e)
         return memories
 
-    def get_frames_by_day(self, date: str) -> list[dict[str, object]]:
+    def get_frames_by_day(
+        self, date: str, include: Sequence[str] = ()
+    ) -> list[dict[str, object]]:
         """Retrieve all frames for a specific day.
 
         Args:
             date: Date string in YYYY-MM-DD format.
+            include: Full text fields to return, as in get_recent_memories.
 
         Returns:
             List of dicts with frame data formatted for UI consumption.
@@ -908,12 +1370,12 @@ class FramesStore:
         try:
             with self._connect() as conn:
                 rows = conn.execute(
-                    """
+                    f"""
                     SELECT f.id, f.capture_id, f.local_timestamp AS timestamp, f.app_name, f.window_name,
                            f.snapshot_path, f.status, f.ingested_at, f.last_known_app,
                            f.last_known_window, f.text_source, f.processed_at,
                            f.capture_trigger, f.device_name, f.error_message,
-                           f.accessibility_text, f.ocr_text, f.browser_url, f.focused,
+                           {_memory_text_columns(include)}, f.browser_url, f.focused,
                            f.description_status, f.embedding_status, f.visibility_status,
                            LENGTH(f.accessibility_text) as accessibility_text_length,
                            LENGTH(f.ocr_text) as ocr_text_length,
@@ -962,8 +1424,6 @@ class FramesStore:
                             # Text source and content
                             "text_source": row["text_source"] or "",
                             "text_length": row["text_length_computed"] or 0,
-                            "accessibility_text": row["accessibility_text"] or "",
-                            "ocr_text": row["ocr_text"] or "",
                             "text_preview": row["text_preview"] or "",
                             "ocr_engine": row["ocr_engine"] or "",
                             # Additional metadata
@@ -985,6 +1445,9 @@ class FramesStore:
                             "visibility_status": row["visibility_status"] or "pending",
                         }
                     )
+                    for name in MEMORY_TEXT_FIELDS:
+                        if name in include:
+                            frames[-1][name] = row[name] or ""
         except sqlite3.Error as e:
             logger.error("get_frames_by_day failed: %s", e)
         return frames
@@ -1061,12 +1524,133 @@ class FramesStore:
             logger.error("get_timeline_frames failed: %s", e)
         return frames
 
-    def get_memories_since(self, timestamp: str) -> list[dict[str, object]]:
+    def get_timeline_density(
+        self,
+        start: datetime,
+        end: datetime,
+        bucket_seconds: int,
+    ) -> list[dict[str, object]]:
+        """Summarise [start, end) into fixed-width buckets for the timeline scrubber.
+
+        Queryable frames are summed from ``activity_rollups``, so
+        ``start``/``end`` should sit on 5-minute boundaries and
+        ``bucket_seconds`` be a multiple of 300. Frames still pending or
+        failed (e.g. waiting hours for a description on a CPU-only box) are
+        counted straight from ``idx_frames_visibility_local_ts``: the
+        scrubber shows every captured frame, as ``/v1/timeline`` does.
+        Active time only accrues between queryable frames, as in the
+        activity summary.
+
+        Args:
+            start: Naive local datetime of the first bucket.
+            end: Naive local datetime bounding the last bucket.
+            bucket_seconds: Bucket width.
+
+        Returns:
+            Non-empty buckets in time order, each with start, frame_count,
+            active_minutes, dominant_app and a representative frame_id
+            (the first frame of the dominant app in the bucket).
+        """
+        start_str = start.strftime("%Y-%m-%dT%H:%M:%S")
+        end_str = end.strftime("%Y-%m-%dT%H:%M:%S")
+        buckets: dict[int, dict] = {}
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT
+                        CAST(ROUND((JULIANDAY(bucket_start) - JULIANDAY(?)) * 86400.0) AS INTEGER) / ?
+                            AS idx,
+                        app_name,
+                        SUM(frame_count) AS frame_count,
+                        TOTAL(active_seconds) AS active_seconds,
+                        MIN(first_seen) AS first_seen
+                    FROM activity_rollups
+                    WHERE bucket_start >= ? AND bucket_start < ?
+                    GROUP BY idx, app_name
+                    """,
+                    (start_str, bucket_seconds, start_str, end_str),
+                ).fetchall()
+                # Every visibility_status other than 'queryable'; listed so
+                # both index ranges are seeks rather than a scan of the range
+                rows += conn.execute(
+                    """
+                    SELECT
+                        (CAST(strftime('%s', substr(local_timestamp, 1, 19)) AS INTEGER)
+                         - CAST(strftime('%s', ?) AS INTEGER)) / ? AS idx,
+                        app_name,
+                        COUNT(*) AS frame_count,
+                        0.0 AS active_seconds,
+                        MIN(local_timestamp) AS first_seen
+                    FROM frames
+                    WHERE visibility_status IN ('pending', 'failed')
+                      AND local_timestamp >= ? AND local_timestamp < ?
+                    GROUP BY idx, app_name
+                    """,
+                    (start_str, bucket_seconds, start_str, end_str),
+                ).fetchall()
+
+                for row in rows:
+                    bucket = buckets.setdefault(row["idx"], {})
+                    app = bucket.setdefault(
+                        row["app_name"],
+                        {"frame_count": 0, "active_seconds": 0.0, "first_seen": row["first_seen"]},
+                    )
+                    app["frame_count"] += row["frame_count"]
+                    app["active_seconds"] += row["active_seconds"]
+                    app["first_seen"] = min(app["first_seen"], row["first_seen"])
+
+                result = []
+                for idx in sorted(buckets):
+                    apps = buckets[idx]
+                    dominant_app = max(
+                        apps,
+                        key=lambda name: (apps[name]["active_seconds"], apps[name]["frame_count"]),
+                    )
+                    # One index seek per visibility status, earliest wins
+                    frame = min(
+                        (
+                            row
+                            for status in ("queryable", "pending", "failed")
+                            for row in conn.execute(
+                                """
+                                SELECT id, local_timestamp FROM frames
+                                WHERE visibility_status = ?
+                                  AND app_name IS ?
+                                  AND local_timestamp >= ?
+                                ORDER BY local_timestamp, id
+                                LIMIT 1
+                                """,
+                                (status, dominant_app, apps[dominant_app]["first_seen"]),
+                            )
+                        ),
+                        key=lambda row: (row["local_timestamp"], row["id"]),
+                        default=None,
+                    )
+                    bucket_start = start + timedelta(seconds=idx * bucket_seconds)
+                    result.append({
+                        "start": bucket_start.strftime("%Y-%m-%dT%H:%M:%S"),
+                        "frame_count": sum(app["frame_count"] for app in apps.values()),
+                        "active_minutes": round(
+                            sum(app["active_seconds"] for app in apps.values()) / 60.0, 1
+                        ),
+                        "dominant_app": dominant_app or "",
+                        "frame_id": frame["id"] if frame else None,
+                    })
+                return result
+        except sqlite3.Error as e:
+            logger.error("get_timeline_density failed: %s", e)
+            return []
+
+    def get_memories_since(
+        self, timestamp: str, include: Sequence[str] = ()
+    ) -> list[dict[str, object]]:
         """Return frames with local_timestamp > the given timestamp.
 
         Args:
             timestamp: Local timestamp string (e.g. "2026-04-26T16:30:00.123")
                       to filter frames by. Compared against local_timestamp.
+            include: Full text fields to return, as in get_recent_memories.
 
         Returns:
             List of dicts with frame data.
@@ -1075,14 +1659,21 @@ class FramesStore:
         memories = []
         try:
             with self._connect() as conn:
+                ocr_text_column = "o.text" if "ocr_text" in include else "NULL"
+                accessibility_column = (
+                    "f.accessibility_text" if "accessibility_text" in include else "NULL"
+                )
                 rows = conn.execute(
-                    """
+                    f"""
                     SELECT f.id, f.capture_id, f.local_timestamp AS timestamp, f.app_name, f.window_name,
                            f.snapshot_path, f.status, f.ingested_at, f.last_known_app,
                            f.last_known_window, f.text_source, f.processed_at,
                            f.capture_trigger, f.device_name, f.error_message,
                            f.description_status, f.embedding_status, f.visibility_status,
-                           o.text_length, o.ocr_engine, o.text AS ocr_text,
+                           o.text_length, o.ocr_engine, {ocr_text_column} AS ocr_text,
+                           {accessibility_column} AS accessibility_text,
+                           LENGTH(f.accessibility_text) AS accessibility_text_length,
+                           LENGTH(f.ocr_text) AS ocr_text_length,
                            SUBSTR(o.text, 1, 100) AS ocr_text_preview
                     FROM frames f
                     LEFT JOIN ocr_text o ON f.id = o.frame_id
@@ -1111,8 +1702,9 @@ class FramesStore:
                             # P1-S3 additions
                             "text_source": row["text_source"] or "",
                             "text_length": row["text_length"] or 0,
-                            "ocr_text": row["ocr_text"] or "",
                             "ocr_text_preview": row["ocr_text_preview"] or "",
+                            "accessibility_text_length": row["accessibility_text_length"] or 0,
+                            "ocr_text_length": row["ocr_text_length"] or 0,
                             "ocr_engine": row["ocr_engine"] or "",
                             "processed_at": row["processed_at"] or "",
                             "capture_trigger": row["capture_trigger"] or "",
@@ -1125,10 +1717,42 @@ class FramesStore:
                             "visibility_status": row["visibility_status"] or "pending",
                         }
                     )
+                    for name in MEMORY_TEXT_FIELDS:
+                        if name in include:
+                            memories[-1][name] = row[name] or ""
         except sqlite3.Error as e:
             logger.error("get_memories_since failed: %s", e)
         return memories
 
+    def get_frame_text(self, frame_id: int) -> Optional[dict[str, object]]:
+        """Return the full text bodies the memories lists omit by default.
+
+        Returns:
+            Dict with frame_id, text_source and MEMORY_TEXT_FIELDS, or None
+            if the frame does not exist.
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    """
+                    SELECT id, text_source, accessibility_text, ocr_text
+                    FROM frames
+                    WHERE id = ?
+                    """,
+                    (frame_id,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error("get_frame_text failed frame_id=%d: %s", frame_id, e)
+            return None
+        if row is None:
+            return None
+        return {
+            "frame_id": row["id"],
+            "text_source": row["text_source"] or "",
+            "accessibility_text": row["accessibility_text"] or "",
+            "ocr_text": row["ocr_text"] or "",
+        }
+
     def get_capture_latency_summary(
         self, window_seconds: int = 300
     ) -> dict[str, object]:
@@ -1279,6 +1903,31 @@ class FramesStore:
             logger.error("insert_ocr_text failed frame_id=%d: %s", frame_id, e)
             return False
 
+    def get_ocr_boxes(self, frame_id: int) -> Optional[dict]:
+        """Return the stored OCR bounding boxes (``ocr_text.text_json``).
+
+        Returns:
+            Dict with boxes/texts/scores, or None if the frame has no OCR
+            row, no boxes, or the payload is unreadable.
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT text_json FROM ocr_text WHERE frame_id = ?",
+                    (frame_id,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error("get_ocr_boxes failed frame_id=%d: %s", frame_id, e)
+            return None
+        if row is None or not row["text_json"]:
+            return None
+        try:
+            boxes = json.loads(row["text_json"])
+        except (TypeError, ValueError) as e:
+            logger.warning("get_ocr_boxes: bad text_json frame_id=%d: %s", frame_id, e)
+            return None
+        return boxes if isinstance(boxes, dict) and boxes.get("boxes") else None
+
     def update_text_source(self, frame_id: int, text_source: str) -> bool:
         """Update the text_source field for a frame.
 
@@ -1470,6 +2119,8 @@ class FramesStore:
                     )
                     return False
 
+                self._cache_frame_urls(conn, frame_id, text)
+
                 # Delete existing accessibility row if any (idempotency)
                 conn.execute(
                     "DELETE FROM accessibility WHERE frame_id = ?",
@@ -1515,62 +2166,201 @@ class FramesStore:
             )
             return False
 
-    def _insert_elements_with_parent_derivation(
-        self, conn: sqlite3.Connection, frame_id: int, elements: list[dict]
-    ) -> None:
-        """Insert elements with parent_id and sort_order derived from depth-first ordering.
+    def complete_ocr_frame(
+        self,
+        frame_id: int,
+        text: str,
+        ocr_engine: str,
+        app_name: Optional[str],
+        window_name: Optional[str],
+        text_json: Optional[str] = None,
+    ) -> bool:
+        """Complete a frame with OCR results in one transaction.
 
-        The depth stack tracks the path from root to current position, enabling
-        correct parent_id assignment as we traverse the tree in depth-first order.
+        Replaces the insert_ocr_text / update_text_source /
+        update_frames_ocr_text / update_full_text / advance_frame_status /
+        try_set_queryable_standalone sequence (one commit each) with a single
+        commit, and touches full_text once so frames_au reindexes FTS once.
+
+        Writes to:
+        - ocr_text (INSERT OR IGNORE, as insert_ocr_text)
+        - frames (text_source, ocr_text, full_text, status, processed_at)
+        - frames.visibility_status when every stage is complete
+
+        Args:
+            frame_id: The frame ID; must be in status 'processing'
+            text: Extracted OCR text (must be non-empty)
+            ocr_engine: Engine name (e.g., 'rapidocr')
+            app_name: Application name from frame metadata
+            window_name: Window name from frame metadata
+            text_json: JSON string with bounding boxes
+
+        Returns:
+            True if committed, False if the frame was no longer 'processing'
+            or the write failed (nothing is written in either case).
+        """
+        assert text and len(text) > 0, (
+            f"complete_ocr_frame: refusing empty text for frame_id={frame_id}"
+        )
+
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    """
+                    UPDATE frames SET
+                        text_source = 'ocr',
+                        ocr_text = ?,
+                        full_text = ?,
+                        status = 'completed',
+                        processed_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+                    WHERE id = ? AND status = 'processing'
+                    """,
+                    (text, text, frame_id),
+                )
+                if cursor.rowcount == 0:
+                    conn.rollback()
+                    logger.warning(
+                        "complete_ocr_frame: frame_id=%d not in processing", frame_id
+                    )
+                    return False
+                self._cache_frame_urls(conn, frame_id, text)
+
+                cursor = conn.execute(
+                    """
+                    INSERT OR IGNORE INTO ocr_text
+                        (frame_id, text, text_length, text_json, ocr_engine, app_name, window_name)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (frame_id, text, len(text), text_json, ocr_engine, app_name, window_name),
+                )
+                if cursor.rowcount == 0:
+                    logger.warning(
+                        "complete_ocr_frame: ocr_text row already exists for frame_id=%d",
+                        frame_id,
+                    )
+
+                self.try_set_queryable(conn, frame_id)
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            logger.error("complete_ocr_frame failed frame_id=%d: %s", frame_id, e)
+            return False
+
+    def _insert_elements_with_parent_derivation(
+        self, conn: sqlite3.Connection, frame_id: int, elements: list[dict]
+    ) -> None:
+        """Insert elements with parent_id and sort_order derived from depth-first ordering.
+
+        Element ids are pre-assigned from the table's high-water mark so the
+        parent links can be derived in memory and the whole tree written with
+        one ``executemany`` instead of one statement per node. The caller
+        must already hold the write lock (any earlier write in the same
+        transaction does), so no other connection can take the same ids.
 
         Args:
             conn: Active database connection
             frame_id: The frame ID
             elements: List of element dicts in depth-first order
         """
-        depth_stack: list[tuple[int, int]] = []  # Stack of (depth, element_id)
-
-        for sort_order, elem in enumerate(elements):
-            depth = elem.get("depth", 0)
-
-            # Pop stack until we find a shallower depth (potential parent)
-            while depth_stack and depth_stack[-1][0] >= depth:
-                depth_stack.pop()
+        if not elements:
+            return
+        first_id = conn.execute(
+            """
+            SELECT MAX(
+                COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'elements'), 0),
+                COALESCE((SELECT MAX(id) FROM elements), 0)
+            ) + 1
+            """
+        ).fetchone()[0]
+        conn.executemany(
+            """
+            INSERT INTO elements (
+                id, frame_id, source, role, text, parent_id, depth,
+                left_bound, top_bound, width_bound, height_bound, sort_order
+            ) VALUES (?, ?, 'accessibility', ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            _derive_element_rows(frame_id, elements, first_id),
+        )
 
-            # Parent is the last element with depth < current depth
-            parent_id = depth_stack[-1][1] if depth_stack else None
+    def compact_accessibility_trees(
+        self, older_than_days: int, batch_size: int = 500
+    ) -> int:
+        """Store old frames' ``accessibility_tree_json`` as a compressed blob.
 
-            # Extract bounds if present
-            bounds = elem.get("bounds") or {}
-            left_bound = bounds.get("left") if isinstance(bounds, dict) else None
-            top_bound = bounds.get("top") if isinstance(bounds, dict) else None
-            width_bound = bounds.get("width") if isinstance(bounds, dict) else None
-            height_bound = bounds.get("height") if isinstance(bounds, dict) else None
+        The tree JSON is only kept for provenance (the ``elements`` rows are
+        the queryable copy), so frames older than ``older_than_days`` keep it
+        zstd- or gzip-compressed. Use ``get_accessibility_tree_json`` to read
+        it back transparently.
 
-            # Insert element
-            cursor = conn.execute(
-                """
-                INSERT INTO elements (
-                    frame_id, source, role, text, parent_id, depth,
-                    left_bound, top_bound, width_bound, height_bound, sort_order
-                ) VALUES (?, 'accessibility', ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    frame_id,
-                    elem.get("role"),
-                    elem.get("text"),
-                    parent_id,
-                    depth,
-                    left_bound,
-                    top_bound,
-                    width_bound,
-                    height_bound,
-                    sort_order,
-                ),
+        Returns:
+            Number of frames compacted.
+        """
+        cutoff = (
+            datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        ).strftime("%Y-%m-%dT%H:%M:%SZ")
+        encoding = supported_encodings()[0]
+        compacted = 0
+        try:
+            with self._connect() as conn:
+                while True:
+                    rows = conn.execute(
+                        """
+                        SELECT id, accessibility_tree_json FROM frames
+                        WHERE timestamp < ?
+                          AND typeof(accessibility_tree_json) = 'text'
+                          AND length(accessibility_tree_json) > 0
+                        LIMIT ?
+                        """,
+                        (cutoff, batch_size),
+                    ).fetchall()
+                    if not rows:
+                        break
+                    conn.executemany(
+                        "UPDATE frames SET accessibility_tree_json = ? WHERE id = ?",
+                        [
+                            (
+                                compress(
+                                    row["accessibility_tree_json"].encode("utf-8"),
+                                    encoding,
+                                ),
+                                row["id"],
+                            )
+                            for row in rows
+                        ],
+                    )
+                    conn.commit()
+                    compacted += len(rows)
+        except sqlite3.Error as e:
+            logger.error("compact_accessibility_trees failed: %s", e)
+        if compacted:
+            logger.info(
+                "Compacted accessibility trees of %d frame(s) older than %s (%s)",
+                compacted,
+                cutoff,
+                encoding,
             )
+        return compacted
 
-            # Push current element to stack
-            depth_stack.append((depth, cursor.lastrowid))
+    def get_accessibility_tree_json(self, frame_id: int) -> Optional[str]:
+        """Return a frame's accessibility tree JSON, decompressing if compacted."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT accessibility_tree_json FROM frames WHERE id = ?",
+                    (frame_id,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(
+                "get_accessibility_tree_json failed frame_id=%d: %s", frame_id, e
+            )
+            return None
+        if row is None or row[0] is None:
+            return None
+        value = row[0]
+        if isinstance(value, bytes):
+            raw = decompress(value, detect_encoding(value), _MAX_TREE_JSON_BYTES)
+            return raw.decode("utf-8")
+        return value
 
     def list_accessibility_for_frame(self, frame_id: int) -> list[dict]:
         """Get accessibility rows for a frame.
@@ -1645,7 +2435,8 @@ class FramesStore:
                        processed_at, capture_trigger, device_name, error_message,
                        accessibility_text, ocr_text, full_text, browser_url, focused,
                        description_status, embedding_status, visibility_status,
-                       event_ts
+                       event_ts, storage_tier, storage_offset, storage_length,
+                       storage_scale
                 FROM frames
                 WHERE id = ?
                 """,
@@ -1677,7 +2468,8 @@ class FramesStore:
             row = conn.execute(
                 """
                 SELECT id, capture_id, timestamp, app_name, window_name,
-                       snapshot_path, full_text
+                       snapshot_path, full_text, storage_tier, storage_offset,
+                       storage_length, storage_scale
                 FROM frames
                 WHERE id = ?
                 """,
@@ -1743,9 +2535,11 @@ class FramesStore:
     ) -> list[dict]:
         """Return apps with accurate usage minutes from timestamp gaps.
 
-        Uses SQLite LEAD() window function to calculate the actual time gap
-        between consecutive frames per app. Only gaps < 300 seconds (5 min)
-        count toward usage time, filtering out "away from computer" periods.
+        Usage time is the sum of gaps between consecutive frames per app
+        within the range. Only gaps < 300 seconds (5 min) count toward
+        usage time, filtering out "away from computer" periods. Whole
+        5-minute buckets are read from ``activity_rollups``; see
+        :meth:`_activity_rollup_totals`.
 
         Also returns first_seen and last_seen timestamps.
 
@@ -1757,69 +2551,27 @@ class FramesStore:
         Returns:
             List of dicts with name, frame_count, minutes, first_seen, last_seen
         """
-        apps = []
         try:
             with self._connect() as conn:
-                if app_name:
-                    inner_sql = """
-                        SELECT
-                            app_name,
-                            local_timestamp AS ts,
-                            (JULIANDAY(LEAD(local_timestamp) OVER (
-                                PARTITION BY app_name ORDER BY local_timestamp
-                            )) - JULIANDAY(local_timestamp)) * 86400.0 AS gap_sec
-                        FROM frames
-                        WHERE visibility_status = 'queryable'
-                          AND app_name = ?
-                          AND local_timestamp >= ?
-                          AND local_timestamp <= ?
-                    """
-                    params = [app_name, start_time, end_time]
-                else:
-                    inner_sql = """
-                        SELECT
-                            app_name,
-                            local_timestamp AS ts,
-                            (JULIANDAY(LEAD(local_timestamp) OVER (
-                                PARTITION BY app_name ORDER BY local_timestamp
-                            )) - JULIANDAY(local_timestamp)) * 86400.0 AS gap_sec
-                        FROM frames
-                        WHERE visibility_status = 'queryable'
-                          AND local_timestamp >= ?
-                          AND local_timestamp <= ?
-                          AND app_name IS NOT NULL
-                          AND app_name != ''
-                    """
-                    params = [start_time, end_time]
-
-                sql = f"""
-                    SELECT
-                        app_name,
-                        COUNT(*) AS frame_count,
-                        ROUND(SUM(
-                            CASE WHEN gap_sec < 300 THEN gap_sec ELSE 0 END
-                        ) / 60.0, 1) AS minutes,
-                        MIN(ts) AS first_seen,
-                        MAX(ts) AS last_seen
-                    FROM (
-                        {inner_sql}
-                    )
-                    GROUP BY app_name
-                    ORDER BY minutes DESC
-                """
-
-                rows = conn.execute(sql, params).fetchall()
-
-                for row in rows:
-                    apps.append({
-                        "name": row["app_name"] or "Unknown",
-                        "frame_count": row["frame_count"],
-                        "minutes": row["minutes"] or 0.0,
-                        "first_seen": row["first_seen"],
-                        "last_seen": row["last_seen"],
-                    })
+                totals = self._activity_rollup_totals(conn, start_time, end_time, app_name)
+                if totals is None:
+                    return self._activity_summary_apps_raw(conn, start_time, end_time, app_name)
         except sqlite3.Error as e:
             logger.error("get_activity_summary_apps failed: %s", e)
+            return []
+
+        apps = [
+            {
+                "name": name,
+                "frame_count": agg["frame_count"],
+                "minutes": round(agg["active_seconds"] / 60.0, 1),
+                "first_seen": agg["first_seen"],
+                "last_seen": agg["last_seen"],
+            }
+            for name, agg in totals.items()
+            if name
+        ]
+        apps.sort(key=lambda app: app["minutes"], reverse=True)
         return apps
 
     def get_activity_summary_total_frames(
@@ -1840,21 +2592,12 @@ class FramesStore:
         """
         try:
             with self._connect() as conn:
-                sql = """
-                    SELECT COUNT(*) AS cnt
-                    FROM frames
-                    WHERE visibility_status = 'queryable'
-                      AND local_timestamp >= ?
-                      AND local_timestamp <= ?
-                """
-                params: list = [start_time, end_time]
-
-                if app_name:
-                    sql += " AND app_name = ?"
-                    params.append(app_name)
-
-                row = conn.execute(sql, params).fetchone()
-                return row["cnt"] if row else 0
+                totals = self._activity_rollup_totals(conn, start_time, end_time, app_name)
+                if totals is None:
+                    return self._activity_summary_total_frames_raw(
+                        conn, start_time, end_time, app_name
+                    )
+                return sum(agg["frame_count"] for agg in totals.values())
         except sqlite3.Error as e:
             logger.error("get_activity_summary_total_frames failed: %s", e)
             return 0
@@ -1877,29 +2620,323 @@ class FramesStore:
         """
         try:
             with self._connect() as conn:
-                sql = """
-                    SELECT MIN(local_timestamp) AS start, MAX(local_timestamp) AS end
+                totals = self._activity_rollup_totals(conn, start_time, end_time, app_name)
+                if totals is None:
+                    return self._activity_summary_time_range_raw(
+                        conn, start_time, end_time, app_name
+                    )
+        except sqlite3.Error as e:
+            logger.error("get_activity_summary_time_range failed: %s", e)
+            return None
+
+        if not totals:
+            return None
+        return {
+            "start": min(agg["first_seen"] for agg in totals.values()),
+            "end": max(agg["last_seen"] for agg in totals.values()),
+        }
+
+    def _activity_rollup_totals(
+        self,
+        conn: sqlite3.Connection,
+        start_time: str,
+        end_time: str,
+        app_name: Optional[str] = None,
+    ) -> Optional[dict[Optional[str], dict]]:
+        """Per-app activity totals over [start, end] using activity_rollups.
+
+        Whole buckets come from the rollup table; the partial buckets at
+        either end are read from raw frames. Each frame carries its gap to
+        the next frame of its app, so the last frame in range is credited
+        with a gap that reaches past ``end_time``. That gap is subtracted
+        again, which makes the result match the in-range LEAD() query.
+
+        Returns:
+            Dict app_name -> frame_count/active_seconds/first_seen/last_seen,
+            or None when the range cannot use the rollups (short or
+            non-local bounds, database without the rollup migration).
+        """
+        interior = _rollup_interior(start_time, end_time)
+        if interior is None:
+            return None
+        first_bucket, last_bucket = interior
+        app_sql = " AND app_name = ?" if app_name else ""
+        frames_app_sql = " AND f.app_name = ?" if app_name else ""
+        app_params = [app_name] if app_name else []
+
+        # Partial buckets: a few minutes of frames, so pin the time-range index
+        frames_sql = f"""
+            SELECT g.app_name, COUNT(*) AS frame_count,
+                   TOTAL(CASE WHEN g.gap_sec < 300 THEN g.gap_sec END) AS active_seconds,
+                   MIN(g.ts) AS first_seen, MAX(g.ts) AS last_seen
+            FROM frames f INDEXED BY idx_frames_visibility_local_ts
+            JOIN activity_frame_gaps g ON g.id = f.id
+            WHERE f.visibility_status = 'queryable'
+              AND f.local_timestamp >= ? AND f.local_timestamp {{op}} ?{frames_app_sql}
+            GROUP BY g.app_name
+        """
+        try:
+            parts = [
+                conn.execute(
+                    frames_sql.format(op="<"), [start_time, first_bucket, *app_params]
+                ).fetchall(),
+                conn.execute(
+                    f"""
+                    SELECT app_name, SUM(frame_count) AS frame_count,
+                           TOTAL(active_seconds) AS active_seconds,
+                           MIN(first_seen) AS first_seen, MAX(last_seen) AS last_seen
+                    FROM activity_rollups
+                    WHERE bucket_start >= ? AND bucket_start < ?{app_sql}
+                    GROUP BY app_name
+                    """,
+                    [first_bucket, last_bucket, *app_params],
+                ).fetchall(),
+                conn.execute(
+                    frames_sql.format(op="<="), [last_bucket, end_time, *app_params]
+                ).fetchall(),
+            ]
+        except sqlite3.OperationalError as e:
+            logger.debug("activity rollups unavailable, using raw frames: %s", e)
+            return None
+
+        totals: dict[Optional[str], dict] = {}
+        for rows in parts:
+            for row in rows:
+                agg = totals.get(row["app_name"])
+                if agg is None:
+                    totals[row["app_name"]] = {
+                        "frame_count": row["frame_count"],
+                        "active_seconds": row["active_seconds"],
+                        "first_seen": row["first_seen"],
+                        "last_seen": row["last_seen"],
+                    }
+                    continue
+                agg["frame_count"] += row["frame_count"]
+                agg["active_seconds"] += row["active_seconds"]
+                agg["first_seen"] = min(agg["first_seen"], row["first_seen"])
+                agg["last_seen"] = max(agg["last_seen"], row["last_seen"])
+
+        for name, agg in totals.items():
+            row = conn.execute(
+                """
+                SELECT gap_sec FROM activity_frame_gaps
+                WHERE app_name IS ? AND ts >= ? AND ts <= ?
+                ORDER BY ts DESC, id DESC
+                LIMIT 1
+                """,
+                (name, start_time, end_time),
+            ).fetchone()
+            if row is not None and row["gap_sec"] is not None and row["gap_sec"] < 300:
+                agg["active_seconds"] = max(0.0, agg["active_seconds"] - row["gap_sec"])
+        return totals
+
+    def rebuild_activity_rollups(self) -> int:
+        """Recompute activity_rollups from all queryable frames.
+
+        The triggers keep the table current; this is the backfill/repair
+        job for use after bulk imports or a failed consistency check.
+
+        Returns:
+            Number of (bucket, app) rows written.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM activity_rollups")
+            cursor = conn.execute(
+                """
+                INSERT INTO activity_rollups
+                    (bucket_start, app_name, frame_count, active_seconds, first_seen, last_seen)
+                SELECT
+                    substr(ts, 1, 14)
+                        || printf('%02d', CAST(substr(ts, 15, 2) AS INTEGER) / 5 * 5)
+                        || ':00',
+                    app_name,
+                    COUNT(*),
+                    TOTAL(CASE WHEN gap_sec < 300 THEN gap_sec END),
+                    MIN(ts),
+                    MAX(ts)
+                FROM (
+                    SELECT
+                        app_name,
+                        local_timestamp AS ts,
+                        (JULIANDAY(LEAD(local_timestamp) OVER (
+                            PARTITION BY app_name ORDER BY local_timestamp, id
+                        )) - JULIANDAY(local_timestamp)) * 86400.0 AS gap_sec
                     FROM frames
                     WHERE visibility_status = 'queryable'
-                      AND local_timestamp >= ?
-                      AND local_timestamp <= ?
+                )
+                WHERE length(ts) >= 16
+                GROUP BY 1, app_name
                 """
-                params: list = [start_time, end_time]
+            )
+            count = cursor.rowcount
+            conn.commit()
+        logger.info("rebuild_activity_rollups: %d buckets", count)
+        return count
+
+    def check_activity_rollups(
+        self,
+        start_time: str,
+        end_time: str,
+        app_name: Optional[str] = None,
+    ) -> dict:
+        """Compare the rollup answer for a range with the raw LEAD() query.
 
-                if app_name:
-                    sql += " AND app_name = ?"
-                    params.append(app_name)
+        Returns:
+            Dict with ``consistent`` plus a ``mismatches`` list of
+            {name, field, rollup, raw} entries. Minutes may differ by the
+            0.1 rounding step.
+        """
+        with self._connect() as conn:
+            raw_apps = self._activity_summary_apps_raw(conn, start_time, end_time, app_name)
+            raw_total = self._activity_summary_total_frames_raw(
+                conn, start_time, end_time, app_name
+            )
+        rolled = {app["name"]: app for app in self.get_activity_summary_apps(
+            start_time, end_time, app_name
+        )}
+        rolled_total = self.get_activity_summary_total_frames(start_time, end_time, app_name)
+
+        mismatches = []
+        if rolled_total != raw_total:
+            mismatches.append(
+                {"name": None, "field": "total_frames", "rollup": rolled_total, "raw": raw_total}
+            )
+        for raw in raw_apps:
+            app = rolled.pop(raw["name"], None)
+            if app is None:
+                mismatches.append({"name": raw["name"], "field": "app", "rollup": None, "raw": raw})
+                continue
+            for field in ("frame_count", "first_seen", "last_seen"):
+                if app[field] != raw[field]:
+                    mismatches.append(
+                        {"name": raw["name"], "field": field, "rollup": app[field], "raw": raw[field]}
+                    )
+            if abs(app["minutes"] - raw["minutes"]) > 0.1 + 1e-9:
+                mismatches.append(
+                    {"name": raw["name"], "field": "minutes", "rollup": app["minutes"], "raw": raw["minutes"]}
+                )
+        for name, app in rolled.items():
+            mismatches.append({"name": name, "field": "app", "rollup": app, "raw": None})
 
-                row = conn.execute(sql, params).fetchone()
-                if row and row["start"] and row["end"]:
-                    return {
-                        "start": row["start"],
-                        "end": row["end"],
-                    }
-                return None
-        except sqlite3.Error as e:
-            logger.error("get_activity_summary_time_range failed: %s", e)
-            return None
+        return {"consistent": not mismatches, "mismatches": mismatches}
+
+    def _activity_summary_apps_raw(
+        self,
+        conn: sqlite3.Connection,
+        start_time: str,
+        end_time: str,
+        app_name: Optional[str] = None,
+    ) -> list[dict]:
+        """get_activity_summary_apps via a LEAD() window over the whole range."""
+        if app_name:
+            inner_sql = """
+                SELECT
+                    app_name,
+                    local_timestamp AS ts,
+                    (JULIANDAY(LEAD(local_timestamp) OVER (
+                        PARTITION BY app_name ORDER BY local_timestamp
+                    )) - JULIANDAY(local_timestamp)) * 86400.0 AS gap_sec
+                FROM frames
+                WHERE visibility_status = 'queryable'
+                  AND app_name = ?
+                  AND local_timestamp >= ?
+                  AND local_timestamp <= ?
+            """
+            params = [app_name, start_time, end_time]
+        else:
+            inner_sql = """
+                SELECT
+                    app_name,
+                    local_timestamp AS ts,
+                    (JULIANDAY(LEAD(local_timestamp) OVER (
+                        PARTITION BY app_name ORDER BY local_timestamp
+                    )) - JULIANDAY(local_timestamp)) * 86400.0 AS gap_sec
+                FROM frames
+                WHERE visibility_status = 'queryable'
+                  AND local_timestamp >= ?
+                  AND local_timestamp <= ?
+                  AND app_name IS NOT NULL
+                  AND app_name != ''
+            """
+            params = [start_time, end_time]
+
+        sql = f"""
+            SELECT
+                app_name,
+                COUNT(*) AS frame_count,
+                ROUND(SUM(
+                    CASE WHEN gap_sec < 300 THEN gap_sec ELSE 0 END
+                ) / 60.0, 1) AS minutes,
+                MIN(ts) AS first_seen,
+                MAX(ts) AS last_seen
+            FROM (
+                {inner_sql}
+            )
+            GROUP BY app_name
+            ORDER BY minutes DESC
+        """
+
+        return [
+            {
+                "name": row["app_name"] or "Unknown",
+                "frame_count": row["frame_count"],
+                "minutes": row["minutes"] or 0.0,
+                "first_seen": row["first_seen"],
+                "last_seen": row["last_seen"],
+            }
+            for row in conn.execute(sql, params).fetchall()
+        ]
+
+    def _activity_summary_total_frames_raw(
+        self,
+        conn: sqlite3.Connection,
+        start_time: str,
+        end_time: str,
+        app_name: Optional[str] = None,
+    ) -> int:
+        sql = """
+            SELECT COUNT(*) AS cnt
+            FROM frames
+            WHERE visibility_status = 'queryable'
+              AND local_timestamp >= ?
+              AND local_timestamp <= ?
+        """
+        params: list = [start_time, end_time]
+
+        if app_name:
+            sql += " AND app_name = ?"
+            params.append(app_name)
+
+        row = conn.execute(sql, params).fetchone()
+        return row["cnt"] if row else 0
+
+    def _activity_summary_time_range_raw(
+        self,
+        conn: sqlite3.Connection,
+        start_time: str,
+        end_time: str,
+        app_name: Optional[str] = None,
+    ) -> Optional[dict]:
+        sql = """
+            SELECT MIN(local_timestamp) AS start, MAX(local_timestamp) AS end
+            FROM frames
+            WHERE visibility_status = 'queryable'
+              AND local_timestamp >= ?
+              AND local_timestamp <= ?
+        """
+        params: list = [start_time, end_time]
+
+        if app_name:
+            sql += " AND app_name = ?"
+            params.append(app_name)
+
+        row = conn.execute(sql, params).fetchone()
+        if row and row["start"] and row["end"]:
+            return {
+                "start": row["start"],
+                "end": row["end"],
+            }
+        return None
 
     MAX_TEXT_LENGTH = 5000
 
@@ -1914,70 +2951,134 @@ class FramesStore:
             - text: accessibility_text or ocr_text, middle-truncated at MAX_TEXT_LENGTH chars
             - text_source: 'accessibility' | 'ocr' | 'hybrid' | None
             - urls: extracted from text via regex
-            - browser_url, status, visibility_status: frame metadata
+            - browser_url, status, visibility_status, description_status: frame metadata
 
         Text is always middle-truncated at MAX_TEXT_LENGTH (5000) chars when exceeding the limit.
         """
         try:
-            with self._connect() as conn:
-                row = conn.execute(
-                    """
-                    SELECT f.id, f.accessibility_text, f.ocr_text, f.text_source,
-                           f.browser_url, f.status, f.visibility_status,
-                           f.local_timestamp AS timestamp, f.app_name, f.window_name
-                    FROM frames f
-                    WHERE f.id = ?
-                    """,
-                    (frame_id,),
-                ).fetchone()
-
-                if row is None:
-                    return None
-
-                frame_id_val = row["id"]
-                # Use frames.ocr_text for OCR frames, frames.accessibility_text for accessibility frames
-                if row["text_source"] == "ocr":
-                    text = row["ocr_text"] or ""
-                else:
-                    text = row["accessibility_text"] or ""
-                text_source = row["text_source"]
-                browser_url = row["browser_url"]
-                status = row["status"]
-                visibility_status = row["visibility_status"]
-                timestamp = row["timestamp"]
-                app_name = row["app_name"]
-                window_name = row["window_name"]
-
-                urls: list[str] = []
-
-                # Extract URLs from text using regex (screenpipe-aligned)
-                for url in self._extract_urls_from_text(text):
-                    if url not in urls:
-                        urls.append(url)
-
-                # Apply fixed text truncation at MAX_TEXT_LENGTH with middle-truncation
-                result_text = text
-                if len(result_text) > self.MAX_TEXT_LENGTH:
-                    half = self.MAX_TEXT_LENGTH // 2
-                    removed = len(result_text) - self.MAX_TEXT_LENGTH
-                    result_text = result_text[:half] + f"...{removed} chars..." + result_text[-half:]
-
-                return {
-                    "frame_id": frame_id_val,
-                    "timestamp": timestamp,
-                    "app_name": app_name,
-                    "window_name": window_name,
-                    "text": result_text,
-                    "text_source": text_source,
-                    "urls": urls,
-                    "browser_url": browser_url,
-                    "status": status,
-                    "visibility_status": visibility_status,
-                }
+            return self.get_frame_contexts([frame_id]).get(frame_id)
         except Exception:
             logger.exception(f"Error getting frame context for frame_id={frame_id}")
             return None
 
+    def get_frame_contexts(self, frame_ids: Sequence[int]) -> dict[int, dict]:
+        """Return ``get_frame_context`` dicts for several frames in one query.
+
+        The text is middle-truncated in SQL, so oversized texts are never
+        loaded; URLs come from the ``frame_urls`` cache (see
+        ``_frame_urls``). Frames that do not exist are left out.
+
+        Raises:
+            sqlite3.Error: If the query fails.
+        """
+        if not frame_ids:
+            return {}
+        half = self.MAX_TEXT_LENGTH // 2
+        placeholders = ",".join("?" * len(frame_ids))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT id, timestamp, app_name, window_name, text_source, browser_url,
+                       status, visibility_status, description_status,
+                       CASE WHEN length(t) > ?
+                            THEN substr(t, 1, ?) || '...' || (length(t) - ?) || ' chars...'
+                                 || substr(t, -?)
+                            ELSE t
+                       END AS text
+                FROM (
+                    SELECT f.id, f.local_timestamp AS timestamp, f.app_name, f.window_name,
+                           f.text_source, f.browser_url, f.status, f.visibility_status,
+                           f.description_status,
+                           -- frames.ocr_text for OCR frames, accessibility_text otherwise
+                           CASE WHEN f.text_source = 'ocr' THEN COALESCE(f.ocr_text, '')
+                                ELSE COALESCE(f.accessibility_text, '')
+                           END AS t
+                    FROM frames f
+                    WHERE f.id IN ({placeholders})
+                )
+                """,
+                (self.MAX_TEXT_LENGTH, half, self.MAX_TEXT_LENGTH, half, *frame_ids),
+            ).fetchall()
+            urls = self._frame_urls(conn, [row["id"] for row in rows])
+
+        return {
+            row["id"]: {
+                "frame_id": row["id"],
+                "timestamp": row["timestamp"],
+                "app_name": row["app_name"],
+                "window_name": row["window_name"],
+                "text": row["text"],
+                "text_source": row["text_source"],
+                "urls": urls.get(row["id"], []),
+                "browser_url": row["browser_url"],
+                "status": row["status"],
+                "visibility_status": row["visibility_status"],
+                "description_status": row["description_status"],
+            }
+            for row in rows
+        }
+
+    def _frame_urls(self, conn: sqlite3.Connection, frame_ids: Sequence[int]) -> dict[int, list[str]]:
+        """URLs in each frame's context text, from the ``frame_urls`` cache.
+
+        Frames not cached yet (ingested before the cache existed, or whose
+        text changed since) are scanned once and cached.
+        """
+        if not frame_ids:
+            return {}
+        placeholders = ",".join("?" * len(frame_ids))
+        try:
+            urls = {
+                row["frame_id"]: json.loads(row["urls_json"])
+                for row in conn.execute(
+                    f"SELECT frame_id, urls_json FROM frame_urls WHERE frame_id IN ({placeholders})",
+                    tuple(frame_ids),
+                )
+            }
+            cache_available = True
+        except sqlite3.OperationalError as e:
+            logger.debug("frame_urls cache unavailable, scanning text: %s", e)
+            urls, cache_available = {}, False
+
+        missing = [frame_id for frame_id in frame_ids if frame_id not in urls]
+        if not missing:
+            return urls
+        rows = conn.execute(
+            f"""
+            SELECT id, CASE WHEN text_source = 'ocr' THEN ocr_text ELSE accessibility_text END AS t
+            FROM frames WHERE id IN ({",".join("?" * len(missing))})
+            """,
+            tuple(missing),
+        ).fetchall()
+        scanned = {row["id"]: self._context_urls(row["t"] or "") for row in rows}
+        urls.update(scanned)
+        if cache_available and scanned:
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO frame_urls (frame_id, urls_json) VALUES (?, ?)",
+                    [(frame_id, json.dumps(found)) for frame_id, found in scanned.items()],
+                )
+                conn.commit()
+            except sqlite3.OperationalError as e:
+                # Best effort: e.g. the write lock is busy; scan again next time
+                conn.rollback()
+                logger.debug("frame_urls cache write skipped: %s", e)
+        return urls
+
+    def _cache_frame_urls(self, conn: sqlite3.Connection, frame_id: int, text: str) -> None:
+        """Cache the URLs of a frame's new context text in the caller's transaction."""
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO frame_urls (frame_id, urls_json) VALUES (?, ?)",
+                (frame_id, json.dumps(self._context_urls(text))),
+            )
+        except sqlite3.OperationalError as e:
+            logger.debug("frame_urls cache unavailable: %s", e)
+
+    def _context_urls(self, text: str) -> list[str]:
+        """Unique URLs of a frame's context text, in first-seen order."""
+        return list(dict.fromkeys(self._extract_urls_from_text(text)))
+
     def _extract_urls_from_text(self, text: str) -> list[str]:
         """Extract URLs from text using regex (screenpipe-aligned).
 
@@ -1999,15 +3100,17 @@ class FramesStore:
     # Description task methods
     # ======================================================================
 
-    def insert_description_task(self, conn: sqlite3.Connection, frame_id: int) -> None:
-        """Insert a pending description task. Idempotent via UNIQUE constraint."""
-        conn.execute(
-            """
-            INSERT OR IGNORE INTO description_tasks (frame_id, status)
-            VALUES (?, 'pending')
-            """,
-            (frame_id,),
-        )
+    def insert_description_task(
+        self,
+        conn: sqlite3.Connection,
+        frame_id: int,
+        lane: int = LANE_LIVE,
+    ) -> None:
+        """Insert a pending description task. Idempotent via UNIQUE constraint.
+
+        A still-pending task is promoted if ``lane`` outranks its own.
+        """
+        self._upsert_task(conn, "description_tasks", frame_id, lane)
         conn.execute(
             """
             UPDATE frames
@@ -2017,15 +3120,17 @@ class FramesStore:
             (frame_id,),
         )
 
-    def insert_embedding_task(self, conn: sqlite3.Connection, frame_id: int) -> None:
-        """Insert a pending embedding task. Idempotent via UNIQUE constraint."""
-        conn.execute(
-            """
-            INSERT OR IGNORE INTO embedding_tasks (frame_id, status)
-            VALUES (?, 'pending')
-            """,
-            (frame_id,),
-        )
+    def insert_embedding_task(
+        self,
+        conn: sqlite3.Connection,
+        frame_id: int,
+        lane: int = LANE_LIVE,
+    ) -> None:
+        """Insert a pending embedding task. Idempotent via UNIQUE constraint.
+
+        A still-pending task is promoted if ``lane`` outranks its own.
+        """
+        self._upsert_task(conn, "embedding_tasks", frame_id, lane)
         conn.execute(
             """
             UPDATE frames
@@ -2035,68 +3140,171 @@ class FramesStore:
             (frame_id,),
         )
 
+    @staticmethod
+    def _upsert_task(conn: sqlite3.Connection, table: str, frame_id: int, lane: int) -> None:
+        conn.execute(
+            f"""
+            INSERT INTO {table} (frame_id, status, priority)
+            VALUES (?, 'pending', ?)
+            ON CONFLICT(frame_id) DO UPDATE
+            SET priority = MIN(priority, excluded.priority)
+            WHERE status = 'pending'
+            """,
+            (frame_id, lane),
+        )
+
     def claim_description_task(
         self,
         conn: sqlite3.Connection,
+        lanes: Sequence[int] = DEFAULT_LANE_ORDER,
     ) -> Optional[dict]:
         """Atomically claim the next pending description task. Returns dict or None."""
-        cursor = conn.execute(
-            """
-            WITH next_task AS (
-                SELECT id FROM description_tasks
-                WHERE (
-                    status = 'pending'
-                    AND (next_retry_at IS NULL OR next_retry_at <= strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
-                ) OR (
-                    status = 'processing'
-                    AND started_at <= strftime('%Y-%m-%dT%H:%M:%fZ', 'now', '-5 minutes')
-                )
-                ORDER BY status = 'processing' DESC, id ASC
-                LIMIT 1
-            )
-            UPDATE description_tasks
-            SET status = 'processing',
-                started_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
-            WHERE id IN (SELECT id FROM next_task)
-            RETURNING id, frame_id, retry_count
-            """,
-        )
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        conn.commit()
-        return {"id": row[0], "frame_id": row[1], "retry_count": row[2]}
+        tasks = self.claim_description_tasks(conn, limit=1, lanes=lanes)
+        return tasks[0] if tasks else None
+
+    def claim_description_tasks(
+        self,
+        conn: sqlite3.Connection,
+        limit: int,
+        lanes: Sequence[int] = DEFAULT_LANE_ORDER,
+    ) -> list[dict]:
+        """Atomically claim up to ``limit`` description tasks.
+
+        Stale ``processing`` tasks come first, then pending tasks lane by
+        lane in ``lanes`` order, oldest first within a lane.
+        """
+        return self._claim_tasks(conn, "description_tasks", limit, lanes)
 
     def claim_embedding_task(
         self,
         conn: sqlite3.Connection,
+        lanes: Sequence[int] = DEFAULT_LANE_ORDER,
     ) -> Optional[dict]:
         """Atomically claim the next pending embedding task. Returns dict or None."""
-        cursor = conn.execute(
-            """
-            WITH next_task AS (
-                SELECT id FROM embedding_tasks
-                WHERE (
-                    status = 'pending'
-                    AND (next_retry_at IS NULL OR next_retry_at <= strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
-                ) OR (
-                    status = 'processing'
-                    AND started_at <= strftime('%Y-%m-%dT%H:%M:%fZ', 'now', '-5 minutes')
-                )
-                ORDER BY status = 'processing' DESC, created_at ASC
-                LIMIT 1
+        tasks = self._claim_tasks(conn, "embedding_tasks", 1, lanes)
+        return tasks[0] if tasks else None
+
+    def _claim_tasks(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        limit: int,
+        lanes: Sequence[int],
+    ) -> list[dict]:
+        # One UPDATE per lane so each walks the (status, priority, ...) index
+        # instead of sorting every pending row by an expression.
+        order_column = _TASK_QUEUE_ORDER[table]
+        claim_sql = f"""
+            UPDATE {table}
+            SET status = 'processing',
+                started_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+            WHERE id IN (
+                SELECT id FROM {table}
+                WHERE {{where}}
+                ORDER BY {order_column} ASC
+                LIMIT ?
             )
-            UPDATE embedding_tasks
-            SET status = 'processing', started_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
-            WHERE id = (SELECT id FROM next_task)
-            RETURNING id, frame_id, retry_count
-            """
+            RETURNING id, frame_id, retry_count, priority
+        """
+        limit = max(1, limit)
+        rows = conn.execute(
+            claim_sql.format(
+                where="status = 'processing' "
+                "AND started_at <= strftime('%Y-%m-%dT%H:%M:%fZ', 'now', '-5 minutes')"
+            ),
+            (limit,),
+        ).fetchall()
+        pending_sql = claim_sql.format(
+            where="status = 'pending' AND priority = ? "
+            "AND (next_retry_at IS NULL OR next_retry_at <= strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))"
         )
-        row = cursor.fetchone()
-        if row is None:
-            return None
+        for lane in lanes:
+            if len(rows) >= limit:
+                break
+            # RETURNING order is unspecified
+            claimed = conn.execute(pending_sql, (lane, limit - len(rows))).fetchall()
+            rows.extend(sorted(claimed, key=lambda row: row[0]))
+        if not rows:
+            return []
         conn.commit()
-        return {"id": row[0], "frame_id": row[1], "retry_count": row[2]}
+        return [
+            {"id": row[0], "frame_id": row[1], "retry_count": row[2], "priority": row[3]}
+            for row in rows
+        ]
+
+    def get_pending_lane_waits(self, conn: sqlite3.Connection, queue: str) -> dict[int, float]:
+        """Seconds the oldest claimable pending task of each lane has waited.
+
+        ``queue`` is ``"description"`` or ``"embedding"``.
+        """
+        table = _task_table(queue)
+        order_column = _TASK_QUEUE_ORDER[table]
+        waits: dict[int, float] = {}
+        for lane in DEFAULT_LANE_ORDER:
+            row = conn.execute(
+                f"""
+                SELECT (julianday('now') - julianday(created_at)) * 86400
+                FROM {table}
+                WHERE status = 'pending' AND priority = ?
+                  AND (next_retry_at IS NULL OR next_retry_at <= strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+                ORDER BY {order_column} ASC
+                LIMIT 1
+                """,
+                (lane,),
+            ).fetchone()
+            if row is not None and row[0] is not None:
+                waits[lane] = row[0]
+        return waits
+
+    def get_task_lane_status(self, conn: sqlite3.Connection, queue: str) -> dict[str, dict]:
+        """Per-lane queue depth and wait times for ``queue``.
+
+        ``oldest_pending_seconds`` is how long the oldest pending task has
+        waited; ``avg_wait_seconds_1h`` is the mean enqueue-to-claim time of
+        tasks claimed in the last hour (None when there were none).
+        """
+        table = _task_table(queue)
+        lanes = {
+            name: {
+                "pending": 0,
+                "processing": 0,
+                "oldest_pending_seconds": None,
+                "avg_wait_seconds_1h": None,
+            }
+            for name in LANE_NAMES.values()
+        }
+        # Both queries stay on indexes: active rows via (status, priority, ...)
+        # and the last hour of claims via started_at
+        active = conn.execute(
+            f"""
+            SELECT priority, status, COUNT(*),
+                   (julianday('now') - julianday(MIN(created_at))) * 86400
+            FROM {table}
+            WHERE status IN ('pending', 'processing')
+            GROUP BY priority, status
+            """
+        ).fetchall()
+        for priority, status, count, oldest in active:
+            name = LANE_NAMES.get(priority)
+            if name is None:
+                continue
+            lanes[name][status] = count
+            if status == "pending" and oldest is not None:
+                lanes[name]["oldest_pending_seconds"] = round(oldest, 1)
+        waits = conn.execute(
+            f"""
+            SELECT priority, AVG((julianday(started_at) - julianday(created_at)) * 86400)
+            FROM {table}
+            WHERE started_at >= strftime('%Y-%m-%dT%H:%M:%fZ', 'now', '-1 hour')
+              AND status != 'pending'
+            GROUP BY priority
+            """
+        ).fetchall()
+        for priority, avg_wait in waits:
+            name = LANE_NAMES.get(priority)
+            if name is not None and avg_wait is not None:
+                lanes[name]["avg_wait_seconds_1h"] = round(avg_wait, 1)
+        return lanes
 
     def insert_frame_description(
         self,
@@ -2184,12 +3392,13 @@ class FramesStore:
         """Enqueue all frames without description_status. Returns count."""
         cursor = conn.execute(
             """
-            INSERT OR IGNORE INTO description_tasks (frame_id, status)
-            SELECT id, 'pending'
+            INSERT OR IGNORE INTO description_tasks (frame_id, status, priority)
+            SELECT id, 'pending', ?
             FROM frames
             WHERE description_status IS NULL
               AND snapshot_path IS NOT NULL
-            """
+            """,
+            (LANE_BACKFILL,),
         )
         conn.execute(
             """
@@ -2204,17 +3413,11 @@ class FramesStore:
 
     def get_description_queue_status(self, conn: sqlite3.Connection) -> dict[str, int]:
         """Return count of tasks by status."""
-        cursor = conn.execute(
-            """
-            SELECT status, COUNT(*) FROM description_tasks GROUP BY status
-            """
-        )
-        result: dict[str, int] = {"pending": 0, "processing": 0, "completed": 0, "failed": 0}
-        for row in cursor.fetchall():
-            status = row[0]
-            if status in result:
-                result[status] = row[1]
-        return result
+        return self._read_queue_counters(conn, "description")
+
+    def get_embedding_queue_status(self, conn: sqlite3.Connection) -> dict[str, int]:
+        """Return count of tasks by status."""
+        return self._read_queue_counters(conn, "embedding")
 
     def get_frame_description(
         self,
@@ -2245,6 +3448,7 @@ class FramesStore:
         self,
         frame_ids: List[int],
         conn: Optional[sqlite3.Connection] = None,
+        include_model: bool = False,
     ) -> dict[int, dict]:
         """Get descriptions for multiple frames in one query.
 
@@ -2253,6 +3457,8 @@ class FramesStore:
         Args:
             frame_ids: List of frame IDs to retrieve descriptions for
             conn: Optional existing connection. If None, creates a new one.
+            include_model: Also return ``model`` and ``generated_at``, as
+                ``get_frame_description`` does.
 
         Returns:
             Dict mapping frame_id to description dict {narrative, summary, tags}
@@ -2265,7 +3471,8 @@ class FramesStore:
             placeholders = ",".join("?" * len(frame_ids))
             rows = c.execute(
                 f"""
-                SELECT fd.frame_id, fd.narrative, fd.summary, fd.tags_json
+                SELECT fd.frame_id, fd.narrative, fd.summary, fd.tags_json,
+                       fd.description_model, fd.generated_at
                 FROM frame_descriptions fd
                 INNER JOIN frames f ON fd.frame_id = f.id
                 WHERE fd.frame_id IN ({placeholders})
@@ -2273,14 +3480,18 @@ class FramesStore:
                 """,
                 frame_ids,
             ).fetchall()
-            return {
-                row[0]: {
+            descriptions = {}
+            for row in rows:
+                description = {
                     "narrative": row[1],
                     "summary": row[2],
                     "tags": json.loads(row[3]) if row[3] else [],
                 }
-                for row in rows
-            }
+                if include_model:
+                    description["model"] = row[4]
+                    description["generated_at"] = row[5]
+                descriptions[row[0]] = description
+            return descriptions
 
         if conn is not None:
             return _query(conn)
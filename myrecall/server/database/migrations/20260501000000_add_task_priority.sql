@@ -0,0 +1,8 @@
+-- Scheduling lane for description/embedding tasks:
+-- 0 = live ingest, 1 = user-triggered, 2 = backfill
+ALTER TABLE description_tasks ADD COLUMN priority INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE embedding_tasks ADD COLUMN priority INTEGER NOT NULL DEFAULT 0;
+
+-- Per-lane claims walk pending tasks in queue order
+CREATE INDEX idx_dt_lane ON description_tasks(status, priority, id);
+CREATE INDEX idx_et_lane ON embedding_tasks(status, priority, created_at);
@@ -0,0 +1,5 @@
+-- Migration: 20260502000000_add_frames_ingested_at_index.sql
+-- Purpose: Visibility latency stats scan recent frames by ingest time.
+-- Note: Transaction is managed by migrations_runner.py, do not add BEGIN/COMMIT here.
+
+CREATE INDEX IF NOT EXISTS idx_frames_ingested_at ON frames(ingested_at);
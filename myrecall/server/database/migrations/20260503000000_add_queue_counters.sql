@@ -0,0 +1,90 @@
+-- Migration: 20260503000000_add_queue_counters.sql
+-- Purpose: Row counts per status for frames, description_tasks and
+--          embedding_tasks, kept current by triggers so health, ingest
+--          back-pressure and queue-status endpoints read them in O(1)
+--          instead of COUNT/GROUP BY over whole tables.
+-- Note: Transaction is managed by migrations_runner.py, do not add BEGIN/COMMIT here.
+
+CREATE TABLE queue_counters (
+    queue  TEXT    NOT NULL,
+    status TEXT    NOT NULL,
+    count  INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (queue, status)
+) WITHOUT ROWID;
+
+INSERT INTO queue_counters (queue, status, count)
+SELECT 'frames', status, COUNT(*) FROM frames WHERE status IS NOT NULL GROUP BY status;
+INSERT INTO queue_counters (queue, status, count)
+SELECT 'description', status, COUNT(*) FROM description_tasks WHERE status IS NOT NULL GROUP BY status;
+INSERT INTO queue_counters (queue, status, count)
+SELECT 'embedding', status, COUNT(*) FROM embedding_tasks WHERE status IS NOT NULL GROUP BY status;
+
+-- frames
+CREATE TRIGGER frames_qc_ai AFTER INSERT ON frames
+WHEN NEW.status IS NOT NULL
+BEGIN
+    INSERT OR IGNORE INTO queue_counters (queue, status) VALUES ('frames', NEW.status);
+    UPDATE queue_counters SET count = count + 1 WHERE queue = 'frames' AND status = NEW.status;
+END;
+
+CREATE TRIGGER frames_qc_au AFTER UPDATE OF status ON frames
+WHEN OLD.status IS NOT NEW.status
+BEGIN
+    UPDATE queue_counters SET count = count - 1 WHERE queue = 'frames' AND status = OLD.status;
+    INSERT OR IGNORE INTO queue_counters (queue, status) SELECT 'frames', NEW.status WHERE NEW.status IS NOT NULL;
+    UPDATE queue_counters SET count = count + 1 WHERE queue = 'frames' AND status = NEW.status;
+END;
+
+CREATE TRIGGER frames_qc_ad AFTER DELETE ON frames
+WHEN OLD.status IS NOT NULL
+BEGIN
+    UPDATE queue_counters SET count = count - 1 WHERE queue = 'frames' AND status = OLD.status;
+END;
+
+-- description_tasks
+CREATE TRIGGER description_tasks_qc_ai AFTER INSERT ON description_tasks
+WHEN NEW.status IS NOT NULL
+BEGIN
+    INSERT OR IGNORE INTO queue_counters (queue, status) VALUES ('description', NEW.status);
+    UPDATE queue_counters SET count = count + 1 WHERE queue = 'description' AND status = NEW.status;
+END;
+
+CREATE TRIGGER description_tasks_qc_au AFTER UPDATE OF status ON description_tasks
+WHEN OLD.status IS NOT NEW.status
+BEGIN
+    UPDATE queue_counters SET count = count - 1 WHERE queue = 'description' AND status = OLD.status;
+    INSERT OR IGNORE INTO queue_counters (queue, status) SELECT 'description', NEW.status WHERE NEW.status IS NOT NULL;
+    UPDATE queue_counters SET count = count + 1 WHERE queue = 'description' AND status = NEW.status;
+END;
+
+CREATE TRIGGER description_tasks_qc_ad AFTER DELETE ON description_tasks
+WHEN OLD.status IS NOT NULL
+BEGIN
+    UPDATE queue_counters SET count = count - 1 WHERE queue = 'description' AND status = OLD.status;
+END;
+
+-- embedding_tasks
+CREATE TRIGGER embedding_tasks_qc_ai AFTER INSERT ON embedding_tasks
+WHEN NEW.status IS NOT NULL
+BEGIN
+    INSERT OR IGNORE INTO queue_counters (queue, status) VALUES ('embedding', NEW.status);
+    UPDATE queue_counters SET count = count + 1 WHERE queue = 'embedding' AND status = NEW.status;
+END;
+
+CREATE TRIGGER embedding_tasks_qc_au AFTER UPDATE OF status ON embedding_tasks
+WHEN OLD.status IS NOT NEW.status
+BEGIN
+    UPDATE queue_counters SET count = count - 1 WHERE queue = 'embedding' AND status = OLD.status;
+    INSERT OR IGNORE INTO queue_counters (queue, status) SELECT 'embedding', NEW.status WHERE NEW.status IS NOT NULL;
+    UPDATE queue_counters SET count = count + 1 WHERE queue = 'embedding' AND status = NEW.status;
+END;
+
+CREATE TRIGGER embedding_tasks_qc_ad AFTER DELETE ON embedding_tasks
+WHEN OLD.status IS NOT NULL
+BEGIN
+    UPDATE queue_counters SET count = count - 1 WHERE queue = 'embedding' AND status = OLD.status;
+END;
+
+-- Lane status reads only active rows plus recently claimed ones
+CREATE INDEX idx_dt_started_at ON description_tasks(started_at);
+CREATE INDEX idx_et_started_at ON embedding_tasks(started_at);
@@ -0,0 +1,186 @@
+-- Migration: 20260504000000_add_activity_rollups.sql
+-- Purpose: Per-app, per-5-minute activity rollups so /v1/activity-summary
+--          sums a few buckets instead of running LEAD() over every
+--          queryable frame in the requested range.
+-- Note: Transaction is managed by migrations_runner.py, do not add BEGIN/COMMIT here.
+--
+-- A frame's gap is the time to the next queryable frame of the same app
+-- (ordered by local_timestamp, id). It is credited to the bucket holding
+-- the earlier frame; gaps of 300s or more count as idle, as in the raw
+-- query. app_name may be NULL and is always matched with IS.
+
+CREATE TABLE activity_rollups (
+    bucket_start   TEXT    NOT NULL,
+    app_name       TEXT,
+    frame_count    INTEGER NOT NULL,
+    active_seconds REAL    NOT NULL,
+    first_seen     TEXT    NOT NULL,
+    last_seen      TEXT    NOT NULL
+);
+
+CREATE UNIQUE INDEX idx_activity_rollups_bucket ON activity_rollups(bucket_start, app_name);
+
+-- Next/previous same-app frame lookups, and the partial buckets at the
+-- edges of a summary range
+CREATE INDEX idx_frames_visibility_app_ts ON frames(visibility_status, app_name, local_timestamp);
+CREATE INDEX idx_frames_visibility_local_ts ON frames(visibility_status, local_timestamp);
+
+-- Queryable frames with their gap to the next same-app queryable frame
+CREATE VIEW activity_frame_gaps AS
+SELECT
+    f.id,
+    f.app_name,
+    f.local_timestamp AS ts,
+    (JULIANDAY((
+        SELECT n.local_timestamp FROM frames n
+        WHERE n.visibility_status = 'queryable'
+          AND n.app_name IS f.app_name
+          AND (n.local_timestamp, n.id) > (f.local_timestamp, f.id)
+        ORDER BY n.local_timestamp, n.id
+        LIMIT 1
+    )) - JULIANDAY(f.local_timestamp)) * 86400.0 AS gap_sec
+FROM frames f
+WHERE f.visibility_status = 'queryable';
+
+-- Buckets touched by the current statement; emptied by the same trigger
+CREATE TABLE activity_rollups_dirty (
+    bucket_start TEXT NOT NULL,
+    app_name     TEXT
+);
+
+-- Seed from existing frames
+INSERT INTO activity_rollups (bucket_start, app_name, frame_count, active_seconds, first_seen, last_seen)
+SELECT
+    substr(ts, 1, 14) || printf('%02d', CAST(substr(ts, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+    app_name,
+    COUNT(*),
+    TOTAL(CASE WHEN gap_sec < 300 THEN gap_sec END),
+    MIN(ts),
+    MAX(ts)
+FROM (
+    SELECT
+        app_name,
+        local_timestamp AS ts,
+        (JULIANDAY(LEAD(local_timestamp) OVER (
+            PARTITION BY app_name ORDER BY local_timestamp, id
+        )) - JULIANDAY(local_timestamp)) * 86400.0 AS gap_sec
+    FROM frames
+    WHERE visibility_status = 'queryable'
+)
+WHERE length(ts) >= 16
+GROUP BY 1, app_name;
+
+-- A frame entering or leaving the rollups changes its own bucket and the
+-- gap of the previous same-app frame, so both buckets are recomputed.
+CREATE TRIGGER activity_rollups_ai AFTER INSERT ON frames
+WHEN NEW.visibility_status = 'queryable'
+BEGIN
+    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+    SELECT substr(NEW.local_timestamp, 1, 14) || printf('%02d', CAST(substr(NEW.local_timestamp, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+           NEW.app_name
+    WHERE length(NEW.local_timestamp) >= 16;
+    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+    SELECT substr(p.local_timestamp, 1, 14) || printf('%02d', CAST(substr(p.local_timestamp, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+           p.app_name
+    FROM frames p
+    WHERE p.visibility_status = 'queryable'
+      AND p.app_name IS NEW.app_name
+      AND (p.local_timestamp, p.id) < (NEW.local_timestamp, NEW.id)
+      AND length(p.local_timestamp) >= 16
+    ORDER BY p.local_timestamp DESC, p.id DESC
+    LIMIT 1;
+    DELETE FROM activity_rollups WHERE rowid IN (
+        SELECT r.rowid FROM activity_rollups_dirty d
+        JOIN activity_rollups r ON r.bucket_start = d.bucket_start AND r.app_name IS d.app_name
+    );
+    INSERT INTO activity_rollups (bucket_start, app_name, frame_count, active_seconds, first_seen, last_seen)
+    SELECT d.bucket_start, d.app_name, COUNT(*), TOTAL(CASE WHEN g.gap_sec < 300 THEN g.gap_sec END), MIN(g.ts), MAX(g.ts)
+    FROM (SELECT DISTINCT bucket_start, app_name FROM activity_rollups_dirty) d
+    JOIN activity_frame_gaps g
+      ON g.app_name IS d.app_name
+     AND g.ts >= d.bucket_start
+     AND g.ts < strftime('%Y-%m-%dT%H:%M:%S', d.bucket_start, '+5 minutes')
+    GROUP BY d.bucket_start, d.app_name;
+    DELETE FROM activity_rollups_dirty;
+END;
+
+CREATE TRIGGER activity_rollups_au AFTER UPDATE OF visibility_status, app_name, local_timestamp ON frames
+WHEN (OLD.visibility_status = 'queryable' OR NEW.visibility_status = 'queryable')
+ AND (OLD.visibility_status IS NOT NEW.visibility_status
+      OR OLD.app_name IS NOT NEW.app_name
+      OR OLD.local_timestamp IS NOT NEW.local_timestamp)
+BEGIN
+    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+    SELECT substr(OLD.local_timestamp, 1, 14) || printf('%02d', CAST(substr(OLD.local_timestamp, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+           OLD.app_name
+    WHERE length(OLD.local_timestamp) >= 16;
+    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+    SELECT substr(NEW.local_timestamp, 1, 14) || printf('%02d', CAST(substr(NEW.local_timestamp, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+           NEW.app_name
+    WHERE length(NEW.local_timestamp) >= 16;
+    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+    SELECT substr(p.local_timestamp, 1, 14) || printf('%02d', CAST(substr(p.local_timestamp, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+           p.app_name
+    FROM frames p
+    WHERE p.visibility_status = 'queryable'
+      AND p.app_name IS OLD.app_name
+      AND (p.local_timestamp, p.id) < (OLD.local_timestamp, OLD.id)
+      AND length(p.local_timestamp) >= 16
+    ORDER BY p.local_timestamp DESC, p.id DESC
+    LIMIT 1;
+    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+    SELECT substr(p.local_timestamp, 1, 14) || printf('%02d', CAST(substr(p.local_timestamp, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+           p.app_name
+    FROM frames p
+    WHERE p.visibility_status = 'queryable'
+      AND p.app_name IS NEW.app_name
+      AND (p.local_timestamp, p.id) < (NEW.local_timestamp, NEW.id)
+      AND length(p.local_timestamp) >= 16
+    ORDER BY p.local_timestamp DESC, p.id DESC
+    LIMIT 1;
+    DELETE FROM activity_rollups WHERE rowid IN (
+        SELECT r.rowid FROM activity_rollups_dirty d
+        JOIN activity_rollups r ON r.bucket_start = d.bucket_start AND r.app_name IS d.app_name
+    );
+    INSERT INTO activity_rollups (bucket_start, app_name, frame_count, active_seconds, first_seen, last_seen)
+    SELECT d.bucket_start, d.app_name, COUNT(*), TOTAL(CASE WHEN g.gap_sec < 300 THEN g.gap_sec END), MIN(g.ts), MAX(g.ts)
+    FROM (SELECT DISTINCT bucket_start, app_name FROM activity_rollups_dirty) d
+    JOIN activity_frame_gaps g
+      ON g.app_name IS d.app_name
+     AND g.ts >= d.bucket_start
+     AND g.ts < strftime('%Y-%m-%dT%H:%M:%S', d.bucket_start, '+5 minutes')
+    GROUP BY d.bucket_start, d.app_name;
+    DELETE FROM activity_rollups_dirty;
+END;
+
+CREATE TRIGGER activity_rollups_ad AFTER DELETE ON frames
+WHEN OLD.visibility_status = 'queryable'
+BEGIN
+    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+    SELECT substr(OLD.local_timestamp, 1, 14) || printf('%02d', CAST(substr(OLD.local_timestamp, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+           OLD.app_name
+    WHERE length(OLD.local_timestamp) >= 16;
+    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+    SELECT substr(p.local_timestamp, 1, 14) || printf('%02d', CAST(substr(p.local_timestamp, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+           p.app_name
+    FROM frames p
+    WHERE p.visibility_status = 'queryable'
+      AND p.app_name IS OLD.app_name
+      AND (p.local_timestamp, p.id) < (OLD.local_timestamp, OLD.id)
+      AND length(p.local_timestamp) >= 16
+    ORDER BY p.local_timestamp DESC, p.id DESC
+    LIMIT 1;
+    DELETE FROM activity_rollups WHERE rowid IN (
+        SELECT r.rowid FROM activity_rollups_dirty d
+        JOIN activity_rollups r ON r.bucket_start = d.bucket_start AND r.app_name IS d.app_name
+    );
+    INSERT INTO activity_rollups (bucket_start, app_name, frame_count, active_seconds, first_seen, last_seen)
+    SELECT d.bucket_start, d.app_name, COUNT(*), TOTAL(CASE WHEN g.gap_sec < 300 THEN g.gap_sec END), MIN(g.ts), MAX(g.ts)
+    FROM (SELECT DISTINCT bucket_start, app_name FROM activity_rollups_dirty) d
+    JOIN activity_frame_gaps g
+      ON g.app_name IS d.app_name
+     AND g.ts >= d.bucket_start
+     AND g.ts < strftime('%Y-%m-%dT%H:%M:%S', d.bucket_start, '+5 minutes')
+    GROUP BY d.bucket_start, d.app_name;
+    DELETE FROM activity_rollups_dirty;
+END;
@@ -0,0 +1,52 @@
+-- Migration: 20260505000000_add_bulk_frame_deletion.sql
+-- Purpose: Let bulk frame deletion (time-range DELETE /v1/frames and the
+--          retention pruner) delete frames in chunks without paying the
+--          per-row activity-rollup recompute, and index description_tasks
+--          by frame_id so chunked child-row deletes do not scan the table.
+-- Note: Transaction is managed by migrations_runner.py, do not add BEGIN/COMMIT here.
+--
+-- While activity_rollups_deferred holds a row, deleting a frame leaves the
+-- rollups alone; FramesStore.delete_frames() marks the affected buckets
+-- itself, recomputes them once per chunk and clears the row again inside
+-- the same transaction, so other connections never see it set.
+
+CREATE TABLE activity_rollups_deferred (
+    id INTEGER PRIMARY KEY CHECK (id = 1)
+);
+
+CREATE INDEX IF NOT EXISTS idx_dt_frame_id ON description_tasks(frame_id);
+
+DROP TRIGGER activity_rollups_ad;
+
+CREATE TRIGGER activity_rollups_ad AFTER DELETE ON frames
+WHEN OLD.visibility_status = 'queryable'
+ AND NOT EXISTS (SELECT 1 FROM activity_rollups_deferred)
+BEGIN
+    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+    SELECT substr(OLD.local_timestamp, 1, 14) || printf('%02d', CAST(substr(OLD.local_timestamp, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+           OLD.app_name
+    WHERE length(OLD.local_timestamp) >= 16;
+    INSERT INTO activity_rollups_dirty (bucket_start, app_name)
+    SELECT substr(p.local_timestamp, 1, 14) || printf('%02d', CAST(substr(p.local_timestamp, 15, 2) AS INTEGER) / 5 * 5) || ':00',
+           p.app_name
+    FROM frames p
+    WHERE p.visibility_status = 'queryable'
+      AND p.app_name IS OLD.app_name
+      AND (p.local_timestamp, p.id) < (OLD.local_timestamp, OLD.id)
+      AND length(p.local_timestamp) >= 16
+    ORDER BY p.local_timestamp DESC, p.id DESC
+    LIMIT 1;
+    DELETE FROM activity_rollups WHERE rowid IN (
+        SELECT r.rowid FROM activity_rollups_dirty d
+        JOIN activity_rollups r ON r.bucket_start = d.bucket_start AND r.app_name IS d.app_name
+    );
+    INSERT INTO activity_rollups (bucket_start, app_name, frame_count, active_seconds, first_seen, last_seen)
+    SELECT d.bucket_start, d.app_name, COUNT(*), TOTAL(CASE WHEN g.gap_sec < 300 THEN g.gap_sec END), MIN(g.ts), MAX(g.ts)
+    FROM (SELECT DISTINCT bucket_start, app_name FROM activity_rollups_dirty) d
+    JOIN activity_frame_gaps g
+      ON g.app_name IS d.app_name
+     AND g.ts >= d.bucket_start
+     AND g.ts < strftime('%Y-%m-%dT%H:%M:%S', d.bucket_start, '+5 minutes')
+    GROUP BY d.bucket_start, d.app_name;
+    DELETE FROM activity_rollups_dirty;
+END;
@@ -0,0 +1,21 @@
+-- Migration: 20260506000000_add_frame_storage_tiers.sql
+-- Purpose: Track where each frame's snapshot lives as it ages through the
+--          storage tiers (see myrecall/server/frame_storage.py).
+-- Note: Transaction is managed by migrations_runner.py, do not add BEGIN/COMMIT here.
+--
+-- storage_tier:
+--   'original'   - snapshot_path is the JPEG as ingested
+--   'compressed' - snapshot_path is a re-encoded (WebP/AVIF, maybe downscaled) file
+--   'archived'   - snapshot_path is a per-day append-only pack file; the
+--                  image is storage_length bytes at storage_offset
+-- storage_length is the on-disk size for the last two tiers (image_size_bytes
+-- keeps the ingested size), storage_scale the downscale factor applied
+-- (original pixels per stored pixel) so OCR boxes can be mapped onto the
+-- stored image.
+
+ALTER TABLE frames ADD COLUMN storage_tier TEXT NOT NULL DEFAULT 'original';
+ALTER TABLE frames ADD COLUMN storage_offset INTEGER;
+ALTER TABLE frames ADD COLUMN storage_length INTEGER;
+ALTER TABLE frames ADD COLUMN storage_scale REAL NOT NULL DEFAULT 1.0;
+
+CREATE INDEX idx_frames_storage_tier_ts ON frames(storage_tier, timestamp);
@@ -0,0 +1,28 @@
+-- Migration: 20260507000000_add_frame_urls.sql
+-- Purpose: Cache the URLs found in each frame's context text so
+--          /v1/frames/<id>/context and /v1/frames/context never read the
+--          full accessibility/OCR text just to scan it for URLs.
+-- Note: Transaction is managed by migrations_runner.py, do not add BEGIN/COMMIT here.
+--
+-- urls_json is a JSON array in first-seen order. Rows are written when OCR
+-- or accessibility processing completes, or on the first context read of
+-- older frames. A missing row means "not scanned yet": the triggers below
+-- drop a frame's row whenever the text it was scanned from changes.
+
+CREATE TABLE frame_urls (
+    frame_id INTEGER PRIMARY KEY,
+    urls_json TEXT NOT NULL DEFAULT '[]'
+);
+
+CREATE TRIGGER frame_urls_text_au AFTER UPDATE OF accessibility_text, ocr_text, text_source ON frames
+WHEN OLD.text_source IS NOT NEW.text_source
+  OR OLD.ocr_text IS NOT NEW.ocr_text
+  OR OLD.accessibility_text IS NOT NEW.accessibility_text
+BEGIN
+    DELETE FROM frame_urls WHERE frame_id = NEW.id;
+END;
+
+CREATE TRIGGER frame_urls_ad AFTER DELETE ON frames
+BEGIN
+    DELETE FROM frame_urls WHERE frame_id = OLD.id;
+END;
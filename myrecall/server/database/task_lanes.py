@@ -0,0 +1,86 @@
+"""Scheduling lanes for the description/embedding task queues.
+
+Every task row carries a ``priority`` lane. Workers claim live ingest
+first, then user-triggered tasks, then backfill. Two rules stop the lower
+lanes from starving:
+
+- backfill gets at least ``backfill_share`` of claims while it has work;
+- a live or user task pending longer than ``max_wait_seconds`` moves its
+  lane to the front of the order.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Iterable, Optional, Sequence
+
+LANE_LIVE = 0
+LANE_USER = 1
+LANE_BACKFILL = 2
+
+LANE_NAMES = {LANE_LIVE: "live", LANE_USER: "user", LANE_BACKFILL: "backfill"}
+DEFAULT_LANE_ORDER: tuple[int, ...] = (LANE_LIVE, LANE_USER, LANE_BACKFILL)
+
+
+class LaneScheduler:
+    """Pick the lane order for each claim made by a queue worker.
+
+    Backfill's share is tracked with a deficit counter over the current
+    busy period. The counters reset when a lane runs dry, so an idle
+    stretch never builds up credit that is later spent in a burst.
+    """
+
+    def __init__(
+        self,
+        backfill_share: Optional[float] = None,
+        max_wait_seconds: Optional[float] = None,
+    ):
+        from myrecall.shared.config import settings
+
+        if backfill_share is None:
+            backfill_share = getattr(settings, "processing_backfill_share", 0.1)
+        if max_wait_seconds is None:
+            max_wait_seconds = getattr(settings, "processing_max_wait_seconds", 900)
+        self.backfill_share = min(max(float(backfill_share), 0.0), 1.0)
+        self.max_wait_seconds = float(max_wait_seconds)
+        self._lock = threading.Lock()
+        self._served = 0
+        self._served_backfill = 0
+
+    def next_order(self, pending_waits: Optional[dict[int, float]] = None) -> tuple[int, ...]:
+        """Return the lane order for the next claim.
+
+        ``pending_waits`` maps lane -> seconds its oldest pending task has
+        waited (see ``FramesStore.get_pending_lane_waits``).
+        """
+        with self._lock:
+            backfill_turn = (
+                self.backfill_share > 0
+                and self._served_backfill < self.backfill_share * (self._served + 1)
+            )
+        order = [LANE_BACKFILL] if backfill_turn else []
+        order += [lane for lane in DEFAULT_LANE_ORDER if lane not in order]
+        if pending_waits and self.max_wait_seconds > 0:
+            overdue = [
+                lane
+                for lane in (LANE_LIVE, LANE_USER)
+                if pending_waits.get(lane, 0) >= self.max_wait_seconds
+            ]
+            order = overdue + [lane for lane in order if lane not in overdue]
+        return tuple(order)
+
+    def record(self, order: Sequence[int], lanes: Iterable[int]) -> None:
+        """Account for the lanes of the tasks claimed with ``order``."""
+        lanes = list(lanes)
+        if not lanes:
+            return
+        backfill = sum(1 for lane in lanes if lane == LANE_BACKFILL)
+        with self._lock:
+            if order[0] == LANE_BACKFILL and backfill == 0:
+                # Backfill is empty: nothing to owe it
+                self._served = self._served_backfill = 0
+            elif order[0] != LANE_BACKFILL and backfill == len(lanes):
+                # Only backfill had work: this was idle capacity, not its share
+                self._served = self._served_backfill = 0
+            else:
+                self._served += len(lanes)
+                self._served_backfill += backfill
@@ -52,3 +52,25 @@ class DescriptionProvider(ABC):
             DescriptionProviderUnavailableError: On missing dependencies.
         """
         raise NotImplementedError
+
+    def max_batch_size(self) -> int:
+        """Largest batch ``generate_batch`` can run in one call right now."""
+        return 1
+
+    def generate_batch(
+        self,
+        items: "list[tuple[str, FrameContext]]",
+    ) -> "list[FrameDescription | Exception]":
+        """
+        Generate descriptions for several frames.
+
+        Returns one entry per item, in order: the description, or the
+        exception that item failed with. The default runs items one by one.
+        """
+        results: "list[FrameDescription | Exception]" = []
+        for image_path, context in items:
+            try:
+                results.append(self.generate(image_path, context))
+            except Exception as e:
+                results.append(e)
+        return results
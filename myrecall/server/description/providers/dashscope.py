@@ -5,6 +5,11 @@ import time
 from pathlib import Path
 from typing import Any
 
+from myrecall.server.description.providers.dispatch import (
+    RemoteDispatcher,
+    Throttled,
+    call_with_backoff,
+)
 from myrecall.server.description.models import FrameDescription, FrameContext
 from myrecall.server.description.prompts import build_description_prompt, PROMPT_VERSION
 from myrecall.server.description.providers.base import (
@@ -13,6 +18,8 @@ from myrecall.server.description.providers.base import (
     DescriptionProviderConfigError,
     DescriptionProviderUnavailableError,
 )
+from myrecall.server.runtime_config import get_description_request_timeout
+from myrecall.shared.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +39,38 @@ class DashScopeDescriptionProvider(DescriptionProvider):
         self._dashscope = dashscope
         self._dashscope.api_key = api_key
         self.model_name = model_name
+        self._dispatcher = RemoteDispatcher(
+            getattr(settings, "description_max_concurrency", 8),
+            getattr(settings, "description_rate_limit", 0.0),
+        )
+
+    def close(self) -> None:
+        self._dispatcher.close()
+
+    def max_batch_size(self) -> int:
+        return self._dispatcher.max_concurrency
 
     def generate(self, image_path: str, context: FrameContext) -> FrameDescription:
+        return self._dispatcher.run(self._describe, (image_path, context))
+
+    def generate_batch(
+        self,
+        items: list[tuple[str, FrameContext]],
+    ) -> list[FrameDescription | Exception]:
+        return self._dispatcher.map(self._describe, items)
+
+    def _call(self, messages: list[dict[str, Any]]) -> Any:
+        response = self._dashscope.MultiModalConversation.call(
+            model=self.model_name,
+            messages=messages,
+        )
+        if getattr(response, "status_code", None) == 429:
+            # The SDK exposes no Retry-After; back off exponentially
+            raise Throttled("DashScope request throttled: status=429")
+        return response
+
+    def _describe(self, item: tuple[str, FrameContext]) -> FrameDescription:
+        image_path, _context = item
         path = Path(image_path).resolve()
         if not path.is_file():
             raise DescriptionProviderRequestError(f"Image not found: {image_path}")
@@ -52,11 +89,15 @@ class DashScopeDescriptionProvider(DescriptionProvider):
 
         try:
             start_time = time.time()
-            response = self._dashscope.MultiModalConversation.call(
-                model=self.model_name,
-                messages=messages,
+            # The SDK call takes no timeout; the budget bounds throttle retries
+            response = call_with_backoff(
+                lambda _timeout: self._call(messages),
+                get_description_request_timeout(),
+                self._dispatcher.bucket,
             )
             elapsed = time.time() - start_time
+        except Throttled:
+            raise
         except Exception as e:
             raise DescriptionProviderRequestError(f"DashScope request failed: {e}") from e
 
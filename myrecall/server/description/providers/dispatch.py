@@ -0,0 +1,235 @@
+"""Concurrent dispatch for remote description providers.
+
+Remote endpoints (vLLM, OpenAI-compatible gateways, DashScope) serve many
+requests at once. ``RemoteDispatcher`` fans a batch of frames out over a
+bounded thread pool. A shared token bucket paces request starts, and
+``dispatch_metrics`` records in-flight count, throughput and latency for
+``/v1/description/tasks/status``.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional, Sequence, TypeVar
+
+from myrecall.server.description.providers.base import DescriptionProviderRequestError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_LATENCY_WINDOW = 256  # recent request latencies kept for percentiles
+_THROUGHPUT_WINDOW_SEC = 60.0
+_MAX_THROTTLE_RETRIES = 4
+_BASE_BACKOFF_SEC = 1.0
+_MAX_BACKOFF_SEC = 30.0
+
+
+class Throttled(DescriptionProviderRequestError):
+    """The endpoint asked us to slow down (HTTP 429, or 503 with Retry-After)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``rate <= 0`` disables limiting."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        self.rate = float(rate)
+        self.capacity = float(burst if burst else max(1.0, self.rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back, e.g. after a 429 with Retry-After."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """Block until a token is available. False if ``deadline`` passes first."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self.rate <= 0:
+                        return True
+                    self._tokens = min(
+                        self.capacity, self._tokens + (now - self._updated) * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return True
+                    wait = (1.0 - self._tokens) / self.rate
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class DispatchMetrics:
+    """In-flight, throughput and latency counters for remote requests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._throttled = 0
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._finished_at: deque[float] = deque()
+
+    def started(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def finished(self, latency: float, ok: bool) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight -= 1
+            if ok:
+                self._completed += 1
+                self._latencies.append(latency)
+                self._finished_at.append(now)
+            else:
+                self._failed += 1
+            self._trim(now)
+
+    def throttled(self) -> None:
+        with self._lock:
+            self._throttled += 1
+
+    def _trim(self, now: float) -> None:
+        while self._finished_at and now - self._finished_at[0] > _THROUGHPUT_WINDOW_SEC:
+            self._finished_at.popleft()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            self._trim(time.monotonic())
+            latencies = sorted(self._latencies)
+
+            def pct(q: float) -> Optional[float]:
+                if not latencies:
+                    return None
+                return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 1)
+
+            return {
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "throttled": self._throttled,
+                "throughput_per_min": len(self._finished_at) * 60.0 / _THROUGHPUT_WINDOW_SEC,
+                "latency_ms_p50": pct(0.50),
+                "latency_ms_p95": pct(0.95),
+            }
+
+
+dispatch_metrics = DispatchMetrics()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def call_with_backoff(
+    attempt: Callable[[float], R],
+    timeout: float,
+    bucket: TokenBucket,
+) -> R:
+    """Call ``attempt(remaining_timeout)``, backing off on ``Throttled``.
+
+    Waits honour Retry-After when given (exponential otherwise) and pause the
+    shared bucket so concurrent requests back off too. Retries never run past
+    ``timeout`` seconds from the first attempt.
+    """
+    deadline = time.monotonic() + timeout
+    backoff = _BASE_BACKOFF_SEC
+    for retry in range(_MAX_THROTTLE_RETRIES + 1):
+        try:
+            return attempt(max(0.1, deadline - time.monotonic()))
+        except Throttled as e:
+            dispatch_metrics.throttled()
+            wait = e.retry_after if e.retry_after is not None else backoff
+            backoff = min(backoff * 2, _MAX_BACKOFF_SEC)
+            if retry == _MAX_THROTTLE_RETRIES or time.monotonic() + wait >= deadline:
+                raise
+            logger.info(f"Description endpoint throttled; retrying in {wait:.1f}s")
+            bucket.pause(wait)
+            if not bucket.acquire(deadline):
+                raise
+    raise AssertionError("unreachable")
+
+
+class RemoteDispatcher:
+    """Runs one callable per item over a bounded pool, paced by a token bucket."""
+
+    def __init__(self, max_concurrency: int, rate_per_sec: float = 0.0) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.bucket = TokenBucket(rate_per_sec, burst=self.max_concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="DescriptionDispatch",
+                )
+            return self._executor
+
+    def run(self, fn: Callable[[T], R], item: T) -> R:
+        """Run one request inline (rate limited and measured); raises on failure."""
+        result = self._call(fn, item)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def map(self, fn: Callable[[T], R], items: Sequence[T]) -> list[R | Exception]:
+        """Apply ``fn`` to every item; failures are returned in place of results."""
+        if len(items) <= 1:
+            return [self._call(fn, item) for item in items]
+        futures = [self._pool().submit(self._call, fn, item) for item in items]
+        return [future.result() for future in futures]
+
+    def _call(self, fn: Callable[[T], R], item: T) -> R | Exception:
+        self.bucket.acquire()
+        dispatch_metrics.started()
+        started = time.perf_counter()
+        try:
+            result = fn(item)
+        except Exception as e:
+            dispatch_metrics.finished(time.perf_counter() - started, ok=False)
+            return e
+        dispatch_metrics.finished(time.perf_counter() - started, ok=True)
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
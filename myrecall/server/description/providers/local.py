@@ -1,14 +1,13 @@
 """Local description provider using Qwen3 VL."""
 import json
 import logging
+import os
+import sys
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from PIL import Image
-from qwen_vl_utils import process_vision_info
-import torch
-from transformers import AutoProcessor, Qwen3VLForConditionalGeneration
 
 from myrecall.server.description.models import FrameDescription, FrameContext
 from myrecall.server.description.prompts import build_description_prompt, PROMPT_VERSION
@@ -16,12 +15,29 @@ from myrecall.server.description.providers.base import (
     DescriptionProvider,
     DescriptionProviderRequestError,
 )
-from myrecall.server.ai_engine import AIEngine
 from myrecall.shared.config import settings
 
 logger = logging.getLogger(__name__)
 
 _MAX_NEW_TOKENS = 384
+# Rough activation + KV-cache cost of one batch item at max_pixels (bf16)
+_BATCH_ITEM_BYTES = 512 * 1024 * 1024
+_BATCH_MEMORY_FRACTION = 0.5
+
+
+def _free_memory_bytes(device: str) -> Optional[int]:
+    torch = sys.modules.get("torch")
+    if device.startswith("cuda") and torch is not None and torch.cuda.is_available():
+        free, _total = torch.cuda.mem_get_info()
+        return int(free)
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _is_out_of_memory(exc: Exception) -> bool:
+    return "out of memory" in str(exc).lower()
 
 
 class LocalDescriptionProvider(DescriptionProvider):
@@ -30,6 +46,10 @@ class LocalDescriptionProvider(DescriptionProvider):
     MAX_IMAGE_SIZE = 1024
 
     def __init__(self, model_name: str = "") -> None:
+        # Heavy model stacks are imported only when this provider is built
+        from myrecall.server.ai.model_pool import model_pool
+        from myrecall.server.ai_engine import AIEngine
+
         self.model_id = model_name or AIEngine.MODEL_ID
         if not self.model_id:
             raise ValueError(
@@ -37,24 +57,16 @@ class LocalDescriptionProvider(DescriptionProvider):
                 "Set [description] model = '/path/to/local/model' in server.toml, "
                 "or use provider = 'openai' with api_base pointing to a vLLM server."
             )
-        if settings.device == "cpu":
-            torch_dtype = torch.float32
-        else:
-            torch_dtype = torch.bfloat16
         logger.info(f"Loading LocalDescriptionProvider: {self.model_id}")
         logger.info(f"Using device: {settings.device}")
-        self.model = Qwen3VLForConditionalGeneration.from_pretrained(
-            self.model_id,
-            trust_remote_code=True,
-            dtype=torch_dtype,
-            device_map=settings.device,
-        )
-        self.processor = AutoProcessor.from_pretrained(
-            self.model_id,
-            trust_remote_code=True,
-            min_pixels=256 * 28 * 28,
-            max_pixels=1024 * 28 * 28,
-        )
+        # Shared with the local vision provider when both use the same model
+        self._lease = model_pool.acquire(self.model_id)
+        self.model = self._lease.model
+        self.processor = self._lease.processor
+        self._batch_cap = max(1, int(getattr(settings, "description_batch_size", 1) or 1))
+
+    def close(self) -> None:
+        self._lease.release()
 
     def _resize_if_needed(self, image: Image.Image) -> Image.Image:
         w, h = image.size
@@ -66,7 +78,16 @@ class LocalDescriptionProvider(DescriptionProvider):
             new_h, new_w = self.MAX_IMAGE_SIZE, int(w * (self.MAX_IMAGE_SIZE / h))
         return image.resize((new_w, new_h), Image.Resampling.LANCZOS)
 
-    def generate(self, image_path: str, context: FrameContext) -> FrameDescription:
+    def max_batch_size(self) -> int:
+        """Frames per generate() call that fit in currently free memory."""
+        free = _free_memory_bytes(settings.device)
+        if free is None:
+            return self._batch_cap
+        per_item = _BATCH_ITEM_BYTES * (2 if settings.device == "cpu" else 1)
+        fits = int(free * _BATCH_MEMORY_FRACTION) // per_item
+        return max(1, min(self._batch_cap, fits))
+
+    def _build_messages(self, image_path: str) -> list[dict]:
         path = Path(image_path)
         if not path.is_file():
             raise DescriptionProviderRequestError(f"Image not found: {image_path}")
@@ -75,25 +96,36 @@ class LocalDescriptionProvider(DescriptionProvider):
         if settings.device == "cpu":
             image = self._resize_if_needed(image)
 
-        prompt_text = build_description_prompt()
-        messages = [
+        return [
             {
                 "role": "user",
                 "content": [
                     {"type": "image", "image": image},
-                    {"type": "text", "text": prompt_text},
+                    {"type": "text", "text": build_description_prompt()},
                 ],
             }
         ]
 
-        text = self.processor.apply_chat_template(
-            messages,
-            tokenize=False,
-            add_generation_prompt=True,
-        )
-        image_inputs, video_inputs = process_vision_info(messages)
+    def _generate_texts(self, conversations: list[list[dict]]) -> tuple[list[str], float]:
+        """Run one padded generate() over all conversations."""
+        import torch
+        from qwen_vl_utils import process_vision_info
+
+        texts = [
+            self.processor.apply_chat_template(
+                messages,
+                tokenize=False,
+                add_generation_prompt=True,
+            )
+            for messages in conversations
+        ]
+        image_inputs, video_inputs = process_vision_info(conversations)
+        tokenizer = getattr(self.processor, "tokenizer", None)
+        if tokenizer is not None:
+            # Decoder-only batching needs prompts aligned on the right
+            tokenizer.padding_side = "left"
         inputs = self.processor(
-            text=text,
+            text=texts,
             images=image_inputs,
             videos=video_inputs,
             padding=True,
@@ -110,14 +142,62 @@ class LocalDescriptionProvider(DescriptionProvider):
             elapsed = time.time() - start_time
 
         generated_ids_trimmed = [
-            out_ids[len(in_ids):] for in_ids, out_ids in zip(inputs.input_ids, generated_ids)
+            out_ids[len(in_ids):] for in_ids, out_ids in zip(inputs["input_ids"], generated_ids)
         ]
-        output_text = self.processor.batch_decode(
+        output_texts = self.processor.batch_decode(
             generated_ids_trimmed,
             skip_special_tokens=True,
             clean_up_tokenization_spaces=False,
-        )[0]
+        )
+        return output_texts, elapsed
 
+    def generate(self, image_path: str, context: FrameContext) -> FrameDescription:
+        messages = self._build_messages(image_path)
+        output_texts, elapsed = self._generate_texts([messages])
+        return self._parse_output(output_texts[0], elapsed)
+
+    def generate_batch(
+        self,
+        items: list[tuple[str, FrameContext]],
+    ) -> list[FrameDescription | Exception]:
+        results: list[FrameDescription | Exception] = [None] * len(items)  # type: ignore[list-item]
+        pending: list[tuple[int, list[dict]]] = []
+        for index, (image_path, _context) in enumerate(items):
+            try:
+                pending.append((index, self._build_messages(image_path)))
+            except Exception as e:
+                results[index] = e
+        self._run_batch(pending, results)
+        return results
+
+    def _run_batch(
+        self,
+        pending: list[tuple[int, list[dict]]],
+        results: list[FrameDescription | Exception],
+    ) -> None:
+        if not pending:
+            return
+        try:
+            output_texts, elapsed = self._generate_texts([messages for _, messages in pending])
+        except Exception as e:
+            if len(pending) > 1 and _is_out_of_memory(e):
+                # Remember the smaller size so later batches don't hit OOM again
+                half = len(pending) // 2
+                self._batch_cap = max(1, half)
+                logger.warning(f"Description batch of {len(pending)} ran out of memory; retrying as {half}")
+                self._run_batch(pending[:half], results)
+                self._run_batch(pending[half:], results)
+                return
+            for index, _ in pending:
+                results[index] = e
+            return
+        per_item = elapsed / len(pending)
+        if len(pending) > 1:
+            logger.info(f"Description batch of {len(pending)} generated in {elapsed:.2f}s")
+        for (index, _), output_text in zip(pending, output_texts):
+            results[index] = self._parse_output(output_text, per_item)
+
+    def _parse_output(self, output_text: str, elapsed: float) -> FrameDescription:
         raw = output_text.strip()
         try:
             clean = raw.replace("```json", "").replace("```", "").strip()
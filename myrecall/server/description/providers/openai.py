@@ -6,7 +6,14 @@ import time
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from myrecall.server.description.providers.dispatch import (
+    RemoteDispatcher,
+    Throttled,
+    call_with_backoff,
+    parse_retry_after,
+)
 from myrecall.server.description.models import FrameDescription, FrameContext
 from myrecall.server.description.prompts import build_description_prompt, PROMPT_VERSION
 from myrecall.server.description.providers.base import (
@@ -16,6 +23,7 @@ from myrecall.server.description.providers.base import (
 )
 from myrecall.server.ai.providers import _normalize_api_base
 from myrecall.server.runtime_config import get_description_request_timeout
+from myrecall.shared.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +40,43 @@ class OpenAIDescriptionProvider(DescriptionProvider):
         self.api_key = api_key.strip() if api_key else ""
         self.model_name = model_name.strip()
         self.api_base = _normalize_api_base(api_base or "https://api.openai.com/v1")
+        self._dispatcher = RemoteDispatcher(
+            getattr(settings, "description_max_concurrency", 8),
+            getattr(settings, "description_rate_limit", 0.0),
+        )
+        # One keep-alive pool sized to the dispatcher, shared by all requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._dispatcher.max_concurrency)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        self._dispatcher.close()
+        self._session.close()
+
+    def max_batch_size(self) -> int:
+        return self._dispatcher.max_concurrency
 
     def generate(self, image_path: str, context: FrameContext) -> FrameDescription:
+        return self._dispatcher.run(self._describe, (image_path, context))
+
+    def generate_batch(
+        self,
+        items: list[tuple[str, FrameContext]],
+    ) -> list[FrameDescription | Exception]:
+        return self._dispatcher.map(self._describe, items)
+
+    def _post(self, url: str, headers: dict, payload: dict, timeout: float) -> requests.Response:
+        resp = self._session.post(url, headers=headers, json=payload, timeout=timeout)
+        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+        if resp.status_code == 429 or (resp.status_code == 503 and retry_after is not None):
+            raise Throttled(
+                f"OpenAI request throttled: status={resp.status_code}", retry_after
+            )
+        return resp
+
+    def _describe(self, item: tuple[str, FrameContext]) -> FrameDescription:
+        image_path, _context = item
         path = Path(image_path).resolve()
         if not path.is_file():
             raise DescriptionProviderRequestError(f"Image not found: {image_path}")
@@ -68,8 +111,14 @@ class OpenAIDescriptionProvider(DescriptionProvider):
 
         try:
             start_time = time.time()
-            resp = requests.post(url, headers=headers, json=payload, timeout=get_description_request_timeout())
+            resp = call_with_backoff(
+                lambda timeout: self._post(url, headers, payload, timeout),
+                get_description_request_timeout(),
+                self._dispatcher.bucket,
+            )
             elapsed = time.time() - start_time
+        except Throttled:
+            raise
         except Exception as e:
             raise DescriptionProviderRequestError(f"OpenAI request failed: {e}") from e
 
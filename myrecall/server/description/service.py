@@ -5,6 +5,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Optional
 
+from myrecall.server.database.task_lanes import LANE_LIVE
 from myrecall.server.description.models import FrameDescription, FrameContext
 from myrecall.server.description.providers import DescriptionProviderError
 from myrecall.server.ai.factory import get_description_provider
@@ -36,9 +37,9 @@ class DescriptionService:
             logger.info(f"DescriptionProvider initialized: {type(self._provider).__name__}")
         return self._provider
 
-    def enqueue_description_task(self, conn, frame_id: int) -> None:
+    def enqueue_description_task(self, conn, frame_id: int, lane: int = LANE_LIVE) -> None:
         """Insert a pending description task for a frame. Idempotent."""
-        self._store.insert_description_task(conn, frame_id)
+        self._store.insert_description_task(conn, frame_id, lane=lane)
         logger.debug(f"Description task enqueued for frame #{frame_id}")
 
     def generate_description(
@@ -59,6 +60,32 @@ class DescriptionService:
             logger.warning(f"Description generation failed: {e}")
             raise
 
+    def batch_limit(self) -> int:
+        """How many tasks the provider can take at once.
+
+        The local provider batches up to [description] batch_size frames that
+        fit in memory; remote providers run max_concurrency requests at once.
+        """
+        try:
+            return max(1, int(self.provider.max_batch_size()))
+        except Exception:
+            return 1
+
+    def generate_descriptions(
+        self,
+        items: list[tuple[str, FrameContext]],
+    ) -> list[FrameDescription | Exception]:
+        """Generate descriptions for several frames; failures are returned per item."""
+        try:
+            results = self.provider.generate_batch(items)
+        except Exception as e:
+            logger.warning(f"Batched description generation failed: {e}")
+            return [e] * len(items)
+        failed = sum(isinstance(r, Exception) for r in results)
+        if failed:
+            logger.warning(f"Description batch: {failed}/{len(items)} frames failed")
+        return results
+
     def insert_description(
         self,
         conn,
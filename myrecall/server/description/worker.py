@@ -5,11 +5,14 @@ import logging
 import sqlite3
 import threading
 import time
+from contextlib import ExitStack
 from typing import TYPE_CHECKING, Optional
 
+from myrecall.server.database.task_lanes import LaneScheduler
 from myrecall.server.description.models import FrameContext
 from myrecall.server.description.service import DescriptionService
 from myrecall.server.description.providers import DescriptionProviderError
+from myrecall.server.frame_storage import SnapshotLocation
 
 if TYPE_CHECKING:
     from myrecall.server.database.frames_store import FramesStore
@@ -32,6 +35,7 @@ class DescriptionWorker(threading.Thread):
         self._last_processing_version: int = -1  # NEW; -1 forces first-batch alignment
         self._stats_counter = 0
         self._last_stats_time = 0.0
+        self._lanes = LaneScheduler()
 
     @property
     def service(self) -> DescriptionService:
@@ -45,9 +49,10 @@ class DescriptionWorker(threading.Thread):
     def run(self) -> None:
         logger.info("DescriptionWorker started")
         while not self._stop_event.is_set():
+            processed = 0
             try:
                 with self._store._connect() as conn:
-                    self._process_batch(conn)
+                    processed = self._process_batch(conn)
             except sqlite3.OperationalError as e:
                 if "database is locked" in str(e):
                     logger.warning("Database locked, will retry")
@@ -55,7 +60,9 @@ class DescriptionWorker(threading.Thread):
                     logger.error(f"Database error: {e}")
             except Exception as e:
                 logger.error(f"Unexpected error in worker loop: {e}")
-            self._stop_event.wait(timeout=self._poll_interval)
+            if not processed:
+                # Only idle when the queue was empty; drain backlogs back-to-back
+                self._stop_event.wait(timeout=self._poll_interval)
         logger.info("DescriptionWorker stopped")
 
     def _log_queue_status(self, conn: sqlite3.Connection) -> None:
@@ -73,8 +80,8 @@ class DescriptionWorker(threading.Thread):
                 logger.debug(f"Failed to get queue status: {e}")
             self._last_stats_time = now
 
-    def _process_batch(self, conn: sqlite3.Connection) -> None:
-        """Fetch and process one pending description task."""
+    def _process_batch(self, conn: sqlite3.Connection) -> int:
+        """Fetch and process pending description tasks. Returns tasks claimed."""
         from myrecall.server.config_runtime import runtime_settings
         current_version = runtime_settings.ai_processing_version
         if current_version != self._last_processing_version:
@@ -89,10 +96,23 @@ class DescriptionWorker(threading.Thread):
         # Log queue status periodically
         self._log_queue_status(conn)
 
-        task = self._store.claim_description_task(conn)
+        waits = None
+        if self._lanes.max_wait_seconds > 0:
+            waits = self._store.get_pending_lane_waits(conn, "description")
+        order = self._lanes.next_order(waits)
+        task = self._store.claim_description_task(conn, lanes=order)
         if task is None:
             logger.debug("No pending description tasks")
-            return
+            return 0
+
+        # Work is waiting: top up to what the provider can batch or run concurrently
+        tasks = [task]
+        limit = self.service.batch_limit()
+        if limit > 1:
+            tasks += self._store.claim_description_tasks(conn, limit - 1, lanes=order)
+        self._lanes.record(order, (t["priority"] for t in tasks))
+        if len(tasks) > 1:
+            return self._process_many(conn, tasks)
 
         task_id, frame_id = task["id"], task["frame_id"]
         logger.debug(f"Processing description task #{task_id} for frame #{frame_id}")
@@ -101,13 +121,13 @@ class DescriptionWorker(threading.Thread):
         frame = self._store.get_frame_by_id(frame_id, conn)
         if frame is None:
             logger.warning(f"Frame #{frame_id} not found, skipping task #{task_id}")
-            return
+            return 1
 
-        snapshot_path = frame.get("snapshot_path")
-        if not snapshot_path:
+        location = SnapshotLocation.from_row(frame)
+        if location is None:
             logger.warning(f"Frame #{frame_id} has no snapshot_path, skipping")
             self.service.mark_failed(conn, task_id, frame_id, "No snapshot_path", 1)
-            return
+            return 1
 
         context = FrameContext(
             app_name=frame.get("app_name"),
@@ -116,7 +136,8 @@ class DescriptionWorker(threading.Thread):
         )
 
         try:
-            description = self.service.generate_description(snapshot_path, context)
+            with location.as_file() as snapshot_path:
+                description = self.service.generate_description(snapshot_path, context)
             self.service.insert_description(conn, frame_id, description)
             self.service.mark_completed(conn, task_id, frame_id)
             logger.info(f"Description completed for frame #{frame_id}")
@@ -127,3 +148,53 @@ class DescriptionWorker(threading.Thread):
             logger.error(f"Unexpected error processing frame #{frame_id}: {e}")
             retry_count = task.get("retry_count", 0) + 1
             self.service.mark_failed(conn, task_id, frame_id, str(e), retry_count)
+        return 1
+
+    def _process_many(self, conn: sqlite3.Connection, tasks: list[dict]) -> int:
+        """Describe claimed tasks in one provider call (a padded local batch or
+        concurrent remote requests) and write all results in one transaction."""
+        runnable: list[tuple[dict, SnapshotLocation, FrameContext]] = []
+        for task in tasks:
+            frame = self._store.get_frame_by_id(task["frame_id"], conn)
+            if frame is None:
+                logger.warning(f"Frame #{task['frame_id']} not found, skipping task #{task['id']}")
+                continue
+            location = SnapshotLocation.from_row(frame)
+            if location is None:
+                logger.warning(f"Frame #{task['frame_id']} has no snapshot_path, skipping")
+                self.service.mark_failed(conn, task["id"], task["frame_id"], "No snapshot_path", 1)
+                continue
+            context = FrameContext(
+                app_name=frame.get("app_name"),
+                window_name=frame.get("window_name"),
+                browser_url=frame.get("browser_url"),
+            )
+            runnable.append((task, location, context))
+
+        if runnable:
+            with ExitStack() as files:
+                ready: list[tuple[dict, str, FrameContext]] = []
+                for task, location, context in runnable:
+                    try:
+                        ready.append((task, files.enter_context(location.as_file()), context))
+                    except OSError as e:
+                        # Unreadable archived snapshot: fail this task, keep the batch
+                        retry_count = task.get("retry_count", 0) + 1
+                        self.service.mark_failed(conn, task["id"], task["frame_id"], str(e), retry_count)
+                results = self.service.generate_descriptions(
+                    [(snapshot_path, context) for _, snapshot_path, context in ready]
+                )
+            for (task, _, _), result in zip(ready, results):
+                task_id, frame_id = task["id"], task["frame_id"]
+                if isinstance(result, Exception):
+                    retry_count = task.get("retry_count", 0) + 1
+                    self.service.mark_failed(conn, task_id, frame_id, str(result), retry_count)
+                else:
+                    self.service.insert_description(conn, frame_id, result)
+                    self.service.mark_completed(conn, task_id, frame_id)
+            conn.commit()
+            logger.info(
+                f"Description batch completed: {sum(not isinstance(r, Exception) for r in results)}"
+                f"/{len(ready)} frames"
+            )
+        return len(tasks)
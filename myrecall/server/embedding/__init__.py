@@ -1,5 +1,4 @@
 """Frame embedding module for multimodal vector search."""
-from myrecall.server.embedding.models import FrameEmbedding
 from myrecall.server.embedding.service import EmbeddingService
 from myrecall.server.embedding.worker import EmbeddingWorker
 
@@ -8,3 +7,12 @@ __all__ = [
     "EmbeddingService",
     "EmbeddingWorker",
 ]
+
+
+def __getattr__(name: str):
+    # FrameEmbedding is a LanceModel (lancedb ~2s import); load it on first use
+    if name == "FrameEmbedding":
+        from myrecall.server.embedding.models import FrameEmbedding
+
+        return FrameEmbedding
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Optional
 
-from myrecall.server.embedding.models import FrameEmbedding
+from myrecall.server.database.task_lanes import LANE_BACKFILL
 from myrecall.server.embedding.providers import (
     MultimodalEmbeddingProvider,
 )
@@ -14,6 +14,7 @@ from myrecall.server.embedding.providers import (
 if TYPE_CHECKING:
     from myrecall.server.database.frames_store import FramesStore
     from myrecall.server.database.embedding_store import EmbeddingStore
+    from myrecall.server.embedding.models import FrameEmbedding
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +78,9 @@ class EmbeddingService:
         text: Optional[str] = None,
     ) -> FrameEmbedding:
         """Call the embedding provider to generate an embedding."""
+        # FrameEmbedding is a LanceModel; keep lancedb out of server startup
+        from myrecall.server.embedding.models import FrameEmbedding
+
         vector = self.provider.embed_image(image_path, text)
         return FrameEmbedding(
             frame_id=0,  # Will be set by caller
@@ -192,11 +196,12 @@ class EmbeddingService:
         """Enqueue all frames without embedding_status. Returns count."""
         cursor = conn.execute(
             """
-            INSERT INTO embedding_tasks (frame_id, status)
-            SELECT id, 'pending' FROM frames
+            INSERT INTO embedding_tasks (frame_id, status, priority)
+            SELECT id, 'pending', ? FROM frames
             WHERE embedding_status IS NULL
               AND id NOT IN (SELECT frame_id FROM embedding_tasks)
-            """
+            """,
+            (LANE_BACKFILL,),
         )
         conn.commit()
         return cursor.rowcount
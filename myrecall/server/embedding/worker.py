@@ -7,6 +7,9 @@ import threading
 import time
 from typing import TYPE_CHECKING
 
+from myrecall.server.database.task_lanes import LaneScheduler
+from myrecall.server.frame_storage import SnapshotLocation
+
 if TYPE_CHECKING:
     from myrecall.server.database.frames_store import FramesStore
 
@@ -30,6 +33,7 @@ class EmbeddingWorker(threading.Thread):
         self._poll_interval = poll_interval
         self._service = None
         self._last_stats_time = 0.0
+        self._lanes = LaneScheduler()
 
     @property
     def service(self):
@@ -76,10 +80,15 @@ class EmbeddingWorker(threading.Thread):
         """Fetch and process one pending embedding task."""
         self._log_queue_status(conn)
 
-        task = self._store.claim_embedding_task(conn)
+        waits = None
+        if self._lanes.max_wait_seconds > 0:
+            waits = self._store.get_pending_lane_waits(conn, "embedding")
+        order = self._lanes.next_order(waits)
+        task = self._store.claim_embedding_task(conn, lanes=order)
         if task is None:
             logger.debug("No pending embedding tasks")
             return
+        self._lanes.record(order, [task["priority"]])
 
         task_id, frame_id = task["id"], task["frame_id"]
         logger.debug(f"Processing embedding task #{task_id} for frame #{frame_id}")
@@ -89,17 +98,18 @@ class EmbeddingWorker(threading.Thread):
             logger.warning(f"Frame #{frame_id} not found, skipping task #{task_id}")
             return
 
-        snapshot_path = frame.get("snapshot_path")
-        if not snapshot_path:
+        location = SnapshotLocation.from_row(frame)
+        if location is None:
             logger.warning(f"Frame #{frame_id} has no snapshot_path, skipping")
             self.service.mark_failed(conn, task_id, frame_id, "No snapshot_path", 1)
             return
 
         try:
-            embedding = self.service.generate_embedding(
-                image_path=snapshot_path,
-                text=frame.get("full_text"),
-            )
+            with location.as_file() as snapshot_path:
+                embedding = self.service.generate_embedding(
+                    image_path=snapshot_path,
+                    text=frame.get("full_text"),
+                )
             self.service.save_embedding(
                 conn,
                 frame_id,
@@ -0,0 +1,367 @@
+"""Tiered snapshot storage.
+
+Snapshots are ingested as capture-quality JPEGs in ``frames_dir``. Old
+frames are rarely viewed at full quality, so a background job moves them
+down two optional tiers (``[storage]`` settings):
+
+- compressed (after ``compress_after_days``): re-encoded as WebP (AVIF
+  when the installed Pillow can write it) at ``compress_quality``, and
+  downscaled to ``compress_max_side`` if set. The new file replaces the
+  JPEG next to it.
+- archived (after ``archive_after_days``): appended to an append-only pack
+  file per local day (``frames_dir/archive/YYYY-MM-DD.pack``); the frame
+  row records the byte offset and length.
+
+Readers resolve a frame's snapshot through ``SnapshotLocation``, so
+``GET /v1/frames/<id>``, the OCR visualization and the OCR, description
+and embedding workers (``SnapshotLocation.as_file``) handle every tier.
+Pack files only grow: bytes of frames deleted after archiving are not
+reclaimed.
+"""
+
+import io
+import logging
+import os
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from PIL import Image
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+TIER_ORIGINAL = "original"
+TIER_COMPRESSED = "compressed"
+TIER_ARCHIVED = "archived"
+
+_MIMETYPES = {".webp": "image/webp", ".avif": "image/avif"}
+_SUFFIXES = {"image/webp": ".webp", "image/avif": ".avif", "image/jpeg": ".jpg"}
+
+
+def sniff_mimetype(head: bytes) -> str:
+    """Image MIME type from the leading bytes of an encoded snapshot."""
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[4:12] in (b"ftypavif", b"ftypavis"):
+        return "image/avif"
+    return "image/jpeg"
+
+
+@dataclass(frozen=True)
+class SnapshotLocation:
+    """Where a frame's snapshot bytes live."""
+
+    path: str
+    tier: str = TIER_ORIGINAL
+    offset: Optional[int] = None
+    length: Optional[int] = None
+    scale: float = 1.0
+
+    @classmethod
+    def from_row(cls, row) -> Optional["SnapshotLocation"]:
+        """Build from a frames row or dict; missing storage columns mean an original."""
+        if row is None or not _field(row, "snapshot_path"):
+            return None
+        return cls(
+            path=row["snapshot_path"],
+            tier=_field(row, "storage_tier") or TIER_ORIGINAL,
+            offset=_field(row, "storage_offset"),
+            length=_field(row, "storage_length"),
+            scale=_field(row, "storage_scale") or 1.0,
+        )
+
+    @property
+    def is_packed(self) -> bool:
+        return self.tier == TIER_ARCHIVED
+
+    def exists(self) -> bool:
+        return Path(self.path).exists()
+
+    def read_bytes(self) -> bytes:
+        """Return the encoded image.
+
+        Raises:
+            OSError: If the file or pack is missing or truncated.
+        """
+        if not self.is_packed:
+            return Path(self.path).read_bytes()
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(self.length)
+        if len(data) != self.length:
+            raise OSError(f"archive pack truncated: {self.path}@{self.offset}")
+        return data
+
+    def open(self) -> BinaryIO:
+        """Open the encoded image as a binary file (for PIL)."""
+        if self.is_packed:
+            return io.BytesIO(self.read_bytes())
+        return open(self.path, "rb")
+
+    @property
+    def mimetype(self) -> str:
+        return _MIMETYPES.get(Path(self.path).suffix.lower(), "image/jpeg")
+
+    @contextmanager
+    def as_file(self) -> Iterator[str]:
+        """Yield a path to a file holding only this frame's encoded image.
+
+        Workers whose providers take an image path use this: an archived
+        snapshot is copied out of its day pack into a temporary file
+        (removed on exit), since opening the pack itself would decode the
+        first image in it.
+
+        Raises:
+            OSError: If an archived snapshot cannot be read.
+        """
+        if not self.is_packed:
+            yield self.path
+            return
+        data = self.read_bytes()
+        with tempfile.NamedTemporaryFile(
+            prefix="snapshot-", suffix=_SUFFIXES[sniff_mimetype(data[:16])], delete=False
+        ) as tmp:
+            tmp.write(data)
+        try:
+            yield tmp.name
+        finally:
+            Path(tmp.name).unlink(missing_ok=True)
+
+
+def _field(row, key: str):
+    """``row[key]``, or None when a row or dict lacks the column."""
+    try:
+        return row[key]
+    except (KeyError, IndexError):
+        return None
+
+
+def location_for_frame(store: FramesStore, frame_id: int) -> Optional[SnapshotLocation]:
+    """Resolve a frame's snapshot; None if the frame or its path is missing."""
+    return SnapshotLocation.from_row(store.get_snapshot_location(frame_id))
+
+
+@dataclass
+class TieringResult:
+    """Outcome of one tiering run."""
+
+    compressed: int = 0
+    archived: int = 0
+    failed: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    seconds: float = 0.0
+    finished_at: str = field(default="")
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "saved_bytes": self.bytes_before - self.bytes_after}
+
+
+_last_result: Optional[TieringResult] = None
+
+
+def last_tiering_result() -> Optional[TieringResult]:
+    return _last_result
+
+
+def _compress_format() -> tuple[str, str]:
+    """(Pillow format, suffix) for the compressed tier."""
+    requested = str(getattr(settings, "storage_compress_format", "webp")).lower()
+    Image.init()
+    if requested == "avif":
+        if "AVIF" in Image.SAVE:
+            return "AVIF", ".avif"
+        logger.warning("AVIF encoding not available in Pillow; using WebP")
+    return "WEBP", ".webp"
+
+
+def _reencode(
+    location: SnapshotLocation, fmt: str, quality: int, max_side: int
+) -> tuple[bytes, float]:
+    """Encode a snapshot for the compressed tier; returns (bytes, new scale)."""
+    with location.open() as fp, Image.open(fp) as img:
+        width = img.width
+        if max_side > 0 and max(img.size) > max_side:
+            # DCT-scaled JPEG decode close to the target, then a real resample
+            img.draft("RGB", (max_side, max_side))
+            img = img.convert("RGB")
+            img.thumbnail((max_side, max_side), Image.LANCZOS)
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+        buf = io.BytesIO()
+        img.save(buf, format=fmt, quality=quality)
+        return buf.getvalue(), location.scale * width / img.width
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def _unlink(path: str) -> None:
+    try:
+        Path(path).unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning("storage tiering: failed to remove %s: %s", path, exc)
+
+
+def compress_snapshots(
+    store: FramesStore, older_than: str, result: TieringResult, batch_size: int = 200
+) -> None:
+    """Move original-tier frames captured before ``older_than`` to the compressed tier."""
+    fmt, suffix = _compress_format()
+    quality = int(getattr(settings, "storage_compress_quality", 60))
+    max_side = int(getattr(settings, "storage_compress_max_side", 0) or 0)
+    after_id = 0
+    while True:
+        rows = store.find_frames_for_tiering([TIER_ORIGINAL], older_than, batch_size, after_id)
+        if not rows:
+            return
+        after_id = rows[-1]["id"]
+        moves, sizes = [], {}
+        for row in rows:
+            location = SnapshotLocation.from_row(row)
+            try:
+                before = os.path.getsize(location.path)
+                data, scale = _reencode(location, fmt, quality, max_side)
+                target = Path(location.path).with_suffix(suffix)
+                _write_atomic(target, data)
+            except OSError as exc:
+                logger.warning("storage tiering: compress failed frame_id=%d: %s", row["id"], exc)
+                result.failed += 1
+                continue
+            moves.append(
+                (row["id"], location.path, str(target), TIER_COMPRESSED, None, len(data), scale)
+            )
+            sizes[row["id"]] = (before, len(data))
+        applied = set(store.update_snapshot_locations(moves))
+        for frame_id, old_path, new_path, *_ in moves:
+            if frame_id in applied:
+                _unlink(old_path)
+                result.compressed += 1
+                result.bytes_before += sizes[frame_id][0]
+                result.bytes_after += sizes[frame_id][1]
+            elif new_path != old_path:
+                _unlink(new_path)
+
+
+def archive_snapshots(
+    store: FramesStore, older_than: str, result: TieringResult, batch_size: int = 200
+) -> None:
+    """Append frames captured before ``older_than`` to per-day pack files."""
+    archive_dir = Path(settings.frames_dir) / "archive"
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    after_id = 0
+    while True:
+        rows = store.find_frames_for_tiering(
+            [TIER_ORIGINAL, TIER_COMPRESSED], older_than, batch_size, after_id
+        )
+        if not rows:
+            return
+        after_id = rows[-1]["id"]
+        by_day: dict[str, list] = {}
+        for row in rows:
+            by_day.setdefault((row["local_timestamp"] or "")[:10] or "undated", []).append(row)
+
+        moves = []
+        for day, day_rows in by_day.items():
+            pack = archive_dir / f"{day}.pack"
+            with open(pack, "ab") as f:
+                for row in day_rows:
+                    location = SnapshotLocation.from_row(row)
+                    try:
+                        data = location.read_bytes()
+                    except OSError as exc:
+                        logger.warning(
+                            "storage tiering: archive read failed frame_id=%d: %s", row["id"], exc
+                        )
+                        result.failed += 1
+                        continue
+                    offset = f.tell()
+                    f.write(data)
+                    moves.append(
+                        (row["id"], location.path, str(pack), TIER_ARCHIVED, offset, len(data),
+                         location.scale)
+                    )
+                f.flush()
+                os.fsync(f.fileno())
+
+        applied = set(store.update_snapshot_locations(moves))
+        for frame_id, old_path, *_ in moves:
+            if frame_id in applied:
+                _unlink(old_path)
+                result.archived += 1
+
+
+def run_storage_tiering(store: FramesStore, now: Optional[datetime] = None) -> TieringResult:
+    """Run the enabled tiers once, oldest-first, and remember the result."""
+    global _last_result
+    now = now or datetime.now(timezone.utc)
+    batch_size = max(1, int(getattr(settings, "storage_tiering_batch_size", 200)))
+    result = TieringResult()
+    start = time.perf_counter()
+
+    compress_days = int(getattr(settings, "storage_compress_after_days", 0) or 0)
+    if compress_days > 0:
+        cutoff = (now - timedelta(days=compress_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        compress_snapshots(store, cutoff, result, batch_size)
+    archive_days = int(getattr(settings, "storage_archive_after_days", 0) or 0)
+    if archive_days > 0:
+        cutoff = (now - timedelta(days=archive_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        archive_snapshots(store, cutoff, result, batch_size)
+
+    result.seconds = round(time.perf_counter() - start, 3)
+    result.finished_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    _last_result = result
+    if result.compressed or result.archived or result.failed:
+        logger.info(
+            "storage tiering: %d compressed, %d archived, %d failed, saved %.1f MB in %.1fs",
+            result.compressed,
+            result.archived,
+            result.failed,
+            (result.bytes_before - result.bytes_after) / 1e6,
+            result.seconds,
+        )
+    return result
+
+
+def tier_report(store: FramesStore, sample: int = 5) -> list[dict]:
+    """Per-tier frame counts, bytes saved and sampled read/decode latency.
+
+    Latency is measured now, on this host, over the ``sample`` most recent
+    frames of each tier: ``read_ms_p50`` to fetch the encoded bytes and
+    ``decode_ms_p50`` to decode them.
+    """
+    report = []
+    for stats in store.get_storage_tier_stats():
+        read_ms, decode_ms = [], []
+        for row in store.sample_snapshot_locations(stats["tier"], sample):
+            location = SnapshotLocation.from_row(row)
+            try:
+                start = time.perf_counter()
+                data = location.read_bytes()
+                read_ms.append((time.perf_counter() - start) * 1000)
+                start = time.perf_counter()
+                with Image.open(io.BytesIO(data)) as img:
+                    img.load()
+                decode_ms.append((time.perf_counter() - start) * 1000)
+            except OSError:
+                continue
+        report.append(
+            {
+                **stats,
+                "saved_bytes": stats["ingested_bytes"] - stats["stored_bytes"],
+                "read_ms_p50": round(statistics.median(read_ms), 2) if read_ms else None,
+                "decode_ms_p50": round(statistics.median(decode_ms), 2) if decode_ms else None,
+            }
+        )
+    return report
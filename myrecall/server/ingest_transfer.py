@@ -0,0 +1,189 @@
+"""Transfer-layer helpers for POST /v1/ingest.
+
+- ``decode_request_body``: honours a request-level ``Content-Encoding``
+  by inflating the body before Werkzeug parses the multipart form.
+- ``PartialUploadStore``: append-only ``.part`` files backing the resumable
+  ``/v1/ingest/uploads/<capture_id>`` endpoints.
+- ``TransferStats``: process-wide size / bytes-saved counters reported by
+  ``/v1/ingest/queue/status``.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from myrecall.shared.compression import IDENTITY, DecompressionError, decompress
+
+logger = logging.getLogger(__name__)
+
+_STALE_PART_SECONDS = 24 * 3600
+
+
+class TransferStats:
+    """Thread-safe counters for ingest transfer sizes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters = {
+            "requests": 0,
+            "compressed_requests": 0,
+            "wire_bytes": 0,
+            "decoded_bytes": 0,
+            "bytes_saved": 0,
+            "chunks_received": 0,
+            "resumed_uploads": 0,
+        }
+
+    def add(self, **deltas: int) -> None:
+        with self._lock:
+            for key, delta in deltas.items():
+                self._counters[key] += delta
+
+    def record_payload(self, wire_bytes: int, decoded_bytes: int) -> None:
+        """Account one decoded payload (metadata part or whole request)."""
+        self.add(
+            compressed_requests=1,
+            bytes_saved=max(decoded_bytes - wire_bytes, 0),
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            snapshot: dict[str, Any] = dict(self._counters)
+        decoded = snapshot["decoded_bytes"]
+        snapshot["compression_ratio"] = (
+            round(snapshot["wire_bytes"] / decoded, 3) if decoded else None
+        )
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            for key in self._counters:
+                self._counters[key] = 0
+
+
+transfer_stats = TransferStats()
+
+
+def decode_request_body(environ: dict, max_size: int) -> int | None:
+    """Inflate a ``Content-Encoding``-compressed request body in place.
+
+    Must run before anything touches ``request.stream``/``request.form``.
+    Swaps ``wsgi.input`` for the decoded bytes and fixes up the headers so
+    normal multipart parsing sees a plain body.
+
+    Returns:
+        Wire (compressed) size when the body was decoded, else None.
+
+    Raises:
+        DecompressionError: corrupt payload, unknown encoding, or too large.
+    """
+    encoding = environ.get("HTTP_CONTENT_ENCODING", "").strip().lower()
+    if not encoding or encoding == IDENTITY:
+        return None
+
+    # The wire body is never larger than the decoded one, so it gets the
+    # same cap. Chunked bodies carry no length: read one byte past the cap.
+    length = int(environ.get("CONTENT_LENGTH") or 0)
+    if length > max_size:
+        raise DecompressionError("payload exceeds maximum size")
+    raw = environ["wsgi.input"].read(length or max_size + 1)
+    if len(raw) > max_size:
+        raise DecompressionError("payload exceeds maximum size")
+    body = decompress(raw, encoding, max_size)
+
+    environ["wsgi.input"] = io.BytesIO(body)
+    environ["CONTENT_LENGTH"] = str(len(body))
+    environ.pop("HTTP_CONTENT_ENCODING", None)
+    transfer_stats.record_payload(len(raw), len(body))
+    return len(raw)
+
+
+class PartialUploadStore:
+    """Stores in-progress chunked uploads as ``<capture_id>.part`` files."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    @staticmethod
+    def validate_id(capture_id: str) -> str:
+        """Normalize the id; only canonical UUIDs may name files on disk."""
+        return str(uuid.UUID(capture_id))
+
+    def path_for(self, capture_id: str) -> Path:
+        return self.root / f"{self.validate_id(capture_id)}.part"
+
+    def offset(self, capture_id: str) -> int:
+        path = self.path_for(capture_id)
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def append(self, capture_id: str, offset: int, chunk: bytes, max_size: int) -> int:
+        """Append ``chunk`` at ``offset``; return the new offset.
+
+        Raises:
+            OffsetMismatch: ``offset`` differs from the bytes already stored.
+            UploadTooLarge: the upload would exceed ``max_size``.
+            ValueError: ``capture_id`` is not a UUID.
+        """
+        path = self.path_for(capture_id)
+        current = self.offset(capture_id)
+        if offset != current:
+            raise OffsetMismatch(current)
+        if current + len(chunk) > max_size:
+            raise UploadTooLarge(current + len(chunk))
+        if current == 0:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self.purge_stale()
+        with open(path, "ab") as fh:
+            fh.write(chunk)
+            fh.flush()
+            os.fsync(fh.fileno())
+        return current + len(chunk)
+
+    def read(self, capture_id: str) -> bytes | None:
+        try:
+            return self.path_for(capture_id).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def discard(self, capture_id: str) -> None:
+        try:
+            self.path_for(capture_id).unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("ingest: failed to delete partial upload %s: %s", capture_id, exc)
+
+    def purge_stale(self, max_age_seconds: float = _STALE_PART_SECONDS) -> int:
+        """Delete partial uploads abandoned for longer than ``max_age_seconds``."""
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for path in self.root.glob("*.part"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            logger.info("ingest: purged %d stale partial upload(s)", removed)
+        return removed
+
+
+class OffsetMismatch(Exception):
+    """Client offset does not match the stored partial upload."""
+
+    def __init__(self, current: int) -> None:
+        super().__init__(f"expected offset {current}")
+        self.current = current
+
+
+class UploadTooLarge(Exception):
+    """Appending the chunk would exceed the ingest size limit."""
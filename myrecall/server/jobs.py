@@ -0,0 +1,110 @@
+"""In-memory registry of background admin jobs.
+
+Bulk deletion (``retention.py``) and failed-frame recovery
+(``recovery.py``) run as background jobs that clients poll for progress.
+Both keep their recent jobs here: a ``BackgroundJob`` subclass tracks one
+run, and a ``JobRegistry`` keeps the newest ones for progress queries.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Generic, Optional, TypeVar
+
+
+def _utc(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ") if value else None
+
+
+class BackgroundJob:
+    """Progress of one background job.
+
+    Subclasses count their work under ``self._lock``, report how many of
+    ``total`` items are done with ``_done`` and add their own counters to
+    ``to_dict`` with ``_fields``.
+    """
+
+    def __init__(self, total: int):
+        self.job_id = str(uuid.uuid4())
+        self.total = total
+        self.status = "running"
+        self.batches = 0
+        self.error: Optional[str] = None
+        self.started_at = datetime.now(timezone.utc)
+        self.finished_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def _done(self) -> int:
+        raise NotImplementedError
+
+    def _fields(self) -> dict:
+        return {}
+
+    def _finish(self, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.status = "failed" if error else "completed"
+            self.error = error
+            self.finished_at = datetime.now(timezone.utc)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "status": self.status,
+                "total": self.total,
+                **self._fields(),
+                "batches": self.batches,
+                "progress": (
+                    min(1.0, round(self._done() / self.total, 4)) if self.total else 1.0
+                ),
+                "error": self.error,
+                "started_at": _utc(self.started_at),
+                "finished_at": _utc(self.finished_at),
+            }
+
+
+J = TypeVar("J", bound=BackgroundJob)
+
+
+class JobRegistry(Generic[J]):
+    """The ``max_jobs`` most recent jobs of one kind; running jobs are never dropped."""
+
+    def __init__(self, max_jobs: int):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, J]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> Optional[J]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> list[J]:
+        """Recent jobs, newest first."""
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    def add(self, job: J) -> J:
+        with self._lock:
+            self._add(job)
+        return job
+
+    def add_unless_running(self, create: Callable[[], J]) -> tuple[J, bool]:
+        """Register ``create()`` unless a job is running; returns (job, created).
+
+        ``create`` runs under the registry lock, so two callers cannot both
+        start a job.
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status == "running":
+                    return job, False
+            return self._add(create()), True
+
+    def _add(self, job: J) -> J:
+        self._jobs[job.job_id] = job
+        while len(self._jobs) > self.max_jobs:
+            if next(iter(self._jobs.values())).status == "running":
+                break
+            self._jobs.popitem(last=False)
+        return job
@@ -0,0 +1,83 @@
+"""Helpers for cross-frame batched text recognition.
+
+Batch mode runs detection per frame, crops every detected text line, and
+recognizes the lines of several frames together in batches of similar
+aspect ratio (so little of each batch is padding), then scatters the
+results back per frame. These helpers are engine-independent; the
+RapidOCR calls live in rapid_backend.py.
+"""
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+# Lines whose width/height ratios differ by more than this never share a
+# recognition batch: the batch is padded to its widest member.
+_MAX_BUCKET_RATIO_SPREAD = 2.0
+
+
+def crop_text_line(image: np.ndarray, box: Sequence[Sequence[float]]) -> np.ndarray:
+    """Crop the axis-aligned bounds of a detected 4-point box.
+
+    Screen text is axis-aligned, so the bounding rectangle stands in for
+    RapidOCR's perspective crop. Tall crops are rotated like RapidOCR does.
+    """
+    xs = [p[0] for p in box]
+    ys = [p[1] for p in box]
+    height, width = image.shape[:2]
+    x0 = max(0, int(math.floor(min(xs))))
+    x1 = min(width, int(math.ceil(max(xs))))
+    y0 = max(0, int(math.floor(min(ys))))
+    y1 = min(height, int(math.ceil(max(ys))))
+    crop = image[y0:max(y1, y0 + 1), x0:max(x1, x0 + 1)]
+    if crop.shape[0] / max(crop.shape[1], 1) >= 1.5:
+        crop = np.rot90(crop)
+    return np.ascontiguousarray(crop)
+
+
+def width_buckets(crops: Sequence[np.ndarray], batch_size: int) -> list[list[int]]:
+    """Group crop indices into recognition batches of similar aspect ratio.
+
+    Returns lists of indices into ``crops``; every index appears once.
+    """
+    ratios = [c.shape[1] / max(c.shape[0], 1) for c in crops]
+    order = sorted(range(len(crops)), key=ratios.__getitem__)
+    buckets: list[list[int]] = []
+    for index in order:
+        if (
+            buckets
+            and len(buckets[-1]) < batch_size
+            and ratios[index] <= max(ratios[buckets[-1][0]], 1e-6) * _MAX_BUCKET_RATIO_SPREAD
+        ):
+            buckets[-1].append(index)
+        else:
+            buckets.append([index])
+    return buckets
+
+
+def layout_text(boxes: Sequence[Sequence[Sequence[float]]], texts: Sequence[str]) -> str:
+    """Join recognized lines in reading order.
+
+    Boxes whose vertical centers fall within half a line height of each
+    other form one row (joined with spaces, left to right); rows are
+    joined with newlines, top to bottom.
+    """
+    items = []
+    for box, text in zip(boxes, texts):
+        if not text:
+            continue
+        ys = [p[1] for p in box]
+        items.append(((min(ys) + max(ys)) / 2, max(ys) - min(ys), min(p[0] for p in box), text))
+    items.sort()
+
+    rows: list[list[tuple]] = []
+    for item in items:
+        center, height, _, _ = item
+        if rows:
+            row_center, row_height = rows[-1][0][0], rows[-1][0][1]
+            if abs(center - row_center) <= max(row_height, height) / 2:
+                rows[-1].append(item)
+                continue
+        rows.append([item])
+    return "\n".join(" ".join(item[3] for item in sorted(row, key=lambda i: i[2])) for row in rows)
@@ -0,0 +1,52 @@
+"""Reduced-resolution image decoding for OCR input.
+
+RapidOCR shrinks every frame to at most ``Global.max_side_len`` (2000 px)
+before detection, so decoding a 5K snapshot at full resolution wastes most
+of the work. JPEG frames are decoded with DCT scaling (``Image.draft``) to
+the smallest 1/2, 1/4 or 1/8 scale that still covers the target side, and
+packed straight into a contiguous BGR array in a single pass. Boxes found
+on the reduced image are mapped back to original-resolution coordinates
+with ``rescale_boxes`` so stored text_json and visualizations line up.
+"""
+
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+from PIL import Image
+
+
+def load_ocr_image(
+    path: Union[str, Path], max_side: int
+) -> tuple[np.ndarray, float, float]:
+    """Decode an image for OCR as a BGR array no smaller than ``max_side``.
+
+    Args:
+        path: Image file path.
+        max_side: Target long side; 0 decodes at full resolution. Only JPEGs
+            are reduced (and only by whole DCT scale factors); other formats
+            decode at full size.
+
+    Returns:
+        ``(bgr, scale_x, scale_y)`` where the scales map decoded pixel
+        coordinates back to the original image.
+    """
+    with Image.open(path) as img:
+        width, height = img.size
+        if max_side > 0 and max(width, height) > max_side:
+            ratio = max_side / max(width, height)
+            img.draft("RGB", (max(1, round(width * ratio)), max(1, round(height * ratio))))
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        # One packing pass straight to BGR: no RGB array plus flipped copy
+        bgr = np.frombuffer(img.tobytes("raw", "BGR"), dtype=np.uint8).reshape(
+            img.height, img.width, 3
+        )
+    return bgr, width / bgr.shape[1], height / bgr.shape[0]
+
+
+def rescale_boxes(boxes: list, scale_x: float, scale_y: float) -> list:
+    """Map 4-point boxes from decoded to original image coordinates."""
+    if scale_x == 1.0 and scale_y == 1.0:
+        return boxes
+    return [[[x * scale_x, y * scale_y] for x, y in box] for box in boxes]
@@ -0,0 +1,71 @@
+"""Pool of independent OCR engine instances.
+
+One RapidOCR instance serializes inference, and ONNX Runtime threading
+inside a single session stops scaling well before a many-core host runs out
+of cores. The pool holds N independent engines (each with its own session
+thread settings) so N frames can be recognized concurrently.
+
+``[ocr] pool_size = 1`` (the default) keeps the single shared
+``RapidOCRBackend()`` and no pool is created.
+"""
+
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from myrecall.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EnginePool:
+    """Fixed-size pool of engines handed out one caller at a time."""
+
+    def __init__(self, factory: Callable[[], Any], size: int, warmup: bool = True):
+        if size < 1:
+            raise ValueError(f"pool size must be >= 1, got {size}")
+        self.size = size
+        self._engines: "queue.Queue[Any]" = queue.Queue()
+        for _ in range(size):
+            engine = factory()
+            if warmup and hasattr(engine, "warmup"):
+                engine.warmup()
+            self._engines.put(engine)
+        logger.info("OCR engine pool ready (size=%d, warmup=%s)", size, warmup)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Borrow an engine, blocking until one is free.
+
+        Raises:
+            queue.Empty: If ``timeout`` elapses with every engine busy.
+        """
+        engine = self._engines.get(timeout=timeout)
+        try:
+            yield engine
+        finally:
+            self._engines.put(engine)
+
+
+_pool: Optional[EnginePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_ocr_engine_pool() -> Optional[EnginePool]:
+    """Return the process-wide RapidOCR pool, or None when pool_size <= 1."""
+    global _pool
+    size = int(getattr(settings, "ocr_pool_size", 1) or 1)
+    if size <= 1:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            from myrecall.server.ocr.rapid_backend import RapidOCRBackend
+
+            _pool = EnginePool(
+                RapidOCRBackend.create,
+                size=size,
+                warmup=bool(getattr(settings, "ocr_warmup", True)),
+            )
+        return _pool
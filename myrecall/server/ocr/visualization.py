@@ -0,0 +1,154 @@
+"""On-demand OCR visualization rendering.
+
+Draws the bounding boxes stored in ``ocr_text.text_json`` over the frame's
+snapshot. Rendered JPEGs are kept in a size-bounded LRU directory
+(``<server_data_dir>/ocr_vis``) so repeat views are a file read; the
+least recently viewed images are evicted once the cache exceeds its budget.
+
+Pillow-only, so it works without the OCR engine loaded.
+"""
+
+import io
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from PIL import Image, ImageDraw
+
+from myrecall.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+_BOX_COLORS = (
+    (230, 57, 70),
+    (42, 157, 143),
+    (69, 123, 157),
+    (244, 162, 97),
+    (131, 56, 236),
+)
+_FILL_ALPHA = 48
+_JPEG_QUALITY = 85
+
+
+def render_ocr_visualization(
+    image_path: Union[str, BinaryIO], text_json: dict, scale: float = 1.0
+) -> bytes:
+    """Render OCR boxes over a snapshot and return JPEG bytes.
+
+    Args:
+        image_path: Path to the frame's snapshot, or an open binary file.
+        text_json: Stored OCR payload with a ``boxes`` list of 4-point polygons.
+        scale: Original pixels per snapshot pixel; boxes are stored in
+            original coordinates, so a downscaled snapshot (storage tiering)
+            divides them by this.
+
+    Raises:
+        OSError: If the snapshot cannot be read.
+    """
+    with Image.open(image_path) as img:
+        base = img.convert("RGBA")
+
+    overlay = Image.new("RGBA", base.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    width = max(1, round(max(base.size) / 800))
+    for i, box in enumerate(text_json.get("boxes") or []):
+        try:
+            points = [(float(x) / scale, float(y) / scale) for x, y in box]
+        except (TypeError, ValueError):
+            continue
+        if len(points) < 3:
+            continue
+        r, g, b = _BOX_COLORS[i % len(_BOX_COLORS)]
+        # polygon(width>1) pastes a full-image mask per box; line() does not
+        draw.polygon(points, fill=(r, g, b, _FILL_ALPHA))
+        draw.line(points + points[:1], fill=(r, g, b, 255), width=width)
+
+    rendered = Image.alpha_composite(base, overlay).convert("RGB")
+    buf = io.BytesIO()
+    rendered.save(buf, format="JPEG", quality=_JPEG_QUALITY)
+    return buf.getvalue()
+
+
+class OcrVisCache:
+    """Size-bounded LRU directory of rendered visualizations.
+
+    Recency is the file mtime (touched on every hit), so the cache is shared
+    safely with eagerly generated images and other processes.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def path_for(self, frame_id: int) -> Path:
+        return self.directory / f"{frame_id}.jpg"
+
+    def get(self, frame_id: int) -> Optional[Path]:
+        """Return the cached image path and mark it recently used."""
+        path = self.path_for(frame_id)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, frame_id: int, data: bytes) -> Path:
+        """Store a rendered image, evicting least recently used entries."""
+        path = self.path_for(frame_id)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".jpg.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+            self._evict(keep=path)
+        return path
+
+    def discard(self, frame_id: int) -> None:
+        self.path_for(frame_id).unlink(missing_ok=True)
+
+    def _evict(self, keep: Path) -> None:
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".jpg"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+                total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, entry_path, size in entries:
+            if total <= self.max_bytes:
+                break
+            if entry_path == str(keep):
+                continue
+            try:
+                os.unlink(entry_path)
+            except OSError:
+                continue
+            total -= size
+        logger.debug("OCR vis cache evicted down to %d bytes", total)
+
+
+_cache: Optional[OcrVisCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_ocr_vis_cache() -> OcrVisCache:
+    """Return the process-wide cache under ``<server_data_dir>/ocr_vis``."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            max_mb = int(getattr(settings, "ocr_vis_cache_mb", 256))
+            _cache = OcrVisCache(
+                settings.server_data_dir / "ocr_vis", max_bytes=max_mb * 1024 * 1024
+            )
+        return _cache
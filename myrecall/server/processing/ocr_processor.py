@@ -8,13 +8,13 @@ SSOT: design.md D2 - OCR result classification
 
 import logging
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional
-
-from PIL import Image
+from typing import Iterator, Optional
 
+from myrecall.server.ocr.decode import load_ocr_image, rescale_boxes
 from myrecall.shared.config import settings
 
 logger = logging.getLogger(__name__)
@@ -63,19 +63,58 @@ class OcrResult:
         return self.status in (OcrStatus.FAILED, OcrStatus.EMPTY_TEXT)
 
 
+@contextmanager
+def _ocr_backend() -> Iterator:
+    """Yield the shared RapidOCRBackend, or an engine borrowed from the pool."""
+    # Import here to avoid circular imports and allow lazy loading
+    from myrecall.server.ocr.engine_pool import get_ocr_engine_pool
+    from myrecall.server.ocr.rapid_backend import RapidOCRBackend
+
+    pool = get_ocr_engine_pool()
+    if pool is None:
+        yield RapidOCRBackend()
+    else:
+        with pool.acquire() as backend:
+            yield backend
+
+
+def _decode_max_side() -> int:
+    """Long side OCR input is decoded to; 0 decodes at full resolution."""
+    return max(0, int(getattr(settings, "ocr_decode_max_side", 2000) or 0))
+
+
+def _classify_output(output, elapsed_ms: float) -> OcrResult:
+    """Classify an OcrOutput per design.md D2 (empty text vs success)."""
+    if not output.text:
+        return OcrResult(
+            status=OcrStatus.EMPTY_TEXT,
+            error_reason="OCR_EMPTY_TEXT",
+            elapsed_ms=elapsed_ms,
+        )
+
+    # Success - non-empty text with bounding boxes
+    return OcrResult(
+        status=OcrStatus.SUCCESS,
+        text=output.text,
+        text_json=output.to_json_dict() if output.boxes else None,
+        elapsed_ms=elapsed_ms,
+    )
+
+
 def execute_ocr(image_path: str, frame_id: Optional[int] = None) -> OcrResult:
     """Execute OCR on an image and return a structured result.
 
     This function:
     1. Loads the image from disk
     2. Calls RapidOCRBackend to extract text with bounding boxes
-    3. Generates OCR visualization image (if frame_id provided)
+    3. Generates OCR visualization image (if frame_id provided and
+       ``ocr_vis_eager`` is on; otherwise it is rendered on demand)
     4. Classifies the result (success/empty/failed)
     5. Returns structured OcrResult with timing info and text_json
 
     Args:
         image_path: Path to the image file (JPEG expected)
-        frame_id: Optional frame ID for generating visualization image
+        frame_id: Optional frame ID for eager visualization output
 
     Returns:
         OcrResult with status, text, text_json, error_reason, and elapsed_ms
@@ -98,43 +137,24 @@ def execute_ocr(image_path: str, frame_id: Optional[int] = None) -> OcrResult:
                 elapsed_ms=0.0,
             )
 
-        # Import here to avoid circular imports and allow lazy loading
-        from myrecall.server.ocr.rapid_backend import RapidOCRBackend
-
-        backend = RapidOCRBackend()
-
-        # Build visualization output path if frame_id is provided
+        # Eager visualization is opt-in; /v1/frames/<id>/ocr-vis renders lazily
         vis_output_path = None
-        if frame_id is not None:
+        if frame_id is not None and getattr(settings, "ocr_vis_eager", False):
             vis_dir = settings.server_data_dir / "ocr_vis"
             vis_output_path = str(vis_dir / f"{frame_id}.jpg")
 
-        # Load image as PIL Image
-        with Image.open(path) as img:
-            # Convert to RGB if needed (handles grayscale, RGBA, etc.)
-            if img.mode != "RGB":
-                img = img.convert("RGB")
+        # Decode (JPEG DCT-scaled to the OCR working size) as a BGR array
+        image, scale_x, scale_y = load_ocr_image(path, _decode_max_side())
 
-            # Call extract_text_with_boxes - may raise exceptions per D2
-            output = backend.extract_text_with_boxes(img, vis_output_path=vis_output_path)
-
-        elapsed_ms = (time.perf_counter() - start_time) * 1000
-
-        # Classify result per design.md D2
-        if not output.text:
-            return OcrResult(
-                status=OcrStatus.EMPTY_TEXT,
-                error_reason="OCR_EMPTY_TEXT",
-                elapsed_ms=elapsed_ms,
+        # Call extract_text_with_boxes - may raise exceptions per D2
+        with _ocr_backend() as backend:
+            output = backend.extract_text_with_boxes(
+                image, vis_output_path=vis_output_path
             )
+        output.boxes = rescale_boxes(output.boxes, scale_x, scale_y)
 
-        # Success - non-empty text with bounding boxes
-        return OcrResult(
-            status=OcrStatus.SUCCESS,
-            text=output.text,
-            text_json=output.to_json_dict() if output.boxes else None,
-            elapsed_ms=elapsed_ms,
-        )
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        return _classify_output(output, elapsed_ms)
 
     except FileNotFoundError as e:
         elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -154,3 +174,73 @@ def execute_ocr(image_path: str, frame_id: Optional[int] = None) -> OcrResult:
             error_reason=f"OCR_FAILED: {error_type}: {error_msg}",
             elapsed_ms=elapsed_ms,
         )
+
+
+def execute_ocr_batch(items: list[tuple[str, Optional[int]]]) -> list[OcrResult]:
+    """Execute OCR on several images with cross-frame recognition batching.
+
+    Like execute_ocr for each (image_path, frame_id), but text lines of all
+    images are recognized together (RapidOCRBackend.extract_batch). A
+    missing or unreadable image fails only its own item; an engine
+    exception fails the whole batch. Each result's elapsed_ms is the batch
+    time split evenly across the images OCR'd.
+    """
+    start_time = time.perf_counter()
+    results: list[Optional[OcrResult]] = [None] * len(items)
+    images = []
+    scales = []
+    positions = []
+    max_side = _decode_max_side()
+    for position, (image_path, _) in enumerate(items):
+        path = Path(image_path)
+        if not path.exists():
+            results[position] = OcrResult(
+                status=OcrStatus.FAILED,
+                error_reason=f"OCR_FAILED: image_not_found path={image_path}",
+            )
+            continue
+        try:
+            image, scale_x, scale_y = load_ocr_image(path, max_side)
+        except Exception as e:
+            results[position] = OcrResult(
+                status=OcrStatus.FAILED,
+                error_reason=f"OCR_FAILED: {type(e).__name__}: {e}",
+            )
+            continue
+        images.append(image)
+        scales.append((scale_x, scale_y))
+        positions.append(position)
+
+    if images:
+        try:
+            with _ocr_backend() as backend:
+                outputs = backend.extract_batch(images)
+        except Exception as e:
+            elapsed_ms = (time.perf_counter() - start_time) * 1000 / len(images)
+            for position in positions:
+                results[position] = OcrResult(
+                    status=OcrStatus.FAILED,
+                    error_reason=f"OCR_FAILED: {type(e).__name__}: {e}",
+                    elapsed_ms=elapsed_ms,
+                )
+            return results
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000 / len(images)
+        for position, output, (scale_x, scale_y) in zip(positions, outputs, scales):
+            output.boxes = rescale_boxes(output.boxes, scale_x, scale_y)
+            results[position] = _classify_output(output, elapsed_ms)
+            image_path, frame_id = items[position]
+            if frame_id is not None and output.boxes and getattr(settings, "ocr_vis_eager", False):
+                _write_eager_visualization(image_path, frame_id, output.to_json_dict())
+
+    return results
+
+
+def _write_eager_visualization(image_path: str, frame_id: int, text_json: dict) -> None:
+    """Render and cache a visualization now (batch mode has no RapidOCR vis)."""
+    from myrecall.server.ocr.visualization import get_ocr_vis_cache, render_ocr_visualization
+
+    try:
+        get_ocr_vis_cache().put(frame_id, render_ocr_visualization(image_path, text_json))
+    except OSError as e:
+        logger.warning("Failed to save OCR visualization frame_id=%d: %s", frame_id, e)
@@ -5,7 +5,7 @@ This worker implements the OCR processing pipeline:
 2. Validate capture_trigger
 3. Execute OCR via RapidOCRBackend
 4. Write results to ocr_text table
-5. Update frame status and text_source
+5. Update frame status and text_source (4-5 in one transaction)
 
 SSOT: design.md D1-D5, tasks.md §2
 """
@@ -16,11 +16,19 @@ import sqlite3
 import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Optional
 
 from myrecall.server.database.frames_store import FramesStore
-from myrecall.server.processing.ocr_processor import OcrStatus, execute_ocr
+from myrecall.server.frame_storage import SnapshotLocation, location_for_frame
+from myrecall.server.processing.ocr_processor import (
+    OcrStatus,
+    execute_ocr,
+    execute_ocr_batch,
+)
+from myrecall.shared.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -52,11 +60,21 @@ class V3ProcessingWorker:
         self,
         db_path: Optional[Path] = None,
         poll_interval: float = _DEFAULT_POLL_INTERVAL_SECONDS,
+        concurrency: Optional[int] = None,
+        batch_frames: Optional[int] = None,
     ) -> None:
         self._store = FramesStore(db_path=db_path)
         self._poll_interval = poll_interval
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        # Frames in flight at once; matches the OCR engine pool by default
+        if concurrency is None:
+            concurrency = int(getattr(settings, "ocr_pool_size", 1) or 1)
+        self._concurrency = max(1, concurrency)
+        # Frames per cross-frame recognition batch (1 = per-frame OCR)
+        if batch_frames is None:
+            batch_frames = int(getattr(settings, "ocr_batch_frames", 1) or 1)
+        self._batch_frames = max(1, batch_frames)
 
     # ------------------------------------------------------------------
     # Public interface (matches NoopQueueDriver pattern)
@@ -122,10 +140,34 @@ class V3ProcessingWorker:
             logger.error("V3ProcessingWorker: _fetch_pending_frames failed: %s", exc)
             return
 
-        for frame in pending_frames:
-            if self._stop_event.is_set():
-                break
-            self._process_frame(frame)
+        if self._batch_frames > 1:
+            size = self._batch_frames
+            units = [pending_frames[i:i + size] for i in range(0, len(pending_frames), size)]
+            handler = self._process_batch
+        else:
+            units = pending_frames
+            handler = self._process_frame
+
+        if self._concurrency == 1:
+            for unit in units:
+                if self._stop_event.is_set():
+                    break
+                handler(unit)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=self._concurrency, thread_name_prefix="v3-ocr"
+        ) as executor:
+            futures = [
+                executor.submit(self._run_unless_stopped, handler, unit)
+                for unit in units
+            ]
+            for future in futures:
+                future.result()
+
+    def _run_unless_stopped(self, handler, unit) -> None:
+        if not self._stop_event.is_set():
+            handler(unit)
 
     def _fetch_pending_frames(self) -> list[tuple]:
         """Fetch pending frames from database.
@@ -189,9 +231,54 @@ class V3ProcessingWorker:
         Args:
             frame: (frame_id, capture_id, capture_trigger, app_name, window_name, snapshot_path)
         """
-        frame_id, capture_id, capture_trigger, app_name, window_name, snapshot_path = frame
         request_id = str(uuid.uuid4())
         start_time = time.perf_counter()
+        if not self._prepare_frame(frame, request_id):
+            return
+
+        # --- Step 5: Execute OCR ---
+        try:
+            with self._snapshot(frame).as_file() as snapshot_path:
+                result = execute_ocr(snapshot_path, frame_id=frame[0])
+        except OSError as exc:
+            self._mark_failed(frame[0], f"OCR_FAILED: snapshot_unreadable {exc}", request_id, frame[1])
+            return
+        self._finish_frame(frame, request_id, result, start_time)
+
+    def _process_batch(self, frames: list[tuple]) -> None:
+        """Process frames together: validate each -> one batched OCR -> write each."""
+        start_time = time.perf_counter()
+        ready = []
+        for frame in frames:
+            request_id = str(uuid.uuid4())
+            if self._prepare_frame(frame, request_id):
+                ready.append((frame, request_id))
+        if not ready:
+            return
+
+        # --- Step 5: Execute OCR (cross-frame recognition batches) ---
+        with ExitStack() as files:
+            readable, items = [], []
+            for frame, request_id in ready:
+                try:
+                    items.append((files.enter_context(self._snapshot(frame).as_file()), frame[0]))
+                except OSError as exc:
+                    self._mark_failed(
+                        frame[0], f"OCR_FAILED: snapshot_unreadable {exc}", request_id, frame[1]
+                    )
+                    continue
+                readable.append((frame, request_id))
+            results = execute_ocr_batch(items) if items else []
+        for (frame, request_id), result in zip(readable, results):
+            self._finish_frame(frame, request_id, result, start_time)
+
+    def _snapshot(self, frame: tuple) -> SnapshotLocation:
+        """Where the frame's snapshot lives (archived frames sit in a day pack)."""
+        return location_for_frame(self._store, frame[0]) or SnapshotLocation(frame[5])
+
+    def _prepare_frame(self, frame: tuple, request_id: str) -> bool:
+        """Claim and validate a frame (steps 1-4); True if it needs OCR."""
+        frame_id, capture_id, capture_trigger, app_name, window_name, snapshot_path = frame
 
         # --- Step 1: pending → processing ---
         ok = self._store.advance_frame_status(frame_id, "pending", "processing")
@@ -201,7 +288,7 @@ class V3ProcessingWorker:
                 "V3ProcessingWorker: frame_id=%d no longer pending, skipping",
                 frame_id,
             )
-            return
+            return False
 
         # --- Step 2: Validate capture_trigger ---
         is_valid, error_reason = self._validate_trigger(capture_trigger)
@@ -213,7 +300,7 @@ class V3ProcessingWorker:
                 request_id=request_id,
                 capture_id=capture_id,
             )
-            return
+            return False
 
         # --- Step 3: Check snapshot_path ---
         if not snapshot_path:
@@ -223,7 +310,7 @@ class V3ProcessingWorker:
                 request_id=request_id,
                 capture_id=capture_id,
             )
-            return
+            return False
 
         # Verify file exists
         snapshot_file = Path(snapshot_path)
@@ -234,7 +321,7 @@ class V3ProcessingWorker:
                 request_id=request_id,
                 capture_id=capture_id,
             )
-            return
+            return False
 
         # --- Step 4: Layer 2 idempotency check ---
         if self._store.check_ocr_text_exists(frame_id):
@@ -244,10 +331,15 @@ class V3ProcessingWorker:
             )
             # Advance to completed since OCR was already done
             self._store.advance_frame_status(frame_id, "processing", "completed")
-            return
+            return False
 
-        # --- Step 5: Execute OCR ---
-        result = execute_ocr(str(snapshot_file), frame_id=frame_id)
+        return True
+
+    def _finish_frame(
+        self, frame: tuple, request_id: str, result, start_time: float
+    ) -> None:
+        """Write an OCR result for a prepared frame (steps 6-7)."""
+        frame_id, capture_id, capture_trigger, app_name, window_name, snapshot_path = frame
         elapsed_ms = (time.perf_counter() - start_time) * 1000
 
         # --- Step 6: Handle OCR result ---
@@ -268,37 +360,20 @@ class V3ProcessingWorker:
             )
             return
 
-        # --- Step 7: Write ocr_text (Layer 3: INSERT OR IGNORE) ---
+        # --- Step 7: Commit ocr_text, frame text columns, FTS, status and
+        # visibility in one transaction (Layer 3: INSERT OR IGNORE) ---
         text_json_str = None
         if result.text_json:
             text_json_str = json.dumps(result.text_json)
 
-        inserted = self._store.insert_ocr_text(
+        ok = self._store.complete_ocr_frame(
             frame_id=frame_id,
             text=result.text,
-            text_length=result.text_length,
             ocr_engine="rapidocr",
             app_name=app_name,
             window_name=window_name,
             text_json=text_json_str,
         )
-        if not inserted:
-            # Row already existed (rare race condition)
-            logger.warning(
-                "V3ProcessingWorker: ocr_text insert skipped for frame_id=%d (row exists)",
-                frame_id,
-            )
-
-        # --- Step 8: Update text_source and advance to completed ---
-        self._store.update_text_source(frame_id, "ocr")
-
-        # --- Step 9: Write ocr_text to frames table ---
-        self._store.update_frames_ocr_text(frame_id, result.text)
-
-        # --- Step 9b: Set full_text for FTS indexing ---
-        self._store.update_full_text(frame_id, result.text)
-
-        ok = self._store.advance_frame_status(frame_id, "processing", "completed")
         if not ok:
             logger.error(
                 "V3ProcessingWorker: processing→completed failed for frame_id=%d",
@@ -306,13 +381,6 @@ class V3ProcessingWorker:
             )
             return
 
-        # Try to mark as queryable if all stages are complete
-        if self._store.try_set_queryable_standalone(frame_id):
-            logger.debug(
-                "V3ProcessingWorker: frame_id=%d marked as queryable",
-                frame_id,
-            )
-
         logger.info(
             "MRV3 ocr_completed frame_id=%d text_length=%d engine=rapidocr elapsed_ms=%.1f",
             frame_id,
@@ -0,0 +1,113 @@
+"""Bulk recovery of failed frames.
+
+After a provider outage tens of thousands of frames can be marked failed.
+Resetting them in one transaction holds the SQLite write lock long enough
+to stall ingest, so ``POST /v1/admin/frames/retry-failed`` starts a
+recovery job instead: failed frames are reset ``[recovery] batch_size`` at
+a time, one short set-based transaction per chunk
+(``FramesStore.reset_failed_frame_chunk``), with progress available from
+``GET /v1/admin/frames/retry-failed/<job_id>``.
+
+Only one recovery job runs at a time; starting another while one is
+running returns the running job.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.jobs import BackgroundJob, JobRegistry
+from myrecall.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept for progress queries
+_MAX_JOBS = 20
+
+
+class RecoveryJob(BackgroundJob):
+    """Progress of one failed-frame recovery."""
+
+    def __init__(self, total: int):
+        super().__init__(total)
+        self.frames_reset = 0
+        self.breakdown = {"ocr": 0, "description": 0, "embedding": 0}
+
+    def _add(self, chunk: dict) -> None:
+        with self._lock:
+            self.frames_reset += chunk["total"]
+            for stage, count in chunk["breakdown"].items():
+                self.breakdown[stage] = self.breakdown.get(stage, 0) + count
+            self.batches += 1
+
+    def _done(self) -> int:
+        return self.frames_reset
+
+    def _fields(self) -> dict:
+        return {"reset_count": self.frames_reset, "breakdown": dict(self.breakdown)}
+
+
+_jobs: JobRegistry[RecoveryJob] = JobRegistry(_MAX_JOBS)
+
+
+def get_recovery_job(job_id: str) -> Optional[RecoveryJob]:
+    return _jobs.get(job_id)
+
+
+def list_recovery_jobs() -> list[RecoveryJob]:
+    return _jobs.list()
+
+
+def run_recovery_job(
+    job: RecoveryJob, store: FramesStore, batch_size: Optional[int] = None
+) -> RecoveryJob:
+    """Reset the failed frames chunk by chunk, oldest first.
+
+    Frames that fail again while the job runs are behind the job's cursor
+    and are left for the next recovery.
+    """
+    batch_size = max(1, int(batch_size or getattr(settings, "recovery_batch_size", 500)))
+    pause = max(0.0, float(getattr(settings, "recovery_batch_pause_ms", 5) or 0)) / 1000
+    start = time.perf_counter()
+    after_id = 0
+    try:
+        while True:
+            frame_ids = store.find_failed_frame_ids(batch_size, after_id)
+            if not frame_ids:
+                break
+            after_id = frame_ids[-1]
+            job._add(store.reset_failed_frame_chunk(frame_ids))
+            if pause:
+                # Let queued ingest writers take the lock between chunks
+                time.sleep(pause)
+        job._finish()
+    except Exception as exc:
+        logger.exception("recovery job %s failed: %s", job.job_id, exc)
+        job._finish(error=f"{type(exc).__name__}: {exc}")
+
+    logger.info(
+        "recovery job %s %s: %d frame(s) reset %s in %d batch(es), %.1fs",
+        job.job_id,
+        job.status,
+        job.frames_reset,
+        job.breakdown,
+        job.batches,
+        time.perf_counter() - start,
+    )
+    return job
+
+
+def start_recovery_job(store: FramesStore) -> RecoveryJob:
+    """Start a recovery job on a background thread, or return the running one."""
+    job, created = _jobs.add_unless_running(lambda: RecoveryJob(store.count_failed_frames()))
+    if not created:
+        return job
+    threading.Thread(
+        target=run_recovery_job,
+        args=(job, store),
+        name=f"frame-recovery-{job.job_id[:8]}",
+        daemon=True,
+    ).start()
+    return job
@@ -0,0 +1,322 @@
+"""Bulk frame deletion and retention pruning.
+
+Deleting many frames one ``DELETE /v1/frames/<id>`` at a time costs seven
+single-row SQLite DELETEs, an activity-rollup recompute and a new LanceDB
+table version per frame. A deletion job instead works in batches of
+``[retention] batch_size`` frames:
+
+1. one SQLite transaction per batch (``FramesStore.delete_frames``),
+2. one LanceDB predicate delete per batch, and a single compaction at the
+   end of the job,
+3. snapshot JPEG and cached OCR visualization removal handed to a
+   background unlinker, so disk I/O never holds up the next batch.
+
+Jobs select frames with a ``FrameFilter``: a time range (``DELETE
+/v1/frames``) or the configured retention rules (the background pruner).
+Progress of recent jobs is kept in memory for ``GET /v1/frames/deletions``.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.jobs import BackgroundJob, JobRegistry
+from myrecall.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept for progress queries
+_MAX_JOBS = 50
+
+
+@dataclass(frozen=True)
+class FrameFilter:
+    """A WHERE fragment over ``frames`` with its parameters."""
+
+    where: str
+    params: tuple = ()
+
+
+def frame_range_filter(
+    start_time: str,
+    end_time: str,
+    app_name: Optional[str] = None,
+    window_name: Optional[str] = None,
+) -> FrameFilter:
+    """Frames with start_time <= local_timestamp < end_time.
+
+    ``app_name`` matches exactly; ``window_name`` matches window titles
+    containing it.
+    """
+    where = "local_timestamp >= ? AND local_timestamp < ?"
+    params: list[Any] = [start_time, end_time]
+    if app_name:
+        where += " AND app_name = ?"
+        params.append(app_name)
+    if window_name:
+        where += " AND instr(window_name, ?) > 0"
+        params.append(window_name)
+    return FrameFilter(where, tuple(params))
+
+
+@dataclass(frozen=True)
+class RetentionRule:
+    """Keep frames matching app_name / window_name for max_age_days.
+
+    ``max_age_days = 0`` keeps matching frames forever. ``window_name``
+    matches window titles containing it.
+    """
+
+    max_age_days: int
+    app_name: Optional[str] = None
+    window_name: Optional[str] = None
+
+    @property
+    def specificity(self) -> int:
+        return 2 * (self.app_name is not None) + (self.window_name is not None)
+
+    def match_sql(self) -> tuple[str, list]:
+        clauses, params = [], []
+        if self.app_name is not None:
+            clauses.append("app_name = ?")
+            params.append(self.app_name)
+        if self.window_name is not None:
+            clauses.append("instr(window_name, ?) > 0")
+            params.append(self.window_name)
+        return (" AND ".join(clauses) or "1"), params
+
+
+def load_retention_rules(config=settings) -> list[RetentionRule]:
+    """Build rules from ``[retention]``, most specific first.
+
+    ``[[retention.rules]]`` entries come first in config order within each
+    specificity; ``max_age_days`` is the catch-all default. Malformed
+    entries are logged and skipped.
+    """
+    rules = []
+    for entry in getattr(config, "retention_rules", ()) or ():
+        try:
+            rules.append(
+                RetentionRule(
+                    max_age_days=int(entry["max_age_days"]),
+                    app_name=entry.get("app_name") or None,
+                    window_name=entry.get("window_name") or None,
+                )
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            logger.warning("Ignoring invalid retention rule: %r", entry)
+    default_days = int(getattr(config, "retention_max_age_days", 0) or 0)
+    if default_days > 0:
+        rules.append(RetentionRule(max_age_days=default_days))
+    return sorted(rules, key=lambda rule: -rule.specificity)
+
+
+def retention_filter(
+    rules: Sequence[RetentionRule], now: Optional[datetime] = None
+) -> Optional[FrameFilter]:
+    """Frames past the age limit of the first (most specific) rule they match.
+
+    ``rules`` must be ordered as returned by ``load_retention_rules``.
+    Returns None when no rule can expire anything.
+    """
+    now = now or datetime.now(timezone.utc)
+    clauses, params = [], []
+    for index, rule in enumerate(rules):
+        if rule.max_age_days <= 0:
+            continue
+        match, match_params = rule.match_sql()
+        clause = f"({match}) AND timestamp < ?"
+        clause_params = [
+            *match_params,
+            (now - timedelta(days=rule.max_age_days)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        ]
+        for earlier in rules[:index]:
+            earlier_match, earlier_params = earlier.match_sql()
+            clause += f" AND NOT ({earlier_match})"
+            clause_params.extend(earlier_params)
+        clauses.append(f"({clause})")
+        params.extend(clause_params)
+    if not clauses:
+        return None
+    return FrameFilter(" OR ".join(clauses), tuple(params))
+
+
+class DeletionJob(BackgroundJob):
+    """Progress of one bulk deletion."""
+
+    def __init__(self, kind: str, frame_filter: FrameFilter, total: int):
+        super().__init__(total)
+        self.kind = kind
+        self.frame_filter = frame_filter
+        self.frames_deleted = 0
+        self.files_removed = 0
+
+    def _add(self, frames: int = 0, files: int = 0, batches: int = 0) -> None:
+        with self._lock:
+            self.frames_deleted += frames
+            self.files_removed += files
+            self.batches += batches
+
+    def _done(self) -> int:
+        return self.frames_deleted
+
+    def _fields(self) -> dict:
+        return {
+            "kind": self.kind,
+            "frames_deleted": self.frames_deleted,
+            "files_removed": self.files_removed,
+        }
+
+
+_jobs: JobRegistry[DeletionJob] = JobRegistry(_MAX_JOBS)
+_unlinker: Optional[ThreadPoolExecutor] = None
+_unlinker_lock = threading.Lock()
+
+
+def get_deletion_job(job_id: str) -> Optional[DeletionJob]:
+    return _jobs.get(job_id)
+
+
+def list_deletion_jobs() -> list[DeletionJob]:
+    return _jobs.list()
+
+
+def _get_unlinker() -> ThreadPoolExecutor:
+    global _unlinker
+    with _unlinker_lock:
+        if _unlinker is None:
+            _unlinker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="frame-unlink")
+        return _unlinker
+
+
+def _embedding_store():
+    """The LanceDB store, or None when it cannot be opened."""
+    try:
+        from myrecall.server.database.embedding_store import EmbeddingStore
+
+        return EmbeddingStore()
+    except Exception as exc:
+        logger.warning("bulk delete: LanceDB unavailable, skipping embeddings: %s", exc)
+        return None
+
+
+def _remove_files(job: DeletionJob, deleted: list[tuple[int, Optional[str]]]) -> None:
+    """Unlink snapshots and cached OCR visualizations of deleted frames."""
+    from myrecall.server.ocr.visualization import get_ocr_vis_cache
+
+    cache = get_ocr_vis_cache()
+    removed = 0
+    for frame_id, snapshot_path in deleted:
+        try:
+            cache.discard(frame_id)
+        except OSError as exc:
+            logger.warning("bulk delete: OCR vis cleanup failed frame_id=%d: %s", frame_id, exc)
+        if not snapshot_path:
+            continue
+        try:
+            Path(snapshot_path).unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning(
+                "bulk delete: disk cleanup failed frame_id=%d path=%s: %s",
+                frame_id,
+                snapshot_path,
+                exc,
+            )
+    job._add(files=removed)
+
+
+def run_deletion_job(
+    job: DeletionJob, store: FramesStore, batch_size: Optional[int] = None
+) -> DeletionJob:
+    """Delete every frame matching ``job.frame_filter``, batch by batch."""
+    batch_size = max(1, int(batch_size or getattr(settings, "retention_batch_size", 500)))
+    embeddings = _embedding_store()
+    unlinks = []
+    start = time.perf_counter()
+    try:
+        while True:
+            frame_ids = store.find_frame_ids_where(
+                job.frame_filter.where, job.frame_filter.params, batch_size
+            )
+            if not frame_ids:
+                break
+            deleted = store.delete_frames(frame_ids)
+            if not deleted:
+                break
+            if embeddings is not None:
+                try:
+                    embeddings.delete_by_frame_ids([frame_id for frame_id, _ in deleted])
+                except Exception as exc:
+                    logger.warning("bulk delete: LanceDB cleanup failed: %s", exc)
+            unlinks.append(_get_unlinker().submit(_remove_files, job, deleted))
+            job._add(frames=len(deleted), batches=1)
+
+        if embeddings is not None and job.frames_deleted:
+            try:
+                embeddings.compact()
+            except Exception as exc:
+                logger.warning("bulk delete: LanceDB compaction failed: %s", exc)
+        wait(unlinks)
+        job._finish()
+    except Exception as exc:
+        logger.exception("bulk delete job %s failed: %s", job.job_id, exc)
+        wait(unlinks)
+        job._finish(error=f"{type(exc).__name__}: {exc}")
+
+    logger.info(
+        "bulk delete job %s (%s) %s: %d frame(s), %d file(s) in %.1fs",
+        job.job_id,
+        job.kind,
+        job.status,
+        job.frames_deleted,
+        job.files_removed,
+        time.perf_counter() - start,
+    )
+    return job
+
+
+def start_deletion_job(
+    store: FramesStore, frame_filter: FrameFilter, kind: str = "range"
+) -> DeletionJob:
+    """Register a job for ``frame_filter`` and run it on a background thread."""
+    total = store.count_frames_where(frame_filter.where, frame_filter.params)
+    job = DeletionJob(kind, frame_filter, total)
+    _jobs.add(job)
+    threading.Thread(
+        target=run_deletion_job,
+        args=(job, store),
+        name=f"frame-delete-{job.job_id[:8]}",
+        daemon=True,
+    ).start()
+    return job
+
+
+def prune_expired_frames(
+    store: FramesStore,
+    rules: Optional[Sequence[RetentionRule]] = None,
+    now: Optional[datetime] = None,
+) -> Optional[DeletionJob]:
+    """Delete frames past their retention rule, in the calling thread.
+
+    Returns the finished job, or None when no rule applies or nothing has
+    expired.
+    """
+    rules = load_retention_rules() if rules is None else rules
+    frame_filter = retention_filter(rules, now)
+    if frame_filter is None:
+        return None
+    total = store.count_frames_where(frame_filter.where, frame_filter.params)
+    if total == 0:
+        return None
+    job = DeletionJob("retention", frame_filter, total)
+    _jobs.add(job)
+    return run_deletion_job(job, store)
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from myrecall.server.search.query_utils import sanitize_fts5_query
+from myrecall.server.search.visibility import text_visible_sql
 from myrecall.shared.config import settings
 
 logger = logging.getLogger(__name__)
@@ -123,7 +124,7 @@ class SearchEngine:
             Tuple of (WHERE clause string, parameters list)
         """
         has_text_query = bool(params.q and params.q.strip())
-        where_parts = ["frames.visibility_status = 'queryable'", "frames.full_text IS NOT NULL"]
+        where_parts = [text_visible_sql(), "frames.full_text IS NOT NULL"]
         params_list: list[Any] = []
 
         if has_text_query:
@@ -7,6 +7,8 @@ from collections import defaultdict
 from pathlib import Path
 from typing import List, Tuple, Dict, Any
 
+from myrecall.server.search.visibility import vector_visible_sql
+
 logger = logging.getLogger(__name__)
 
 
@@ -174,22 +176,23 @@ class HybridSearchEngine:
             conn.row_factory = sqlite3.Row
 
             # Count total frames with embeddings
+            visible = vector_visible_sql(alias="")
             count_row = conn.execute(
-                """
+                f"""
                 SELECT COUNT(*) as total FROM frames
-                WHERE visibility_status = 'queryable'
+                WHERE {visible}
                 """
             ).fetchone()
             total = count_row["total"] if count_row else 0
 
             # Get recent frames with embeddings
             rows = conn.execute(
-                """
+                f"""
                 SELECT frames.id as frame_id, frames.local_timestamp AS timestamp, frames.full_text, frames.text_source,
                        frames.app_name, frames.window_name, frames.browser_url, frames.focused,
                        frames.device_name, frames.snapshot_path, frames.embedding_status
                 FROM frames
-                WHERE visibility_status = 'queryable'
+                WHERE {visible}
                 ORDER BY local_timestamp DESC
                 LIMIT ? OFFSET ?
                 """,
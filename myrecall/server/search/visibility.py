@@ -0,0 +1,48 @@
+"""Which frames search may return, per ``processing.visibility_mode``.
+
+``complete`` (default): a frame is visible once OCR, description and
+embedding have all completed (``visibility_status = 'queryable'``).
+
+``staged``: a frame is full-text searchable as soon as its text exists and
+vector searchable once its embedding exists. Descriptions are attached to
+results whenever they are ready, so slow enrichment no longer hides a
+frame from search.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from myrecall.shared.config import settings
+
+MODE_COMPLETE = "complete"
+MODE_STAGED = "staged"
+
+
+def visibility_mode() -> str:
+    mode = getattr(settings, "processing_visibility_mode", MODE_COMPLETE)
+    return MODE_STAGED if mode == MODE_STAGED else MODE_COMPLETE
+
+
+def _column(alias: str, name: str) -> str:
+    return f"{alias}.{name}" if alias else name
+
+
+def text_visible_sql(alias: str = "frames") -> str:
+    """SQL predicate for frames that full-text search may return."""
+    if visibility_mode() == MODE_STAGED:
+        return f"{_column(alias, 'status')} = 'completed'"
+    return f"{_column(alias, 'visibility_status')} = 'queryable'"
+
+
+def vector_visible_sql(alias: str = "frames") -> str:
+    """SQL predicate for frames that vector search may return."""
+    if visibility_mode() == MODE_STAGED:
+        return f"{_column(alias, 'embedding_status')} = 'completed'"
+    return f"{_column(alias, 'visibility_status')} = 'queryable'"
+
+
+def is_text_visible(status: Optional[str], visibility_status: Optional[str]) -> bool:
+    """Python twin of :func:`text_visible_sql` for a single frame row."""
+    if visibility_mode() == MODE_STAGED:
+        return status == "completed"
+    return visibility_status == "queryable"
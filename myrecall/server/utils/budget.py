@@ -0,0 +1,95 @@
+"""Fit JSON payloads into a character budget.
+
+``POST /v1/batch`` lets a chat agent cap how much of its context window a
+response may take. Long strings are middle-truncated first, all down to
+the same length, so short metadata (ids, timestamps, app names) survives
+untouched while OCR text and narratives shrink. If that is not enough,
+trailing items of the largest lists are dropped.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Strings are never cut below this many characters
+MIN_STRING_CHARS = 64
+
+
+def json_chars(value: Any) -> int:
+    """Length of ``value`` as compact JSON."""
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+
+
+def middle_truncate(text: str, max_chars: int) -> str:
+    """Keep the head and tail of ``text``, marking how much was removed."""
+    if len(text) <= max_chars:
+        return text
+    half = max_chars // 2
+    removed = len(text) - max_chars
+    return text[:half] + f"...{removed} chars..." + text[len(text) - (max_chars - half):]
+
+
+def _cap_strings(value: Any, cap: int) -> Any:
+    if isinstance(value, str):
+        return middle_truncate(value, cap)
+    if isinstance(value, dict):
+        return {key: _cap_strings(item, cap) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_cap_strings(item, cap) for item in value]
+    return value
+
+
+def _longest_string(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return max((_longest_string(item) for item in value.values()), default=0)
+    if isinstance(value, list):
+        return max((_longest_string(item) for item in value), default=0)
+    return 0
+
+
+def _largest_list(value: Any) -> list | None:
+    """The non-empty list with the most JSON characters, searched recursively."""
+    best, best_chars = None, 0
+    children = value.values() if isinstance(value, dict) else value if isinstance(value, list) else ()
+    if isinstance(value, list) and value:
+        best, best_chars = value, json_chars(value)
+    for child in children:
+        candidate = _largest_list(child)
+        if candidate is not None:
+            chars = json_chars(candidate)
+            if chars > best_chars:
+                best, best_chars = candidate, chars
+    return best
+
+
+def fit_to_budget(value: Any, max_chars: int) -> tuple[Any, bool]:
+    """Return (value trimmed to at most ``max_chars`` JSON characters, truncated?).
+
+    The input is not modified. A payload whose structure alone exceeds the
+    budget is trimmed down to empty lists and may still be over it.
+    """
+    if json_chars(value) <= max_chars:
+        return value, False
+
+    # Largest uniform string cap that fits (binary search)
+    low, high = MIN_STRING_CHARS, _longest_string(value)
+    best = None
+    while low <= high:
+        cap = (low + high) // 2
+        capped = _cap_strings(value, cap)
+        if json_chars(capped) <= max_chars:
+            best, low = capped, cap + 1
+        else:
+            high = cap - 1
+    if best is not None:
+        return best, True
+
+    trimmed = _cap_strings(value, MIN_STRING_CHARS)
+    while json_chars(trimmed) > max_chars:
+        largest = _largest_list(trimmed)
+        if largest is None:
+            break
+        largest.pop()
+    return trimmed, True
@@ -0,0 +1,34 @@
+"""``fields=`` / ``include=`` query parameters for list endpoints.
+
+``include`` opts in to large optional fields an endpoint leaves out by
+default (full OCR/accessibility text, search text). ``fields`` keeps only
+the named keys of each item; naming an optional field there includes it
+too. Unknown names are ignored.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Optional
+
+
+def parse_field_list(raw: Optional[str]) -> Optional[frozenset[str]]:
+    """Parse a comma-separated parameter; None when absent or empty."""
+    if raw is None:
+        return None
+    names = frozenset(name.strip() for name in raw.split(",") if name.strip())
+    return names or None
+
+
+def parse_projection(
+    args: Mapping[str, str], optional: Iterable[str]
+) -> tuple[Optional[frozenset[str]], frozenset[str]]:
+    """Return (fields, included optional fields) from request args."""
+    fields = parse_field_list(args.get("fields"))
+    asked = (parse_field_list(args.get("include")) or frozenset()) | (fields or frozenset())
+    return fields, asked & frozenset(optional)
+
+
+def project(items: list[dict], fields: Optional[frozenset[str]]) -> list[dict]:
+    """Keep only ``fields`` of each item (all keys when fields is None)."""
+    if fields is None:
+        return items
+    return [{key: value for key, value in item.items() if key in fields} for item in items]
@@ -0,0 +1,113 @@
+"""Payload compression shared by the spool uploader and the ingest endpoint.
+
+gzip is always available. zstd is used when the optional ``zstandard``
+package is installed; callers should ask ``supported_encodings()`` rather
+than assuming it.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+try:  # Optional dependency: faster and smaller than gzip for JSON payloads
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - depends on environment
+    _zstd = None
+
+IDENTITY = "identity"
+GZIP = "gzip"
+ZSTD = "zstd"
+
+
+class DecompressionError(ValueError):
+    """Raised when a payload cannot be decoded or exceeds the size limit."""
+
+
+def supported_encodings() -> list[str]:
+    """Encodings this process can decode, preferred first."""
+    encodings = [GZIP]
+    if _zstd is not None:
+        encodings.insert(0, ZSTD)
+    return encodings
+
+
+def choose_encoding(preference: str, accepted: list[str]) -> Optional[str]:
+    """Pick an encoding both sides support.
+
+    Args:
+        preference: "auto", "zstd", "gzip" or "none".
+        accepted: Encodings advertised by the peer.
+
+    Returns:
+        The encoding to use, or None to send uncompressed.
+    """
+    preference = (preference or "auto").lower()
+    if preference == "none":
+        return None
+    local = supported_encodings()
+    candidates = local if preference == "auto" else [preference]
+    for encoding in candidates:
+        if encoding in local and encoding in accepted:
+            return encoding
+    return None
+
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def detect_encoding(data: bytes) -> str:
+    """Identify a stored payload's encoding from its magic bytes."""
+    if data.startswith(_ZSTD_MAGIC):
+        return ZSTD
+    if data.startswith(_GZIP_MAGIC):
+        return GZIP
+    return IDENTITY
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == GZIP:
+        # Level 6 is gzip's default; mtime=0 keeps output deterministic
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if encoding == ZSTD:
+        if _zstd is None:
+            raise ValueError("zstd requested but zstandard is not installed")
+        return _zstd.ZstdCompressor(level=3).compress(data)
+    if encoding == IDENTITY:
+        return data
+    raise ValueError(f"Unsupported encoding: {encoding!r}")
+
+
+def decompress(data: bytes, encoding: str, max_size: int) -> bytes:
+    """Decode ``data``, refusing to inflate beyond ``max_size`` bytes.
+
+    The size cap protects the ingest endpoint against decompression bombs.
+    """
+    encoding = (encoding or IDENTITY).strip().lower()
+    if encoding == IDENTITY:
+        if len(data) > max_size:
+            raise DecompressionError("payload exceeds maximum size")
+        return data
+    try:
+        if encoding == GZIP:
+            with gzip.GzipFile(fileobj=io.BytesIO(data)) as fh:
+                out = fh.read(max_size + 1)
+        elif encoding == ZSTD and _zstd is not None:
+            reader = _zstd.ZstdDecompressor().stream_reader(io.BytesIO(data))
+            out = reader.read(max_size + 1)
+        else:
+            raise DecompressionError(f"Unsupported encoding: {encoding!r}")
+    except (OSError, EOFError) as exc:
+        raise DecompressionError(f"Corrupt {encoding} payload: {exc}") from exc
+    except Exception as exc:
+        if _zstd is not None and isinstance(exc, _zstd.ZstdError):
+            raise DecompressionError(f"Corrupt {encoding} payload: {exc}") from exc
+        raise
+    if len(out) > max_size:
+        raise DecompressionError("decompressed payload exceeds maximum size")
+    return out
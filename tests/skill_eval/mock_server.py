@@ -169,6 +169,36 @@ def get_frame_context(frame_id):
     })
 
 
+@app.route("/v1/batch", methods=["POST"])
+def batch():
+    body = request.get_json(silent=True) or {}
+    log_request("POST", "/v1/batch", request.args, body)
+    client = app.test_client()
+    results = {}
+    for index, call in enumerate(body.get("requests", [])):
+        call_id = str(call.get("id") or index)
+        path = call.get("path", "")
+        if call.get("frames_from"):
+            source = results.get(call["frames_from"], {}).get("body") or {}
+            items = source.get("data") or source.get("descriptions") or []
+            frame_ids = [item["frame_id"] for item in items][: call.get("top", 3)]
+            results[call_id] = {"status": 200, "items": []}
+            for frame_id in frame_ids:
+                resp = client.get(path.replace("{frame_id}", str(frame_id)),
+                                  query_string=call.get("params") or {})
+                results[call_id]["items"].append(
+                    {"frame_id": frame_id, "status": resp.status_code, "body": resp.get_json()}
+                )
+            continue
+        resp = client.get(path, query_string=call.get("params") or {})
+        results[call_id] = {"status": resp.status_code, "body": resp.get_json(silent=True)}
+    return jsonify({
+        "results": results,
+        "max_chars": body.get("max_chars", 16000),
+        "truncated": False,
+    })
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--port", type=int, default=8083)
@@ -0,0 +1,95 @@
+"""Tests for bulk element inserts and compacted accessibility trees."""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore, _derive_element_rows
+from myrecall.server.database.migrations_runner import run_migrations
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> FramesStore:
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+def _complete(store: FramesStore, capture_id: str, nodes: list[dict], timestamp: str):
+    frame_id, _ = store.claim_frame(
+        capture_id=capture_id,
+        metadata={"timestamp": timestamp, "app_name": "Safari"},
+    )
+    assert store.complete_accessibility_frame(
+        frame_id=frame_id,
+        text="text",
+        browser_url=None,
+        content_hash=None,
+        simhash=None,
+        accessibility_tree_json=json.dumps(nodes),
+        accessibility_text_content="text",
+        accessibility_node_count=len(nodes),
+        accessibility_truncated=False,
+        elements=nodes,
+    )
+    return frame_id
+
+
+_NODES = [
+    {"role": "AXGroup", "text": "", "depth": 0},
+    {"role": "AXStaticText", "text": "a", "depth": 1},
+    {"role": "AXStaticText", "text": "b", "depth": 2},
+    {"role": "AXStaticText", "text": "c", "depth": 1, "bounds": "bad"},
+]
+
+
+@pytest.mark.unit
+def test_derive_element_rows_links_parents_from_first_id():
+    rows = _derive_element_rows(7, _NODES, first_id=100)
+    assert [r[0] for r in rows] == [100, 101, 102, 103]
+    assert [r[4] for r in rows] == [None, 100, 101, 100]
+    assert rows[3][6:10] == (None, None, None, None)
+
+
+@pytest.mark.unit
+def test_element_ids_never_reused_after_recompletion(store: FramesStore):
+    first = _complete(store, "c-1", _NODES, "2026-03-20T10:00:00Z")
+    before = {e["id"] for e in store.list_elements_for_frame(first)}
+
+    # Re-completing deletes and re-inserts; AUTOINCREMENT must not reuse ids
+    _complete(store, "c-1", _NODES, "2026-03-20T10:00:00Z")
+    second = _complete(store, "c-2", _NODES, "2026-03-20T10:00:01Z")
+
+    again = store.list_elements_for_frame(first)
+    other = store.list_elements_for_frame(second)
+    assert not before & {e["id"] for e in again}
+    assert min(e["id"] for e in other) > max(e["id"] for e in again)
+    assert other[1]["parent_id"] == other[0]["id"]
+
+
+@pytest.mark.unit
+def test_compact_accessibility_trees_round_trip(store: FramesStore):
+    old = _complete(store, "c-old", _NODES, "2020-01-01T00:00:00Z")
+    recent = _complete(store, "c-new", _NODES, "2999-01-01T00:00:00Z")
+
+    assert store.compact_accessibility_trees(older_than_days=30) == 1
+    assert store.compact_accessibility_trees(older_than_days=30) == 0
+
+    with sqlite3.connect(str(store.db_path)) as conn:
+        kinds = dict(
+            conn.execute(
+                "SELECT id, typeof(accessibility_tree_json) FROM frames"
+            ).fetchall()
+        )
+    assert kinds == {old: "blob", recent: "text"}
+    assert json.loads(store.get_accessibility_tree_json(old)) == _NODES
+    assert json.loads(store.get_accessibility_tree_json(recent)) == _NODES
+    # Element rows stay queryable after compaction
+    assert len(store.list_elements_for_frame(old)) == len(_NODES)
@@ -0,0 +1,135 @@
+"""Accessibility ingest benchmark on a synthetic 5k-node tree.
+
+Compares the bulk element insert (pre-assigned ids + executemany) used by
+``FramesStore.complete_accessibility_frame`` with the previous
+one-INSERT-per-node loop, which needed ``cursor.lastrowid`` for parent
+linkage.
+
+Run with: pytest -m perf tests/test_accessibility_ingest_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import json
+import logging
+import random
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_NODE_COUNT = 5000
+_ROUNDS = 5
+
+
+def _synthetic_tree(node_count: int, seed: int = 0) -> list[dict]:
+    """Depth-first node list shaped like a dense browser page."""
+    rng = random.Random(seed)
+    nodes = []
+    depth = 0
+    for i in range(node_count):
+        nodes.append(
+            {
+                "role": rng.choice(["AXGroup", "AXStaticText", "AXLink", "AXButton"]),
+                "text": f"node {i} " + "lorem ipsum " * rng.randint(0, 4),
+                "depth": depth,
+                "bounds": {"left": 0.1, "top": i / node_count, "width": 0.5, "height": 0.01},
+            }
+        )
+        depth = max(0, min(depth + rng.choice([-2, -1, 0, 1, 1]), 30))
+    return nodes
+
+
+def _per_node_insert(conn: sqlite3.Connection, frame_id: int, elements: list[dict]) -> None:
+    """The previous implementation, kept here as the baseline."""
+    depth_stack: list[tuple[int, int]] = []
+    for sort_order, elem in enumerate(elements):
+        depth = elem.get("depth", 0)
+        while depth_stack and depth_stack[-1][0] >= depth:
+            depth_stack.pop()
+        parent_id = depth_stack[-1][1] if depth_stack else None
+        bounds = elem.get("bounds") or {}
+        cursor = conn.execute(
+            """
+            INSERT INTO elements (
+                frame_id, source, role, text, parent_id, depth,
+                left_bound, top_bound, width_bound, height_bound, sort_order
+            ) VALUES (?, 'accessibility', ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                frame_id,
+                elem.get("role"),
+                elem.get("text"),
+                parent_id,
+                depth,
+                bounds.get("left"),
+                bounds.get("top"),
+                bounds.get("width"),
+                bounds.get("height"),
+                sort_order,
+            ),
+        )
+        depth_stack.append((depth, cursor.lastrowid))
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> FramesStore:
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+def test_accessibility_ingest_5k_nodes(store: FramesStore, monkeypatch):
+    nodes = _synthetic_tree(_NODE_COUNT)
+    tree_json = json.dumps(nodes)
+
+    def run(label: str) -> list[float]:
+        timings = []
+        for i in range(_ROUNDS):
+            frame_id, _ = store.claim_frame(
+                capture_id=f"{label}-{i}",
+                metadata={"timestamp": "2026-03-20T10:00:00Z", "app_name": "Safari"},
+            )
+            started = time.perf_counter()
+            assert store.complete_accessibility_frame(
+                frame_id=frame_id,
+                text="text",
+                browser_url=None,
+                content_hash=None,
+                simhash=None,
+                accessibility_tree_json=tree_json,
+                accessibility_text_content="text",
+                accessibility_node_count=len(nodes),
+                accessibility_truncated=False,
+                elements=nodes,
+            )
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
+
+    bulk = run("bulk")
+    monkeypatch.setattr(
+        FramesStore,
+        "_insert_elements_with_parent_derivation",
+        lambda self, conn, frame_id, elements: _per_node_insert(conn, frame_id, elements),
+    )
+    per_node = run("per-node")
+
+    logger.info(
+        "5k-node ingest: bulk median=%.1fms per-node median=%.1fms (x%.1f)",
+        statistics.median(bulk),
+        statistics.median(per_node),
+        statistics.median(per_node) / statistics.median(bulk),
+    )
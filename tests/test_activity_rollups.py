@@ -0,0 +1,176 @@
+"""Tests for trigger-maintained activity rollups behind /v1/activity-summary."""
+import random
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+_MIGRATIONS = Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations"
+_BASE = datetime(2026, 3, 20, 9, 0, 0)
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+def _ts(seconds: float) -> str:
+    return (_BASE + timedelta(seconds=seconds)).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
+
+
+def _insert(conn, seconds: float, app_name, visibility: str = "queryable") -> int:
+    cursor = conn.execute(
+        "INSERT INTO frames (capture_id, timestamp, local_timestamp, app_name, visibility_status) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (uuid.uuid4().hex, _ts(seconds), _ts(seconds), app_name, visibility),
+    )
+    return cursor.lastrowid
+
+
+def _rollup_rows(conn) -> list[tuple]:
+    return [
+        tuple(row)
+        for row in conn.execute(
+            "SELECT bucket_start, app_name, frame_count, ROUND(active_seconds, 3), first_seen, last_seen "
+            "FROM activity_rollups ORDER BY bucket_start, app_name"
+        )
+    ]
+
+
+def _random_frames(store: FramesStore, seed: int, count: int = 400) -> list[int]:
+    rng = random.Random(seed)
+    frame_ids = []
+    seconds = 0.0
+    with store._connect() as conn:
+        for _ in range(count):
+            # Mostly short gaps, some idle stretches, some identical timestamps
+            seconds += rng.choice([0, 2, 5, 30, 90, 240, 299.5, 301, 900]) + rng.random()
+            app = rng.choice(["Editor", "Browser", "Terminal", None, ""])
+            visibility = rng.choice(["queryable", "queryable", "queryable", "pending"])
+            frame_ids.append(_insert(conn, seconds, app, visibility))
+    return frame_ids
+
+
+@pytest.mark.unit
+def test_rollup_summary_matches_raw_query_on_random_ranges(store):
+    _random_frames(store, seed=3)
+    rng = random.Random(11)
+    span = 400 * 200
+    for _ in range(40):
+        lo, hi = sorted(rng.uniform(-60, span) for _ in range(2))
+        start = _ts(lo)[: rng.choice([16, 19, 23])]
+        end = _ts(hi)[: rng.choice([19, 23])]
+        for app_name in (None, "Editor"):
+            result = store.check_activity_rollups(start, end, app_name)
+            assert result["consistent"], (start, end, app_name, result["mismatches"])
+            with store._connect() as conn:
+                raw_range = store._activity_summary_time_range_raw(conn, start, end, app_name)
+            assert store.get_activity_summary_time_range(start, end, app_name) == raw_range
+
+
+@pytest.mark.unit
+def test_triggers_keep_rollups_equal_to_rebuild(store):
+    frame_ids = _random_frames(store, seed=5, count=200)
+    rng = random.Random(9)
+    with store._connect() as conn:
+        for _ in range(150):
+            frame_id = rng.choice(frame_ids)
+            action = rng.choice(["visibility", "app", "delete"])
+            if action == "visibility":
+                conn.execute(
+                    "UPDATE frames SET visibility_status = ? WHERE id = ?",
+                    (rng.choice(["queryable", "pending", "failed"]), frame_id),
+                )
+            elif action == "app":
+                conn.execute(
+                    "UPDATE frames SET app_name = ? WHERE id = ?",
+                    (rng.choice(["Editor", "Browser", None]), frame_id),
+                )
+            else:
+                conn.execute("DELETE FROM frames WHERE id = ?", (frame_id,))
+        maintained = _rollup_rows(conn)
+
+    store.rebuild_activity_rollups()
+
+    with store._connect() as conn:
+        assert _rollup_rows(conn) == maintained
+        assert conn.execute("SELECT COUNT(*) FROM activity_rollups_dirty").fetchone()[0] == 0
+
+
+@pytest.mark.unit
+def test_frame_becoming_queryable_updates_previous_bucket(store):
+    with store._connect() as conn:
+        _insert(conn, 290, "Editor")
+        later = _insert(conn, 310, "Editor", visibility="pending")
+        conn.execute(
+            "UPDATE frames SET status = 'completed', description_status = 'completed', "
+            "embedding_status = 'completed' WHERE id = ?",
+            (later,),
+        )
+        assert store.try_set_queryable(conn, later)
+        rows = _rollup_rows(conn)
+
+    assert rows == [
+        ("2026-03-20T09:00:00", "Editor", 1, 20.0, _ts(290), _ts(290)),
+        ("2026-03-20T09:05:00", "Editor", 1, 0.0, _ts(310), _ts(310)),
+    ]
+
+
+@pytest.mark.unit
+def test_migration_seeds_rollups_from_existing_frames(tmp_path):
+    db_path = tmp_path / "edge.db"
+    seed_dir = tmp_path / "migrations"
+    seed_dir.mkdir()
+    for sql in _MIGRATIONS.glob("*.sql"):
+        if sql.name < "20260504000000":
+            (seed_dir / sql.name).write_text(sql.read_text())
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, seed_dir)
+    for seconds in (0, 60, 120):
+        _insert(conn, seconds, "Editor")
+    conn.commit()
+    run_migrations(conn, _MIGRATIONS)
+    conn.close()
+
+    store = FramesStore(db_path=db_path)
+    apps = store.get_activity_summary_apps("2026-03-20T08:00:00", "2026-03-20T10:00:00")
+
+    assert apps == [{
+        "name": "Editor",
+        "frame_count": 3,
+        "minutes": 2.0,
+        "first_seen": _ts(0),
+        "last_seen": _ts(120),
+    }]
+
+
+@pytest.mark.unit
+def test_check_endpoint_reports_drift_and_rebuild_repairs_it(store, monkeypatch):
+    from flask import Flask
+
+    from myrecall.server import api_v1
+
+    with store._connect() as conn:
+        for seconds in range(0, 1800, 30):
+            _insert(conn, seconds, "Editor")
+        conn.execute("UPDATE activity_rollups SET frame_count = frame_count + 1")
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    client = app.test_client()
+    query = "/v1/admin/activity-rollups/check?start_time=2026-03-20T09:00&end_time=2026-03-20T10:00"
+
+    assert client.get(query).get_json()["consistent"] is False
+    rebuilt = client.post("/v1/admin/activity-rollups/rebuild")
+    assert rebuilt.status_code == 200
+    assert rebuilt.get_json()["bucket_count"] == 6
+    assert client.get(query).get_json()["consistent"] is True
@@ -16,7 +16,7 @@ class _FakeStore:
         self._memories = memories_result or []
         self.captured_since = None
 
-    def get_memories_since(self, since: str):
+    def get_memories_since(self, since: str, include=()):
         self.captured_since = since
         return list(self._memories)
 
@@ -0,0 +1,62 @@
+"""Tests for the shared background job registry."""
+import pytest
+
+from myrecall.server.jobs import BackgroundJob, JobRegistry
+
+
+class _Job(BackgroundJob):
+    def __init__(self, total: int):
+        super().__init__(total)
+        self.done = 0
+
+    def _done(self) -> int:
+        return self.done
+
+    def _fields(self) -> dict:
+        return {"done": self.done}
+
+
+@pytest.mark.unit
+def test_job_to_dict_reports_progress_and_fields():
+    job = _Job(total=4)
+    job.done = 3
+    data = job.to_dict()
+    assert (data["status"], data["done"], data["progress"], data["finished_at"]) == (
+        "running", 3, 0.75, None
+    )
+
+    job._finish(error="boom")
+    data = job.to_dict()
+    assert data["status"] == "failed" and data["error"] == "boom"
+    assert data["finished_at"].endswith("Z")
+    assert _Job(total=0).to_dict()["progress"] == 1.0
+
+
+@pytest.mark.unit
+def test_registry_keeps_newest_jobs_and_never_drops_running_ones():
+    registry = JobRegistry(max_jobs=2)
+    running = registry.add(_Job(1))
+    finished = [registry.add(_Job(1)) for _ in range(2)]
+    for job in finished:
+        job._finish()
+    # The oldest job is still running, so nothing can be dropped yet
+    assert registry.list() == [*reversed(finished), running]
+
+    running._finish()
+    registry.add(_Job(1))
+    assert registry.get(running.job_id) is None
+    assert len(registry.list()) == 2
+
+
+@pytest.mark.unit
+def test_add_unless_running_returns_the_running_job():
+    registry = JobRegistry(max_jobs=5)
+    first, created = registry.add_unless_running(lambda: _Job(1))
+    assert created
+
+    again, created = registry.add_unless_running(lambda: _Job(1))
+    assert again is first and not created
+
+    first._finish()
+    second, created = registry.add_unless_running(lambda: _Job(1))
+    assert created and second is not first
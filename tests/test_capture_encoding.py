@@ -0,0 +1,79 @@
+"""Unit tests for the spool capture encoding policy."""
+
+import json
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from myrecall.client import capture_encoding
+from myrecall.client.capture_encoding import (
+    CaptureEncoder,
+    EncodingPolicy,
+    fit_long_side,
+)
+from myrecall.client.spool import SpoolQueue
+
+
+@pytest.mark.unit
+def test_fit_long_side_preserves_aspect_ratio():
+    image = Image.new("RGB", (5120, 2880))
+    scaled = fit_long_side(image, 2560)
+    assert scaled.size == (2560, 1440)
+    assert fit_long_side(image, 0) is image
+    assert fit_long_side(image, 6000) is image
+
+
+@pytest.mark.unit
+def test_fixed_policy_ignores_backlog():
+    encoder = CaptureEncoder(EncodingPolicy(quality=70))
+    assert encoder.select_quality(backlog=10_000) == 70
+
+
+@pytest.mark.unit
+def test_configured_quality_is_clamped_without_adaptive_mode(monkeypatch):
+    assert EncodingPolicy(quality=0).quality == 1
+    monkeypatch.setattr(capture_encoding.settings, "capture_jpeg_quality", 150, raising=False)
+    monkeypatch.setattr(capture_encoding.settings, "capture_adaptive_quality", False, raising=False)
+    encoder = CaptureEncoder(EncodingPolicy.from_settings())
+    assert encoder.select_quality(backlog=0) == 95
+    assert EncodingPolicy(quality_ladder=(200, 50, 50)).quality_ladder == (95, 50)
+
+
+@pytest.mark.unit
+def test_adaptive_quality_steps_down_and_recovers_with_hysteresis():
+    encoder = CaptureEncoder(
+        EncodingPolicy(adaptive=True, quality_ladder=(85, 75, 65), backlog_high=100)
+    )
+    assert encoder.select_quality(backlog=0) == 85
+    assert encoder.select_quality(backlog=150) == 75
+    assert encoder.select_quality(backlog=150) == 65
+    assert encoder.select_quality(backlog=150) == 65
+    # Between the thresholds: hold the current rung
+    assert encoder.select_quality(backlog=50) == 65
+    assert encoder.select_quality(backlog=10) == 75
+    assert encoder.select_quality(backlog=10) == 85
+
+
+@pytest.mark.unit
+def test_adaptive_quality_reacts_to_upload_latency():
+    encoder = CaptureEncoder(
+        EncodingPolicy(adaptive=True, quality_ladder=(85, 60), latency_high_ms=1000)
+    )
+    for _ in range(20):
+        encoder.observe_upload_latency(3000)
+    assert encoder.select_quality(backlog=0) == 60
+
+
+@pytest.mark.unit
+def test_spool_enqueue_applies_policy_and_records_source_size(tmp_path: Path):
+    encoder = CaptureEncoder(EncodingPolicy(max_long_side=64, quality=60))
+    queue = SpoolQueue(storage_dir=tmp_path, encoder=encoder)
+
+    capture_id = queue.enqueue(Image.new("RGB", (256, 128), "white"), {"app": "A"})
+
+    with Image.open(tmp_path / f"{capture_id}.jpg") as stored:
+        assert stored.size == (64, 32)
+    meta = json.loads((tmp_path / f"{capture_id}.json").read_text())
+    assert meta["jpeg_quality"] == 60
+    assert (meta["source_width"], meta["source_height"]) == (256, 128)
@@ -0,0 +1,114 @@
+"""Capture encoding benchmark: JPEG size vs OCR recall.
+
+Renders synthetic 5K "screenshots" full of known words, encodes them at
+each (max_long_side, quality) combination and reports bytes per frame and,
+when RapidOCR is installed, the fraction of words OCR still recovers.
+Use the table to pick ``[capture]`` defaults that don't hurt search recall.
+
+Run with: pytest -m perf tests/test_capture_encoding_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import io
+import logging
+import random
+import re
+import time
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from myrecall.client.capture_encoding import CaptureEncoder, EncodingPolicy
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_SCREEN_SIZE = (5120, 2880)
+_LONG_SIDES = (0, 3840, 2560, 1920)
+_QUALITIES = (85, 75, 65, 50)
+_FONT_SIZES = (18, 24, 32)
+_VOCABULARY = (
+    "recall search timeline capture upload spool server client frame "
+    "accessibility screenshot keyboard terminal browser meeting invoice "
+    "quarterly roadmap deploy pipeline database migration latency budget"
+).split()
+
+
+def _render_screen(font_size: int, seed: int) -> tuple[Image.Image, set[str]]:
+    rng = random.Random(seed)
+    image = Image.new("RGB", _SCREEN_SIZE, "white")
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=font_size)
+    words: set[str] = set()
+    y = 40
+    while y < _SCREEN_SIZE[1] - font_size * 2:
+        line = [rng.choice(_VOCABULARY) for _ in range(rng.randint(4, 10))]
+        words.update(line)
+        draw.text((60, y), " ".join(line), fill="black", font=font)
+        y += int(font_size * 1.8)
+    return image, words
+
+
+def _encode(image: Image.Image, long_side: int, quality: int) -> bytes:
+    buf = io.BytesIO()
+    CaptureEncoder(EncodingPolicy(max_long_side=long_side, quality=quality)).encode(
+        image, buf
+    )
+    return buf.getvalue()
+
+
+def _word_recall(text: str, expected: set[str]) -> float:
+    found = set(re.findall(r"[a-z]+", text.lower()))
+    return len(found & expected) / len(expected)
+
+
+def test_capture_encoding_size_benchmark():
+    screens = [_render_screen(size, seed) for seed, size in enumerate(_FONT_SIZES)]
+    baseline = sum(len(_encode(img, 0, 85)) for img, _ in screens)
+
+    rows = []
+    for long_side in _LONG_SIDES:
+        for quality in _QUALITIES:
+            started = time.perf_counter()
+            total = sum(len(_encode(img, long_side, quality)) for img, _ in screens)
+            encode_ms = (time.perf_counter() - started) * 1000 / len(screens)
+            rows.append((long_side, quality, total / len(screens), encode_ms))
+
+    logger.info("long_side quality  avg_kb  vs_native  encode_ms")
+    for long_side, quality, avg_bytes, encode_ms in rows:
+        logger.info(
+            "%9s %7d %7.0f %9.0f%% %10.1f",
+            long_side or "native",
+            quality,
+            avg_bytes / 1024,
+            100 * avg_bytes * len(screens) / baseline,
+            encode_ms,
+        )
+
+    # Smaller long sides and lower qualities must actually shrink output
+    native_85 = rows[0][2]
+    assert rows[-1][2] < native_85
+
+
+@pytest.mark.model
+def test_capture_encoding_ocr_recall_benchmark():
+    pytest.importorskip("rapidocr")
+    from myrecall.server.ocr.rapid_backend import RapidOCRBackend
+
+    backend = RapidOCRBackend()
+    screens = [_render_screen(size, seed) for seed, size in enumerate(_FONT_SIZES)]
+
+    logger.info("long_side quality font recall")
+    for long_side in _LONG_SIDES:
+        for quality in _QUALITIES:
+            for font_size, (image, words) in zip(_FONT_SIZES, screens):
+                encoded = Image.open(io.BytesIO(_encode(image, long_side, quality)))
+                recall = _word_recall(backend.extract_text(encoded), words)
+                logger.info(
+                    "%9s %7d %4d %6.2f",
+                    long_side or "native",
+                    quality,
+                    font_size,
+                    recall,
+                )
@@ -0,0 +1,206 @@
+"""Tests for batched description generation (claim N, one generate, one commit)."""
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+from myrecall.server.description.models import FrameContext, FrameDescription
+from myrecall.server.description.providers.base import (
+    DescriptionProvider,
+    DescriptionProviderRequestError,
+)
+from myrecall.server.description.service import DescriptionService
+from myrecall.server.description.worker import DescriptionWorker
+
+
+class _BatchProvider(DescriptionProvider):
+    def __init__(self, fail_paths=(), cap=4):
+        self.fail_paths = set(fail_paths)
+        self.cap = cap
+        self.batches = []
+
+    def max_batch_size(self) -> int:
+        return self.cap
+
+    def generate(self, image_path, context):
+        raise AssertionError("batched mode must not call generate()")
+
+    def generate_batch(self, items):
+        self.batches.append([path for path, _ in items])
+        return [
+            DescriptionProviderRequestError("boom")
+            if path in self.fail_paths
+            else FrameDescription(narrative=f"n {path}", summary="s", tags=["t"])
+            for path, _ in items
+        ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+def _enqueue_frames(store: FramesStore, count: int) -> list[int]:
+    frame_ids = [
+        store.claim_frame(
+            capture_id=f"cap-{i}",
+            metadata={"timestamp": f"2026-03-20T10:00:0{i}Z", "app_name": "App"},
+        )[0]
+        for i in range(count)
+    ]
+    with store._connect() as conn:
+        for i, frame_id in enumerate(frame_ids):
+            conn.execute(
+                "UPDATE frames SET snapshot_path = ? WHERE id = ?",
+                (f"/snap/{i}.jpg", frame_id),
+            )
+            store.insert_description_task(conn, frame_id)
+    return frame_ids
+
+
+def _worker_with(store: FramesStore, provider: DescriptionProvider) -> DescriptionWorker:
+    from myrecall.server.config_runtime import runtime_settings
+
+    worker = DescriptionWorker(store)
+    worker._service = DescriptionService(store)
+    worker._service._provider = provider
+    worker._last_processing_version = runtime_settings.ai_processing_version
+    worker._log_queue_status = MagicMock()
+    return worker
+
+
+@pytest.mark.unit
+def test_claim_description_tasks_claims_up_to_limit_in_id_order(store):
+    _enqueue_frames(store, 5)
+    with store._connect() as conn:
+        first = store.claim_description_tasks(conn, 3)
+        second = store.claim_description_tasks(conn, 3)
+        third = store.claim_description_tasks(conn, 3)
+
+    assert [t["id"] for t in first] == sorted(t["id"] for t in first)
+    assert len(first) == 3 and len(second) == 2 and third == []
+    assert {t["id"] for t in first}.isdisjoint(t["id"] for t in second)
+
+
+@pytest.mark.unit
+def test_worker_batches_tasks_into_one_provider_call(store):
+    frame_ids = _enqueue_frames(store, 6)
+    provider = _BatchProvider()
+    worker = _worker_with(store, provider)
+
+    with store._connect() as conn:
+        assert worker._process_batch(conn) == 4
+    with store._connect() as conn:
+        assert worker._process_batch(conn) == 2
+
+    assert [len(b) for b in provider.batches] == [4, 2]
+    with store._connect() as conn:
+        statuses = dict(conn.execute("SELECT id, description_status FROM frames").fetchall())
+        narratives = conn.execute("SELECT COUNT(*) FROM frame_descriptions").fetchone()[0]
+    assert all(statuses[f] == "completed" for f in frame_ids)
+    assert narratives == 6
+
+
+@pytest.mark.unit
+def test_worker_batch_failures_are_rescheduled_per_frame(store):
+    _enqueue_frames(store, 3)
+    worker = _worker_with(store, _BatchProvider(fail_paths={"/snap/1.jpg"}))
+
+    with store._connect() as conn:
+        worker._process_batch(conn)
+
+    with store._connect() as conn:
+        rows = conn.execute(
+            "SELECT t.status, t.retry_count, f.snapshot_path FROM description_tasks t "
+            "JOIN frames f ON f.id = t.frame_id ORDER BY t.id"
+        ).fetchall()
+    assert [(r[0], r[1]) for r in rows] == [("completed", 0), ("pending", 2), ("completed", 0)]
+
+
+@pytest.mark.unit
+def test_provider_batch_limit_caps_claim_size(store):
+    _enqueue_frames(store, 4)
+    provider = _BatchProvider(cap=2)
+    worker = _worker_with(store, provider)
+
+    with store._connect() as conn:
+        assert worker._process_batch(conn) == 2
+
+
+@pytest.mark.unit
+def test_single_task_provider_keeps_one_at_a_time_path(store):
+    _enqueue_frames(store, 3)
+    provider = _BatchProvider(cap=1)
+    provider.generate = lambda path, context: FrameDescription(narrative="n", summary="s", tags=[])
+    worker = _worker_with(store, provider)
+
+    with store._connect() as conn:
+        assert worker._process_batch(conn) == 1
+
+    assert provider.batches == []
+
+
+@pytest.mark.unit
+def test_default_generate_batch_collects_per_item_errors():
+    class _Single(DescriptionProvider):
+        def generate(self, image_path, context):
+            if image_path == "bad":
+                raise DescriptionProviderRequestError("bad")
+            return FrameDescription(narrative="ok", summary="ok", tags=[])
+
+    results = _Single().generate_batch(
+        [("good", FrameContext()), ("bad", FrameContext())]
+    )
+
+    assert isinstance(results[0], FrameDescription)
+    assert isinstance(results[1], DescriptionProviderRequestError)
+
+
+@pytest.mark.unit
+def test_local_provider_splits_batch_on_out_of_memory(monkeypatch):
+    from myrecall.server.description.providers import local
+
+    provider = local.LocalDescriptionProvider.__new__(local.LocalDescriptionProvider)
+    provider._batch_cap = 4
+    calls = []
+
+    def fake_generate_texts(conversations):
+        calls.append(len(conversations))
+        if len(conversations) > 2:
+            raise RuntimeError("CUDA out of memory. Tried to allocate 2.00 GiB")
+        return ['{"narrative": "n", "summary": "s", "tags": ["a"]}'] * len(conversations), 0.1
+
+    monkeypatch.setattr(provider, "_build_messages", lambda path: [{"path": path}])
+    monkeypatch.setattr(provider, "_generate_texts", fake_generate_texts)
+
+    results = provider.generate_batch([(str(i), FrameContext()) for i in range(4)])
+
+    assert calls == [4, 2, 2]
+    assert all(isinstance(r, FrameDescription) for r in results)
+    assert provider._batch_cap == 2
+
+
+@pytest.mark.unit
+def test_local_provider_batch_size_follows_free_memory(monkeypatch):
+    from myrecall.server.description.providers import local
+
+    provider = local.LocalDescriptionProvider.__new__(local.LocalDescriptionProvider)
+    provider._batch_cap = 8
+    monkeypatch.setattr(local.settings, "ai_device", "cuda")
+    monkeypatch.setattr(local, "_free_memory_bytes", lambda device: 3 * 1024 ** 3)
+
+    # 50% of 3 GiB over 512 MiB per item
+    assert provider.max_batch_size() == 3
+
+    monkeypatch.setattr(local, "_free_memory_bytes", lambda device: None)
+    assert provider.max_batch_size() == 8
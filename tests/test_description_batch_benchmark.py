@@ -0,0 +1,74 @@
+"""Local description throughput (frames/minute) by batch size on fixture images.
+
+Needs a local Qwen3-VL checkpoint:
+    MYRECALL_DESCRIPTION_MODEL=/path/to/Qwen3-VL-2B-Instruct \\
+        pytest -m "perf and model" tests/test_description_batch_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.description.models import FrameContext
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf, pytest.mark.model]
+
+_FIXTURES = Path(__file__).resolve().parent / "fixtures" / "images"
+_FRAMES = 8
+_BATCH_SIZES = (1, 2, 4, 8)
+
+
+@pytest.fixture(scope="module")
+def provider():
+    model_path = os.environ.get("MYRECALL_DESCRIPTION_MODEL")
+    if not model_path:
+        pytest.skip("MYRECALL_DESCRIPTION_MODEL not set")
+    pytest.importorskip("torch")
+    pytest.importorskip("qwen_vl_utils")
+    from myrecall.server.description.providers.local import LocalDescriptionProvider
+
+    instance = LocalDescriptionProvider(model_name=model_path)
+    instance._batch_cap = max(_BATCH_SIZES)
+    yield instance
+    instance.close()
+
+
+@pytest.fixture
+def frames(tmp_path: Path) -> list[str]:
+    sources = [_FIXTURES / "sample_jpeg.jpg", _FIXTURES / "empty_text_image.jpg"]
+    paths = []
+    for i in range(_FRAMES):
+        dest = tmp_path / f"frame_{i}.jpg"
+        shutil.copy(sources[i % len(sources)], dest)
+        paths.append(str(dest))
+    return paths
+
+
+def test_description_frames_per_minute_by_batch_size(provider, frames):
+    context = FrameContext(app_name="Safari", window_name="Docs")
+    provider.generate(frames[0], context)  # warm-up
+
+    baseline = None
+    for batch_size in _BATCH_SIZES:
+        started = time.perf_counter()
+        for i in range(0, len(frames), batch_size):
+            chunk = [(path, context) for path in frames[i:i + batch_size]]
+            results = provider.generate_batch(chunk)
+            assert not any(isinstance(r, Exception) for r in results)
+        elapsed = time.perf_counter() - started
+        fpm = len(frames) / elapsed * 60
+        baseline = baseline or fpm
+        logger.info(
+            "batch=%d: %.1f frames/min (x%.2f vs batch=1), memory cap=%d",
+            batch_size,
+            fpm,
+            fpm / baseline,
+            provider.max_batch_size(),
+        )
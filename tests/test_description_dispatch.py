@@ -0,0 +1,260 @@
+"""Tests for concurrent, rate-limited remote description dispatch."""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.description.providers import dispatch
+from myrecall.server.description.providers.dispatch import (
+    DispatchMetrics,
+    RemoteDispatcher,
+    Throttled,
+    TokenBucket,
+    call_with_backoff,
+    parse_retry_after,
+)
+from myrecall.server.description.models import FrameContext, FrameDescription
+from myrecall.server.description.providers import openai as openai_module
+from myrecall.server.description.providers.openai import OpenAIDescriptionProvider
+
+logger = logging.getLogger(__name__)
+
+_IMAGE = str(Path(__file__).resolve().parent / "fixtures" / "images" / "sample_jpeg.jpg")
+_COMPLETION = json.dumps(
+    {"choices": [{"message": {"content": '{"narrative": "n", "summary": "s", "tags": ["a"]}'}}]}
+).encode()
+
+
+class _StubCompletions:
+    """Local OpenAI-compatible /chat/completions stub with fixed latency."""
+
+    def __init__(self, latency: float = 0.0, throttle_first: int = 0, retry_after: str = "0"):
+        self.latency = latency
+        self.throttle_first = throttle_first
+        self.retry_after = retry_after
+        self.requests = 0
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with stub.lock:
+                    stub.requests += 1
+                    throttle = stub.requests <= stub.throttle_first
+                    stub.active += 1
+                    stub.peak = max(stub.peak, stub.active)
+                try:
+                    if throttle:
+                        body = b'{"error": "rate limited"}'
+                        self.send_response(429)
+                        self.send_header("Retry-After", stub.retry_after)
+                    else:
+                        time.sleep(stub.latency)
+                        body = _COMPLETION
+                        self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with stub.lock:
+                        stub.active -= 1
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def api_base(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_factory():
+    stubs = []
+
+    def make(**kwargs) -> _StubCompletions:
+        stub = _StubCompletions(**kwargs)
+        stubs.append(stub)
+        return stub
+
+    yield make
+    for stub in stubs:
+        stub.close()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_metrics(monkeypatch):
+    metrics = DispatchMetrics()
+    monkeypatch.setattr(dispatch, "dispatch_metrics", metrics)
+    monkeypatch.setattr(openai_module, "get_description_request_timeout", lambda: 5)
+    return metrics
+
+
+def _provider(api_base: str, concurrency: int, rate: float = 0.0) -> OpenAIDescriptionProvider:
+    provider = OpenAIDescriptionProvider(api_key="", model_name="stub", api_base=api_base)
+    provider._dispatcher = RemoteDispatcher(concurrency, rate)
+    return provider
+
+
+@pytest.mark.unit
+def test_token_bucket_paces_requests():
+    bucket = TokenBucket(rate=50, burst=1)
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    # First token is free, the other five wait 20ms each
+    assert time.monotonic() - started >= 0.09
+
+
+@pytest.mark.unit
+def test_token_bucket_gives_up_at_deadline():
+    bucket = TokenBucket(rate=0)
+    bucket.pause(5)
+    assert bucket.acquire(deadline=time.monotonic() + 0.05) is False
+
+
+@pytest.mark.unit
+def test_parse_retry_after_seconds_and_http_date():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(future) <= 30
+
+
+@pytest.mark.unit
+def test_call_with_backoff_retries_after_throttle(_isolated_metrics):
+    calls = []
+
+    def attempt(timeout):
+        calls.append(timeout)
+        if len(calls) < 3:
+            raise Throttled("429", retry_after=0.01)
+        return "ok"
+
+    assert call_with_backoff(attempt, 5, TokenBucket(0)) == "ok"
+    assert len(calls) == 3
+    assert _isolated_metrics.snapshot()["throttled"] == 2
+
+
+@pytest.mark.unit
+def test_call_with_backoff_never_waits_past_request_timeout():
+    def attempt(timeout):
+        raise Throttled("429", retry_after=30)
+
+    started = time.monotonic()
+    with pytest.raises(Throttled):
+        call_with_backoff(attempt, 1, TokenBucket(0))
+    assert time.monotonic() - started < 0.5
+
+
+@pytest.mark.unit
+def test_openai_batch_runs_requests_concurrently(stub_factory, _isolated_metrics):
+    stub = stub_factory(latency=0.2)
+    provider = _provider(stub.api_base, concurrency=8)
+
+    started = time.monotonic()
+    results = provider.generate_batch([(_IMAGE, FrameContext())] * 8)
+    elapsed = time.monotonic() - started
+    provider.close()
+
+    assert all(isinstance(r, FrameDescription) for r in results)
+    assert stub.peak > 1
+    assert elapsed < 8 * 0.2
+    snapshot = _isolated_metrics.snapshot()
+    assert snapshot["completed"] == 8
+    assert snapshot["in_flight"] == 0
+    assert snapshot["latency_ms_p50"] >= 150
+
+
+@pytest.mark.unit
+def test_openai_retries_429_with_retry_after(stub_factory, _isolated_metrics):
+    stub = stub_factory(throttle_first=2, retry_after="0")
+    provider = _provider(stub.api_base, concurrency=1)
+
+    description = provider.generate(_IMAGE, FrameContext())
+    provider.close()
+
+    assert description.narrative == "n"
+    assert stub.requests == 3
+    assert _isolated_metrics.snapshot()["throttled"] == 2
+
+
+@pytest.mark.unit
+def test_openai_batch_reports_per_item_failures(stub_factory):
+    stub = stub_factory()
+    provider = _provider(stub.api_base, concurrency=4)
+
+    results = provider.generate_batch([(_IMAGE, FrameContext()), ("/missing.jpg", FrameContext())])
+    provider.close()
+
+    assert isinstance(results[0], FrameDescription)
+    assert isinstance(results[1], Exception)
+
+
+@pytest.mark.unit
+def test_description_status_exposes_dispatch_metrics(tmp_path, monkeypatch):
+    from flask import Flask
+
+    from myrecall.server import api_v1
+    from myrecall.server.database.frames_store import FramesStore
+    from myrecall.server.database.migrations_runner import run_migrations
+
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations")
+    conn.close()
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: FramesStore(db_path=db_path))
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+
+    response = app.test_client().get("/v1/description/tasks/status")
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert "pending" in data
+    assert set(data["dispatch"]) >= {
+        "in_flight",
+        "throughput_per_min",
+        "latency_ms_p50",
+        "latency_ms_p95",
+        "throttled",
+    }
+
+
+@pytest.mark.perf
+def test_remote_description_throughput_by_concurrency(stub_factory):
+    """Frames/minute against a 100ms stub endpoint at increasing concurrency."""
+    stub = stub_factory(latency=0.1)
+    frames = [(_IMAGE, FrameContext())] * 32
+    baseline = None
+    for concurrency in (1, 4, 8, 16):
+        provider = _provider(stub.api_base, concurrency=concurrency)
+        started = time.perf_counter()
+        for i in range(0, len(frames), concurrency):
+            provider.generate_batch(frames[i:i + concurrency])
+        fpm = len(frames) / (time.perf_counter() - started) * 60
+        provider.close()
+        baseline = baseline or fpm
+        logger.info("concurrency=%d: %.0f frames/min (x%.1f)", concurrency, fpm, fpm / baseline)
@@ -26,6 +26,7 @@ class TestDescriptionWorkerHotReload:
         store._connect.return_value.__enter__ = MagicMock(return_value=MagicMock())
         store._connect.return_value.__exit__ = MagicMock(return_value=False)
         store.claim_description_task.return_value = None  # no tasks
+        store.get_pending_lane_waits.return_value = {}
 
         worker = DescriptionWorker(store)
         worker._service = MagicMock()  # pretend service exists
@@ -47,6 +48,7 @@ class TestDescriptionWorkerHotReload:
         store._connect.return_value.__enter__ = MagicMock(return_value=MagicMock())
         store._connect.return_value.__exit__ = MagicMock(return_value=False)
         store.claim_description_task.return_value = None
+        store.get_pending_lane_waits.return_value = {}
 
         worker = DescriptionWorker(store)
         fake_service = MagicMock()
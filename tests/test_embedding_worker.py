@@ -34,7 +34,11 @@ class TestEmbeddingWorker:
                 timestamp TEXT,
                 app_name TEXT,
                 window_name TEXT,
-                embedding_status TEXT DEFAULT NULL
+                embedding_status TEXT DEFAULT NULL,
+                storage_tier TEXT NOT NULL DEFAULT 'original',
+                storage_offset INTEGER,
+                storage_length INTEGER,
+                storage_scale REAL NOT NULL DEFAULT 1.0
             );
             CREATE TABLE embedding_tasks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -46,6 +50,7 @@ class TestEmbeddingWorker:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 started_at TIMESTAMP,
                 completed_at TIMESTAMP,
+                priority INTEGER NOT NULL DEFAULT 0,
                 UNIQUE(frame_id)
             );
         """)
@@ -151,7 +156,11 @@ class TestEmbeddingWorker:
                 timestamp TEXT,
                 app_name TEXT,
                 window_name TEXT,
-                embedding_status TEXT DEFAULT NULL
+                embedding_status TEXT DEFAULT NULL,
+                storage_tier TEXT NOT NULL DEFAULT 'original',
+                storage_offset INTEGER,
+                storage_length INTEGER,
+                storage_scale REAL NOT NULL DEFAULT 1.0
             );
             CREATE TABLE embedding_tasks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -163,6 +172,7 @@ class TestEmbeddingWorker:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 started_at TIMESTAMP,
                 completed_at TIMESTAMP,
+                priority INTEGER NOT NULL DEFAULT 0,
                 UNIQUE(frame_id)
             );
         """)
@@ -0,0 +1,140 @@
+"""Tests for batched frame context (GET /v1/frames/context) and the frame_urls cache."""
+import json
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from myrecall.server import api_v1
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+_MIGRATIONS = Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations"
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+@pytest.fixture
+def client(store, monkeypatch):
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    return app.test_client()
+
+
+def _insert(store, text, visibility_status="queryable", narrative=None):
+    with store._connect() as conn:
+        frame_id = conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, local_timestamp, app_name, window_name, "
+            "text_source, ocr_text, status, visibility_status, description_status) "
+            "VALUES (?, '2026-03-20T09:00:00Z', '2026-03-20T09:00:00', 'Browser', 'main', "
+            "'ocr', ?, 'completed', ?, ?)",
+            (uuid.uuid4().hex, text, visibility_status, "completed" if narrative else None),
+        ).lastrowid
+        if narrative:
+            conn.execute(
+                "INSERT INTO frame_descriptions (frame_id, narrative, summary, tags_json, "
+                "description_model) VALUES (?, ?, 'summary', ?, 'test-model')",
+                (frame_id, narrative, json.dumps(["web"])),
+            )
+    return frame_id
+
+
+def _cached_urls(store, frame_id):
+    with store._connect() as conn:
+        row = conn.execute(
+            "SELECT urls_json FROM frame_urls WHERE frame_id = ?", (frame_id,)
+        ).fetchone()
+    return None if row is None else json.loads(row["urls_json"])
+
+
+@pytest.mark.unit
+def test_sql_truncation_matches_middle_truncation(store):
+    limit = FramesStore.MAX_TEXT_LENGTH
+    text = "".join(chr(ord("a") + i % 26) for i in range(limit + 1234))
+    long_id = _insert(store, text)
+    exact_id = _insert(store, "y" * limit)
+
+    contexts = store.get_frame_contexts([long_id, exact_id, 999])
+
+    half = limit // 2
+    assert contexts[long_id]["text"] == text[:half] + "...1234 chars..." + text[-half:]
+    assert contexts[exact_id]["text"] == "y" * limit
+    assert 999 not in contexts
+    assert store.get_frame_context(long_id) == contexts[long_id]
+
+
+@pytest.mark.unit
+def test_frame_urls_cached_and_invalidated_on_text_change(store):
+    frame_id, _ = store.claim_frame(
+        capture_id="urls-1",
+        metadata={"timestamp": "2026-03-20T09:00:00Z", "app_name": "Browser"},
+    )
+    assert store.advance_frame_status(frame_id, "pending", "processing")
+    assert store.complete_ocr_frame(
+        frame_id, "see https://example.com/a, https://example.com/a and http://x.org/b)",
+        "rapidocr", "Browser", None,
+    )
+    # Written at OCR completion, deduplicated
+    assert _cached_urls(store, frame_id) == ["https://example.com/a", "http://x.org/b"]
+
+    with store._connect() as conn:
+        conn.execute(
+            "UPDATE frames SET ocr_text = 'now https://new.example.com/page' WHERE id = ?",
+            (frame_id,),
+        )
+    assert _cached_urls(store, frame_id) is None
+
+    # Rescanned and cached again on the next read
+    assert store.get_frame_context(frame_id)["urls"] == ["https://new.example.com/page"]
+    assert _cached_urls(store, frame_id) == ["https://new.example.com/page"]
+
+
+@pytest.mark.unit
+def test_accessibility_completion_caches_urls_only_for_existing_frames(store):
+    def complete(frame_id):
+        return store.complete_accessibility_frame(
+            frame_id, "open https://example.com/ax", None, None, None, "{}",
+            "open https://example.com/ax", 1, False, [],
+        )
+
+    frame_id = _insert(store, "")
+    assert complete(frame_id)
+    assert _cached_urls(store, frame_id) == ["https://example.com/ax"]
+
+    assert not complete(999)
+    assert _cached_urls(store, 999) is None
+
+
+@pytest.mark.unit
+def test_frame_contexts_endpoint(store, client):
+    described = _insert(store, "docs at https://docs.example.com/x", narrative="Reading docs.")
+    plain = _insert(store, "plain text")
+    pending = _insert(store, "not yet", visibility_status="pending")
+
+    response = client.get(f"/v1/frames/context?ids={plain},{described},{pending},999")
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [item["frame_id"] for item in body["data"]] == [plain, described]
+    assert body["not_found"] == [999]
+    assert body["not_ready"] == [pending]
+    # Same body as the single-frame endpoint
+    assert body["data"][1] == client.get(f"/v1/frames/{described}/context").get_json()
+    assert body["data"][1]["description"]["model"] == "test-model"
+    assert body["data"][1]["urls"] == ["https://docs.example.com/x"]
+    assert body["data"][0]["description"] is None
+
+    assert client.get("/v1/frames/context").status_code == 400
+    assert client.get("/v1/frames/context?ids=1,abc").status_code == 400
+    too_many = ",".join(str(i) for i in range(api_v1.MAX_CONTEXT_IDS + 1))
+    assert client.get(f"/v1/frames/context?ids={too_many}").status_code == 400
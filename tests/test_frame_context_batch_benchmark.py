@@ -0,0 +1,76 @@
+"""Frame context for ten frames: per-frame GETs vs one GET /v1/frames/context.
+
+Seeds described frames with long OCR text and times fetching the context
+of ten of them, once as ten ``/v1/frames/<id>/context`` requests and once
+as a single ``/v1/frames/context?ids=`` request (one IN query, text
+truncated in SQL, URLs from the frame_urls cache).
+
+Run with: pytest -m perf tests/test_frame_context_batch_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from myrecall.server import api_v1
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_MIGRATIONS = Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations"
+_FRAMES = 500
+_IDS = 10
+_ROUNDS = 50
+
+
+def test_batched_vs_single_frame_context(tmp_path, monkeypatch):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    text = "see https://example.com/docs and some screen text " * 2000
+    for _ in range(_FRAMES):
+        frame_id = conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, local_timestamp, app_name, text_source, "
+            "ocr_text, status, visibility_status, description_status) "
+            "VALUES (?, '2026-03-20T09:00:00Z', '2026-03-20T09:00:00', 'Browser', 'ocr', ?, "
+            "'completed', 'queryable', 'completed')",
+            (uuid.uuid4().hex, text),
+        ).lastrowid
+        conn.execute(
+            "INSERT INTO frame_descriptions (frame_id, narrative, summary, tags_json) "
+            "VALUES (?, 'The user is reading docs.', 'docs', '[]')",
+            (frame_id,),
+        )
+    conn.commit()
+    conn.close()
+    store = FramesStore(db_path=db_path)
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    client = app.test_client()
+    ids = list(range(1, _IDS + 1))
+    client.get("/v1/frames/context", query_string={"ids": ",".join(map(str, ids))})  # warm URL cache
+
+    start = time.perf_counter()
+    for _ in range(_ROUNDS):
+        for frame_id in ids:
+            client.get(f"/v1/frames/{frame_id}/context")
+    single = (time.perf_counter() - start) / _ROUNDS * 1000
+
+    start = time.perf_counter()
+    for _ in range(_ROUNDS):
+        client.get("/v1/frames/context", query_string={"ids": ",".join(map(str, ids))})
+    batched = (time.perf_counter() - start) / _ROUNDS * 1000
+
+    logger.info("mode                 requests   ms/%d frames", _IDS)
+    logger.info("per-frame           %9d %9.1f", _IDS, single)
+    logger.info("batched             %9d %9.1f", 1, batched)
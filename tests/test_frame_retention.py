@@ -0,0 +1,235 @@
+"""Tests for bulk frame deletion, retention rules and DELETE /v1/frames."""
+import random
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from myrecall.server import api_v1, retention
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+from myrecall.server.ocr import visualization
+from myrecall.server.retention import (
+    DeletionJob,
+    RetentionRule,
+    load_retention_rules,
+    prune_expired_frames,
+    retention_filter,
+    run_deletion_job,
+)
+
+_MIGRATIONS = Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations"
+_BASE = datetime(2026, 3, 20, 9, 0, 0)
+_NOW = datetime(2026, 5, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+class _Embeddings:
+    def __init__(self):
+        self.deletes = []
+        self.compactions = 0
+
+    def delete_by_frame_ids(self, frame_ids):
+        self.deletes.append(list(frame_ids))
+
+    def compact(self):
+        self.compactions += 1
+
+
+class _VisCache:
+    def __init__(self):
+        self.discarded = []
+
+    def discard(self, frame_id):
+        self.discarded.append(frame_id)
+
+
+@pytest.fixture
+def embeddings(monkeypatch):
+    fake = _Embeddings()
+    monkeypatch.setattr(retention, "_embedding_store", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def vis_cache(monkeypatch):
+    fake = _VisCache()
+    monkeypatch.setattr(visualization, "get_ocr_vis_cache", lambda: fake)
+    return fake
+
+
+def _insert(conn, local_ts, app_name="Editor", window_name="main.py", utc_ts=None,
+            snapshot_path=None, visibility="queryable"):
+    cursor = conn.execute(
+        "INSERT INTO frames (capture_id, timestamp, local_timestamp, app_name, window_name, "
+        "snapshot_path, visibility_status) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (uuid.uuid4().hex, utc_ts or local_ts, local_ts, app_name, window_name,
+         snapshot_path, visibility),
+    )
+    frame_id = cursor.lastrowid
+    conn.execute(
+        "INSERT INTO ocr_text (frame_id, text, text_length, ocr_engine) VALUES (?, 'x', 1, 'test')",
+        (frame_id,),
+    )
+    return frame_id
+
+
+def _rollup_rows(conn):
+    return [
+        tuple(row)
+        for row in conn.execute(
+            "SELECT bucket_start, app_name, frame_count, ROUND(active_seconds, 3), first_seen, last_seen "
+            "FROM activity_rollups ORDER BY bucket_start, app_name"
+        )
+    ]
+
+
+@pytest.mark.unit
+def test_delete_frames_clears_children_and_matches_rollup_rebuild(store):
+    rng = random.Random(7)
+    ids = []
+    with store._connect() as conn:
+        seconds = 0.0
+        for _ in range(300):
+            seconds += rng.choice([1, 5, 30, 200, 400])
+            ts = (_BASE + timedelta(seconds=seconds)).strftime("%Y-%m-%dT%H:%M:%S")
+            app = rng.choice(["Editor", "Browser", None])
+            ids.append(_insert(conn, ts, app, visibility=rng.choice(["queryable", "pending"])))
+        conn.commit()
+    doomed = sorted(rng.sample(ids, 150))
+
+    deleted = store.delete_frames(doomed + [10**9])
+
+    assert [frame_id for frame_id, _ in deleted] == doomed
+    with store._connect() as conn:
+        incremental = _rollup_rows(conn)
+        assert conn.execute("SELECT COUNT(*) FROM frames").fetchone()[0] == 150
+        assert conn.execute("SELECT COUNT(*) FROM ocr_text").fetchone()[0] == 150
+        assert conn.execute("SELECT COUNT(*) FROM activity_rollups_deferred").fetchone()[0] == 0
+    store.rebuild_activity_rollups()
+    with store._connect() as conn:
+        assert incremental == _rollup_rows(conn)
+
+    with store._connect() as conn:
+        survivor = conn.execute("SELECT id FROM frames LIMIT 1").fetchone()[0]
+        conn.execute("DELETE FROM frames WHERE id = ?", (survivor,))
+        conn.commit()
+        per_row = _rollup_rows(conn)
+    store.rebuild_activity_rollups()
+    with store._connect() as conn:
+        assert per_row == _rollup_rows(conn)
+
+
+@pytest.mark.unit
+def test_most_specific_retention_rule_wins(store, embeddings, vis_cache):
+    class _Config:
+        retention_max_age_days = 30
+        retention_rules = (
+            {"max_age_days": 7},
+            {"app_name": "Slack", "max_age_days": 2},
+            {"window_name": "Private", "max_age_days": 1},
+            {"app_name": "Bank", "max_age_days": 0},
+            {"app_name": None},
+        )
+
+    def utc(days):
+        return (_NOW - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    rules = load_retention_rules(_Config)
+    with store._connect() as conn:
+        frames = {
+            "slack_3d": _insert(conn, "2026-04-28T12:00:00", "Slack", "general", utc(3)),
+            "slack_1d": _insert(conn, "2026-04-30T12:00:00", "Slack", "general", utc(1)),
+            "private_2d": _insert(conn, "2026-04-29T12:00:00", "Browser", "Private tab", utc(2)),
+            "browser_5d": _insert(conn, "2026-04-26T12:00:00", "Browser", "news", utc(5)),
+            "browser_8d": _insert(conn, "2026-04-23T12:00:00", "Browser", "news", utc(8)),
+            "bank_100d": _insert(conn, "2026-01-21T12:00:00", "Bank", "Private", utc(100)),
+        }
+        conn.commit()
+
+    job = prune_expired_frames(store, rules, now=_NOW)
+
+    assert rules[0] == RetentionRule(max_age_days=2, app_name="Slack")
+    assert job.status == "completed" and job.total == 3
+    with store._connect() as conn:
+        remaining = {row[0] for row in conn.execute("SELECT id FROM frames")}
+    assert remaining == {frames[k] for k in ("slack_1d", "browser_5d", "bank_100d")}
+    assert prune_expired_frames(store, rules, now=_NOW) is None
+    assert retention_filter([RetentionRule(max_age_days=0)], now=_NOW) is None
+
+
+@pytest.mark.unit
+def test_deletion_job_batches_embeddings_and_unlinks_files(store, tmp_path, embeddings, vis_cache):
+    paths = []
+    with store._connect() as conn:
+        for i in range(5):
+            path = tmp_path / f"{i}.jpg"
+            path.write_bytes(b"jpeg")
+            paths.append(path)
+            _insert(conn, f"2026-03-20T10:0{i}:00", snapshot_path=str(path))
+        keep = _insert(conn, "2026-03-20T11:00:00")
+        conn.commit()
+    frame_filter = retention.frame_range_filter("2026-03-20T10:00:00", "2026-03-20T11:00:00")
+    job = DeletionJob("range", frame_filter, total=5)
+
+    run_deletion_job(job, store, batch_size=2)
+
+    assert job.to_dict()["status"] == "completed"
+    assert (job.frames_deleted, job.files_removed, job.batches) == (5, 5, 3)
+    assert [len(batch) for batch in embeddings.deletes] == [2, 2, 1]
+    assert embeddings.compactions == 1
+    assert sorted(vis_cache.discarded) == sorted(i for batch in embeddings.deletes for i in batch)
+    assert not any(path.exists() for path in paths)
+    with store._connect() as conn:
+        assert [row[0] for row in conn.execute("SELECT id FROM frames")] == [keep]
+
+
+@pytest.mark.unit
+def test_delete_frames_endpoint_runs_range_job(store, embeddings, vis_cache, monkeypatch):
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    client = app.test_client()
+    with store._connect() as conn:
+        inside = _insert(conn, "2026-03-20T13:30:00", "Slack")
+        _insert(conn, "2026-03-20T13:45:00", "Editor")
+        _insert(conn, "2026-03-20T18:00:00", "Slack")
+        conn.commit()
+
+    assert client.delete("/v1/frames?start_time=2026-03-20T12:00").status_code == 400
+    assert client.delete(
+        "/v1/frames?start_time=2026-03-20T18:00&end_time=2026-03-20T12:00"
+    ).status_code == 400
+
+    response = client.delete(
+        "/v1/frames?start_time=2026-03-20T12:00&end_time=2026-03-20T17:00&app_name=Slack"
+    )
+
+    assert response.status_code == 202
+    body = response.get_json()
+    assert body["total"] == 1
+    for _ in range(100):
+        status = client.get(f"/v1/frames/deletions/{body['job_id']}").get_json()
+        if status["status"] != "running":
+            break
+        time.sleep(0.02)
+    assert status["status"] == "completed"
+    assert status["frames_deleted"] == 1 and status["progress"] == 1.0
+    assert embeddings.deletes == [[inside]]
+    listed = client.get("/v1/frames/deletions").get_json()["jobs"]
+    assert listed[0]["job_id"] == body["job_id"]
+    assert client.get("/v1/frames/deletions/nope").status_code == 404
+    with store._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM frames").fetchone()[0] == 2
@@ -0,0 +1,71 @@
+"""Bulk frame deletion: per-frame delete_frame vs batched delete_frames.
+
+Seeds an afternoon of queryable frames (one every 3 s across a few apps,
+each with an ocr_text row) and deletes all of them, once with one
+``delete_frame`` transaction per frame (what N ``DELETE /v1/frames/<id>``
+calls cost in SQLite) and once with ``delete_frames`` in batches of 500.
+Reports frames/second for each.
+
+Run with: pytest -m perf tests/test_frame_retention_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_MIGRATIONS = Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations"
+_FRAMES = 4000
+_BATCH = 500
+
+
+def _seed(tmp_path, name):
+    db_path = tmp_path / f"{name}.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    start = datetime(2026, 3, 20, 13, 0, 0)
+    for i in range(_FRAMES):
+        ts = (start + timedelta(seconds=3 * i)).strftime("%Y-%m-%dT%H:%M:%S")
+        frame_id = conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, local_timestamp, app_name, visibility_status) "
+            "VALUES (?, ?, ?, ?, 'queryable')",
+            (uuid.uuid4().hex, ts, ts, ("Editor", "Browser", "Terminal", "Slack")[i % 4]),
+        ).lastrowid
+        conn.execute(
+            "INSERT INTO ocr_text (frame_id, text, text_length, ocr_engine) VALUES (?, 'x', 1, 'bench')",
+            (frame_id,),
+        )
+    conn.commit()
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+def test_bulk_delete_throughput(tmp_path):
+    store = _seed(tmp_path, "per_frame")
+    frame_ids = list(range(1, _FRAMES + 1))
+    start = time.perf_counter()
+    for frame_id in frame_ids:
+        store.delete_frame(frame_id)
+    per_frame = _FRAMES / (time.perf_counter() - start)
+
+    store = _seed(tmp_path, "batched")
+    start = time.perf_counter()
+    for offset in range(0, _FRAMES, _BATCH):
+        store.delete_frames(frame_ids[offset:offset + _BATCH])
+    batched = _FRAMES / (time.perf_counter() - start)
+
+    logger.info("mode                 frames/s")
+    logger.info("per-frame delete   %10.1f", per_frame)
+    logger.info("batched (%d)      %10.1f", _BATCH, batched)
@@ -0,0 +1,227 @@
+"""Tests for snapshot storage tiering and tier-transparent frame serving."""
+import io
+import json
+import sqlite3
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from PIL import Image, ImageStat
+
+from myrecall.server import api_v1, frame_storage
+from myrecall.server.config_runtime import runtime_settings
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+from myrecall.server.description.models import FrameDescription
+from myrecall.server.description.providers.base import DescriptionProvider
+from myrecall.server.description.service import DescriptionService
+from myrecall.server.description.worker import DescriptionWorker
+from myrecall.server.frame_storage import location_for_frame, run_storage_tiering
+from myrecall.server.ocr.visualization import OcrVisCache
+
+_MIGRATIONS = Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations"
+_NOW = datetime(2026, 5, 1, 12, 0, 0, tzinfo=timezone.utc)
+_BOXES = {
+    "boxes": [[[100, 100], [900, 100], [900, 300], [100, 300]]],
+    "texts": ["hello"],
+    "scores": [0.99],
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+@pytest.fixture
+def tiering(tmp_path, monkeypatch):
+    config = frame_storage.settings
+    monkeypatch.setattr(config, "paths_data_dir", tmp_path)
+    for name, value in {
+        "storage_compress_after_days": 0,
+        "storage_compress_format": "webp",
+        "storage_compress_quality": 60,
+        "storage_compress_max_side": 0,
+        "storage_archive_after_days": 0,
+        "storage_tiering_batch_size": 2,
+    }.items():
+        monkeypatch.setattr(config, name, value, raising=False)
+    (tmp_path / "frames").mkdir()
+    return config
+
+
+@pytest.fixture
+def client(store, tmp_path, monkeypatch):
+    cache = OcrVisCache(tmp_path / "ocr_vis", max_bytes=10 * 1024 * 1024)
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    monkeypatch.setattr(api_v1, "get_ocr_vis_cache", lambda: cache)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    return app.test_client()
+
+
+def _insert(store, tmp_path, utc_ts, size=(2000, 1000)):
+    path = tmp_path / "frames" / f"{uuid.uuid4().hex}.jpg"
+    Image.effect_noise(size, 40).convert("RGB").save(path, "JPEG", quality=90)
+    with store._connect() as conn:
+        frame_id = conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, local_timestamp, snapshot_path, "
+            "image_size_bytes, status) VALUES (?, ?, ?, ?, ?, 'completed')",
+            (uuid.uuid4().hex, utc_ts, utc_ts.rstrip("Z"), str(path), path.stat().st_size),
+        ).lastrowid
+        conn.execute(
+            "INSERT INTO ocr_text (frame_id, text, text_length, text_json, ocr_engine) "
+            "VALUES (?, 'hello', 5, ?, 'rapidocr')",
+            (frame_id, json.dumps(_BOXES)),
+        )
+    return frame_id, path
+
+
+@pytest.mark.unit
+def test_compress_tier_downscales_to_webp_and_serves_it(store, tmp_path, tiering, client):
+    tiering.storage_compress_after_days = 7
+    tiering.storage_compress_max_side = 1000
+    old = [_insert(store, tmp_path, "2026-04-01T10:00:0%dZ" % i) for i in range(3)]
+    recent_id, recent_path = _insert(store, tmp_path, "2026-04-30T10:00:00Z")
+
+    result = run_storage_tiering(store, now=_NOW)
+
+    assert (result.compressed, result.failed) == (3, 0)
+    assert result.to_dict()["saved_bytes"] > 0
+    for frame_id, jpeg_path in old:
+        location = location_for_frame(store, frame_id)
+        assert location.tier == "compressed" and location.scale == 2.0
+        assert location.path.endswith(".webp") and not jpeg_path.exists()
+        response = client.get(f"/v1/frames/{frame_id}")
+        assert response.status_code == 200 and response.mimetype == "image/webp"
+        with Image.open(io.BytesIO(response.data)) as img:
+            assert img.size == (1000, 500)
+    assert location_for_frame(store, recent_id).tier == "original" and recent_path.exists()
+
+    # Boxes are in capture pixels; they are drawn scaled onto the smaller image
+    vis = client.get(f"/v1/frames/{old[0][0]}/ocr-vis")
+    with Image.open(io.BytesIO(vis.data)) as img:
+        assert img.size == (1000, 500)
+        inside = ImageStat.Stat(img.crop((60, 60, 440, 140))).mean
+        outside = ImageStat.Stat(img.crop((500, 160, 880, 290))).mean
+    assert inside[0] - inside[1] > outside[0] - outside[1] + 15
+    assert run_storage_tiering(store, now=_NOW).compressed == 0
+
+
+@pytest.mark.unit
+def test_archive_tier_packs_by_day_and_serves_from_pack(store, tmp_path, tiering, client):
+    tiering.storage_archive_after_days = 7
+    frames = [
+        _insert(store, tmp_path, "2026-04-01T10:00:00Z", size=(400, 200)),
+        _insert(store, tmp_path, "2026-04-01T11:00:00Z", size=(400, 200)),
+        _insert(store, tmp_path, "2026-04-02T10:00:00Z", size=(400, 200)),
+    ]
+    originals = {frame_id: path.read_bytes() for frame_id, path in frames}
+
+    result = run_storage_tiering(store, now=_NOW)
+
+    assert result.archived == 3
+    packs = sorted(p.name for p in (tmp_path / "frames" / "archive").iterdir())
+    assert packs == ["2026-04-01.pack", "2026-04-02.pack"]
+    for frame_id, path in frames:
+        assert not path.exists()
+        response = client.get(f"/v1/frames/{frame_id}")
+        assert response.status_code == 200 and response.mimetype == "image/jpeg"
+        assert response.data == originals[frame_id]
+    assert client.get(f"/v1/frames/{frames[1][0]}/ocr-vis").status_code == 200
+
+    # Deleting an archived frame must not unlink the shared pack
+    assert store.delete_frame(frames[0][0]) == (True, None)
+    assert store.delete_frames([frames[1][0]]) == [(frames[1][0], None)]
+    assert (tmp_path / "frames" / "archive" / "2026-04-01.pack").exists()
+    assert client.get(f"/v1/frames/{frames[2][0]}").data == originals[frames[2][0]]
+
+
+@pytest.mark.unit
+def test_frames_with_pending_work_are_not_tiered(store, tmp_path, tiering):
+    tiering.storage_compress_after_days = 7
+    busy_desc, _ = _insert(store, tmp_path, "2026-04-01T10:00:00Z", size=(200, 100))
+    busy_embed, _ = _insert(store, tmp_path, "2026-04-01T10:00:01Z", size=(200, 100))
+    done, _ = _insert(store, tmp_path, "2026-04-01T10:00:02Z", size=(200, 100))
+    with store._connect() as conn:
+        conn.execute("INSERT INTO description_tasks (frame_id, status) VALUES (?, 'processing')",
+                     (busy_desc,))
+        conn.execute("INSERT INTO embedding_tasks (frame_id, status) VALUES (?, 'pending')",
+                     (busy_embed,))
+        conn.execute("INSERT INTO embedding_tasks (frame_id, status) VALUES (?, 'completed')",
+                     (done,))
+
+    assert run_storage_tiering(store, now=_NOW).compressed == 1
+    assert location_for_frame(store, done).tier == "compressed"
+    assert location_for_frame(store, busy_desc).tier == "original"
+    assert location_for_frame(store, busy_embed).tier == "original"
+
+
+class _SizeProvider(DescriptionProvider):
+    """Describes a snapshot by the pixel size it decodes to."""
+
+    def __init__(self):
+        self.paths = []
+
+    def generate(self, image_path, context):
+        self.paths.append(image_path)
+        with Image.open(image_path) as img:
+            return FrameDescription(narrative="%dx%d" % img.size, summary="s", tags=[])
+
+
+@pytest.mark.unit
+def test_failed_description_retried_on_archived_frame_reads_its_own_image(
+    store, tmp_path, tiering
+):
+    tiering.storage_archive_after_days = 7
+    _insert(store, tmp_path, "2026-04-01T10:00:00Z", size=(400, 200))
+    frame_id, _ = _insert(store, tmp_path, "2026-04-01T11:00:00Z", size=(300, 150))
+    with store._connect() as conn:
+        conn.execute(
+            "INSERT INTO description_tasks (frame_id, status) VALUES (?, 'failed')", (frame_id,)
+        )
+        conn.execute(
+            "UPDATE frames SET description_status = 'failed', visibility_status = 'failed' "
+            "WHERE id = ?",
+            (frame_id,),
+        )
+    assert run_storage_tiering(store, now=_NOW).archived == 2
+    assert location_for_frame(store, frame_id).offset > 0  # not first in its pack
+
+    assert store.reset_failed_frames()["breakdown"]["description"] == 1
+    provider = _SizeProvider()
+    worker = DescriptionWorker(store)
+    worker._service = DescriptionService(store)
+    worker._service._provider = provider
+    worker._last_processing_version = runtime_settings.ai_processing_version
+    with store._connect() as conn:
+        assert worker._process_batch(conn) == 1
+
+    with store._connect() as conn:
+        description = store.get_frame_description(conn, frame_id)
+    assert description["narrative"] == "300x150"
+    assert not Path(provider.paths[0]).exists()  # temporary copy removed
+
+
+@pytest.mark.unit
+def test_storage_tiers_endpoint_reports_savings(store, tmp_path, tiering, client):
+    tiering.storage_compress_after_days = 7
+    _insert(store, tmp_path, "2026-04-01T10:00:00Z")
+    _insert(store, tmp_path, "2026-04-30T10:00:00Z")
+    run_storage_tiering(store, now=_NOW)
+
+    body = client.get("/v1/storage/tiers?sample=3").get_json()
+
+    tiers = {entry["tier"]: entry for entry in body["tiers"]}
+    assert set(tiers) == {"original", "compressed"}
+    assert tiers["original"]["saved_bytes"] == 0
+    assert tiers["compressed"]["frames"] == 1 and tiers["compressed"]["saved_bytes"] > 0
+    assert tiers["compressed"]["read_ms_p50"] is not None
+    assert tiers["compressed"]["decode_ms_p50"] is not None
+    assert body["last_run"]["compressed"] == 1
@@ -0,0 +1,85 @@
+"""Snapshot storage tiers: bytes on disk and read/decode latency per tier.
+
+Builds a synthetic 5K screenshot (flat UI panels, text-like strokes and a
+noisy photo region), stores it as the ingested JPEG, then moves copies
+through the compressed tier (WebP at capture size and downscaled to 2560
+px) and the archived tier (a pack file holding 50 frames). Reports stored
+bytes and median read / decode milliseconds for each.
+
+Run with: pytest -m perf tests/test_frame_storage_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import io
+import logging
+import statistics
+import time
+
+import pytest
+from PIL import Image, ImageDraw
+
+from myrecall.server.frame_storage import SnapshotLocation, _reencode
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_SIZE = (5120, 2880)
+_PACKED = 50
+_ROUNDS = 5
+
+
+def _screenshot() -> Image.Image:
+    img = Image.new("RGB", _SIZE, (246, 246, 248))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((0, 0, 900, _SIZE[1]), fill=(36, 39, 46))
+    for y in range(120, _SIZE[1] - 60, 44):
+        for x in range(980, 4100, 260):
+            draw.rectangle((x, y, x + 180 + (x * y) % 60, y + 18), fill=(40, 40, 40))
+        draw.rectangle((60, y, 620, y + 16), fill=(180, 184, 192))
+    img.paste(Image.effect_noise((900, 700), 60).convert("RGB"), (4150, 200))
+    return img
+
+
+def _timed(location: SnapshotLocation) -> tuple[float, float]:
+    start = time.perf_counter()
+    data = location.read_bytes()
+    read_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    with Image.open(io.BytesIO(data)) as img:
+        img.load()
+    return read_ms, (time.perf_counter() - start) * 1000
+
+
+def test_tier_size_and_latency(tmp_path):
+    original = tmp_path / "frame.jpg"
+    _screenshot().save(original, "JPEG", quality=85)
+    jpeg = SnapshotLocation(str(original))
+
+    tiers = {"original": (jpeg, original.stat().st_size)}
+    for name, max_side in (("webp", 0), ("webp-2560", 2560)):
+        data, scale = _reencode(jpeg, "WEBP", 60, max_side)
+        path = tmp_path / f"{name}.webp"
+        path.write_bytes(data)
+        tiers[name] = (SnapshotLocation(str(path), "compressed", scale=scale), len(data))
+
+    pack = tmp_path / "day.pack"
+    payload = (tmp_path / "webp-2560.webp").read_bytes()
+    with open(pack, "wb") as f:
+        for _ in range(_PACKED):
+            f.write(payload)
+    middle = SnapshotLocation(
+        str(pack), "archived", offset=len(payload) * (_PACKED // 2), length=len(payload)
+    )
+    tiers["archived"] = (middle, len(payload))
+
+    logger.info("tier            bytes     read ms   decode ms")
+    for name, (location, size) in tiers.items():
+        timings = [_timed(location) for _ in range(_ROUNDS)]
+        logger.info(
+            "%-12s %10d %10.2f %10.2f",
+            name,
+            size,
+            statistics.median(t[0] for t in timings),
+            statistics.median(t[1] for t in timings),
+        )
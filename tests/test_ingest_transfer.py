@@ -0,0 +1,284 @@
+"""Tests for compressed and resumable transfer on /v1/ingest."""
+
+import gzip
+import io
+import json
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+import requests
+
+from myrecall.server.ingest_transfer import (
+    PartialUploadStore,
+    decode_request_body,
+    transfer_stats,
+)
+from myrecall.shared.compression import (
+    GZIP,
+    DecompressionError,
+    choose_encoding,
+    compress,
+    decompress,
+)
+
+_JPEG = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00" * 64
+
+_METADATA = {
+    "timestamp": "2026-03-20T10:00:00Z",
+    "capture_trigger": "click",
+    "device_name": "monitor_1",
+    "app_name": "Safari",
+    "window_name": "Doc " * 200,
+}
+
+
+def _capture_id() -> str:
+    return str(uuid.UUID(int=(uuid.uuid4().int & ~(0xF << 76)) | (0x7 << 76)))
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch):
+    from flask import Flask
+
+    import myrecall.server.api_v1 as api_module
+    from myrecall.server.database.frames_store import FramesStore
+    from myrecall.server.database.migrations_runner import run_migrations
+
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+
+    monkeypatch.setattr(api_module, "_frames_store", FramesStore(db_path=db_path))
+    monkeypatch.setattr(
+        api_module, "_partial_uploads", PartialUploadStore(tmp_path / "uploads")
+    )
+    transfer_stats.reset()
+
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.register_blueprint(api_module.v1_bp)
+    return app.test_client()
+
+
+@pytest.mark.unit
+def test_compression_round_trip_and_bomb_limit():
+    payload = json.dumps(_METADATA).encode()
+    encoded = compress(payload, GZIP)
+    assert len(encoded) < len(payload)
+    assert decompress(encoded, GZIP, len(payload)) == payload
+
+    with pytest.raises(DecompressionError):
+        decompress(compress(b"\0" * 10_000, GZIP), GZIP, 1_000)
+    with pytest.raises(DecompressionError):
+        decompress(b"not gzip", GZIP, 1_000)
+
+
+@pytest.mark.unit
+def test_decode_request_body_caps_wire_size_without_content_length():
+    class _Input(io.BytesIO):
+        def read(self, size=-1):
+            assert size != -1, "unbounded read"
+            return super().read(size)
+
+    def environ(body, **extra):
+        return {"HTTP_CONTENT_ENCODING": "gzip", "wsgi.input": _Input(body), **extra}
+
+    payload = json.dumps(_METADATA).encode()
+    encoded = gzip.compress(payload)
+    env = environ(encoded)
+    assert decode_request_body(env, len(payload)) == len(encoded)
+    assert env["wsgi.input"].read() == payload
+
+    # Incompressible chunked body larger than the limit: rejected before inflating
+    noise = gzip.compress(uuid.uuid4().bytes * 200, compresslevel=0)
+    with pytest.raises(DecompressionError):
+        decode_request_body(environ(noise), 1_000)
+    with pytest.raises(DecompressionError):
+        decode_request_body(environ(noise, CONTENT_LENGTH=str(len(noise))), 1_000)
+
+
+@pytest.mark.unit
+def test_choose_encoding_respects_peer_and_preference():
+    assert choose_encoding("auto", []) is None
+    assert choose_encoding("none", ["gzip"]) is None
+    assert choose_encoding("auto", ["gzip"]) == "gzip"
+    assert choose_encoding("gzip", ["zstd", "gzip"]) == "gzip"
+
+
+@pytest.mark.unit
+def test_capabilities_advertise_gzip_and_resumable(client):
+    body = client.get("/v1/ingest/capabilities").get_json()
+    assert "gzip" in body["metadata_encodings"]
+    assert body["resumable"] is True
+
+
+@pytest.mark.unit
+def test_ingest_accepts_compressed_metadata_part(client):
+    capture_id = _capture_id()
+    response = client.post(
+        "/v1/ingest",
+        data={
+            "capture_id": capture_id,
+            "metadata_encoding": "gzip",
+            "metadata": (
+                io.BytesIO(compress(json.dumps(_METADATA).encode(), GZIP)),
+                "metadata.json",
+            ),
+            "file": (io.BytesIO(_JPEG), "test.jpg", "image/jpeg"),
+        },
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 201
+    transfer = client.get("/v1/ingest/queue/status").get_json()["transfer"]
+    assert transfer["requests"] == 1
+    assert transfer["compressed_requests"] == 1
+    assert transfer["bytes_saved"] > 0
+
+
+@pytest.mark.unit
+def test_ingest_rejects_corrupt_metadata_part(client):
+    response = client.post(
+        "/v1/ingest",
+        data={
+            "capture_id": _capture_id(),
+            "metadata_encoding": "gzip",
+            "metadata": (io.BytesIO(b"garbage"), "metadata.json"),
+            "file": (io.BytesIO(_JPEG), "test.jpg", "image/jpeg"),
+        },
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.unit
+def test_ingest_accepts_gzip_content_encoding(client):
+    capture_id = _capture_id()
+    prepared = requests.Request(
+        "POST",
+        "http://edge/v1/ingest",
+        data={"capture_id": capture_id, "metadata": json.dumps(_METADATA)},
+        files={"file": ("test.jpg", _JPEG, "image/jpeg")},
+    ).prepare()
+
+    response = client.post(
+        "/v1/ingest",
+        data=gzip.compress(prepared.body),
+        headers={
+            "Content-Type": prepared.headers["Content-Type"],
+            "Content-Encoding": "gzip",
+        },
+    )
+
+    assert response.status_code == 201
+    assert response.get_json()["capture_id"] == capture_id
+
+
+@pytest.mark.unit
+def test_resumable_upload_resumes_after_offset_mismatch(client):
+    capture_id = _capture_id()
+    url = f"/v1/ingest/uploads/{capture_id}"
+    half = len(_JPEG) // 2
+
+    assert client.get(url).get_json()["offset"] == 0
+    first = client.patch(url, data=_JPEG[:half], headers={"Upload-Offset": "0"})
+    assert first.get_json()["offset"] == half
+
+    # A retried chunk from a stale offset is refused with the real offset
+    stale = client.patch(url, data=_JPEG[:half], headers={"Upload-Offset": "0"})
+    assert stale.status_code == 409
+    assert stale.get_json()["offset"] == half
+
+    assert client.get(url).get_json()["offset"] == half
+    rest = client.patch(url, data=_JPEG[half:], headers={"Upload-Offset": str(half)})
+    assert rest.get_json()["offset"] == len(_JPEG)
+
+    response = client.post(
+        "/v1/ingest",
+        data={
+            "capture_id": capture_id,
+            "upload_id": capture_id,
+            "metadata": json.dumps(_METADATA),
+        },
+    )
+    assert response.status_code == 201
+    assert client.get(url).get_json()["offset"] == 0
+
+    transfer = client.get("/v1/ingest/queue/status").get_json()["transfer"]
+    assert transfer["chunks_received"] == 2
+    assert transfer["resumed_uploads"] == 1
+
+
+@pytest.mark.unit
+def test_resumable_upload_rejects_oversized_upload(client, monkeypatch):
+    import myrecall.server.api_v1 as api_module
+
+    monkeypatch.setattr(api_module, "_MAX_FILE_SIZE_BYTES", 16)
+    url = f"/v1/ingest/uploads/{_capture_id()}"
+    response = client.patch(url, data=b"x" * 32, headers={"Upload-Offset": "0"})
+    assert response.status_code == 413
+    assert client.get(url).get_json()["offset"] == 0
+
+
+@pytest.mark.unit
+def test_uploader_sends_compressed_metadata_and_chunks(tmp_path: Path, monkeypatch):
+    """upload_capture negotiates via capabilities and streams large JPEGs."""
+    from myrecall.client import v3_uploader
+    from myrecall.client.spool import SpoolItem, SpoolQueue
+
+    class _Response:
+        def __init__(self, status_code, payload):
+            self.status_code = status_code
+            self._payload = payload
+            self.text = ""
+
+        def json(self):
+            return self._payload
+
+    class _Session:
+        def __init__(self):
+            self.stored = b""
+            self.posts = []
+
+        def get(self, url, **kwargs):
+            if url.endswith("/capabilities"):
+                return _Response(200, {"metadata_encodings": ["gzip"], "resumable": True})
+            return _Response(200, {"offset": len(self.stored)})
+
+        def patch(self, url, data, headers, **kwargs):
+            assert int(headers["Upload-Offset"]) == len(self.stored)
+            self.stored += data
+            return _Response(200, {"offset": len(self.stored)})
+
+        def post(self, url, files=None, data=None, **kwargs):
+            self.posts.append((files, data))
+            return _Response(201, {"status": "queued", "frame_id": 1})
+
+    monkeypatch.setattr(v3_uploader, "_ingest_url", lambda: "http://edge/v1/ingest")
+    monkeypatch.setattr(v3_uploader, "_capabilities_cache", {})
+    monkeypatch.setattr(v3_uploader.settings, "upload_chunk_bytes", 100, raising=False)
+    monkeypatch.setattr(v3_uploader.settings, "upload_compression", "gzip", raising=False)
+
+    capture_id = _capture_id()
+    jpg_path = tmp_path / f"{capture_id}.jpg"
+    jpg_path.write_bytes(_JPEG)
+    item = SpoolItem(capture_id=capture_id, jpg_path=jpg_path, metadata=_METADATA)
+
+    session = _Session()
+    result = v3_uploader.upload_capture(
+        item, spool=SpoolQueue(storage_dir=tmp_path), session=session, commit=False
+    )
+
+    assert result.success is True
+    assert session.stored == _JPEG
+    files, data = session.posts[0]
+    assert data["upload_id"] == capture_id
+    assert data["metadata_encoding"] == "gzip"
+    assert "file" not in files
+    assert json.loads(decompress(files["metadata"][1], GZIP, 1 << 20)) == _METADATA
@@ -0,0 +1,102 @@
+"""Tests for fields=/include= projection on the memories endpoints."""
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from myrecall.server import api, api_v1
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+@pytest.fixture
+def client(store, monkeypatch):
+    monkeypatch.setattr(api, "frames_store", store)
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    app = Flask(__name__)
+    app.register_blueprint(api.api_bp, url_prefix="/api")
+    app.register_blueprint(api_v1.v1_bp)
+    return app.test_client()
+
+
+def _insert(store: FramesStore, local_ts: str) -> int:
+    with store._connect() as conn:
+        return conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, local_timestamp, app_name, "
+            "snapshot_path, text_source, accessibility_text, ocr_text, status) "
+            "VALUES (?, ?, ?, 'Editor', 'frame.jpg', 'ocr', ?, ?, 'completed')",
+            (uuid.uuid4().hex, local_ts, local_ts, "ax " * 500, "ocr " * 500),
+        ).lastrowid
+
+
+@pytest.mark.unit
+def test_memories_omit_full_text_by_default(store, client):
+    _insert(store, "2026-03-20T09:00:00.000")
+
+    for url in (
+        "/api/memories/recent",
+        "/api/memories/by-day?date=2026-03-20",
+        "/api/memories/latest?since=2026-03-19T00:00:00",
+    ):
+        (item,) = client.get(url).get_json()
+        assert "ocr_text" not in item and "accessibility_text" not in item, url
+        assert item["ocr_text_length"] == 2000
+        assert item["accessibility_text_length"] == 1500
+
+
+@pytest.mark.unit
+def test_memories_include_returns_requested_text(store, client):
+    _insert(store, "2026-03-20T09:00:00.000")
+
+    (item,) = client.get("/api/memories/recent?include=ocr_text").get_json()
+
+    assert item["ocr_text"] == "ocr " * 500
+    assert "accessibility_text" not in item
+
+
+@pytest.mark.unit
+def test_memories_fields_projection(store, client):
+    frame_id = _insert(store, "2026-03-20T09:00:00.000")
+
+    items = client.get(
+        "/api/memories/by-day?date=2026-03-20&fields=frame_id,timestamp,accessibility_text"
+    ).get_json()
+
+    assert items == [
+        {
+            "frame_id": frame_id,
+            "timestamp": "2026-03-20T09:00:00.000",
+            "accessibility_text": "ax " * 500,
+        }
+    ]
+
+
+@pytest.mark.unit
+def test_frame_text_endpoint(store, client):
+    frame_id = _insert(store, "2026-03-20T09:00:00.000")
+
+    data = client.get(f"/v1/frames/{frame_id}/text").get_json()
+    missing = client.get("/v1/frames/999999/text")
+
+    assert data == {
+        "frame_id": frame_id,
+        "text_source": "ocr",
+        "accessibility_text": "ax " * 500,
+        "ocr_text": "ocr " * 500,
+    }
+    assert missing.status_code == 404
+    assert missing.get_json()["code"] == "NOT_FOUND"
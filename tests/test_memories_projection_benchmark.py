@@ -0,0 +1,78 @@
+"""Memories payload benchmark: default projection vs full text bodies.
+
+Fills a store with frames carrying realistic OCR/accessibility text and
+compares response bytes and latency of /api/memories/recent with the
+default (lazy text) projection, ``include=accessibility_text,ocr_text``
+and a narrow ``fields=`` list.
+
+Run with: pytest -m perf tests/test_memories_projection_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import random
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from myrecall.server import api
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_FRAMES = 1000
+_TEXT_WORDS = 600
+_ROUNDS = 5
+_QUERIES = (
+    ("default", ""),
+    ("include text", "&include=accessibility_text,ocr_text"),
+    ("fields", "&fields=frame_id,timestamp,app_name,status"),
+)
+
+
+def _make_client(tmp_path, monkeypatch):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    rng = random.Random(0)
+    words = "recall search timeline capture invoice terminal browser deploy".split()
+    for i in range(_FRAMES):
+        ts = f"2026-03-20T{9 + i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}.000"
+        text = " ".join(rng.choice(words) for _ in range(_TEXT_WORDS))
+        conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, local_timestamp, app_name, "
+            "snapshot_path, text_source, accessibility_text, ocr_text, status) "
+            "VALUES (?, ?, ?, 'Editor', 'frame.jpg', 'ocr', ?, ?, 'completed')",
+            (uuid.uuid4().hex, ts, ts, text, text),
+        )
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(api, "frames_store", FramesStore(db_path=db_path))
+    app = Flask(__name__)
+    app.register_blueprint(api.api_bp, url_prefix="/api")
+    return app.test_client()
+
+
+def test_memories_projection_benchmark(tmp_path, monkeypatch):
+    client = _make_client(tmp_path, monkeypatch)
+
+    logger.info("projection      avg_kb  ms")
+    for label, query in _QUERIES:
+        url = f"/api/memories/recent?limit={_FRAMES}{query}"
+        client.get(url)
+        start = time.perf_counter()
+        for _ in range(_ROUNDS):
+            body = client.get(url).get_data()
+        elapsed_ms = (time.perf_counter() - start) * 1000 / _ROUNDS
+        logger.info("%-14s %7.1f %5.1f", label, len(body) / 1024, elapsed_ms)
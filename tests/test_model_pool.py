@@ -0,0 +1,151 @@
+"""Tests for the shared local model pool (myrecall.server.ai.model_pool)."""
+
+import threading
+import time
+
+import pytest
+
+from myrecall.server.ai import factory
+from myrecall.server.ai.model_pool import ModelPool, model_key
+
+
+class _FakeModel:
+    def __init__(self, key):
+        self.key = key
+
+    def get_memory_footprint(self):
+        return 1234
+
+
+class _CountingLoader:
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+
+    def __call__(self, key):
+        self.calls.append(key)
+        time.sleep(self.delay)
+        return _FakeModel(key), f"processor:{key[0]}"
+
+
+@pytest.mark.unit
+def test_model_key_follows_device_dtype():
+    assert model_key("m", "cpu") == ("m", "float32", "cpu")
+    assert model_key("m", "cuda") == ("m", "bfloat16", "cuda")
+
+
+@pytest.mark.unit
+def test_same_key_is_loaded_once_and_shared():
+    loader = _CountingLoader()
+    pool = ModelPool(loader=loader)
+
+    vision = pool.acquire("qwen", "cpu")
+    description = pool.acquire("qwen", "cpu")
+
+    assert len(loader.calls) == 1
+    assert vision.model is description.model
+    assert vision.processor == "processor:qwen"
+    assert pool.stats()[0]["refcount"] == 2
+
+
+@pytest.mark.unit
+def test_concurrent_acquire_loads_once():
+    loader = _CountingLoader(delay=0.05)
+    pool = ModelPool(loader=loader)
+    leases = []
+
+    threads = [
+        threading.Thread(target=lambda: leases.append(pool.acquire("qwen", "cpu")))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(loader.calls) == 1
+    assert pool.stats()[0]["refcount"] == 4
+
+
+@pytest.mark.unit
+def test_released_model_stays_warm_for_rebuild():
+    loader = _CountingLoader()
+    pool = ModelPool(loader=loader)
+
+    pool.acquire("qwen", "cpu").release()
+    pool.acquire("qwen", "cpu")
+
+    assert len(loader.calls) == 1
+
+
+@pytest.mark.unit
+def test_release_is_idempotent():
+    pool = ModelPool(loader=_CountingLoader())
+    first = pool.acquire("qwen", "cpu")
+    pool.acquire("qwen", "cpu")
+
+    first.release()
+    first.release()
+
+    assert pool.stats()[0]["refcount"] == 1
+
+
+@pytest.mark.unit
+def test_config_change_evicts_idle_model_before_loading_new_one():
+    loader = _CountingLoader()
+    pool = ModelPool(loader=loader)
+
+    pool.acquire("old", "cpu").release()
+    pool.acquire("new", "cpu")
+
+    assert [s["model_id"] for s in pool.stats()] == ["new"]
+
+
+@pytest.mark.unit
+def test_model_in_use_is_not_evicted_by_other_key():
+    pool = ModelPool(loader=_CountingLoader())
+
+    pool.acquire("a", "cpu")
+    pool.acquire("b", "cpu")
+
+    assert sorted(s["model_id"] for s in pool.stats()) == ["a", "b"]
+
+
+@pytest.mark.unit
+def test_idle_model_expires_after_ttl():
+    pool = ModelPool(loader=_CountingLoader(), idle_ttl=0.0)
+
+    pool.acquire("qwen", "cpu").release()
+
+    assert pool.stats() == []
+
+
+@pytest.mark.unit
+def test_stats_report_load_time_and_memory():
+    pool = ModelPool(loader=_CountingLoader(delay=0.01))
+    pool.acquire("qwen", "cpu")
+
+    (entry,) = pool.stats()
+
+    assert entry["dtype"] == "float32"
+    assert entry["device"] == "cpu"
+    assert entry["memory_bytes"] == 1234
+    assert entry["load_seconds"] >= 0.01
+    assert entry["loaded_at"].endswith("Z")
+
+
+@pytest.mark.unit
+def test_factory_invalidate_closes_dropped_provider():
+    class _Provider:
+        closed = 0
+
+        def close(self):
+            _Provider.closed += 1
+
+    factory._instances["description"] = _Provider()
+    factory._instances["ocr"] = "no-close"
+
+    factory.invalidate()
+
+    assert _Provider.closed == 1
+    assert factory._instances == {}
@@ -0,0 +1,142 @@
+"""Tests for cross-frame batched OCR recognition."""
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+from myrecall.server.ocr.batching import crop_text_line, layout_text, width_buckets
+from myrecall.server.processing import ocr_processor, v3_worker
+from myrecall.server.processing.ocr_processor import (
+    OcrResult,
+    OcrStatus,
+    execute_ocr_batch,
+)
+from myrecall.server.processing.v3_worker import V3ProcessingWorker
+
+
+def _box(x0, y0, x1, y1):
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+
+
+@pytest.mark.unit
+def test_crop_text_line_clamps_and_rotates_tall_boxes():
+    image = np.arange(100 * 200 * 3, dtype=np.uint8).reshape(100, 200, 3)
+
+    wide = crop_text_line(image, _box(-5.2, 10.4, 50.5, 20.1))
+    tall = crop_text_line(image, _box(10, 10, 20, 90))
+
+    assert wide.shape == (11, 51, 3)
+    assert np.array_equal(wide, image[10:21, 0:51])
+    assert tall.shape == (10, 80, 3)
+
+
+@pytest.mark.unit
+def test_width_buckets_group_similar_ratios_up_to_batch_size():
+    crops = [np.zeros((10, w, 3)) for w in (10, 400, 12, 15, 390, 11, 380)]
+
+    buckets = width_buckets(crops, batch_size=2)
+
+    assert sorted(i for bucket in buckets for i in bucket) == list(range(7))
+    assert all(len(bucket) <= 2 for bucket in buckets)
+    for bucket in buckets:
+        widths = [crops[i].shape[1] for i in bucket]
+        assert max(widths) <= 2 * min(widths)
+
+
+@pytest.mark.unit
+def test_layout_text_joins_rows_in_reading_order():
+    boxes = [_box(200, 52, 300, 70), _box(10, 10, 90, 30), _box(10, 50, 150, 70), _box(100, 12, 180, 28)]
+    texts = ["world", "File", "Hello", "Edit"]
+
+    assert layout_text(boxes, texts) == "File Edit\nHello world"
+
+
+@pytest.mark.unit
+def test_execute_ocr_batch_scatters_results_and_isolates_missing_files(tmp_path, monkeypatch):
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"{i}.jpg"
+        Image.new("RGB", (50, 20), "white").save(path)
+        paths.append(str(path))
+    seen = []
+
+    class _Output:
+        def __init__(self, text):
+            self.text = text
+            self.boxes = [_box(0, 0, 1, 1)] if text else []
+
+        def to_json_dict(self):
+            return {"boxes": self.boxes}
+
+    class _Backend:
+        def extract_batch(self, images):
+            seen.append(len(images))
+            return [_Output("first"), _Output("")]
+
+    @contextmanager
+    def backend():
+        yield _Backend()
+
+    monkeypatch.setattr(ocr_processor, "_ocr_backend", backend)
+
+    results = execute_ocr_batch(
+        [(paths[0], 1), (str(tmp_path / "missing.jpg"), 2), (paths[1], 3)]
+    )
+
+    assert seen == [2]
+    assert [r.status for r in results] == [OcrStatus.SUCCESS, OcrStatus.FAILED, OcrStatus.EMPTY_TEXT]
+    assert results[0].text == "first"
+    assert results[0].text_json == {"boxes": [_box(0, 0, 1, 1)]}
+    assert "image_not_found" in results[1].error_reason
+
+
+@pytest.mark.unit
+def test_worker_batch_mode_completes_frames_with_one_ocr_call(tmp_path, monkeypatch):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    store = FramesStore(db_path=db_path)
+    snapshot = tmp_path / "frame.jpg"
+    Image.new("RGB", (50, 20), "white").save(snapshot)
+    frame_ids = []
+    for i, trigger in enumerate(("idle", "BAD", "click")):
+        frame_id, _ = store.claim_frame(
+            capture_id=f"batch-{i}",
+            metadata={"timestamp": "2026-03-17T12:00:00Z", "capture_trigger": trigger},
+        )
+        with store._connect() as c:
+            c.execute(
+                "UPDATE frames SET snapshot_path = ?, capture_trigger = ? WHERE id = ?",
+                (str(snapshot), trigger, frame_id),
+            )
+        frame_ids.append(frame_id)
+    calls = []
+
+    def fake_batch(items):
+        calls.append([frame_id for _, frame_id in items])
+        return [OcrResult(status=OcrStatus.SUCCESS, text=f"text {fid}") for _, fid in items]
+
+    monkeypatch.setattr(v3_worker, "execute_ocr_batch", fake_batch)
+    worker = V3ProcessingWorker(db_path=db_path, concurrency=1, batch_frames=8)
+
+    worker._process_pending_frames()
+
+    assert calls == [[frame_ids[0], frame_ids[2]]]
+    with store._connect() as c:
+        rows = c.execute(
+            "SELECT id, status, full_text FROM frames ORDER BY id"
+        ).fetchall()
+    assert [tuple(r) for r in rows] == [
+        (frame_ids[0], "completed", f"text {frame_ids[0]}"),
+        (frame_ids[1], "failed", None),
+        (frame_ids[2], "completed", f"text {frame_ids[2]}"),
+    ]
@@ -0,0 +1,52 @@
+"""Batched vs per-frame OCR recognition throughput.
+
+OCRs a burst of fixture screenshots three ways: one frame at a time with
+the angle classifier, one frame at a time without it, and through
+``extract_batch`` (per-frame detection, cross-frame width-bucketed
+recognition). Reports frames/second and text lines/second for each. Use
+the result for ``[ocr] use_cls`` / ``batch_frames`` / ``rec_batch_size``.
+
+Run with: pytest -m perf tests/test_ocr_batching_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_FIXTURE = Path(__file__).resolve().parent / "fixtures/images/sample_jpeg.jpg"
+_FRAMES = 8
+
+
+def test_ocr_batched_recognition_throughput():
+    pytest.importorskip("rapidocr")
+    from myrecall.server.ocr.rapid_backend import RapidOCRBackend
+
+    with Image.open(_FIXTURE) as img:
+        images = [img.convert("RGB")] * _FRAMES
+    backend = RapidOCRBackend.create()
+    backend.warmup()
+
+    def per_frame(use_cls):
+        backend.use_cls = use_cls
+        return [backend.extract_text_with_boxes(image) for image in images]
+
+    runs = (
+        ("per-frame cls", lambda: per_frame(True)),
+        ("per-frame no-cls", lambda: per_frame(False)),
+        (f"batched x{_FRAMES}", lambda: backend.extract_batch(images)),
+    )
+    logger.info("%-18s %9s %9s", "mode", "frames/s", "lines/s")
+    for name, run in runs:
+        start = time.perf_counter()
+        outputs = run()
+        elapsed = time.perf_counter() - start
+        lines = sum(len(output.boxes) for output in outputs)
+        logger.info("%-18s %9.2f %9.1f", name, _FRAMES / elapsed, lines / elapsed)
@@ -0,0 +1,85 @@
+"""OCR result commit benchmark: per-step commits vs one transaction.
+
+Commits OCR results for pre-claimed frames through the old per-step path
+(insert_ocr_text, update_text_source, update_frames_ocr_text,
+update_full_text, advance_frame_status, try_set_queryable_standalone --
+one commit each) and through complete_ocr_frame, under WAL with
+synchronous=FULL (the sqlite default) and synchronous=NORMAL, and reports
+committed frames/second.
+
+Run with: pytest -m perf tests/test_ocr_commit_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_FRAMES = 300
+_TEXT = "quarterly roadmap deploy pipeline database migration latency budget " * 40
+
+
+class _SyncStore(FramesStore):
+    def __init__(self, db_path: Path, synchronous: str) -> None:
+        super().__init__(db_path=db_path)
+        self._synchronous = synchronous
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = super()._connect()
+        conn.execute(f"PRAGMA synchronous={self._synchronous}")
+        return conn
+
+
+def _make_store(tmp_path: Path, name: str, synchronous: str) -> tuple[FramesStore, list[int]]:
+    db_path = tmp_path / f"{name}.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    store = _SyncStore(db_path, synchronous)
+    frame_ids = []
+    for i in range(_FRAMES):
+        frame_id, _ = store.claim_frame(
+            capture_id=f"{name}-{i}",
+            metadata={"timestamp": f"2026-03-17T12:{i // 60 % 60:02d}:{i % 60:02d}Z"},
+        )
+        store.advance_frame_status(frame_id, "pending", "processing")
+        frame_ids.append(frame_id)
+    return store, frame_ids
+
+
+def _commit_per_step(store: FramesStore, frame_id: int) -> None:
+    store.insert_ocr_text(frame_id, _TEXT, len(_TEXT), "rapidocr", "Editor", "Budget")
+    store.update_text_source(frame_id, "ocr")
+    store.update_frames_ocr_text(frame_id, _TEXT)
+    store.update_full_text(frame_id, _TEXT)
+    store.advance_frame_status(frame_id, "processing", "completed")
+    store.try_set_queryable_standalone(frame_id)
+
+
+def _commit_once(store: FramesStore, frame_id: int) -> None:
+    store.complete_ocr_frame(frame_id, _TEXT, "rapidocr", "Editor", "Budget")
+
+
+def test_ocr_commit_throughput_benchmark(tmp_path):
+    logger.info("path          synchronous  frames/s")
+    for label, commit in (("per-step", _commit_per_step), ("one-txn", _commit_once)):
+        for synchronous in ("FULL", "NORMAL"):
+            store, frame_ids = _make_store(tmp_path, f"{label}-{synchronous}", synchronous)
+            start = time.perf_counter()
+            for frame_id in frame_ids:
+                commit(store, frame_id)
+            elapsed = time.perf_counter() - start
+            logger.info("%-13s %-12s %8.0f", label, synchronous, len(frame_ids) / elapsed)
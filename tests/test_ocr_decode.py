@@ -0,0 +1,76 @@
+"""Tests for reduced-resolution OCR input decoding."""
+from contextlib import contextmanager
+
+import pytest
+from PIL import Image
+
+from myrecall.server.ocr.decode import load_ocr_image, rescale_boxes
+from myrecall.server.processing import ocr_processor
+from myrecall.server.processing.ocr_processor import OcrStatus, execute_ocr
+
+
+@pytest.mark.unit
+def test_jpeg_is_draft_decoded_no_smaller_than_target(tmp_path):
+    path = tmp_path / "frame.jpg"
+    Image.new("RGB", (5120, 2880), (10, 20, 200)).save(path, quality=95)
+
+    bgr, scale_x, scale_y = load_ocr_image(path, max_side=2000)
+
+    assert bgr.shape == (1440, 2560, 3)
+    assert bgr.flags["C_CONTIGUOUS"]
+    assert (scale_x, scale_y) == (2.0, 2.0)
+    blue, green, red = (int(v) for v in bgr[720, 1280])
+    assert blue > 150 and red < 40
+
+
+@pytest.mark.unit
+def test_full_resolution_when_disabled_small_or_not_jpeg(tmp_path):
+    jpeg = tmp_path / "frame.jpg"
+    png = tmp_path / "frame.png"
+    Image.new("RGB", (3000, 1000), "white").save(jpeg)
+    Image.new("L", (3000, 1000), 128).save(png)
+
+    assert load_ocr_image(jpeg, max_side=0)[0].shape == (1000, 3000, 3)
+    assert load_ocr_image(jpeg, max_side=4000)[1:] == (1.0, 1.0)
+    bgr, scale_x, _ = load_ocr_image(png, max_side=1000)
+    assert bgr.shape == (1000, 3000, 3) and scale_x == 1.0
+
+
+@pytest.mark.unit
+def test_rescale_boxes_maps_back_to_original_coordinates():
+    boxes = [[[1, 2], [3, 2], [3, 4], [1, 4]]]
+
+    assert rescale_boxes(boxes, 1.0, 1.0) is boxes
+    assert rescale_boxes(boxes, 2.0, 4.0) == [[[2, 8], [6, 8], [6, 16], [2, 16]]]
+
+
+@pytest.mark.unit
+def test_execute_ocr_passes_reduced_bgr_and_stores_original_boxes(tmp_path, monkeypatch):
+    path = tmp_path / "frame.jpg"
+    Image.new("RGB", (4000, 2000), "white").save(path)
+    seen = []
+
+    class _Output:
+        text = "hello"
+        boxes = [[[10, 10], [50, 10], [50, 20], [10, 20]]]
+
+        def to_json_dict(self):
+            return {"boxes": self.boxes}
+
+    class _Backend:
+        def extract_text_with_boxes(self, image, vis_output_path=None):
+            seen.append(image.shape)
+            return _Output()
+
+    @contextmanager
+    def backend():
+        yield _Backend()
+
+    monkeypatch.setattr(ocr_processor, "_ocr_backend", backend)
+    monkeypatch.setattr(ocr_processor.settings, "ocr_decode_max_side", 1000, raising=False)
+
+    result = execute_ocr(str(path))
+
+    assert seen == [(500, 1000, 3)]
+    assert result.status == OcrStatus.SUCCESS
+    assert result.text_json["boxes"] == [[[40, 40], [200, 40], [200, 80], [40, 80]]]
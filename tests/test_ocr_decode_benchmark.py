@@ -0,0 +1,67 @@
+"""OCR input decode: full-resolution PIL path vs DCT-scaled BGR decode.
+
+Builds a synthetic 5K (5120x2880) text screenshot JPEG and prepares it as
+OCR engine input two ways: the previous path (full decode, RGB convert,
+NumPy copy, channel flip made contiguous as RapidOCR does) and
+``load_ocr_image`` at the default 2000 px target. Reports mean latency,
+decoded megapixels and peak Python-tracked allocation (NumPy and bytes
+buffers; Pillow's own image memory is not tracked by tracemalloc).
+
+Run with: pytest -m perf tests/test_ocr_decode_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from myrecall.server.ocr.decode import load_ocr_image
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_ROUNDS = 10
+
+
+def _full_resolution(path):
+    with Image.open(path) as img:
+        rgb = img.convert("RGB")
+    return np.ascontiguousarray(np.array(rgb)[:, :, ::-1])
+
+
+def test_ocr_decode_latency_and_memory(tmp_path):
+    path = tmp_path / "frame_5k.jpg"
+    image = Image.new("RGB", (5120, 2880), "white")
+    draw = ImageDraw.Draw(image)
+    for y in range(20, 2880, 40):
+        draw.text((20, y), "MyRecall decode benchmark line " * 12, fill="black")
+    image.save(path, quality=85)
+
+    runs = (
+        ("full decode", lambda: _full_resolution(path)),
+        ("draft 2000", lambda: load_ocr_image(path, 2000)[0]),
+    )
+    logger.info("%-12s %10s %8s %12s", "path", "ms/frame", "MP", "peak_MB")
+    for name, run in runs:
+        run()
+        start = time.perf_counter()
+        for _ in range(_ROUNDS):
+            array = run()
+        latency_ms = (time.perf_counter() - start) / _ROUNDS * 1000
+
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        logger.info(
+            "%-12s %10.1f %8.2f %12.1f",
+            name,
+            latency_ms,
+            array.shape[0] * array.shape[1] / 1e6,
+            peak / 1e6,
+        )
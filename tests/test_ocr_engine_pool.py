@@ -0,0 +1,84 @@
+"""Tests for the OCR engine pool and concurrent V3 worker processing."""
+import queue
+import threading
+import time
+
+import pytest
+
+from myrecall.server.ocr import engine_pool
+from myrecall.server.ocr.engine_pool import EnginePool
+from myrecall.server.processing.v3_worker import V3ProcessingWorker
+
+
+class _FakeEngine:
+    def __init__(self):
+        self.warmed_up = False
+
+    def warmup(self):
+        self.warmed_up = True
+
+
+@pytest.mark.unit
+def test_pool_builds_and_warms_up_each_engine():
+    created = []
+
+    def factory():
+        created.append(_FakeEngine())
+        return created[-1]
+
+    EnginePool(factory, size=3)
+
+    assert len(created) == 3
+    assert all(engine.warmed_up for engine in created)
+    assert not EnginePool(_FakeEngine, size=1, warmup=False)._engines.get().warmed_up
+
+
+@pytest.mark.unit
+def test_pool_hands_out_each_engine_once_and_takes_it_back():
+    pool = EnginePool(_FakeEngine, size=2, warmup=False)
+
+    with pool.acquire() as first, pool.acquire() as second:
+        assert first is not second
+        with pytest.raises(queue.Empty):
+            with pool.acquire(timeout=0.01):
+                pass
+
+    with pytest.raises(RuntimeError):
+        with pool.acquire():
+            raise RuntimeError("ocr failed")
+    with pool.acquire(timeout=0.01), pool.acquire(timeout=0.01):
+        pass
+
+
+@pytest.mark.unit
+def test_no_pool_for_single_engine(monkeypatch):
+    monkeypatch.setattr(engine_pool.settings, "ocr_pool_size", 1, raising=False)
+
+    assert engine_pool.get_ocr_engine_pool() is None
+
+
+@pytest.mark.unit
+def test_worker_processes_frames_concurrently(tmp_path, monkeypatch):
+    worker = V3ProcessingWorker(db_path=tmp_path / "edge.db", concurrency=3)
+    frames = [(i, f"cap-{i}", "idle", "App", "Win", "/x.jpg") for i in range(6)]
+    lock = threading.Lock()
+    active = []
+    peak = [0]
+    done = []
+
+    def process(frame):
+        with lock:
+            active.append(frame[0])
+            peak[0] = max(peak[0], len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(frame[0])
+            done.append(frame[0])
+
+    monkeypatch.setattr(worker, "_fetch_pending_frames", lambda: frames)
+    monkeypatch.setattr(worker, "_process_frame", process)
+
+    worker._process_pending_frames()
+
+    assert sorted(done) == list(range(6))
+    assert peak[0] == 3
@@ -0,0 +1,78 @@
+"""OCR engine pool sweep: (instances x ONNX Runtime threads) throughput.
+
+For every pool size and per-engine intra-op thread count whose product
+fits the host's cores, builds an engine pool, OCRs the fixture
+screenshots concurrently (one in-flight frame per engine) and reports
+frames/second, mean per-frame latency and the throughput-optimal
+configuration. Use the result for ``[ocr] pool_size`` /
+``intra_op_threads``.
+
+Run with: pytest -m perf tests/test_ocr_engine_pool_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from myrecall.server.ocr.engine_pool import EnginePool
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_FIXTURE = Path(__file__).resolve().parent / "fixtures/images/sample_jpeg.jpg"
+_FRAMES_PER_ENGINE = 6
+_POOL_SIZES = (1, 2, 4, 8)
+_THREADS = (1, 2, 4, 8)
+
+
+def test_ocr_engine_pool_sweep(monkeypatch):
+    pytest.importorskip("rapidocr")
+    from myrecall.server.ocr.rapid_backend import RapidOCRBackend
+    from myrecall.shared.config import settings
+
+    with Image.open(_FIXTURE) as img:
+        image = img.convert("RGB")
+    cores = os.cpu_count() or 1
+
+    results = []
+    logger.info("engines threads  frames/s  latency_ms")
+    for size in _POOL_SIZES:
+        for threads in _THREADS:
+            if size * threads > cores:
+                continue
+            monkeypatch.setattr(settings, "ocr_intra_op_threads", threads, raising=False)
+            monkeypatch.setattr(settings, "ocr_inter_op_threads", 1, raising=False)
+            pool = EnginePool(RapidOCRBackend.create, size=size)
+            latencies = []
+
+            def run(_):
+                start = time.perf_counter()
+                with pool.acquire() as backend:
+                    backend.extract_text_with_boxes(image)
+                latencies.append(time.perf_counter() - start)
+
+            frames = size * _FRAMES_PER_ENGINE
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=size) as executor:
+                list(executor.map(run, range(frames)))
+            throughput = frames / (time.perf_counter() - start)
+            latency_ms = sum(latencies) / len(latencies) * 1000
+            results.append((throughput, size, threads, latency_ms))
+            logger.info("%7d %7d %9.2f %11.1f", size, threads, throughput, latency_ms)
+
+    throughput, size, threads, latency_ms = max(results)
+    logger.info(
+        "best on %d cores: pool_size=%d intra_op_threads=%d (%.2f frames/s, %.1f ms/frame)",
+        cores,
+        size,
+        threads,
+        throughput,
+        latency_ms,
+    )
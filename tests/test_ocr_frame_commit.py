@@ -0,0 +1,105 @@
+"""Tests for FramesStore.complete_ocr_frame (single-transaction OCR commit)."""
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+def _processing_frame(store: FramesStore, capture_id: str, **statuses) -> int:
+    frame_id, _ = store.claim_frame(
+        capture_id=capture_id,
+        metadata={"timestamp": "2026-03-17T12:00:00Z", "app_name": "Editor"},
+    )
+    assert store.advance_frame_status(frame_id, "pending", "processing")
+    if statuses:
+        assignments = ", ".join(f"{column} = ?" for column in statuses)
+        with store._connect() as conn:
+            conn.execute(
+                f"UPDATE frames SET {assignments} WHERE id = ?",
+                (*statuses.values(), frame_id),
+            )
+    return frame_id
+
+
+@pytest.mark.unit
+def test_complete_ocr_frame_writes_everything_in_one_commit(store):
+    frame_id = _processing_frame(
+        store, "ocr-commit-1", description_status="completed", embedding_status="completed"
+    )
+
+    assert store.complete_ocr_frame(
+        frame_id=frame_id,
+        text="quarterly invoice",
+        ocr_engine="rapidocr",
+        app_name="Editor",
+        window_name="Budget",
+        text_json='{"boxes": [[[0, 0], [1, 0], [1, 1], [0, 1]]]}',
+    )
+
+    with store._connect() as conn:
+        frame = conn.execute(
+            "SELECT status, text_source, ocr_text, full_text, processed_at, visibility_status "
+            "FROM frames WHERE id = ?",
+            (frame_id,),
+        ).fetchone()
+        ocr = conn.execute(
+            "SELECT text, text_length, window_name FROM ocr_text WHERE frame_id = ?",
+            (frame_id,),
+        ).fetchone()
+        fts = conn.execute(
+            "SELECT rowid FROM frames_fts WHERE frames_fts MATCH 'invoice'"
+        ).fetchall()
+
+    assert frame["status"] == "completed"
+    assert frame["text_source"] == "ocr"
+    assert frame["ocr_text"] == frame["full_text"] == "quarterly invoice"
+    assert frame["processed_at"]
+    assert frame["visibility_status"] == "queryable"
+    assert tuple(ocr) == ("quarterly invoice", 17, "Budget")
+    assert [row[0] for row in fts] == [frame_id]
+    assert store.get_ocr_boxes(frame_id) == {"boxes": [[[0, 0], [1, 0], [1, 1], [0, 1]]]}
+
+
+@pytest.mark.unit
+def test_complete_ocr_frame_leaves_visibility_pending_until_all_stages(store):
+    frame_id = _processing_frame(store, "ocr-commit-2")
+
+    assert store.complete_ocr_frame(frame_id, "hello", "rapidocr", "Editor", None)
+
+    with store._connect() as conn:
+        row = conn.execute(
+            "SELECT status, visibility_status FROM frames WHERE id = ?", (frame_id,)
+        ).fetchone()
+    assert tuple(row) == ("completed", "pending")
+
+
+@pytest.mark.unit
+def test_complete_ocr_frame_writes_nothing_unless_processing(store):
+    frame_id, _ = store.claim_frame(
+        capture_id="ocr-commit-3", metadata={"timestamp": "2026-03-17T12:00:00Z"}
+    )
+
+    assert not store.complete_ocr_frame(frame_id, "hello", "rapidocr", None, None)
+
+    assert not store.check_ocr_text_exists(frame_id)
+    with store._connect() as conn:
+        row = conn.execute(
+            "SELECT status, full_text FROM frames WHERE id = ?", (frame_id,)
+        ).fetchone()
+    assert row["status"] == "pending"
+    assert not row["full_text"]
@@ -0,0 +1,85 @@
+"""OCR visualization benchmark: eager per-frame vis vs on-demand rendering.
+
+Times ``execute_ocr`` on synthetic screenshots with ``ocr_vis_eager`` off
+(the default) and on, and reports what a lazy render costs when a frame's
+overlay is actually opened (first view, then a cache hit).
+
+Run with: pytest -m perf tests/test_ocr_vis_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import random
+import time
+
+import pytest
+from PIL import Image, ImageDraw
+
+from myrecall.server.ocr.visualization import OcrVisCache, render_ocr_visualization
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_SCREEN_SIZE = (2560, 1440)
+_FRAMES = 5
+_WORDS = "recall search timeline capture invoice terminal browser deploy".split()
+
+
+def _render_screens(tmp_path) -> list[str]:
+    rng = random.Random(0)
+    paths = []
+    for i in range(_FRAMES):
+        image = Image.new("RGB", _SCREEN_SIZE, "white")
+        draw = ImageDraw.Draw(image)
+        for y in range(20, _SCREEN_SIZE[1] - 20, 28):
+            draw.text((20, y), " ".join(rng.choice(_WORDS) for _ in range(20)), fill="black")
+        path = tmp_path / f"screen_{i}.jpg"
+        image.save(path, "JPEG", quality=85)
+        paths.append(str(path))
+    return paths
+
+
+def _synthetic_boxes() -> dict:
+    boxes = []
+    for y in range(20, _SCREEN_SIZE[1] - 20, 28):
+        boxes.append([[20, y], [900, y], [900, y + 14], [20, y + 14]])
+    return {"boxes": boxes, "texts": ["x"] * len(boxes), "scores": [1.0] * len(boxes)}
+
+
+def test_ocr_stage_eager_vis_benchmark(tmp_path, monkeypatch):
+    pytest.importorskip("rapidocr")
+    from myrecall.server.processing.ocr_processor import execute_ocr
+    from myrecall.shared.config import settings
+
+    monkeypatch.setattr(settings, "server_data_dir", tmp_path)
+    paths = _render_screens(tmp_path)
+    execute_ocr(paths[0])  # warm up the engine
+
+    logger.info("eager_vis  avg_ms  vis_kb")
+    for eager in (False, True):
+        monkeypatch.setattr(settings, "ocr_vis_eager", eager, raising=False)
+        start = time.perf_counter()
+        for frame_id, path in enumerate(paths, start=1):
+            execute_ocr(path, frame_id=frame_id)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / len(paths)
+        vis_bytes = sum(p.stat().st_size for p in (tmp_path / "ocr_vis").glob("*.jpg")) if eager else 0
+        logger.info("%-9s %7.1f %7.1f", eager, elapsed_ms, vis_bytes / 1024 / len(paths))
+
+
+def test_lazy_ocr_vis_render_benchmark(tmp_path):
+    paths = _render_screens(tmp_path)
+    boxes = _synthetic_boxes()
+    cache = OcrVisCache(tmp_path / "ocr_vis", max_bytes=256 * 1024 * 1024)
+
+    start = time.perf_counter()
+    for frame_id, path in enumerate(paths, start=1):
+        cache.put(frame_id, render_ocr_visualization(path, boxes))
+    render_ms = (time.perf_counter() - start) * 1000 / len(paths)
+
+    start = time.perf_counter()
+    for frame_id in range(1, len(paths) + 1):
+        cache.get(frame_id).read_bytes()
+    hit_ms = (time.perf_counter() - start) * 1000 / len(paths)
+
+    logger.info("lazy first view %.1f ms, cached view %.2f ms", render_ms, hit_ms)
@@ -0,0 +1,126 @@
+"""Tests for on-demand OCR visualization rendering and its LRU disk cache."""
+import io
+import json
+import os
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from PIL import Image
+
+from myrecall.server import api_v1
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+from myrecall.server.ocr.visualization import OcrVisCache, render_ocr_visualization
+
+_BOXES = {
+    "boxes": [[[10, 10], [90, 10], [90, 30], [10, 30]]],
+    "texts": ["hello"],
+    "scores": [0.99],
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return OcrVisCache(tmp_path / "ocr_vis", max_bytes=10 * 1024 * 1024)
+
+
+@pytest.fixture
+def client(store, cache, monkeypatch):
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    monkeypatch.setattr(api_v1, "get_ocr_vis_cache", lambda: cache)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    return app.test_client()
+
+
+def _snapshot(tmp_path: Path) -> Path:
+    path = tmp_path / "frame.jpg"
+    Image.new("RGB", (200, 100), "white").save(path, "JPEG")
+    return path
+
+
+def _insert(store: FramesStore, snapshot: Path, text_json=_BOXES) -> int:
+    with store._connect() as conn:
+        frame_id = conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, snapshot_path, status) "
+            "VALUES (?, '2026-03-20T09:00:00Z', ?, 'completed')",
+            (uuid.uuid4().hex, str(snapshot)),
+        ).lastrowid
+        if text_json is not None:
+            conn.execute(
+                "INSERT INTO ocr_text (frame_id, text, text_length, text_json, ocr_engine) "
+                "VALUES (?, 'hello', 5, ?, 'rapidocr')",
+                (frame_id, json.dumps(text_json)),
+            )
+    return frame_id
+
+
+@pytest.mark.unit
+def test_render_draws_boxes_over_snapshot(tmp_path):
+    data = render_ocr_visualization(str(_snapshot(tmp_path)), _BOXES)
+
+    with Image.open(io.BytesIO(data)) as img:
+        assert img.format == "JPEG"
+        assert img.size == (200, 100)
+        assert img.getpixel((10, 20)) != (255, 255, 255)
+        assert img.getpixel((150, 80)) == (255, 255, 255)
+
+
+@pytest.mark.unit
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = OcrVisCache(tmp_path / "ocr_vis", max_bytes=250)
+    cache.put(1, b"a" * 100)
+    cache.put(2, b"b" * 100)
+    os.utime(cache.path_for(1), (1, 1))
+    os.utime(cache.path_for(2), (2, 2))
+    assert cache.get(1) is not None  # touch: 2 becomes least recent
+
+    cache.put(3, b"c" * 100)
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+    assert cache.get(3) is not None
+
+
+@pytest.mark.unit
+def test_ocr_vis_renders_lazily_then_serves_from_cache(tmp_path, store, cache, client):
+    frame_id = _insert(store, _snapshot(tmp_path))
+    assert cache.get(frame_id) is None
+
+    first = client.get(f"/v1/frames/{frame_id}/ocr-vis")
+
+    assert first.status_code == 200
+    assert first.mimetype == "image/jpeg"
+    assert cache.get(frame_id).read_bytes() == first.data
+
+    with store._connect() as conn:
+        conn.execute("DELETE FROM ocr_text WHERE frame_id = ?", (frame_id,))
+    second = client.get(f"/v1/frames/{frame_id}/ocr-vis")
+    assert second.status_code == 200
+    assert second.data == first.data
+
+
+@pytest.mark.unit
+def test_ocr_vis_not_found_without_boxes_or_snapshot(tmp_path, store, client):
+    no_boxes = _insert(store, _snapshot(tmp_path), text_json=None)
+    no_file = _insert(store, tmp_path / "missing.jpg")
+
+    for frame_id in (no_boxes, no_file, 999999):
+        response = client.get(f"/v1/frames/{frame_id}/ocr-vis")
+        assert response.status_code == 404
+        assert response.get_json()["code"] == "NOT_FOUND"
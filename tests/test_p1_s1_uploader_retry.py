@@ -1,11 +1,17 @@
 import threading
+import time
 from pathlib import Path
 from typing import Any
 
 import pytest
 
 from myrecall.client.spool import SpoolItem, SpoolQueue
-from myrecall.client.v3_uploader import SpoolUploader, UploadResult, upload_capture
+from myrecall.client.v3_uploader import (
+    AdaptiveConcurrency,
+    SpoolUploader,
+    UploadResult,
+    upload_capture,
+)
 
 
 class _FakeResponse:
@@ -71,7 +77,7 @@ def test_spool_uploader_uses_single_wait_for_retry_after(tmp_path: Path, monkeyp
 
     calls = {"n": 0}
 
-    def _fake_upload_capture(_item, spool=None):
+    def _fake_upload_capture(_item, spool=None, **_kwargs):
         calls["n"] += 1
         if calls["n"] == 1:
             return UploadResult(success=False, retry_after=3, apply_backoff=False)
@@ -87,3 +93,103 @@ def test_spool_uploader_uses_single_wait_for_retry_after(tmp_path: Path, monkeyp
     assert calls["n"] == 2
     assert event.wait_calls == [3.0]
     assert uploader._retry_count == 0
+
+
+@pytest.mark.unit
+def test_upload_capture_uses_shared_session_and_skips_commit(tmp_path: Path, monkeypatch):
+    item = _make_item(tmp_path, capture_id="c3")
+    spool = SpoolQueue(storage_dir=tmp_path)
+    commits: list[str] = []
+    monkeypatch.setattr(spool, "commit", lambda capture_id: commits.append(capture_id))
+
+    class _Session:
+        calls = 0
+
+        def get(self, *args, **kwargs):
+            # Legacy edge without /v1/ingest/capabilities
+            return _FakeResponse(404)
+
+        def post(self, *args, **kwargs):
+            _Session.calls += 1
+            return _FakeResponse(201, {"status": "queued", "frame_id": 1})
+
+    def _should_not_post(*args, **kwargs):
+        raise AssertionError("module-level requests.post should not be used")
+
+    monkeypatch.setattr("myrecall.client.v3_uploader.requests.post", _should_not_post)
+    monkeypatch.setattr(
+        "myrecall.client.v3_uploader._ingest_url", lambda: "http://edge/v1/ingest"
+    )
+
+    result = upload_capture(item, spool=spool, session=_Session(), commit=False)
+
+    assert result.success is True
+    assert result.bytes_sent > 0
+    assert _Session.calls == 1
+    assert commits == []
+
+
+@pytest.mark.unit
+def test_spool_uploader_commits_in_capture_order(tmp_path: Path, monkeypatch):
+    items = [_make_item(tmp_path, capture_id=f"c{i}") for i in range(4)]
+    spool = SpoolQueue(storage_dir=tmp_path)
+    pending = list(items)
+    monkeypatch.setattr(spool, "get_pending", lambda limit=1: pending[:limit])
+    commits: list[str] = []
+
+    def _commit(capture_id):
+        commits.append(capture_id)
+        pending[:] = [i for i in pending if i.capture_id != capture_id]
+
+    monkeypatch.setattr(spool, "commit", _commit)
+    event = threading.Event()
+    uploader = SpoolUploader(spool=spool, stop_event=event, concurrency=4)
+    release_first = threading.Event()
+
+    def _fake_upload_capture(item, spool=None, **_kwargs):
+        # The oldest capture finishes last; commits must still be ordered.
+        if item.capture_id == "c0":
+            release_first.wait(timeout=2.0)
+        elif item.capture_id == "c3":
+            release_first.set()
+        return UploadResult(success=True, apply_backoff=False, elapsed_ms=5.0)
+
+    monkeypatch.setattr(
+        "myrecall.client.v3_uploader.upload_capture", _fake_upload_capture
+    )
+
+    thread = threading.Thread(target=uploader.run)
+    thread.start()
+    deadline = time.time() + 5.0
+    while len(commits) < 4 and time.time() < deadline:
+        time.sleep(0.01)
+    event.set()
+    thread.join(timeout=5.0)
+
+    assert commits == ["c0", "c1", "c2", "c3"]
+    stats = uploader.stats.get_and_reset()
+    assert stats["frames"] == 4
+    assert stats["rtt_avg_ms"] == 5
+
+
+@pytest.mark.unit
+def test_adaptive_concurrency_aimd():
+    limiter = AdaptiveConcurrency(max_limit=8)
+    assert limiter.limit == 8
+
+    limiter.on_overload()
+    assert limiter.limit == 4
+
+    for _ in range(20):
+        limiter.on_success(elapsed_ms=40.0)
+    assert limiter.limit > 4
+
+    limiter.on_error()
+    assert limiter.limit == 1
+
+    # Latency far above the best RTT observed is treated as congestion
+    for _ in range(10):
+        limiter.on_success(elapsed_ms=40.0)
+    before = limiter.limit
+    limiter.on_success(elapsed_ms=2000.0)
+    assert limiter.limit <= before
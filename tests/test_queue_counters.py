@@ -0,0 +1,95 @@
+"""Tests for trigger-maintained queue counters (queue_counters table)."""
+import random
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+_MIGRATIONS = Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations"
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+def _group_by(conn: sqlite3.Connection, table: str) -> dict[str, int]:
+    counts = {"pending": 0, "processing": 0, "completed": 0, "failed": 0}
+    for status, count in conn.execute(f"SELECT status, COUNT(*) FROM {table} GROUP BY status"):
+        counts[status] = count
+    return counts
+
+
+def _frames(store: FramesStore, count: int) -> list[int]:
+    return [
+        store.claim_frame(
+            capture_id=f"cap-{i}",
+            metadata={"timestamp": f"2026-03-20T10:00:{i:02d}Z", "app_name": "App"},
+        )[0]
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+def test_frame_counters_follow_inserts_transitions_and_deletes(store):
+    frame_ids = _frames(store, 4)
+    store.advance_frame_status(frame_ids[0], "pending", "processing")
+    store.advance_frame_status(frame_ids[0], "processing", "completed")
+    store.advance_frame_status(frame_ids[1], "pending", "processing")
+    with store._connect() as conn:
+        conn.execute("DELETE FROM frames WHERE id = ?", (frame_ids[2],))
+
+    assert store.get_queue_counts() == {"pending": 1, "processing": 1, "completed": 1, "failed": 0}
+    assert store.get_pending_count() == 1
+
+
+@pytest.mark.unit
+def test_task_counters_match_group_by_after_random_transitions(store):
+    frame_ids = _frames(store, 30)
+    rng = random.Random(7)
+    with store._connect() as conn:
+        for frame_id in frame_ids:
+            store.insert_description_task(conn, frame_id)
+            store.insert_embedding_task(conn, frame_id)
+        for _ in range(200):
+            table = rng.choice(["description_tasks", "embedding_tasks"])
+            conn.execute(
+                f"UPDATE {table} SET status = ? WHERE frame_id = ?",
+                (rng.choice(["pending", "processing", "completed", "failed"]), rng.choice(frame_ids)),
+            )
+        conn.execute("DELETE FROM embedding_tasks WHERE frame_id = ?", (frame_ids[0],))
+
+    with store._connect() as conn:
+        assert store.get_description_queue_status(conn) == _group_by(conn, "description_tasks")
+        assert store.get_embedding_queue_status(conn) == _group_by(conn, "embedding_tasks")
+        assert store.get_queue_counts() == _group_by(conn, "frames")
+
+
+@pytest.mark.unit
+def test_migration_seeds_counters_from_existing_rows(tmp_path):
+    db_path = tmp_path / "edge.db"
+    seed_dir = tmp_path / "migrations"
+    seed_dir.mkdir()
+    for sql in _MIGRATIONS.glob("*.sql"):
+        if sql.name < "20260503000000":
+            (seed_dir / sql.name).write_text(sql.read_text())
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, seed_dir)
+    conn.close()
+
+    store = FramesStore(db_path=db_path)
+    frame_ids = _frames(store, 3)
+    store.advance_frame_status(frame_ids[0], "pending", "processing")
+
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    conn.close()
+
+    assert store.get_queue_counts() == {"pending": 2, "processing": 1, "completed": 0, "failed": 0}
@@ -7,11 +7,14 @@ Usage:
 
 import sqlite3
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
 import requests
+from flask import Flask
 
+from myrecall.server import api_v1, recovery
 from myrecall.server.database.frames_store import FramesStore
 
 BASE_URL = "http://localhost:8083"
@@ -214,17 +217,86 @@ class TestResetFailedFrames:
             assert task["retry_count"] == 3  # Incremented from 2 to 3
 
 
+    def test_reset_in_chunks_matches_single_pass(self, temp_store):
+        """Chunked reset should reset every failed stage exactly once."""
+        stages = [("failed", "completed", "completed"), ("completed", "failed", "completed"),
+                  ("completed", "completed", "failed"), ("completed", "failed", "failed")]
+        with temp_store._connect() as conn:
+            for i in range(23):
+                status, desc, embed = stages[i % len(stages)]
+                conn.execute(
+                    "INSERT INTO frames (id, frame_id, status, description_status, embedding_status, "
+                    "visibility_status) VALUES (?, ?, ?, ?, ?, ?)",
+                    (i + 1, f"f-{i}", status, desc, embed, "failed" if i % 5 else "queryable"),
+                )
+            conn.execute(
+                "INSERT INTO description_tasks (frame_id, status, retry_count) VALUES (2, 'failed', 1)"
+            )
+            conn.commit()
+
+        result = temp_store.reset_failed_frames(batch_size=4)
+
+        assert result["total"] == 18
+        assert result["breakdown"] == {"ocr": 4, "description": 9, "embedding": 9}
+        with temp_store._connect() as conn:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM frames WHERE visibility_status = 'failed'"
+            ).fetchone()[0] == 0
+            assert conn.execute("SELECT COUNT(*) FROM description_tasks").fetchone()[0] == 9
+            assert conn.execute("SELECT COUNT(*) FROM embedding_tasks").fetchone()[0] == 9
+            task = conn.execute(
+                "SELECT status, retry_count FROM description_tasks WHERE frame_id = 2"
+            ).fetchone()
+            assert (task["status"], task["retry_count"]) == ("pending", 2)
+            # Queryable frames are not touched even if a stage is marked failed
+            row = conn.execute("SELECT description_status FROM frames WHERE id = 6").fetchone()
+            assert row["description_status"] == "failed"
+
+    def test_retry_failed_endpoint_runs_async_job(self, temp_store, monkeypatch):
+        """POST starts a chunked recovery job whose progress can be polled."""
+        monkeypatch.setattr(api_v1, "_get_frames_store", lambda: temp_store)
+        monkeypatch.setattr(recovery.settings, "recovery_batch_size", 2, raising=False)
+        monkeypatch.setattr(recovery.settings, "recovery_batch_pause_ms", 0, raising=False)
+        app = Flask(__name__)
+        app.register_blueprint(api_v1.v1_bp)
+        client = app.test_client()
+        with temp_store._connect() as conn:
+            for i in range(5):
+                conn.execute(
+                    "INSERT INTO frames (frame_id, status, visibility_status) "
+                    "VALUES (?, 'failed', 'failed')",
+                    (f"f-{i}",),
+                )
+            conn.commit()
+
+        resp = client.post("/v1/admin/frames/retry-failed")
+
+        assert resp.status_code == 202
+        job = resp.get_json()
+        assert job["total"] == 5 and "request_id" in job
+        for _ in range(100):
+            status = client.get(f"/v1/admin/frames/retry-failed/{job['job_id']}").get_json()
+            if status["status"] != "running":
+                break
+            time.sleep(0.02)
+        assert status["status"] == "completed"
+        assert status["reset_count"] == 5 and status["breakdown"]["ocr"] == 5
+        assert status["batches"] == 3 and status["progress"] == 1.0
+        assert client.get("/v1/admin/frames/retry-failed/nope").status_code == 404
+
+
 @pytest.mark.integration
 class TestRetryFailedFramesAPI:
     """Integration tests for POST /v1/admin/frames/retry-failed."""
 
     def test_retry_failed_returns_success(self):
-        """API should return success with counts."""
+        """API should start a recovery job and return it."""
         resp = requests.post(f"{API_V1}/admin/frames/retry-failed", timeout=5)
 
-        assert resp.status_code == 200
+        assert resp.status_code == 202
         data = resp.json()
         assert "message" in data
+        assert "job_id" in data
         assert "reset_count" in data
         assert "breakdown" in data
         assert "request_id" in data
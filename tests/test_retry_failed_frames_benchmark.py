@@ -0,0 +1,70 @@
+"""Failed-frame recovery: write-lock hold time, one pass vs chunked.
+
+Seeds 20k failed frames (a provider outage: description and embedding
+failed, some with an existing failed task) and resets them once as a
+single chunk and once in chunks of 500. Reports total time and the
+longest single transaction, which is how long ingest can be blocked.
+
+Run with: pytest -m perf tests/test_retry_failed_frames_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_MIGRATIONS = Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations"
+_FRAMES = 20000
+
+
+def _seed(tmp_path, name):
+    db_path = tmp_path / f"{name}.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    for i in range(_FRAMES):
+        frame_id = conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, status, description_status, "
+            "embedding_status, visibility_status) "
+            "VALUES (?, '2026-03-20T09:00:00Z', 'completed', 'failed', 'failed', 'failed')",
+            (uuid.uuid4().hex,),
+        ).lastrowid
+        if i % 3 == 0:
+            conn.execute(
+                "INSERT INTO description_tasks (frame_id, status) VALUES (?, 'failed')",
+                (frame_id,),
+            )
+    conn.commit()
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+def _recover(store, batch_size):
+    longest, after_id = 0.0, 0
+    start = time.perf_counter()
+    while True:
+        frame_ids = store.find_failed_frame_ids(batch_size, after_id)
+        if not frame_ids:
+            break
+        after_id = frame_ids[-1]
+        chunk_start = time.perf_counter()
+        store.reset_failed_frame_chunk(frame_ids)
+        longest = max(longest, time.perf_counter() - chunk_start)
+    return time.perf_counter() - start, longest
+
+
+def test_recovery_lock_hold(tmp_path):
+    logger.info("mode              total s   longest txn ms")
+    for name, batch_size in (("single pass", _FRAMES), ("chunks of 500", 500)):
+        total, longest = _recover(_seed(tmp_path, name.replace(" ", "_")), batch_size)
+        logger.info("%-14s %10.2f %14.1f", name, total, longest * 1000)
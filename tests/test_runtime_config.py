@@ -160,3 +160,60 @@ def test_dedup_defaults_reset(tmp_path):
     store.set("dedup.threshold", "99")
     store.reset_to_defaults()
     assert store.get("dedup.threshold") == "10"
+
+
+# ---------------------------------------------------------------------------
+# In-memory snapshot
+# ---------------------------------------------------------------------------
+
+def test_snapshot_is_reused_without_sqlite_reads(fresh_runtime_config, monkeypatch):
+    """Repeated getter calls should not touch SQLite once the snapshot is built."""
+    store = runtime_config._get_store()
+    first = runtime_config.get_snapshot()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unexpected SQLite read")
+
+    monkeypatch.setattr(store, "get_all", fail)
+    monkeypatch.setattr(store, "get", fail)
+    for _ in range(100):
+        assert runtime_config.get_dedup_threshold() == 10
+        assert runtime_config.get_upload_enabled() is True
+    assert runtime_config.get_snapshot() is first
+
+
+def test_snapshot_reloads_after_write_from_other_store(fresh_runtime_config, tmp_path):
+    """Writes through another store instance on the same db bump the version."""
+    before = runtime_config.get_snapshot()
+    other = ClientSettingsStore(tmp_path / "client" / "client.db")
+    other.set("recording_enabled", "false")
+
+    after = runtime_config.get_snapshot()
+    assert after is not before
+    assert after.version > before.version
+    assert runtime_config.get_recording_enabled() is False
+
+
+def test_snapshot_reloads_after_notify(fresh_runtime_config, monkeypatch):
+    """notify_config_changed() forces a reload even without a version change."""
+    before = runtime_config.get_snapshot()
+    runtime_config.notify_config_changed()
+    assert runtime_config.get_snapshot() is not before
+
+
+def test_snapshot_is_immutable(fresh_runtime_config):
+    import dataclasses
+
+    snapshot = runtime_config.get_snapshot()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.dedup_threshold = 1
+
+
+def test_invalid_value_falls_back_to_toml(fresh_runtime_config):
+    store = runtime_config._get_store()
+    store.set("dedup.threshold", "not-a-number")
+    from myrecall.shared.config import settings
+
+    assert runtime_config.get_dedup_threshold() == getattr(
+        settings, "simhash_dedup_threshold", 10
+    )
@@ -0,0 +1,139 @@
+"""Server startup import cost: budget, heavy-module guard and importtime report.
+
+Importing the edge app must not load local ML stacks (torch, transformers,
+sentence_transformers, rapidocr, lancedb); providers pull those in only when
+selected. Measurements run in a fresh interpreter via ``python -X importtime``.
+
+Full report: pytest -m perf tests/test_server_startup_imports.py -s
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_HEAVY_MODULES = (
+    "torch",
+    "transformers",
+    "sentence_transformers",
+    "qwen_vl_utils",
+    "rapidocr",
+    "lancedb",
+)
+# Generous on purpose: catches an ML stack sneaking back in (seconds),
+# not normal jitter. Override with MYRECALL_STARTUP_BUDGET_MS.
+_STARTUP_BUDGET_MS = int(os.environ.get("MYRECALL_STARTUP_BUDGET_MS", "5000"))
+
+_BOOTSTRAP = textwrap.dedent(
+    """
+    import json, sys, time
+    from pathlib import Path
+    from myrecall.server.config_server import ServerSettings
+    import myrecall.shared.config
+
+    data_dir = Path(sys.argv[1])
+    myrecall.shared.config.settings = ServerSettings(
+        paths_data_dir=data_dir, paths_cache_dir=data_dir / "cache"
+    )
+    started = time.perf_counter()
+    import myrecall.server.app
+    import myrecall.server.ai.factory
+    import myrecall.server.description.worker
+    import myrecall.server.embedding.worker
+    import myrecall.server.processing.v3_worker
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(json.dumps({"elapsed_ms": elapsed_ms, "modules": sorted(sys.modules)}))
+    """
+)
+
+
+def _run_startup(tmp_path: Path, importtime: bool = False) -> subprocess.CompletedProcess:
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _BOOTSTRAP, str(tmp_path / "server")]
+    env = dict(os.environ, PYTHONPATH=str(_REPO_ROOT))
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, env=env, cwd=tmp_path, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result
+
+
+def _parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """Return (self_us, cumulative_us, module) rows from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+@pytest.mark.unit
+def test_server_startup_skips_ml_stacks_and_meets_budget(tmp_path: Path):
+    import json
+
+    report = json.loads(_run_startup(tmp_path).stdout.strip().splitlines()[-1])
+
+    loaded = [m for m in _HEAVY_MODULES if m in report["modules"]]
+    assert loaded == [], f"startup imported heavy modules: {loaded}"
+    assert report["elapsed_ms"] < _STARTUP_BUDGET_MS
+
+
+@pytest.mark.unit
+def test_unknown_provider_raises_config_error():
+    from myrecall.server.ai import factory
+    from myrecall.server.ai.base import AIProviderConfigError
+
+    with pytest.raises(AIProviderConfigError, match="Unknown OCR provider: nope"):
+        factory._load_provider_class("ocr", "nope")
+
+
+@pytest.mark.unit
+def test_registered_provider_module_is_imported_on_selection(tmp_path, monkeypatch):
+    from myrecall.server.ai import factory
+
+    (tmp_path / "fake_ocr_backend.py").write_text(
+        "from myrecall.server.ai.base import OCRProvider\n"
+        "class FakeOCR(OCRProvider):\n"
+        "    def __init__(self, api_key, model_name, api_base):\n"
+        "        self.model_name = model_name\n"
+        "    def extract_text(self, image_path):\n"
+        "        return 'fake'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(factory._PROVIDER_REGISTRY, "ocr", dict(factory._PROVIDER_REGISTRY["ocr"]))
+    monkeypatch.setattr(factory, "_resolve_ocr_config", lambda: ("fake", "m", "", ""))
+
+    factory.register_provider("ocr", "fake", "fake_ocr_backend:FakeOCR")
+    assert "fake_ocr_backend" not in sys.modules
+    try:
+        provider = factory.get_ocr_provider()
+        assert provider.model_name == "m"
+        assert provider.extract_text("x.jpg") == "fake"
+        assert "fake_ocr_backend" in sys.modules
+    finally:
+        factory.invalidate("ocr")
+        sys.modules.pop("fake_ocr_backend", None)
+
+
+@pytest.mark.perf
+def test_server_startup_importtime_report(tmp_path: Path):
+    rows = _parse_importtime(_run_startup(tmp_path, importtime=True).stderr)
+    app_cumulative = max(cum for _, cum, name in rows if name == "myrecall.server.app")
+
+    logger.info("myrecall.server.app cumulative import: %.0f ms", app_cumulative / 1000)
+    logger.info("Top self-time imports:")
+    for self_us, cumulative_us, name in sorted(rows, reverse=True)[:20]:
+        logger.info("  %8.1f ms self %8.1f ms cum  %s", self_us / 1000, cumulative_us / 1000, name)
+
+    assert app_cumulative / 1000 < _STARTUP_BUDGET_MS
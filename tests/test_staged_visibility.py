@@ -0,0 +1,151 @@
+"""Tests for staged search visibility (processing.visibility_mode = "staged")."""
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+from myrecall.server.search import visibility
+from myrecall.server.search.engine import SearchEngine
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+@pytest.fixture
+def staged(monkeypatch):
+    monkeypatch.setattr(visibility.settings, "processing_visibility_mode", "staged", raising=False)
+
+
+def _ocr_done_frame(store: FramesStore, capture_id: str, text: str) -> int:
+    """A frame whose OCR finished but whose description/embedding are pending."""
+    frame_id, _ = store.claim_frame(
+        capture_id=capture_id,
+        metadata={"timestamp": "2026-03-20T10:00:00Z", "app_name": "Editor"},
+    )
+    with store._connect() as conn:
+        conn.execute(
+            "UPDATE frames SET full_text = ?, text_source = 'ocr', local_timestamp = ?, "
+            "description_status = 'pending', embedding_status = 'pending' WHERE id = ?",
+            (text, "2026-03-20T18:00:00.000", frame_id),
+        )
+    store.advance_frame_status(frame_id, "pending", "completed")
+    return frame_id
+
+
+@pytest.mark.unit
+def test_complete_mode_hides_frames_until_fully_enriched(store):
+    _ocr_done_frame(store, "cap-1", "quarterly roadmap")
+
+    _, total = SearchEngine(db_path=store.db_path).search(q="roadmap")
+
+    assert total == 0
+
+
+@pytest.mark.unit
+def test_staged_mode_makes_text_searchable_before_enrichment(store, staged):
+    frame_id = _ocr_done_frame(store, "cap-1", "quarterly roadmap")
+
+    results, total = SearchEngine(db_path=store.db_path).search(q="roadmap")
+
+    assert total == 1
+    assert results[0]["frame_id"] == frame_id
+
+
+@pytest.mark.unit
+def test_staged_mode_still_hides_frames_without_text(store, staged):
+    frame_id, _ = store.claim_frame(
+        capture_id="cap-1",
+        metadata={"timestamp": "2026-03-20T10:00:00Z", "app_name": "Editor"},
+    )
+    with store._connect() as conn:
+        conn.execute("UPDATE frames SET full_text = 'roadmap' WHERE id = ?", (frame_id,))
+
+    _, total = SearchEngine(db_path=store.db_path).search(q="roadmap")
+
+    assert total == 0
+
+
+@pytest.mark.unit
+def test_vector_visibility_waits_for_embedding(staged):
+    assert visibility.vector_visible_sql(alias="") == "embedding_status = 'completed'"
+    assert visibility.text_visible_sql() == "frames.status = 'completed'"
+    assert visibility.is_text_visible("completed", "pending") is True
+
+
+@pytest.mark.unit
+def test_frame_context_follows_visibility_mode(store, monkeypatch):
+    from flask import Flask
+
+    from myrecall.server import api_v1
+
+    frame_id = _ocr_done_frame(store, "cap-1", "quarterly roadmap")
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    client = app.test_client()
+
+    assert client.get(f"/v1/frames/{frame_id}/context").status_code == 404
+    monkeypatch.setattr(visibility.settings, "processing_visibility_mode", "staged", raising=False)
+    response = client.get(f"/v1/frames/{frame_id}/context")
+
+    assert response.status_code == 200
+    assert response.get_json()["description"] is None
+
+
+@pytest.mark.unit
+def test_visibility_latency_separates_first_searchable_from_enriched(store):
+    text_only = _ocr_done_frame(store, "cap-1", "alpha")
+    enriched = _ocr_done_frame(store, "cap-2", "beta")
+    with store._connect() as conn:
+        conn.execute(
+            "UPDATE frames SET ingested_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now', '-60 seconds'), "
+            "processed_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now', '-50 seconds') WHERE id IN (?, ?)",
+            (text_only, enriched),
+        )
+        for table in ("description_tasks", "embedding_tasks"):
+            conn.execute(
+                f"INSERT INTO {table} (frame_id, status, completed_at) "
+                "VALUES (?, 'completed', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))",
+                (enriched,),
+            )
+
+    latency = store.get_visibility_latency("2000-01-01T00:00:00.000Z")
+
+    assert latency["text_searchable"]["count"] == 2
+    assert 9 <= latency["text_searchable"]["p50_seconds"] <= 11
+    assert latency["vector_searchable"]["count"] == 1
+    assert latency["fully_enriched"]["count"] == 1
+    assert 59 <= latency["fully_enriched"]["max_seconds"] <= 61
+
+
+@pytest.mark.unit
+def test_visibility_latency_endpoint_reports_mode(store, monkeypatch):
+    from flask import Flask
+
+    from myrecall.server import api_v1
+
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+
+    data = app.test_client().get("/v1/visibility/latency?hours=1").get_json()
+
+    assert data["mode"] == "complete"
+    assert data["window_hours"] == 1.0
+    assert data["fully_enriched"] == {
+        "count": 0,
+        "p50_seconds": None,
+        "p95_seconds": None,
+        "max_seconds": None,
+    }
@@ -0,0 +1,182 @@
+"""Tests for lane-scheduled description/embedding task queues."""
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+from myrecall.server.database.task_lanes import (
+    LANE_BACKFILL,
+    LANE_LIVE,
+    LANE_USER,
+    LaneScheduler,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+def _frames(store: FramesStore, count: int) -> list[int]:
+    frame_ids = [
+        store.claim_frame(
+            capture_id=f"cap-{i}",
+            metadata={"timestamp": f"2026-03-20T10:00:{i:02d}Z", "app_name": "App"},
+        )[0]
+        for i in range(count)
+    ]
+    with store._connect() as conn:
+        for frame_id in frame_ids:
+            conn.execute(
+                "UPDATE frames SET snapshot_path = ? WHERE id = ?",
+                (f"/snap/{frame_id}.jpg", frame_id),
+            )
+    return frame_ids
+
+
+@pytest.mark.unit
+def test_claims_follow_lane_order(store):
+    backfill, live, user = _frames(store, 3)
+    with store._connect() as conn:
+        store.insert_description_task(conn, backfill, lane=LANE_BACKFILL)
+        store.insert_description_task(conn, live)
+        store.insert_description_task(conn, user, lane=LANE_USER)
+
+    with store._connect() as conn:
+        tasks = store.claim_description_tasks(conn, 3)
+
+    assert [t["frame_id"] for t in tasks] == [live, user, backfill]
+    assert [t["priority"] for t in tasks] == [LANE_LIVE, LANE_USER, LANE_BACKFILL]
+
+
+@pytest.mark.unit
+def test_reinsert_promotes_pending_task_but_never_demotes(store):
+    (frame_id,) = _frames(store, 1)
+    with store._connect() as conn:
+        store.insert_embedding_task(conn, frame_id, lane=LANE_BACKFILL)
+        store.insert_embedding_task(conn, frame_id, lane=LANE_USER)
+        store.insert_embedding_task(conn, frame_id, lane=LANE_BACKFILL)
+        rows = conn.execute("SELECT priority FROM embedding_tasks").fetchall()
+
+    assert [r[0] for r in rows] == [LANE_USER]
+
+
+@pytest.mark.unit
+def test_backfill_enqueues_into_backfill_lane(store):
+    _frames(store, 2)
+    with store._connect() as conn:
+        assert store.enqueue_pending_descriptions(conn) == 2
+        lanes = {r[0] for r in conn.execute("SELECT priority FROM description_tasks")}
+
+    assert lanes == {LANE_BACKFILL}
+
+
+@pytest.mark.unit
+def test_scheduler_gives_backfill_its_share():
+    scheduler = LaneScheduler(backfill_share=0.25, max_wait_seconds=0)
+    first_lanes = []
+    for _ in range(40):
+        order = scheduler.next_order()
+        # Both lanes always have work: serve the first lane in the order
+        first_lanes.append(order[0])
+        scheduler.record(order, [order[0] if order[0] != LANE_USER else LANE_LIVE])
+
+    assert first_lanes.count(LANE_BACKFILL) == 10
+    assert first_lanes[:2] == [LANE_BACKFILL, LANE_LIVE]
+
+
+@pytest.mark.unit
+def test_scheduler_zero_share_keeps_backfill_last():
+    scheduler = LaneScheduler(backfill_share=0, max_wait_seconds=0)
+    for _ in range(5):
+        order = scheduler.next_order()
+        assert order == (LANE_LIVE, LANE_USER, LANE_BACKFILL)
+        scheduler.record(order, [LANE_LIVE])
+
+
+@pytest.mark.unit
+def test_scheduler_does_not_bank_idle_backfill_credit():
+    scheduler = LaneScheduler(backfill_share=0.5, max_wait_seconds=0)
+    # Live was idle: backfill ran on spare capacity, not on its share
+    for _ in range(6):
+        order = scheduler.next_order()
+        scheduler.record(order, [LANE_BACKFILL])
+    # Once live has work again backfill gets its share and no more
+    leads = []
+    for _ in range(6):
+        order = scheduler.next_order()
+        leads.append(order[0])
+        scheduler.record(order, [order[0]])
+
+    assert leads.count(LANE_BACKFILL) == 3
+
+
+@pytest.mark.unit
+def test_overdue_user_lane_jumps_ahead_of_live():
+    scheduler = LaneScheduler(backfill_share=0, max_wait_seconds=60)
+
+    assert scheduler.next_order({LANE_LIVE: 1, LANE_USER: 30})[0] == LANE_LIVE
+    assert scheduler.next_order({LANE_LIVE: 1, LANE_USER: 61})[0] == LANE_USER
+    # Backfill relies on its share, not on age
+    assert scheduler.next_order({LANE_BACKFILL: 10_000})[0] == LANE_LIVE
+
+
+@pytest.mark.unit
+def test_pending_lane_waits_and_status(store):
+    live, backfill = _frames(store, 2)
+    with store._connect() as conn:
+        store.insert_embedding_task(conn, live)
+        store.insert_embedding_task(conn, backfill, lane=LANE_BACKFILL)
+        conn.execute(
+            "UPDATE embedding_tasks SET created_at = datetime('now', '-120 seconds') "
+            "WHERE frame_id = ?",
+            (backfill,),
+        )
+    with store._connect() as conn:
+        store.claim_embedding_task(conn)
+        waits = store.get_pending_lane_waits(conn, "embedding")
+        lanes = store.get_task_lane_status(conn, "embedding")
+
+    assert set(waits) == {LANE_BACKFILL}
+    assert 110 <= waits[LANE_BACKFILL] <= 130
+    assert lanes["live"]["processing"] == 1
+    assert lanes["live"]["avg_wait_seconds_1h"] is not None
+    assert lanes["backfill"]["pending"] == 1
+    assert 110 <= lanes["backfill"]["oldest_pending_seconds"] <= 130
+    assert lanes["user"] == {
+        "pending": 0,
+        "processing": 0,
+        "oldest_pending_seconds": None,
+        "avg_wait_seconds_1h": None,
+    }
+
+
+@pytest.mark.unit
+def test_manual_trigger_promotes_queued_task(store, monkeypatch):
+    from flask import Flask
+
+    from myrecall.server import api_v1
+
+    (frame_id,) = _frames(store, 1)
+    with store._connect() as conn:
+        store.enqueue_pending_descriptions(conn)
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    client = app.test_client()
+
+    response = client.post(f"/v1/frames/{frame_id}/description")
+    status = client.get("/v1/description/tasks/status").get_json()
+
+    assert response.status_code == 409
+    assert status["lanes"]["user"]["pending"] == 1
+    assert status["lanes"]["backfill"]["pending"] == 0
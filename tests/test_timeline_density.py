@@ -0,0 +1,128 @@
+"""Tests for the /v1/timeline/density endpoint (rollups plus unprocessed frames)."""
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from myrecall.server import api_v1
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(
+        conn,
+        Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations",
+    )
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+@pytest.fixture
+def client(store, monkeypatch):
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    return app.test_client()
+
+
+def _insert(store: FramesStore, local_ts: str, app_name: str, visibility: str = "queryable") -> int:
+    with store._connect() as conn:
+        return conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, local_timestamp, app_name, visibility_status) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (uuid.uuid4().hex, local_ts, local_ts, app_name, visibility),
+        ).lastrowid
+
+
+@pytest.mark.unit
+def test_density_buckets_report_counts_dominant_app_and_frame(store, client):
+    _insert(store, "2026-03-20T09:10:00.000", "Terminal")
+    editor_first = _insert(store, "2026-03-20T09:20:00.000", "Editor")
+    for minute in range(21, 30):
+        _insert(store, f"2026-03-20T09:{minute}:00.000", "Editor")
+    _insert(store, "2026-03-20T09:40:00.000", "Editor", visibility="pending")
+    browser = _insert(store, "2026-03-20T11:05:00.000", "Browser")
+
+    data = client.get(
+        "/v1/timeline/density?start_time=2026-03-20T09:30&end_time=2026-03-20T12:00"
+        "&bucket_seconds=3600"
+    ).get_json()
+
+    assert data["start"] == "2026-03-20T09:00:00"
+    assert data["end"] == "2026-03-20T12:00:00"
+    assert data["buckets"] == [
+        {
+            "start": "2026-03-20T09:00:00",
+            "frame_count": 12,  # the pending 09:40 frame counts too
+            "active_minutes": 9.0,
+            "dominant_app": "Editor",
+            "frame_id": editor_first,
+        },
+        {
+            "start": "2026-03-20T11:00:00",
+            "frame_count": 1,
+            "active_minutes": 0.0,
+            "dominant_app": "Browser",
+            "frame_id": browser,
+        },
+    ]
+
+
+@pytest.mark.unit
+def test_density_buckets_align_to_local_midnight(store, client):
+    _insert(store, "2026-03-20T23:59:00.000", "Editor")
+    _insert(store, "2026-03-21T00:01:00.000", "Editor")
+
+    data = client.get(
+        "/v1/timeline/density?start_time=2026-03-20T23:50&end_time=2026-03-21T00:10"
+        "&bucket_seconds=900"
+    ).get_json()
+
+    assert [b["start"] for b in data["buckets"]] == ["2026-03-20T23:45:00", "2026-03-21T00:00:00"]
+    assert data["buckets"][0]["active_minutes"] == 2.0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "query",
+    [
+        "start_time=2026-03-20&end_time=2026-03-21&bucket_seconds=60",
+        "start_time=2026-03-20&end_time=2026-03-21&bucket_seconds=1000",
+        "start_time=2026-03-21&end_time=2026-03-20",
+        "start_time=2026-01-01&end_time=2026-12-31&bucket_seconds=300",
+        "end_time=2026-03-21",
+    ],
+)
+def test_density_rejects_invalid_zoom_and_ranges(client, query):
+    response = client.get(f"/v1/timeline/density?{query}")
+
+    assert response.status_code == 400
+    assert response.get_json()["code"] == "INVALID_PARAMS"
+
+
+@pytest.mark.unit
+def test_density_shows_frames_still_being_processed(store, client):
+    _insert(store, "2026-03-20T09:05:00.000", "Editor")
+    pending = _insert(store, "2026-03-20T10:00:00.000", "Browser", visibility="pending")
+    _insert(store, "2026-03-20T10:10:00.000", "Browser", visibility="pending")
+    _insert(store, "2026-03-20T10:20:00.000", "Slack", visibility="failed")
+
+    data = client.get(
+        "/v1/timeline/density?start_time=2026-03-20T09:00&end_time=2026-03-20T11:00"
+        "&bucket_seconds=3600"
+    ).get_json()
+
+    assert data["buckets"][1] == {
+        "start": "2026-03-20T10:00:00",
+        "frame_count": 3,
+        "active_minutes": 0.0,
+        "dominant_app": "Browser",
+        "frame_id": pending,
+    }
+    assert data["buckets"][0]["frame_count"] == 1
@@ -0,0 +1,160 @@
+"""Tests for POST /v1/batch and the response character budget."""
+import json
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from myrecall.server import api_v1
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+from myrecall.server.utils.budget import fit_to_budget, json_chars
+
+_MIGRATIONS = Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations"
+_RANGE = {"start_time": "2026-03-20T00:00:00", "end_time": "2026-03-20T23:59:59"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    conn.close()
+    return FramesStore(db_path=db_path)
+
+
+@pytest.fixture
+def client(store, monkeypatch):
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    return app.test_client()
+
+
+def _insert(store, local_ts, app_name, text, summary=None):
+    with store._connect() as conn:
+        frame_id = conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, local_timestamp, app_name, window_name, "
+            "text_source, ocr_text, status, visibility_status, description_status) "
+            "VALUES (?, ?, ?, ?, 'main', 'ocr', ?, 'completed', 'queryable', ?)",
+            (uuid.uuid4().hex, local_ts + "Z", local_ts, app_name, text,
+             "completed" if summary else None),
+        ).lastrowid
+        if summary:
+            conn.execute(
+                "INSERT INTO frame_descriptions (frame_id, narrative, summary, tags_json) "
+                "VALUES (?, ?, ?, ?)",
+                (frame_id, f"The user was {summary}.", summary, json.dumps(["work"])),
+            )
+    return frame_id
+
+
+@pytest.mark.unit
+def test_batch_runs_calls_and_fans_out_frame_context(store, client):
+    ids = [
+        _insert(store, "2026-03-20T09:00:00", "Editor", "def main(): pass", "editing code"),
+        _insert(store, "2026-03-20T10:00:00", "Browser", "pull request #12", "reviewing a PR"),
+        _insert(store, "2026-03-20T11:00:00", "Slack", "lunch?", "chatting"),
+    ]
+
+    response = client.post("/v1/batch", json={
+        "requests": [
+            {"id": "summary", "path": "/v1/activity-summary",
+             "params": {**_RANGE, "max_descriptions": 2}},
+            {"id": "ctx", "path": "/v1/frames/{frame_id}/context",
+             "frames_from": "summary", "top": 2},
+            {"id": "text", "path": f"/v1/frames/{ids[0]}/text"},
+            {"id": "missing", "path": "/v1/frames/999/context"},
+            {"id": "bad", "path": "/v1/activity-summary"},
+        ],
+    })
+
+    assert response.status_code == 200
+    body = response.get_json()
+    results = body["results"]
+    assert set(results) == {"summary", "ctx", "text", "missing", "bad"}
+    assert body["truncated"] is False and "request_id" in body
+    assert results["summary"]["status"] == 200
+    assert results["summary"]["body"]["total_frames"] == 3
+    # Most recent descriptions first: Slack, then Browser
+    items = results["ctx"]["items"]
+    assert [item["frame_id"] for item in items] == [ids[2], ids[1]]
+    assert items[1]["status"] == 200
+    assert items[1]["body"]["description"]["narrative"] == "The user was reviewing a PR."
+    assert items[1]["body"]["text"] == "pull request #12"
+    assert results["text"]["status"] == 200
+    assert results["missing"]["status"] == 404
+    assert results["bad"]["status"] == 400
+
+
+@pytest.mark.unit
+def test_batch_trims_to_character_budget(store, client):
+    long_text = "lorem ipsum " * 2000
+    ids = [_insert(store, f"2026-03-20T09:0{i}:00", "Editor", long_text, f"task {i}")
+           for i in range(3)]
+
+    response = client.post("/v1/batch", json={
+        "max_chars": 3000,
+        "requests": [
+            {"id": "summary", "path": "/v1/activity-summary", "params": _RANGE},
+            {"id": "ctx", "path": "/v1/frames/{frame_id}/context",
+             "frames_from": "summary", "top": 3},
+        ],
+    })
+
+    body = response.get_json()
+    assert body["truncated"] is True
+    assert json_chars(body["results"]) <= 3000
+    items = body["results"]["ctx"]["items"]
+    assert sorted(item["frame_id"] for item in items) == sorted(ids)
+    text = items[0]["body"]["text"]
+    assert text.startswith("lorem ipsum") and " chars..." in text
+    # Short fields are not cut
+    assert items[0]["body"]["app_name"] == "Editor"
+
+
+@pytest.mark.unit
+def test_batch_rejects_malformed_requests(client):
+    def post(body):
+        return client.post("/v1/batch", json=body)
+
+    assert post({}).status_code == 400
+    assert post({"requests": []}).status_code == 400
+    assert post({"requests": [{"path": "/v1/frames/1"}]}).status_code == 400
+    assert post({"requests": [{"path": "/v1/admin/frames/retry-failed"}]}).status_code == 400
+    assert post({"requests": [{"path": "/v1/nope"}]}).status_code == 400
+    assert post({"requests": [
+        {"id": "a", "path": "/v1/frames/{frame_id}/context", "frames_from": "b"},
+        {"id": "b", "path": "/v1/activity-summary"},
+    ]}).status_code == 400
+    assert post({"requests": [
+        {"id": "a", "path": "/v1/activity-summary"},
+        {"id": "a", "path": "/v1/activity-summary"},
+    ]}).status_code == 400
+    # frames_from cannot chain: a fan-out result has no frame list
+    assert post({"requests": [
+        {"id": "hits", "path": "/v1/search", "params": {"q": "x"}},
+        {"id": "similar", "path": "/v1/frames/{frame_id}/similar", "frames_from": "hits"},
+        {"id": "ctx", "path": "/v1/frames/{frame_id}/context", "frames_from": "similar"},
+    ]}).status_code == 400
+    assert post({"max_chars": "lots", "requests": [{"path": "/v1/activity-summary"}]}
+                ).status_code == 400
+
+
+@pytest.mark.unit
+def test_fit_to_budget_caps_long_strings_then_drops_items():
+    payload = {"data": [{"frame_id": i, "app": "Editor", "text": "x" * (500 * (i + 1))}
+                        for i in range(10)]}
+
+    trimmed, truncated = fit_to_budget(payload, 6000)
+    assert truncated and json_chars(trimmed) <= 6000
+    assert len(trimmed["data"]) == 10
+    assert trimmed["data"][0]["text"] == "x" * 500
+    assert len(payload["data"][9]["text"]) == 5000  # input untouched
+
+    trimmed, truncated = fit_to_budget(payload, 600)
+    assert truncated and json_chars(trimmed) <= 600
+    assert 0 < len(trimmed["data"]) < 10
+    assert fit_to_budget(payload, 10**6) == (payload, False)
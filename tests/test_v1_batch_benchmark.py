@@ -0,0 +1,94 @@
+"""Progressive-disclosure turn: sequential calls vs one POST /v1/batch.
+
+Seeds a day of described frames and times an agent turn that fetches the
+activity summary plus context for the three latest frames, once as four
+sequential requests and once as a single batch (context calls fanned out
+in parallel server-side). In-process test client, so this shows
+server-side cost only; each avoided request also saves a real HTTP round
+trip plus an agent tool-call step.
+
+Run with: pytest -m perf tests/test_v1_batch_benchmark.py -s
+Observation only (non-blocking).
+"""
+
+import logging
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from myrecall.server import api_v1
+from myrecall.server.database.frames_store import FramesStore
+from myrecall.server.database.migrations_runner import run_migrations
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.perf]
+
+_MIGRATIONS = Path(__file__).resolve().parent.parent / "myrecall/server/database/migrations"
+_FRAMES = 3000
+_ROUNDS = 20
+_RANGE = {"start_time": "2026-03-20T00:00:00", "end_time": "2026-03-20T23:59:59"}
+
+
+def _client(tmp_path, monkeypatch):
+    db_path = tmp_path / "edge.db"
+    conn = sqlite3.connect(str(db_path))
+    run_migrations(conn, _MIGRATIONS)
+    start = datetime(2026, 3, 20, 8, 0, 0)
+    for i in range(_FRAMES):
+        ts = (start + timedelta(seconds=10 * i)).strftime("%Y-%m-%dT%H:%M:%S")
+        frame_id = conn.execute(
+            "INSERT INTO frames (capture_id, timestamp, local_timestamp, app_name, text_source, "
+            "ocr_text, status, visibility_status, description_status) "
+            "VALUES (?, ?, ?, ?, 'ocr', ?, 'completed', 'queryable', 'completed')",
+            (uuid.uuid4().hex, ts + "Z", ts, ("Editor", "Browser", "Slack")[i % 3],
+             "screen text " * 400),
+        ).lastrowid
+        conn.execute(
+            "INSERT INTO frame_descriptions (frame_id, narrative, summary, tags_json) "
+            "VALUES (?, 'The user is working.', 'working', '[]')",
+            (frame_id,),
+        )
+    conn.commit()
+    conn.close()
+    store = FramesStore(db_path=db_path)
+    monkeypatch.setattr(api_v1, "_get_frames_store", lambda: store)
+    app = Flask(__name__)
+    app.register_blueprint(api_v1.v1_bp)
+    return app.test_client()
+
+
+def test_batch_vs_sequential_turn(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch)
+
+    start = time.perf_counter()
+    for _ in range(_ROUNDS):
+        summary = client.get(
+            "/v1/activity-summary", query_string={**_RANGE, "max_descriptions": 10}
+        ).get_json()
+        for item in summary["descriptions"][:3]:
+            client.get(f"/v1/frames/{item['frame_id']}/context")
+    sequential = (time.perf_counter() - start) / _ROUNDS * 1000
+
+    body = {
+        "max_chars": 12000,
+        "requests": [
+            {"id": "summary", "path": "/v1/activity-summary",
+             "params": {**_RANGE, "max_descriptions": 10}},
+            {"id": "ctx", "path": "/v1/frames/{frame_id}/context",
+             "frames_from": "summary", "top": 3},
+        ],
+    }
+    start = time.perf_counter()
+    for _ in range(_ROUNDS):
+        client.post("/v1/batch", json=body)
+    batched = (time.perf_counter() - start) / _ROUNDS * 1000
+
+    logger.info("mode                 requests   ms/turn")
+    logger.info("sequential          %9d %9.1f", 4, sequential)
+    logger.info("batch               %9d %9.1f", 1, batched)